@@ -8,7 +8,7 @@ Usage:
 from setuptools import setup
 
 APP = ['../main.py']
-DATA_FILES = ['../Resources/SolarFarmDiagram.bmp','../Resources/currencyList.txt','../Resources/help.html']
+DATA_FILES = ['../Resources/SolarFarmDiagram.bmp','../Resources/currencyList.txt','../Resources/help.html','../SolarCalculator/Utils/AverageTemperatureData.dat','../SolarCalculator/Utils/CountryBoundaries.npz']
 OPTIONS = {'argv_emulation': False}
 
 setup(
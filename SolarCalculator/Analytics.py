@@ -0,0 +1,249 @@
+'''@package Analytics.py
+
+Financial analytics of solar farm simulations - net present value, internal rate of return, payback date and the
+levelised cost of energy. They are worked out from the results of a Simulation (see getFinancialResults and
+getPowerResults) with the discounting done on whole arrays rather than one day at a time.
+
+Every function also takes a 2D array of daily cash flows with one row per scenario, so the results of a parameter
+sweep or a set of simulations can be evaluated and ranked at once. The initial costs, discount rates and expenses can
+then either be single values shared by every scenario or arrays with one value per scenario.
+
+Usage example:
+>>> summary = summariseFinancialResults(simulation.getPowerResults(), simulation.getFinancialResults())
+>>> summary['npv'], summary['irr'], summary['paybackDate'], summary['lcoe']
+>>> metrics = evaluateCashFlows(cashFlows, initialCosts, discountRate=8, energy=energy, dailyExpenses=expenses)
+>>> best = rankScenarios(metrics, 'npv')[:10]     # Rows of the ten scenarios with the highest NPV
+'''
+
+# Import NumPy
+import numpy
+
+# --------------------------------------------------------------------------------------------------------------------
+# CONSTANTS
+# --------------------------------------------------------------------------------------------------------------------
+
+DAYS_PER_YEAR = 365.0           # Days in a year for discounting, the same as the daily interest of the simulation
+
+IRR_MIN_RATE = -99.0            # Lowest internal rate of return that is searched for (%/year)
+IRR_MAX_RATE = 100000.0         # Highest internal rate of return that is searched for (%/year)
+IRR_GUESS_RATE = 10.0           # Rate the search for the internal rate of return starts from (%/year)
+IRR_TOLERANCE = 1e-12           # Change in the continuously compounded rate that the search stops at
+IRR_MAX_ITERATIONS = 100        # Most steps taken searching for the internal rate of return
+
+# Metrics returned by evaluateCashFlows and whether a higher value is better when they are ranked
+METRIC_HIGHER_IS_BETTER = {'npv' : True, 'irr' : True, 'paybackDay' : False, 'discountedPaybackDay' : False,
+                           'lcoe' : False}
+PAYBACK_METRICS = ('paybackDay', 'discountedPaybackDay')    # Metrics that are -1 when the costs are never paid back
+
+# --------------------------------------------------------------------------------------------------------------------
+# FUNCTIONS
+# --------------------------------------------------------------------------------------------------------------------
+
+def getDailyCashFlows(financialResults):
+    ''' Returns an array of the net cash flow of each day of a simulation in the base currency - the revenue from the
+    power sold less the daily expenses. The revenue of each day is the change in the accumulated revenue '''
+    accumulativeRevenue = numpy.asarray(financialResults['accumulativeRevenue'], dtype=float)
+    dailyRevenue = numpy.diff(numpy.concatenate(([0.0], accumulativeRevenue)))
+    return dailyRevenue - financialResults['dailyExpenses']
+
+
+def calcDiscountFactors(discountRate, numDays):
+    ''' Returns an array of the factors that the cash flow of each day is multiplied by to discount it to the start
+    of the simulation, given the discount rate in %/year. The first day's cash flow is taken to arrive at the end of
+    that day. If the discount rate is an array of one rate per scenario there is a row of factors for each scenario '''
+    rate = numpy.asarray(discountRate, dtype=float)[..., numpy.newaxis]
+    years = numpy.arange(1, numDays + 1) / DAYS_PER_YEAR
+    return numpy.exp(-numpy.log1p(rate / 100.0) * years)
+
+
+def calcNPV(cashFlows, initialCost, discountRate):
+    ''' Returns the net present value of the daily cash flows given the initial cost paid at the start and the
+    discount rate in %/year. Given a 2D array of cash flows, one row per scenario, it returns an array of the net
+    present value of each scenario '''
+    cashFlows = numpy.asarray(cashFlows, dtype=float)
+    discountFactors = calcDiscountFactors(discountRate, cashFlows.shape[-1])
+    return (cashFlows * discountFactors).sum(axis=-1) - initialCost
+
+
+def calcIRR(cashFlows, initialCost):
+    ''' Returns the internal rate of return (%/year) of the daily cash flows given the initial cost paid at the
+    start - the discount rate that makes the net present value zero. Given a 2D array of cash flows, one row per
+    scenario, it returns an array of the rate of each scenario. The rate is NaN if the net present value doesn't
+    change sign between IRR_MIN_RATE and IRR_MAX_RATE.
+
+    The rates of all the scenarios are searched for at once with Newton's method on the continuously compounded
+    rate, falling back to halving the bracket around the rate whenever a step would leave it. Scenarios drop out of
+    the search as they converge so later steps only work on the rows that are left.'''
+    cashFlows = numpy.asarray(cashFlows, dtype=float)
+    shape = cashFlows.shape[:-1]
+    numDays = cashFlows.shape[-1]
+    initialCost = numpy.broadcast_to(numpy.asarray(initialCost, dtype=float), shape).ravel()
+
+    # Without any days the net present value is just the initial cost, so there's no rate that makes it zero
+    if numDays == 0:
+        return numpy.full(shape, numpy.nan) if shape else numpy.nan
+
+    # Split the days into blocks so the discount factor of day a*blockDays+b is the factor of the start of block a 
+    # times the factor of day b within the block, which needs far fewer exponentials than one for every day
+    blockDays = int(numpy.ceil(numpy.sqrt(numDays)))
+    numBlocks = -(-numDays // blockDays)
+    paddedFlows = numpy.zeros((cashFlows.size // numDays, numBlocks * blockDays))
+    paddedFlows[:, :numDays] = cashFlows.reshape(-1, numDays)
+    cashFlows = paddedFlows.reshape(-1, numBlocks, blockDays)
+    blockYears = numpy.arange(numBlocks) * blockDays / DAYS_PER_YEAR
+    dayYears = numpy.arange(1, blockDays + 1) / DAYS_PER_YEAR
+
+    def calcValueAndSlope(flows, costs, rate):
+        ''' Net present value of the cash flows at continuously compounded rates, and its derivative '''
+        blockFactors = numpy.exp(-rate[:, numpy.newaxis] * blockYears)
+        dayFactors = numpy.exp(-rate[:, numpy.newaxis] * dayYears)
+        blockValues = numpy.einsum('sab,sb->sa', flows, dayFactors)
+        blockSlopes = numpy.einsum('sab,sb->sa', flows, dayFactors * dayYears)
+        value = (blockFactors * blockValues).sum(axis=1) - costs
+        slope = -(blockFactors * (blockYears * blockValues + blockSlopes)).sum(axis=1)
+        return value, slope
+
+    numScenarios = cashFlows.shape[0]
+    low = numpy.full(numScenarios, numpy.log1p(IRR_MIN_RATE / 100.0))
+    high = numpy.full(numScenarios, numpy.log1p(IRR_MAX_RATE / 100.0))
+    lowSign = numpy.sign(calcValueAndSlope(cashFlows, initialCost, low)[0])
+    highSign = numpy.sign(calcValueAndSlope(cashFlows, initialCost, high)[0])
+
+    # Only search the scenarios where the rate is bracketed. Rather than taking the rows still being searched out of
+    # the cash flows every step, the working arrays are cut down whenever half of their rows have converged
+    rows = numpy.flatnonzero(lowSign * highSign < 0)
+    if len(rows) < numScenarios:
+        cashFlows, initialCost = cashFlows[rows], initialCost[rows]
+        low, high, lowSign = low[rows], high[rows], lowSign[rows]
+    rate = numpy.full(len(rows), numpy.log1p(IRR_GUESS_RATE / 100.0))
+    searching = numpy.ones(len(rows), dtype=bool)
+    irr = numpy.full(numScenarios, numpy.nan)
+
+    for iteration in range(IRR_MAX_ITERATIONS):
+        if not searching.any():
+            break
+
+        if 2 * searching.sum() <= len(searching):
+            rows, rate, low, high = rows[searching], rate[searching], low[searching], high[searching]
+            cashFlows, initialCost, lowSign = cashFlows[searching], initialCost[searching], lowSign[searching]
+            searching = searching[searching]
+
+        value, slope = calcValueAndSlope(cashFlows, initialCost, rate)
+
+        # Narrow the bracket to the side of the rate that still has the root
+        sameAsLow = numpy.sign(value) == lowSign
+        low = numpy.where(sameAsLow, rate, low)
+        high = numpy.where(sameAsLow, high, rate)
+
+        # Take a Newton step, or bisect the bracket if the step leaves it
+        with numpy.errstate(divide='ignore', invalid='ignore'):
+            newRate = rate - value / slope
+        outside = ~((newRate > numpy.minimum(low, high)) & (newRate < numpy.maximum(low, high)))
+        newRate[outside] = 0.5 * (low + high)[outside]
+
+        # Rows that have already converged keep their rate
+        converged = searching & ((numpy.abs(newRate - rate) < IRR_TOLERANCE) | (value == 0))
+        rate = numpy.where(searching, newRate, rate)
+        irr[rows[converged]] = rate[converged]
+        searching &= ~converged
+
+    # Convert from continuously compounded to %/year
+    irr = 100.0 * numpy.expm1(irr)
+    return irr.reshape(shape) if shape else irr[0]
+
+
+def getFirstDay(reached):
+    ''' Returns the index of the first day that is True in a boolean array of days, or -1 if none of them are. Given
+    a 2D array, one row per scenario, it returns an array of the day of each scenario '''
+    if reached.shape[-1] == 0:
+        return numpy.full(reached.shape[:-1], -1, dtype=int)
+    return numpy.where(reached.any(axis=-1), reached.argmax(axis=-1), -1)
+
+
+def calcPaybackDay(cashFlows, initialCost, discountRate=None):
+    ''' Returns the index of the first day that the accumulated cash flows have paid back the initial cost, or -1 if
+    they never do. If a discount rate (%/year) is given the cash flows are discounted first, giving the discounted
+    payback. Given a 2D array of cash flows, one row per scenario, it returns an array of the day of each scenario '''
+    cashFlows = numpy.asarray(cashFlows, dtype=float)
+    if discountRate is not None:
+        cashFlows = cashFlows * calcDiscountFactors(discountRate, cashFlows.shape[-1])
+
+    paidBack = numpy.cumsum(cashFlows, axis=-1) >= numpy.asarray(initialCost, dtype=float)[..., numpy.newaxis]
+    return getFirstDay(paidBack)
+
+
+def calcLoanPaidOffDay(loanValue):
+    ''' Returns the index of the first day the loan of a simulation is paid off, or -1 if it never is. Unlike the
+    payback day this includes the interest on the loan. Given a 2D array of loan values, one row per scenario, it
+    returns an array of the day of each scenario '''
+    paidOff = numpy.asarray(loanValue, dtype=float) <= 0
+    return getFirstDay(paidOff)
+
+
+def calcLCOE(energy, initialCost, dailyExpenses, discountRate):
+    ''' Returns the levelised cost of energy in the base currency per kWh - the present value of the initial cost and
+    the daily expenses divided by the present value of the daily energy (kWh), given the discount rate in %/year.
+    Given a 2D array of daily energy, one row per scenario, it returns an array of the cost of each scenario '''
+    energy = numpy.asarray(energy, dtype=float)
+    discountFactors = calcDiscountFactors(discountRate, energy.shape[-1])
+    costs = initialCost + numpy.asarray(dailyExpenses, dtype=float) * discountFactors.sum(axis=-1)
+    return costs / (energy * discountFactors).sum(axis=-1)
+
+
+def evaluateCashFlows(cashFlows, initialCost, discountRate, energy=None, dailyExpenses=None):
+    ''' Returns a dictionary of the net present value, internal rate of return, payback day and discounted payback
+    day of the daily cash flows, and the levelised cost of energy if the daily energy and expenses are given. Given
+    2D arrays with one row per scenario each metric is an array with a value for each scenario, which can be ranked
+    with rankScenarios. '''
+    metrics = {
+        'npv' : calcNPV(cashFlows, initialCost, discountRate),
+        'irr' : calcIRR(cashFlows, initialCost),
+        'paybackDay' : calcPaybackDay(cashFlows, initialCost),
+        'discountedPaybackDay' : calcPaybackDay(cashFlows, initialCost, discountRate)
+    }
+
+    if energy is not None and dailyExpenses is not None:
+        metrics['lcoe'] = calcLCOE(energy, initialCost, dailyExpenses, discountRate)
+
+    return metrics
+
+
+def rankScenarios(metrics, metric='npv'):
+    ''' Returns the indices of the scenarios evaluated by evaluateCashFlows ordered from best to worst by the given
+    metric. Scenarios without a value (no IRR, or never paid back) come last. '''
+    values = numpy.array(metrics[metric], dtype=float, ndmin=1)
+    if metric in PAYBACK_METRICS:
+        values[values < 0] = numpy.nan
+    if METRIC_HIGHER_IS_BETTER[metric]:
+        values = -values
+
+    # NaNs are sorted to the end, and the sort is stable so ties keep their order
+    return numpy.argsort(values, kind='mergesort')
+
+
+def summariseFinancialResults(powerResults, financialResults, discountRate=None):
+    ''' Returns a dictionary of the financial metrics of a simulation from its power and financial results. The
+    discount rate (%/year) defaults to the interest rate of the loan. The payback and loan paid off dates are None if
+    they aren't reached by the end of the simulation. All values are in the base currency. '''
+    if discountRate is None:
+        discountRate = financialResults['interestRate']
+
+    days = financialResults['days']
+    initialCost = financialResults['initialCost']
+    cashFlows = getDailyCashFlows(financialResults)
+    metrics = evaluateCashFlows(cashFlows, initialCost, discountRate, energy=powerResults['electricalEnergy'],
+                                dailyExpenses=financialResults['dailyExpenses'])
+
+    def getDate(day):
+        return days[day] if day >= 0 else None
+
+    return {
+        'discountRate' : discountRate,
+        'initialCost' : initialCost,
+        'npv' : float(metrics['npv']),
+        'irr' : float(metrics['irr']),
+        'lcoe' : float(metrics['lcoe']),
+        'paybackDate' : getDate(metrics['paybackDay']),
+        'discountedPaybackDate' : getDate(metrics['discountedPaybackDay']),
+        'loanPaidOffDate' : getDate(calcLoanPaidOffDay(financialResults['loanValue']))
+    }
@@ -12,10 +12,15 @@ Author: Jarrad Raumati
 Date: 20/09/2013
 '''
 
+# Import NumPy for calculating depreciation schedules
+import numpy
+
 # Import the currency exchange module
 import SolarCalculator.Utils.PyExchangeRates
 
 # Create a global currency exchange for all the assets to share. This stops the currency API from being hit too many times.
+# The rates aren't loaded until the first asset is created, so importing this module never waits on the network. Use
+# CURRENCY_EXCHANGE.setProvider to take the rates from a file or from memory instead.
 CURRENCY_EXCHANGE = SolarCalculator.Utils.PyExchangeRates.Exchange('843ce8fdc22c47779fb3040c2ba9a586')
 
 
@@ -49,6 +54,13 @@ class Asset(object):
         ''' Returns the asset's value factoring in depreciation for the given amount of days'''
         return self.cost * (1-self.depRate/(365.0*100.0))**daysOld
 
+    def getDepreciationSchedule(self, numDays):
+        ''' Returns a float array of the asset's value for each day from 0 to numDays - 1 days old.
+
+        This gives the same amounts as calling getDepreciatedValue for each day, but works out all of them at once.'''
+        daysOld = numpy.arange(numDays, dtype=float)
+        return self.cost.getAmount() * (1-self.depRate/(365.0*100.0))**daysOld
+
     def getDepRate(self):
         ''' Return the asset's depreciation rate of the asset. '''
         return self.depRate
@@ -470,10 +482,15 @@ class Financial(object):
         self.baseCurrency = baseCurrency         # Base currency that results are returned in
         self.interestRate = interestRate                                               # Interest rate (%/year)
         self.maintenance = Financial.exchange.withdraw(maintenance,self.baseCurrency)  # Maintaince budget per year
-        self.loan = Financial.exchange.withdraw(miscExpenses,self.baseCurrency)        # + assets 
+        self.miscExpenses = Financial.exchange.withdraw(miscExpenses,self.baseCurrency)   # Initial startup costs
+        self.loan = self.miscExpenses                                                  # + assets 
         self.powerPrice = Financial.exchange.withdraw(powerPrice,self.baseCurrency)    # Selling rate of power (currency/kWh)
         
 
+    def getMiscExpenses(self):
+        ''' Returns the initial startup costs, which the loan starts from before the assets are added '''
+        return self.miscExpenses
+
     def getDailyMaintenance(self):
         ''' Returns the maintenance budget per year '''
         return self.maintenance / 365.0
@@ -504,6 +521,10 @@ class Financial(object):
         ''' Returns the current value of the loan '''
         return self.loan
 
+    def setCurrentLoanValue(self, loan):
+        ''' Sets the current value of the loan '''
+        self.loan = loan
+
     def amountInBaseCurrency(self, money):
         ''' Returns the value of a money object in the base currency of the loan'''
         return money.convert(self.baseCurrency).getAmount()
@@ -0,0 +1,194 @@
+'''@package Export.py
+
+Exports the results of simulations as columns of NumPy arrays, so they can be used by other analysis tools or loaded
+again later without re-running the simulation.
+
+An export is a folder with a JSON manifest and one column per daily series - the days (as int64 days since
+1970-01-01), every output of the power simulation and every output of the financial simulation. The manifest holds
+the dates, where the loan and revenue were left, the scalar results such as the asset costs, and the list of columns.
+
+By default each column is saved as its own uncompressed .npy file, which loadExport memory maps, so reloading even
+a 50 year simulation costs no more than opening the files - the data is only read from disk as it's used. The
+columns can also be saved compressed in a single .npz file, split into chunks of days so each chunk can be read on
+its own. Compressed exports are smaller but are read into memory when they're loaded.
+
+Usage example:
+>>> exportSimulation(simulation, 'results/tonga')
+>>> resultSet = loadExport('results/tonga')
+>>> resultSet['power']['electricalEnergy']       # Memory mapped array of the daily energy (kWh)
+>>> simulation = Simulation(..., previousResults=resultSet)     # Carry on from the exported results
+'''
+
+# Import system modules
+import os
+import json
+import datetime
+
+# Import NumPy
+import numpy
+
+# Import the simulation module
+import SolarCalculator.Simulation
+
+# --------------------------------------------------------------------------------------------------------------------
+# CONSTANTS
+# --------------------------------------------------------------------------------------------------------------------
+
+EXPORT_FORMAT_VERSION = 1               # Change this when the layout of the exports changes
+MANIFEST_FILE = 'manifest.json'         # Name of the manifest file in an export folder
+COLUMN_FILE_FORMAT = '%s.npy'           # Name of the file of each column of an uncompressed export
+COMPRESSED_FILE = 'columns.npz'         # Name of the file holding all the columns of a compressed export
+CHUNK_NAME_FORMAT = '%s.%d'             # Name of each chunk of a column in a compressed export
+EXPORT_CHUNK_DAYS = 365                 # Number of days in each chunk of a compressed export by default
+
+EPOCH = datetime.date(1970, 1, 1)       # Day zero of the days column
+
+# Scalar financial results that are saved in the manifest
+FINANCIAL_SCALAR_FIELDS = ('baseCurrency', 'arrayCost', 'DCCableCost', 'inverterCost', 'AC1CableCost',
+                           'transformerCost', 'AC2CableCost', 'siteCost', 'initialCost', 'dailyExpenses',
+                           'interestRate')
+
+# --------------------------------------------------------------------------------------------------------------------
+# EXCEPTIONS
+# --------------------------------------------------------------------------------------------------------------------
+
+class InvalidExport(Exception):
+    ''' Thrown when a folder isn't an export or was written by an incompatible version '''
+    pass
+
+# --------------------------------------------------------------------------------------------------------------------
+# FUNCTIONS
+# --------------------------------------------------------------------------------------------------------------------
+
+def datesToEpochDays(start, numDays):
+    ''' Returns an int64 array of the number of days since 1970-01-01 of numDays consecutive days from the start '''
+    return numpy.arange(numDays, dtype=numpy.int64) + (start - EPOCH).days
+
+
+def epochDaysToDates(epochDays):
+    ''' Returns a list of the dates of an array of days since 1970-01-01 '''
+    return [EPOCH + datetime.timedelta(days=int(x)) for x in epochDays]
+
+
+def getResultSetColumns(resultSet):
+    ''' Returns a list of (name, array) tuples of the daily columns of a result set (see Simulation.getResultSet) '''
+    numDays = (resultSet['finish'] - resultSet['start']).days
+
+    columns = [('days', datesToEpochDays(resultSet['start'], numDays))]
+    for field in SolarCalculator.Simulation.POWER_OUTPUT_FIELDS:
+        columns.append(('power.' + field, numpy.asarray(resultSet['power'][field], dtype=float)))
+    for field in SolarCalculator.Simulation.FINANCIAL_OUTPUT_FIELDS:
+        columns.append(('financial.' + field, numpy.asarray(resultSet['financial'][field], dtype=float)))
+
+    return columns
+
+
+def exportResultSet(resultSet, directory, compress=False, chunkDays=EXPORT_CHUNK_DAYS, financialResults=None):
+    ''' Exports a result set (see Simulation.getResultSet) to the given folder. If compress is True the columns are
+    saved in one compressed file in chunks of chunkDays days, otherwise each column is saved as a .npy file that can
+    be memory mapped. The scalar results from financialResults are saved in the manifest if they're given. The
+    manifest is written last, so a folder that was only partly written can't be loaded. '''
+    if not os.path.isdir(directory):
+        os.makedirs(directory)
+
+    columns = getResultSetColumns(resultSet)
+    manifest = {
+        'version' : EXPORT_FORMAT_VERSION,
+        'start' : resultSet['start'].isoformat(),
+        'finish' : resultSet['finish'].isoformat(),
+        'loanState' : resultSet['loanState'],
+        'revenueState' : resultSet['revenueState'],
+        'compressed' : compress,
+        'chunkDays' : chunkDays if compress else None,
+        'columns' : [{'name' : name, 'dtype' : column.dtype.str, 'length' : len(column)} for name, column in columns],
+        'financial' : {}
+    }
+
+    if financialResults is not None:
+        for field in FINANCIAL_SCALAR_FIELDS:
+            if field in financialResults:
+                value = financialResults[field]
+                manifest['financial'][field] = value.item() if isinstance(value, numpy.generic) else value
+
+    # Remove the manifest of an earlier export first, so it never describes a mix of old and new columns
+    manifestFilename = os.path.join(directory, MANIFEST_FILE)
+    if os.path.isfile(manifestFilename):
+        os.remove(manifestFilename)
+
+    if compress:
+        chunks = {}
+        for name, column in columns:
+            for i, start in enumerate(range(0, max(len(column), 1), chunkDays)):
+                chunks[CHUNK_NAME_FORMAT % (name, i)] = column[start:start + chunkDays]
+
+        with open(os.path.join(directory, COMPRESSED_FILE), 'wb') as f:
+            numpy.savez_compressed(f, **chunks)
+
+    else:
+        for name, column in columns:
+            numpy.save(os.path.join(directory, COLUMN_FILE_FORMAT % name), column)
+
+    with open(manifestFilename, 'w') as f:
+        json.dump(manifest, f, indent=4, sort_keys=True)
+
+
+def exportSimulation(simulation, directory, compress=False, chunkDays=EXPORT_CHUNK_DAYS):
+    ''' Exports the results of a simulation to the given folder (see exportResultSet). The power and financial
+    simulations must have been run. '''
+    exportResultSet(simulation.getResultSet(), directory, compress, chunkDays, simulation.getFinancialResults())
+
+
+def loadManifest(directory):
+    ''' Returns the manifest of the export in the given folder '''
+    manifestFilename = os.path.join(directory, MANIFEST_FILE)
+    if not os.path.isfile(manifestFilename):
+        raise InvalidExport("%s is not an export of simulation results" % directory)
+
+    with open(manifestFilename, 'r') as f:
+        manifest = json.load(f)
+
+    if manifest.get('version') != EXPORT_FORMAT_VERSION:
+        raise InvalidExport("%s was exported by an incompatible version" % directory)
+
+    return manifest
+
+
+def loadColumns(directory, manifest, mmapMode='r'):
+    ''' Returns a dictionary of the columns of an export by name. The columns of an uncompressed export are memory
+    mapped with the given mode ('r' by default, None reads them into memory), those of a compressed export are
+    decompressed into memory. '''
+    columns = {}
+
+    if manifest['compressed']:
+        with numpy.load(os.path.join(directory, COMPRESSED_FILE)) as chunks:
+            for column in manifest['columns']:
+                numChunks = max(-(-column['length'] // manifest['chunkDays']), 1)
+                names = [CHUNK_NAME_FORMAT % (column['name'], i) for i in range(numChunks)]
+                columns[column['name']] = numpy.concatenate([chunks[name] for name in names])
+
+    else:
+        for column in manifest['columns']:
+            filename = os.path.join(directory, COLUMN_FILE_FORMAT % column['name'])
+            columns[column['name']] = numpy.load(filename, mmap_mode=mmapMode)
+
+    return columns
+
+
+def loadExport(directory, mmapMode='r'):
+    ''' Loads an export of simulation results from the given folder. Returns a result set in the same form as
+    Simulation.getResultSet, so it can be given to a Simulation as its previousResults, along with the days column
+    (int64 days since 1970-01-01) and the scalar financial results from the manifest under 'financialScalars'.
+    The columns of an uncompressed export are memory mapped, see loadColumns. '''
+    manifest = loadManifest(directory)
+    columns = loadColumns(directory, manifest, mmapMode)
+
+    return {
+        'start' : datetime.datetime.strptime(manifest['start'], '%Y-%m-%d').date(),
+        'finish' : datetime.datetime.strptime(manifest['finish'], '%Y-%m-%d').date(),
+        'days' : columns['days'],
+        'power' : dict((field, columns['power.' + field]) for field in SolarCalculator.Simulation.POWER_OUTPUT_FIELDS),
+        'financial' : dict((field, columns['financial.' + field]) for field in SolarCalculator.Simulation.FINANCIAL_OUTPUT_FIELDS),
+        'loanState' : manifest['loanState'],
+        'revenueState' : manifest['revenueState'],
+        'financialScalars' : manifest['financial']
+    }
@@ -0,0 +1,302 @@
+'''@package MonteCarlo.py
+
+Monte Carlo simulations of the uncertainty in the energy and finances of a solar farm. Rather than the single
+trajectory given by a Simulation, the monthly temperatures of the site, the degradation rate of the panels, the power
+price and the interest rate are sampled from distributions, and percentile bands of the daily energy and loan value
+are returned along with P50/P90 estimates of the total energy and the day the loan is paid off.
+
+Thousands of realisations are run at once. The irradiance on the panels is only calculated once for the site (shared
+with parameter sweeps, see Sweep.py) and reduced to the sums of its powers over each day. The electrical output is a
+polynomial in the solar output, where the cable losses depend on the sampled temperatures, so the daily energy of
+every realisation is worked out from those sums without going back to the timesteps. The realisations are an extra
+dimension of the arrays, and the days are processed in blocks to keep the memory bounded.
+
+Usage example:
+>>> simulation = SolarCalculator.Scenario.createSimulation(inputParameters, optionalInputParameters)
+>>> monteCarlo = MonteCarloSimulation(simulation, {'temperature' : Normal(0, 1.5), 'powerPrice' : Uniform(0.2, 0.3)})
+>>> results = monteCarlo.run()
+>>> results['totalEnergy']['P90']         # kWh over the whole simulation that 90% of the realisations achieve
+>>> results['loanValue']['P50']           # Median loan value for each day
+'''
+
+# Import NumPy
+import numpy
+
+# Import the simulation modules
+import SolarCalculator.Simulation
+import SolarCalculator.Sweep
+
+# --------------------------------------------------------------------------------------------------------------------
+# CONSTANTS
+# --------------------------------------------------------------------------------------------------------------------
+
+# Inputs that can be sampled. The temperature is an offset in degrees C added to each of the site's monthly
+# temperatures, the others replace the values of the simulation (degradation in %/year, power price in the base
+# currency per kWh and interest rate in %/year)
+MONTE_CARLO_PARAMETERS = ('temperature', 'degradationRate', 'powerPrice', 'interestRate')
+
+DEFAULT_REALISATIONS = 1000             # Number of realisations run by default
+DEFAULT_EXCEEDANCE_LEVELS = (10, 50, 90)    # P10, P50 and P90 estimates are returned by default
+MAX_BLOCK_ELEMENTS = 2000000            # Most realisations x days that are held in memory at once
+OUTPUT_POLYNOMIAL_DEGREE = 8            # Degree of the electrical output as a polynomial of the solar output
+
+# --------------------------------------------------------------------------------------------------------------------
+# DISTRIBUTIONS
+# --------------------------------------------------------------------------------------------------------------------
+
+class Normal(object):
+    ''' Normal distribution with the given mean and standard deviation '''
+    def __init__(self, mean, std):
+        self.mean = mean
+        self.std = std
+
+    def sample(self, randomState, size):
+        return randomState.normal(self.mean, self.std, size)
+
+
+class Uniform(object):
+    ''' Uniform distribution between low and high '''
+    def __init__(self, low, high):
+        self.low = low
+        self.high = high
+
+    def sample(self, randomState, size):
+        return randomState.uniform(self.low, self.high, size)
+
+
+class Triangular(object):
+    ''' Triangular distribution between low and high that peaks at the mode '''
+    def __init__(self, low, mode, high):
+        self.low = low
+        self.mode = mode
+        self.high = high
+
+    def sample(self, randomState, size):
+        return randomState.triangular(self.low, self.mode, self.high, size)
+
+# --------------------------------------------------------------------------------------------------------------------
+# FUNCTIONS
+# --------------------------------------------------------------------------------------------------------------------
+
+def polySubtractSquare(coefficients, factor):
+    ''' Takes arrays of polynomial coefficients p (lowest power first, along the last axis) and returns the
+    coefficients of p - factor * p^2. The factor is an array that broadcasts with the other axes '''
+    degree = coefficients.shape[-1]
+    result = numpy.zeros(coefficients.shape[:-1] + (2 * degree - 1,))
+    result[..., :degree] = coefficients
+
+    for i in range(degree):
+        result[..., i:i + degree] -= (factor * coefficients[..., i])[..., numpy.newaxis] * coefficients
+
+    return result
+
+
+def getExceedancePercentile(level, higherIsBetter):
+    ''' Returns the percentile of a P value. P90 is the value that has a 90% chance of being achieved, which is the 10th
+    percentile for something that's better when it's higher (like energy) or the 90th for something that's better
+    when it's lower (like the loan) '''
+    return 100 - level if higherIsBetter else level
+
+
+# --------------------------------------------------------------------------------------------------------------------
+# CLASSES
+# --------------------------------------------------------------------------------------------------------------------
+
+class MonteCarloSimulation(object):
+    ''' Runs Monte Carlo realisations of a simulation with some of its inputs sampled from distributions '''
+
+    def __init__(self, simulation, distributions, numRealisations=DEFAULT_REALISATIONS, seed=None):
+        ''' Initialise the Monte Carlo simulation of the given simulation, which provides the site, dates, timestep
+        and all the inputs that aren't sampled. The distributions are a dictionary of {parameter name : distribution}
+        for any of the MONTE_CARLO_PARAMETERS. Give a seed to get the same realisations every time '''
+        for name in distributions.keys():
+            if name not in MONTE_CARLO_PARAMETERS:
+                raise ValueError("%s is not a parameter that can be sampled" % name)
+
+        self.simulation = simulation
+        self.parameters = simulation.parameters
+        self.days = simulation.days
+        self.timestepMins = simulation.simulationTimestepMins
+        self.distributions = distributions
+        self.numRealisations = numRealisations
+        self.randomState = numpy.random.RandomState(seed)
+
+        self.sweep = SolarCalculator.Sweep.ParameterSweep(simulation)   # Shares the irradiance on the panels
+        self.moments = None             # Sums of the powers of the solar output over each day, (days x degree + 1)
+
+    def getSolarOutputMoments(self):
+        ''' Returns a (days x OUTPUT_POLYNOMIAL_DEGREE + 1) array of the sums over the sunny timesteps of each day of
+        the powers of the solar output without degradation, calculating it the first time '''
+        if self.moments is None:
+            panelRating = self.parameters['PVPanel'].getRating()
+            panelNum = self.parameters['PVModule'].getPanelNum() * self.parameters['PVArray'].getModuleNum() * self.parameters['Site'].getArrayNum()
+            moments = numpy.empty((len(self.days), OUTPUT_POLYNOMIAL_DEGREE + 1))
+
+            # Only a block of the panel irradiance is needed at once
+            for start, stop in self.sweep.getBlocks():
+                panel = self.sweep.getPanelIrradiance(self.parameters['PVArray'].getAngle(), start, stop)
+                solarOutput = numpy.where(panel['sunny'], panel['panelIrradiance'] * panelRating * panelNum / 1000, 0)
+
+                moments[start:stop, 0] = panel['sunny'].sum(axis=1)
+                power = solarOutput.copy()
+                for j in range(1, OUTPUT_POLYNOMIAL_DEGREE + 1):
+                    moments[start:stop, j] = power.sum(axis=1)
+                    power *= solarOutput
+
+            self.moments = moments
+
+        return self.moments
+
+    def sampleInputs(self):
+        ''' Samples the inputs of every realisation. Returns a dictionary of arrays with one row per realisation, the
+        'temperature' being (realisations x 12) monthly temperatures. Inputs without a distribution use the values
+        of the simulation '''
+        n = self.numRealisations
+        financial = self.parameters['Financial']
+        distributions = self.distributions
+
+        temperature = numpy.array([self.parameters['Site'].getTemperature(month) for month in range(1, 13)], dtype=float)
+        samples = {'temperature' : numpy.tile(temperature, (n, 1)),
+                   'degradationRate' : numpy.repeat(float(self.parameters['PVPanel'].getDegradationRate()), n),
+                   'powerPrice' : numpy.repeat(float(financial.getPowerPrice().getAmount()), n),
+                   'interestRate' : numpy.repeat(float(financial.interestRate), n)}
+
+        if 'temperature' in distributions:
+            samples['temperature'] += distributions['temperature'].sample(self.randomState, (n, 12))
+
+        for name in ['degradationRate', 'powerPrice', 'interestRate']:
+            if name in distributions:
+                samples[name] = distributions[name].sample(self.randomState, n)
+
+        return samples
+
+    def getOutputPolynomials(self, temperature):
+        ''' Returns the coefficients of the AC output to the grid as a polynomial of the solar output, for each
+        realisation and month given (realisations x 12) temperatures. Follows the losses in calcElectricalOutput. The
+        coefficients are returned as a (OUTPUT_POLYNOMIAL_DEGREE + 1 x realisations x 12) array '''
+        calcCableResistance = SolarCalculator.Simulation.calcCableResistance
+
+        solarVoltage = self.parameters['PVArray'].getVoltage()
+        InvEff = self.parameters['Inverter'].getEfficiency()
+        InvPowerFactor = self.parameters['Inverter'].getPowerFactor()
+        InvOutVolt = self.parameters['Inverter'].getVoltage()
+        TxEff = self.parameters['Transformer'].getEfficiency()
+        TxOutVolt = self.parameters['Transformer'].getVoltage()
+
+        # Resistances of the cables for each realisation and month
+        DCresistance = calcCableResistance(self.parameters['DCCable'], temperature)
+        AC1TotalResistance = calcCableResistance(self.parameters['AC1Cable'], temperature) / self.parameters['AC1Cable'].getStrandNum()
+        totalResistance = calcCableResistance(self.parameters['AC2Cable'], temperature) / self.parameters['AC2Cable'].getStrandNum()
+
+        # Each stage loses the square of its input times a factor
+        solarOutput = numpy.zeros(temperature.shape + (2,))
+        solarOutput[..., 1] = 1
+
+        DCoutput = polySubtractSquare(solarOutput, 2 * DCresistance / solarVoltage ** 2)
+        AC1Output = polySubtractSquare(DCoutput * InvEff, AC1TotalResistance / (InvPowerFactor * InvOutVolt) ** 2)
+        AC2Output = polySubtractSquare(AC1Output * TxEff, totalResistance / (InvPowerFactor * TxOutVolt) ** 2)
+
+        return numpy.ascontiguousarray(numpy.rollaxis(AC2Output, -1))
+
+    def calcEnergy(self, samples, polynomials, start, stop):
+        ''' Returns the electrical energy (kWh) of each realisation for the days from start to stop, as a
+        (realisations x days) array '''
+        dates = self.days[start:stop]
+        moments = self.getSolarOutputMoments()[start:stop]
+        monthIndex = numpy.array([date.month - 1 for date in dates])
+        currentSimDay = numpy.array([(date - self.parameters['start']).days + 1 for date in dates], dtype=float)
+
+        # Degradation of the panels for each realisation and day
+        degradation = 1 - ((samples['degradationRate'][:, numpy.newaxis] / 100.0) / 365.0) * currentSimDay
+
+        # Sum the coefficient x degradation^j x moment terms using Horner's method, working in place
+        output = polynomials[OUTPUT_POLYNOMIAL_DEGREE].take(monthIndex, axis=1)
+        output *= moments[:, OUTPUT_POLYNOMIAL_DEGREE]
+        for j in range(OUTPUT_POLYNOMIAL_DEGREE - 1, 0, -1):
+            output *= degradation
+            term = polynomials[j].take(monthIndex, axis=1)
+            term *= moments[:, j]
+            output += term
+        output *= degradation
+
+        return output * (self.timestepMins / 60.0) / SolarCalculator.Simulation.POWER_OUTPUT_DIVISORS['electricalEnergy']
+
+    def run(self, exceedanceLevels=DEFAULT_EXCEEDANCE_LEVELS):
+        ''' Runs the realisations and returns a dictionary of the results.
+
+        'electricalEnergy' (kWh) and 'loanValue' (base currency) hold the daily bands, and 'totalEnergy' (kWh),
+        'finalLoanValue' (base currency) and 'loanPayoffDay' (days from the start, inf if it isn't paid off) hold the
+        estimates for the whole simulation. Each is a dictionary of {'P90' : values, ...} for the exceedance levels.
+        'realisations' holds the sampled inputs and the totals of each realisation. '''
+        numDays = len(self.days)
+        n = self.numRealisations
+        financial = self.parameters['Financial']
+
+        samples = self.sampleInputs()
+        polynomials = self.getOutputPolynomials(samples['temperature'])
+
+        # Financial values in US dollars, as in the float financial engine
+        loan = numpy.repeat(self.simulation.getInitialLoan(), n)
+        dailyExpenses = financial.getDailyMaintenance().getAmount()
+        if 'interestRate' in self.distributions:
+            dailyInterest = 1 + samples['interestRate'] / (365 * 100)
+        else:
+            dailyInterest = (1 + financial.interestRate/(365*100))     # The same as the financial simulation
+        toBaseCurrency = financial.getCurrencyExchange().getRate('USD', financial.getBaseCurrency())
+
+        # Percentiles of the daily results for each exceedance level
+        energyPercentiles = [getExceedancePercentile(level, True) for level in exceedanceLevels]
+        loanPercentiles = [getExceedancePercentile(level, False) for level in exceedanceLevels]
+        energyBands = numpy.empty((len(exceedanceLevels), numDays))
+        loanBands = numpy.empty((len(exceedanceLevels), numDays))
+
+        totalEnergy = numpy.zeros(n)
+        loanPayoffDay = numpy.repeat(numpy.inf, n)
+
+        # Work through the days in blocks, carrying the loan on from one block to the next
+        blockDays = max(MAX_BLOCK_ELEMENTS // n, 1)
+        for start in range(0, numDays, blockDays):
+            stop = min(start + blockDays, numDays)
+
+            energy = self.calcEnergy(samples, polynomials, start, stop)
+            totalEnergy += energy.sum(axis=1)
+
+            loanValue = numpy.empty_like(energy)
+            for i in range(stop - start):
+                dailyRevenue = samples['powerPrice'] * energy[:, i]
+                loan += dailyExpenses
+                loan -= dailyRevenue
+                loan = numpy.where(loan > 0, loan * dailyInterest, loan)
+                loanValue[:, i] = loan
+
+            # Day that each realisation first pays off its loan
+            paidOff = (loanValue <= 0).any(axis=1) & numpy.isinf(loanPayoffDay)
+            loanPayoffDay[paidOff] = start + (loanValue[paidOff] <= 0).argmax(axis=1)
+
+            # Percentiles across the realisations, transposed so each day's values are together in memory
+            energyBands[:, start:stop] = numpy.percentile(energy.T.copy(), energyPercentiles, axis=1)
+            loanBands[:, start:stop] = numpy.percentile(loanValue.T.copy(), loanPercentiles, axis=1) * toBaseCurrency
+
+        finalLoanValue = loan * toBaseCurrency
+
+        def byLevel(values):
+            ''' Returns a dictionary of {'P90' : value, ...} for the rows of values '''
+            return dict(('P%g' % level, value) for level, value in zip(exceedanceLevels, values))
+
+        def estimates(values, percentiles, interpolation='linear'):
+            ''' Returns the P values of the realisations '''
+            return byLevel(numpy.percentile(values, percentiles, interpolation=interpolation))
+
+        samples.update({'totalEnergy' : totalEnergy, 'finalLoanValue' : finalLoanValue, 'loanPayoffDay' : loanPayoffDay})
+
+        return {
+            'days' : self.days,
+            'baseCurrency' : financial.getBaseCurrency(),
+            'numRealisations' : n,
+            'electricalEnergy' : byLevel(energyBands),
+            'loanValue' : byLevel(loanBands),
+            'totalEnergy' : estimates(totalEnergy, energyPercentiles),
+            'finalLoanValue' : estimates(finalLoanValue, loanPercentiles),
+            'loanPayoffDay' : estimates(loanPayoffDay, loanPercentiles, 'nearest'),
+            'realisations' : samples
+        }
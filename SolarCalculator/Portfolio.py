@@ -0,0 +1,490 @@
+'''@package Portfolio.py
+
+Simulates portfolios of solar farms. Each site of a portfolio is an ordinary Simulation with its own assets, dates and
+timestep, but rather than every simulation starting its own threads, the days of all the sites are split into jobs
+that are run on one pool of worker threads shared by the whole portfolio. The jobs are handed out by a PowerScheduler
+the same way the jobs of a single simulation are, so the number of threads stays the same however many sites there
+are, and a thread that runs out of work steals jobs from the others. If the sites ask for the processes backend the
+jobs are run on one pool of worker processes shared by the whole portfolio instead, which is sent the parameters of
+every site once when it starts.
+
+Sites at identical coordinates with the same timestep have identical solar geometry on the days they have in common,
+so the vectorised engine works out each of those days once and shares it between the jobs of the sites, even if
+they start on different dates. The threaded engine works out the position of the sun itself as it goes, so its sites
+don't share any geometry.
+
+The results of each site are the same as if it had been simulated on its own. The daily energy, power and finances of
+the sites are also added up into totals for the portfolio, with the finances converted to the portfolio's currency.
+
+Usage example:
+>>> portfolio = loadPortfolio(['tonga.json', 'fiji.json', 'samoa.json'], numWorkers=8)
+>>> portfolio.runPower()
+>>> powerResults = portfolio.getPowerResults()
+>>> powerResults['sites']['fiji']['electricalEnergy']     # Daily energy of one site (kWh)
+>>> powerResults['total']['electricalEnergy']             # Daily energy of the whole portfolio (kWh)
+>>> portfolio.runFinancial()
+>>> financialResults = portfolio.getFinancialResults()
+'''
+
+# Import system modules
+import os
+import sys
+import math
+import datetime
+import threading
+import collections
+import multiprocessing
+
+# Import NumPy
+import numpy
+
+# Import the simulation modules
+import SolarCalculator.Simulation
+import SolarCalculator.Scenario
+
+# Import the utility modules
+import SolarCalculator.Utils.ReverseGeocode
+
+# --------------------------------------------------------------------------------------------------------------------
+# CONSTANTS
+# --------------------------------------------------------------------------------------------------------------------
+
+# Daily power outputs that are added up over the sites of a portfolio. The peak power of each site isn't, as the
+# sites don't peak at the same time
+PORTFOLIO_POWER_FIELDS = ('electricalEnergy', 'averagePower')
+
+# Daily financial outputs that are added up over the sites of a portfolio. These are running totals, so after a site's
+# finish date its last value is carried on to the end of the portfolio
+PORTFOLIO_FINANCIAL_FIELDS = ('netAssetValue', 'loanValue', 'accumulativeRevenue')
+
+# Parameters of the sites of the portfolio a worker process is simulating, see initPortfolioProcess
+PROCESS_PORTFOLIO = None
+
+# --------------------------------------------------------------------------------------------------------------------
+# FUNCTIONS
+# --------------------------------------------------------------------------------------------------------------------
+
+def loadPortfolio(filenames, numWorkers=None, baseCurrency='USD', **simulationOptions):
+    ''' Loads a portfolio from a list of scenario files (see Scenario.py), one site per file named after the file. The
+    countries of the sites that don't give one are looked up together, so each distinct location is only looked up
+    once. Any keyword arguments are passed on to each Simulation. '''
+    scenarios = [SolarCalculator.Scenario.loadScenario(filename) for filename in filenames]
+
+    # Look up the countries of all the sites at once. A site that isn't found is left to createSimulation, which
+    # raises the error
+    missing = [scenario for scenario in scenarios if scenario[1].get('countryCode') is None]
+    codes, errors = SolarCalculator.Utils.ReverseGeocode.get_country_codes(
+        [inputParameters['siteLatitude'] for inputParameters, optionalInputParameters in missing],
+        [inputParameters['siteLongitude'] for inputParameters, optionalInputParameters in missing])
+
+    for (inputParameters, optionalInputParameters), code in zip(missing, codes):
+        if code:
+            optionalInputParameters['countryCode'] = code
+
+    sites = []
+    for filename, (inputParameters, optionalInputParameters) in zip(filenames, scenarios):
+        name = os.path.splitext(os.path.basename(filename))[0]
+        simulation = SolarCalculator.Scenario.createSimulation(inputParameters, optionalInputParameters, **simulationOptions)
+        sites.append((name, simulation))
+
+    return Portfolio(sites, numWorkers, baseCurrency)
+
+
+def initPortfolioProcess(sites):
+    ''' Initialises a worker process for the processes backend of a portfolio, like Simulation.initSimulationProcess
+    does for a single simulation. sites is a dictionary of {name : (parameters, days, timestep, engine)}, which is
+    sent to each worker process once here rather than with every chunk of work'''
+    global PROCESS_PORTFOLIO
+    PROCESS_PORTFOLIO = sites
+
+
+def simulatePortfolioChunk(jobs):
+    ''' Runs the power flow simulation for a chunk of (portfolio job, site name, site job) tuples in a worker process,
+    using the parameters the process was initialised with. Returns a list of (portfolio job, site name, site job, 
+    results) tuples'''
+    results = []
+    for job, name, siteJob in jobs:
+        parameters, days, timestep_mins, engine = PROCESS_PORTFOLIO[name]
+        results.append((job, name, siteJob, SolarCalculator.Simulation.simulateJob(siteJob, parameters, days, 
+                                                                                    timestep_mins, engine)))
+    return results
+
+# --------------------------------------------------------------------------------------------------------------------
+# PORTFOLIO THREAD
+# --------------------------------------------------------------------------------------------------------------------
+
+class thread_SimulatePortfolio(threading.Thread):
+    '''Thread to simulate the power flow of the sites of a portfolio.
+
+    Gets jobs from the portfolio's PowerScheduler and runs each one for the site it belongs to, handing the results
+    to that site's Simulation. Terminates when the scheduler has no more jobs left, or if the simulation fails'''
+
+    def __init__(self, portfolio, worker):
+        ''' Intantiates a portfolio simulation thread'''
+        threading.Thread.__init__(self)
+        self.portfolio = portfolio
+        self.worker = worker
+
+    def run(self):
+        '''' Method thats invoked to run the thread.'''
+        while True:
+
+            # Job of the portfolio, None when there are no jobs left
+            job = self.portfolio.scheduler.getJob(self.worker)
+            if job is None:
+                return
+
+            # Pass any error on to the portfolio so it can be raised when the results are asked for
+            name, siteJob = self.portfolio.jobSites[job]
+            try:
+                self.portfolio.simulateSiteJob(name, siteJob)
+            except:
+                self.portfolio.powerJobFailed(sys.exc_info())
+                return
+
+            # Tick the job off
+            self.portfolio.scheduler.jobDone(job)
+
+# --------------------------------------------------------------------------------------------------------------------
+# PORTFOLIO OBJECTS
+# --------------------------------------------------------------------------------------------------------------------
+
+class SharedSolarGeometry(object):
+    ''' Solar geometry shared between the jobs of the sites of a portfolio.
+
+    The geometry is stored by day, keyed by the coordinates, timestep and date like the tables of a
+    SolarEphemerisCache, so jobs share the days they have in common however the days of their sites are split into
+    jobs. Before the simulation starts the portfolio registers the days each job will ask for. The first job to ask
+    for a day works it out while any others asking for the same day wait, and the day is dropped once the last job
+    that registered for it has taken it, so only the days that are in use are held in memory. It has the same
+    getGeometry method as a SolarEphemerisCache, so it's given to the jobs in its place.'''
+
+    def __init__(self):
+        ''' Initialises an empty store '''
+        self.entries = {}
+        self.lock = threading.Lock()
+        self.numCalculated = 0          # Number of days of geometry that have been worked out
+
+    def getKey(self, lat, lng, date, timestepMins):
+        ''' Returns the key the geometry of the given site, date and timestep is stored by '''
+        return (lat, lng, float(timestepMins), date)
+
+    def register(self, lat, lng, dates, timestepMins):
+        ''' Registers a job that will ask for the geometry of the given site, dates and timestep '''
+        with self.lock:
+            for date in dates:
+                key = self.getKey(lat, lng, date, timestepMins)
+                if key not in self.entries:
+                    self.entries[key] = {'ready' : threading.Event(), 'claimed' : False, 'geometry' : None, 'uses' : 0}
+                self.entries[key]['uses'] += 1
+
+    def getGeometry(self, lat, lng, dates, timestepMins):
+        ''' Returns a tuple of (azimuth, altitude, irradiance) arrays shaped (days x steps) for the given dates. '''
+        if not dates:
+            return SolarCalculator.Simulation.calcSolarGeometry(lat, lng, dates, timestepMins)
+
+        keys = [self.getKey(lat, lng, date, timestepMins) for date in dates]
+
+        # Claim the days that no other job has started working out. Days that weren't registered aren't shared
+        with self.lock:
+            entries = [self.entries.get(key) for key in keys]
+            claimed = [i for i, entry in enumerate(entries) if entry is None or not entry['claimed']]
+            for i in claimed:
+                if entries[i] is not None:
+                    entries[i]['claimed'] = True
+
+        # Work out the claimed days all at once. If it fails the jobs waiting for them work them out themselves
+        days = [None] * len(dates)
+        if claimed:
+            geometry = None
+            try:
+                geometry = SolarCalculator.Simulation.calcSolarGeometry(lat, lng, [dates[i] for i in claimed], 
+                                                                        timestepMins)
+            finally:
+                for row, i in enumerate(claimed):
+                    if geometry is not None:
+                        days[i] = tuple(x[row] for x in geometry)
+                    if entries[i] is not None:
+                        entries[i]['geometry'] = days[i]
+                        entries[i]['ready'].set()
+
+        # Wait for the days that other jobs are working out
+        for i, entry in enumerate(entries):
+            if days[i] is None:
+                entry['ready'].wait()
+                days[i] = entry['geometry']
+                if days[i] is None:
+                    geometry = SolarCalculator.Simulation.calcSolarGeometry(lat, lng, [dates[i]], timestepMins)
+                    days[i] = tuple(x[0] for x in geometry)
+
+        # Drop each day once every job that registered for it has taken it
+        with self.lock:
+            self.numCalculated += len(claimed)
+            for key, entry in zip(keys, entries):
+                if entry is not None:
+                    entry['uses'] -= 1
+                    if entry['uses'] == 0:
+                        del self.entries[key]
+
+        return tuple(numpy.array([day[x] for day in days]) for x in range(3))
+
+
+
+class Portfolio(object):
+    ''' A portfolio of solar farm sites, each one a Simulation, that are simulated on one shared pool of threads or
+    processes '''
+
+    def __init__(self, sites, numWorkers=None, baseCurrency='USD', backend=None):
+        ''' Initialises a portfolio of the given sites, either a list of (name, Simulation) tuples or a dictionary of
+        {name : Simulation}. The power simulations of all the sites run on numWorkers threads (one per core if not
+        given) rather than on the threads of each simulation. The financial totals are given in the base currency.
+
+        The backend is the one the sites were created with unless it's given. With BACKEND_PROCESSES the sites run on
+        numWorkers worker processes instead of threads. The sites must all ask for the same backend, as the jobs of 
+        every site run on the same pool.'''
+        if isinstance(sites, dict):
+            sites = sorted(sites.items())
+
+        self.names = [name for name, simulation in sites]
+        if len(set(self.names)) != len(self.names):
+            raise ValueError("The names of the sites in a portfolio must be unique")
+
+        if backend is None:
+            backends = set(simulation.backend for name, simulation in sites)
+            if len(backends) > 1:
+                raise ValueError("The sites of a portfolio must all use the same simulation backend")
+            backend = backends.pop() if backends else SolarCalculator.Simulation.BACKEND_THREADS
+
+        if backend not in (SolarCalculator.Simulation.BACKEND_THREADS, SolarCalculator.Simulation.BACKEND_PROCESSES):
+            raise ValueError("%s is not a valid simulation backend" % backend)
+
+        self.simulations = dict(sites)
+        self.numWorkers = numWorkers if numWorkers else multiprocessing.cpu_count()
+        self.baseCurrency = baseCurrency
+        self.backend = backend
+
+        # Shared solar geometry, scheduler, threads and process pool, set up when the power simulation is run
+        self.geometry = SharedSolarGeometry()
+        self.scheduler = None
+        self.threads = []
+        self.pool = None
+        self.asyncResults = []
+        self.jobSites = {}              # Site name and job of the site for each job of the portfolio
+        self.jobParameters = {}         # Simulation parameters the jobs of each site are run with
+
+        # Dates covered by the portfolio, from the earliest start to the latest finish of the sites
+        self.start = min(simulation.start for simulation in self.simulations.values()) if sites else None
+        self.finish = max(simulation.finish for simulation in self.simulations.values()) if sites else None
+        self.numDays = (self.finish - self.start).days if sites else 0
+        self.days = [self.start + datetime.timedelta(days=x) for x in range(self.numDays)]
+
+        self.powerResults = {}
+        self.financialResults = {}
+
+    def getSimulation(self, name):
+        ''' Returns the Simulation of the named site '''
+        return self.simulations[name]
+
+
+    def runPower(self):
+        ''' Runs the power flow simulation of every site.
+
+        The jobs of all the sites are handed to one PowerScheduler and run on the portfolio's threads. The jobs of
+        sites at the same coordinates with the same timestep are put in order of their dates, so the jobs that share 
+        days of solar geometry run close together while it's held in memory. With the processes backend the jobs are run on the portfolio's worker processes instead, and the
+        geometry isn't shared as each process works out its own. Sites whose results are in their result cache have
+        no jobs. This method is non blocking.'''
+        SimulationModule = SolarCalculator.Simulation
+        useThreads = self.backend == SimulationModule.BACKEND_THREADS
+
+        # Take the jobs of each site, and group the sites by their solar geometry
+        siteJobs = {}
+        groups = collections.OrderedDict()
+        for name in self.names:
+            simulation = self.simulations[name]
+            siteJobs[name] = simulation.takePowerJobs()
+
+            site = simulation.parameters['Site']
+            key = (site.getLatitude(), site.getLongitude(), float(simulation.simulationTimestepMins))
+            groups.setdefault(key, []).append(name)
+
+            # The vectorised engine takes its geometry from the shared store unless the site has an ephemeris cache.
+            # The store can't be shared between processes
+            parameters = simulation.parameters
+            if (useThreads and simulation.engine == SimulationModule.ENGINE_VECTORISED and 
+                parameters.get('EphemerisCache') is None):
+                parameters = dict(parameters)
+                parameters['EphemerisCache'] = self.geometry
+
+                for start, stop in siteJobs[name]:
+                    self.geometry.register(site.getLatitude(), site.getLongitude(), simulation.days[start:stop],
+                                           simulation.simulationTimestepMins)
+
+            self.jobParameters[name] = parameters
+
+        # Number the days of the sites one after the other so every job of the portfolio is a distinct range of days
+        offsets = {}
+        offset = 0
+        for name in self.names:
+            offsets[name] = offset
+            offset += self.simulations[name].numDays
+
+        # Put the jobs of the sites in each group in order of their first day, costing each job by its number of 
+        # timesteps
+        jobs = []
+        costs = []
+        for names in groups.values():
+            groupJobs = sorted((self.simulations[name].days[siteJob[0]], number, siteJob) 
+                               for number, name in enumerate(names) for siteJob in siteJobs[name])
+
+            for date, number, siteJob in groupJobs:
+                name = names[number]
+                job = (offsets[name] + siteJob[0], offsets[name] + siteJob[1])
+                self.jobSites[job] = (name, siteJob)
+                jobs.append(job)
+                costs.append((siteJob[1] - siteJob[0]) * 1440.0 / self.simulations[name].simulationTimestepMins)
+
+        self.scheduler = SimulationModule.PowerScheduler(jobs, costs, self.numWorkers)
+
+        # Hand the work to the process pool if that backend was chosen
+        if not useThreads:
+            self.__runPowerOnProcesses()
+            return
+
+        # Spawn the threads
+        for i in range(self.numWorkers):
+            simulationThread = thread_SimulatePortfolio(self, i)
+            simulationThread.setDaemon(True)
+            simulationThread.start()
+            self.threads.append(simulationThread)
+
+    def __runPowerOnProcesses(self):
+        ''' Shards the jobs of all the sites into chunks and runs them on a pool of worker processes, the same way 
+        Simulation does for a single simulation. The jobs aren't marked as done until their chunk comes back from a
+        worker, so the progress and the results work the same way as they do with threads'''
+        jobs = self.scheduler.takeAllJobs()
+
+        # Split the jobs into a few chunks per worker so the load stays balanced as the workers finish
+        numChunks = self.numWorkers * SolarCalculator.Simulation.PROCESS_CHUNKS_PER_WORKER
+        chunkSize = max(int(math.ceil(len(jobs) / float(numChunks))), 1)
+
+        # Start the worker processes, they are sent the parameters of every site once when they start
+        sites = dict((name, (self.jobParameters[name], self.simulations[name].days, 
+                             self.simulations[name].simulationTimestepMins, self.simulations[name].engine)) 
+                     for name in self.names)
+        self.pool = multiprocessing.Pool(self.numWorkers, initPortfolioProcess, (sites,))
+
+        for i in range(0, len(jobs), chunkSize):
+            chunk = [(job,) + self.jobSites[job] for job in jobs[i:i + chunkSize]]
+            self.asyncResults.append(self.pool.apply_async(simulatePortfolioChunk, (chunk,),
+                                                           callback=self.__chunkFinished))
+
+        # No more work will be given to the pool
+        self.pool.close()
+
+    def __chunkFinished(self, jobResults):
+        ''' Callback for when a chunk of jobs has been simulated by a worker process. Hands the results of each job to
+        its site and ticks it off in the portfolio's scheduler'''
+        for job, name, siteJob, results in jobResults:
+            self.simulations[name].finishPowerJob(siteJob, results)
+            self.scheduler.jobDone(job)
+
+    def simulateSiteJob(self, name, job):
+        ''' Runs one job of the named site and hands the results to its Simulation '''
+        simulation = self.simulations[name]
+        results = SolarCalculator.Simulation.simulateJob(job, self.jobParameters[name], simulation.days,
+                                                         simulation.simulationTimestepMins, simulation.engine)
+        simulation.finishPowerJob(job, results)
+
+    def powerJobFailed(self, error):
+        ''' Records the sys.exc_info() of a job that failed. This stops the portfolio, and the error is raised when the
+        results of the portfolio or any of its sites are asked for '''
+        self.scheduler.jobFailed(error)
+        for simulation in self.simulations.values():
+            simulation.failPowerJob(error)
+
+    def getPowerProgress(self):
+        ''' Returns the percentage of the days of all the sites that have been simulated, between 0 and 100 '''
+        if self.scheduler is None:
+            return 0.0
+        return self.scheduler.getProgress()
+
+    def getPowerResults(self):
+        ''' Returns the power results of the portfolio. Blocks until the power simulation is finished.
+
+        Returns a dictionary of the power results of each site (see Simulation.getPowerResults) by name under 'sites',
+        and the daily totals of the portfolio under 'total'. The totals are given for every day from the earliest
+        start to the latest finish of the sites, along with the number of sites running on each day.'''
+
+        # Wait for the worker processes if they were used. An error in one of them stops the portfolio and is raised
+        if self.pool is not None:
+            for result in self.asyncResults:
+                try:
+                    result.get()
+                except:
+                    self.powerJobFailed(sys.exc_info())
+                    raise
+            self.pool.join()
+
+        self.scheduler.wait()
+
+        # The threads finish as soon as they find the scheduler is out of jobs
+        for simulationThread in self.threads:
+            simulationThread.join()
+
+        sites = dict((name, self.simulations[name].getPowerResults()) for name in self.names)
+
+        total = {'days' : self.days, 'numSites' : numpy.zeros(self.numDays, dtype=int)}
+        for field in PORTFOLIO_POWER_FIELDS:
+            total[field] = numpy.zeros(self.numDays)
+
+        for name in self.names:
+            simulation = self.simulations[name]
+            start = (simulation.start - self.start).days
+            stop = start + simulation.numDays
+
+            total['numSites'][start:stop] += 1
+            for field in PORTFOLIO_POWER_FIELDS:
+                total[field][start:stop] += sites[name][field]
+
+        self.powerResults = {'sites' : sites, 'total' : total}
+        return self.powerResults
+
+
+    def runFinancial(self):
+        ''' Runs the financial simulation of every site. The power simulation must be complete before this is called.
+        Blocks until complete. '''
+        for name in self.names:
+            self.simulations[name].runFinancial()
+
+        sites = dict((name, self.simulations[name].getFinancialResults()) for name in self.names)
+
+        total = {'days' : self.days, 'baseCurrency' : self.baseCurrency, 'initialCost' : 0.0}
+        for field in PORTFOLIO_FINANCIAL_FIELDS:
+            total[field] = numpy.zeros(self.numDays)
+
+        for name in self.names:
+            simulation = self.simulations[name]
+            start = (simulation.start - self.start).days
+            stop = start + simulation.numDays
+
+            # Convert the results of the site from its own base currency
+            exchange = simulation.parameters['Financial'].getCurrencyExchange()
+            rate = exchange.getRate(sites[name]['baseCurrency'], self.baseCurrency)
+
+            total['initialCost'] += sites[name]['initialCost'] * rate
+            for field in PORTFOLIO_FINANCIAL_FIELDS:
+                values = numpy.asarray(sites[name][field], dtype=float) * rate
+                total[field][start:stop] += values
+
+                # Carry the last value on after the site finishes
+                if len(values):
+                    total[field][stop:] += values[-1]
+
+        self.financialResults = {'sites' : sites, 'total' : total}
+
+    def getFinancialResults(self):
+        ''' Returns the financial results of the portfolio - a dictionary of the financial results of each site (see
+        Simulation.getFinancialResults) by name under 'sites', and the daily totals of the portfolio in its base
+        currency under 'total'. '''
+        return self.financialResults
@@ -0,0 +1,232 @@
+'''@package Scenario.py
+
+Builds simulations from a set of input parameters without any of the GUI. The input parameters use the same keys as
+the input fields in main.py, so the GUI and the batch runner create their simulations in exactly the same way. Scenarios
+can also be loaded from JSON files, which is how simulations are described when running them from the command line.
+
+Example scenario file:
+{
+    "startDate" : "2014-01-01",
+    "endDate" : "2034-01-01",
+    "siteLatitude" : -21.0928,
+    "siteLongitude" : -175.1050,
+    ...
+    "TXCableLength" : null
+}
+'''
+
+# Import system modules
+import datetime
+import json
+
+# Import the simulation modules
+import SolarCalculator.Simulation
+import SolarCalculator.Assets
+
+# Import the utility modules
+import SolarCalculator.Utils.ReverseGeocode
+import SolarCalculator.Utils.AverageTemperatureData
+
+# --------------------------------------------------------------------------------------------------------------------
+# CONSTANTS
+# --------------------------------------------------------------------------------------------------------------------
+
+DATE_FORMAT = '%Y-%m-%d'                    # Format of the start and end dates in scenario files
+
+# Materials that the cables can be made from
+MATERIALS = {}
+MATERIALS['Copper'] = SolarCalculator.Assets.Material(name='Cu', resistivity=1.68e-8, tempCoefficient=3.62e-3)
+MATERIALS['Aluminium'] = SolarCalculator.Assets.Material(name='Al', resistivity=2.82e-8, tempCoefficient=3.9e-3)
+
+# Keys of the input parameters that are optional, None means the parameter is calculated
+OPTIONAL_INPUT_KEYS = ['TXCableLength', 'countryCode']
+
+# Options passed to the Simulation object by default, the same as the GUI uses
+DEFAULT_SIMULATION_OPTIONS = {
+    'numThreads' : 50,
+    'simulationTimestepMins' : 60,
+    'engine' : SolarCalculator.Simulation.ENGINE_VECTORISED,
+    'financialEngine' : SolarCalculator.Simulation.FINANCIAL_ENGINE_FLOAT
+}
+
+# --------------------------------------------------------------------------------------------------------------------
+# EXCEPTIONS
+# --------------------------------------------------------------------------------------------------------------------
+
+class InvalidScenario(Exception):
+    ''' Thrown when a scenario file is missing parameters or has parameters that can't be used '''
+    pass
+
+# --------------------------------------------------------------------------------------------------------------------
+# FUNCTIONS
+# --------------------------------------------------------------------------------------------------------------------
+
+def loadScenario(filename):
+    ''' Loads a scenario from a JSON file and returns a tuple of (inputParameters, optionalInputParameters) which can
+    be passed to createSimulation. The start and end dates are converted to datetime.date objects, and any optional
+    parameters that aren't given are set to None so they're calculated. '''
+
+    # Read the scenario file
+    with open(filename, 'r') as f:
+        try:
+            scenario = json.load(f)
+        except ValueError as e:
+            raise InvalidScenario("%s is not a valid JSON file: %s" % (filename, e))
+
+    # Convert all the keys and string values from unicode to str, the same as the values from the GUI
+    inputParameters = {}
+    for key, value in scenario.items():
+        if isinstance(value, unicode):
+            value = str(value)
+        inputParameters[str(key)] = value
+
+    # Split out the optional parameters
+    optionalInputParameters = {}
+    for key in OPTIONAL_INPUT_KEYS:
+        optionalInputParameters[key] = inputParameters.pop(key, None)
+
+    # Convert the dates
+    for key in ['startDate', 'endDate']:
+        if key not in inputParameters:
+            raise InvalidScenario("%s is missing the %s parameter" % (filename, key))
+        try:
+            inputParameters[key] = datetime.datetime.strptime(inputParameters[key], DATE_FORMAT).date()
+        except (TypeError, ValueError):
+            raise InvalidScenario("%s in %s must be a date formatted as YYYY-MM-DD" % (key, filename))
+
+    # Check the dates are valid
+    if (inputParameters['endDate'] - inputParameters['startDate']).days <= 0:
+        raise InvalidScenario("The end date in %s must be after the start date" % filename)
+
+    return inputParameters, optionalInputParameters
+
+
+def createSimulation(inputParameters, optionalInputParameters, **simulationOptions):
+    ''' Takes the input parameters and instantiates the necessary components to run a simulation.
+
+    Firstly a reverse geocode is run to check the country that the simulation is in is valid, unless the country code
+    is given as an optional parameter. Using the information of the country we can load the historic temperature data
+    for this country. If the length of the transmission line needs to be calculated we do this using the latitude and
+    longitude of the grid connection point. Then all the objects for the simulation are created and a simulation object
+    is instantiated. This is then returned so it can be run. Any keyword arguments are passed on to the Simulation,
+    overriding DEFAULT_SIMULATION_OPTIONS. '''
+
+    # --------------------------------------------------------------------------------------------
+    # REVERSE GEO CODING
+    # --------------------------------------------------------------------------------------------
+
+    # Get the site information from the Reverse Geocode
+    code = optionalInputParameters.get('countryCode')
+    if code is None:
+        code = SolarCalculator.Utils.ReverseGeocode.get_country_code(inputParameters['siteLatitude'], inputParameters['siteLongitude'])
+
+    # Throw an exception if the GeoCode Fails
+    if code == False:
+        raise SolarCalculator.Utils.ReverseGeocode.CountryNotFound("Country Not Found at Given Lat, Long")
+
+
+
+    # --------------------------------------------------------------------------------------------
+    # LOAD DATA FROM FILES
+    # --------------------------------------------------------------------------------------------
+
+    # Load the temperature data
+    temperature = SolarCalculator.Utils.AverageTemperatureData.TEMPERATURE_DATA[code]['PAST']
+
+
+
+    # --------------------------------------------------------------------------------------------
+    # CALCULATE OPTIONAL PARAMETERS
+    # --------------------------------------------------------------------------------------------
+
+    # If the user specified for the transmission line length to be calculated, then calculate it
+    if optionalInputParameters.get('TXCableLength') == None:
+        TXCableLength = SolarCalculator.Simulation.calcLength(inputParameters['siteLatitude'], inputParameters['siteLongitude'],
+                                   inputParameters['siteGridLatitude'], inputParameters['siteGridLongitude'])
+    else:
+        TXCableLength = optionalInputParameters['TXCableLength']
+
+
+
+    # --------------------------------------------------------------------------------------------
+    # CREATE SIMULATION OBJECTS
+    # --------------------------------------------------------------------------------------------
+
+    # Instantiate solar farm objects
+    panel = SolarCalculator.Assets.PVPanel(voltage=inputParameters['panelVoltage'],
+                    rating=inputParameters['panelRating'],
+                    degradationRate=inputParameters['panelDegradation'],
+                    area=inputParameters['panelArea'],
+                    cost=inputParameters['panelCost'],
+                    currency=inputParameters['panelCurrency'],
+                    depRate=inputParameters['panelDepreciation'])
+
+    module = SolarCalculator.Assets.PVModule(panelType=panel,
+                    panelNum=inputParameters['siteNumPanels'])
+
+    array = SolarCalculator.Assets.PVArray(moduleType=module,
+                    moduleNum=inputParameters['siteNumModules'],
+                    arrayAngle=inputParameters['panelAngle'])
+
+    dcCable = SolarCalculator.Assets.DCCable(diameter=inputParameters['DCCableDiameter'],
+                    material=MATERIALS[inputParameters['DCCableMaterial']],
+                    length=inputParameters['DCCableLength'],
+                    costPerMeter=inputParameters['DCCableCost'],
+                    depRate=inputParameters['DCCableDepreciation'])
+
+    ac1Cable = SolarCalculator.Assets.AC1Cable(strandNum=inputParameters['ACCableNumStrands'],
+                    diameter=inputParameters['ACCableDiameter'],
+                    material=MATERIALS[inputParameters['ACCableMaterial']],
+                    length=inputParameters['ACCableLength'],
+                    costPerMeter=inputParameters['ACCableCost'],
+                    depRate=inputParameters['ACCableDepreciation'])
+
+    ac2Cable = SolarCalculator.Assets.AC2Cable(strandNum=inputParameters['TXCableNumStrands'],
+                    diameter=inputParameters['TXCableDiameter'],
+                    material=MATERIALS[inputParameters['TXCableMaterial']],
+                    length=TXCableLength,
+                    costPerMeter=inputParameters['TXCableCost'],
+                    depRate=inputParameters['TXCableDepreciation'])
+
+    inverter = SolarCalculator.Assets.Inverter(powerFactor=inputParameters['inverterPowerFactor'],
+                    efficiency=inputParameters['inverterEfficiency'],
+                    voltage=inputParameters['inverterOutputVoltage'],
+                    cost=inputParameters['inverterCost'] ,
+                    depRate=inputParameters['inverterDepreciation'])
+
+    transformer = SolarCalculator.Assets.Transformer(voltage=inputParameters['transformerOutputVoltage'],
+                    efficiency=inputParameters['transformerEfficiency'] ,
+                    VARating=inputParameters['transformerRating'] ,
+                    cost=inputParameters['transformerCost'] ,
+                    depRate=inputParameters['transformerDepreciation'])
+
+    circuitBreaker = SolarCalculator.Assets.CircuitBreaker(cost=inputParameters['circuitBreakerCost'])
+
+    site = SolarCalculator.Assets.Site(transformerNum=inputParameters['siteNumTransformers'],
+                    arrayNum=inputParameters['siteNumArrays'],
+                    latitude=inputParameters['siteLatitude'],
+                    longitude=inputParameters['siteLongitude'],
+                    circuitBreakerNum=inputParameters['siteNumCircuitBreakers'],
+                    inverterNum=inputParameters['siteNumInverters'],
+                    temperature=temperature,
+                    landPrice=inputParameters['siteCost'],
+                    currency=inputParameters['siteCurrency'],
+                    landAppRate=inputParameters['siteAppreciation'])
+
+    financial = SolarCalculator.Assets.Financial(maintenance=inputParameters['financialMaintenance'],
+                    miscExpenses=inputParameters['financialMiscExpenses'],
+                    interestRate =inputParameters['financialInterestRate'],
+                    powerPrice = inputParameters['financialPowerPrice'],
+                    baseCurrency=inputParameters['financialBaseCurrency'])
+
+    # Combine the default simulation options with any that were given
+    options = dict(DEFAULT_SIMULATION_OPTIONS)
+    options.update(simulationOptions)
+
+    # Create the simulation object
+    simulation = SolarCalculator.Simulation.Simulation(start=inputParameters['startDate'], finish=inputParameters['endDate'],
+                    PVPanel=panel, PVModule=module, PVArray=array,
+                    DCCable=dcCable, Inverter=inverter, AC1Cable=ac1Cable, Transformer=transformer,
+                    AC2Cable=ac2Cable, CircuitBreaker=circuitBreaker, Site=site, Financial=financial, **options)
+
+    return simulation
@@ -11,15 +11,64 @@ Date: 20/09/2013
 '''
 
 # Import system modules
-import operator
-import Queue
+import sys
+import collections
 import threading
+import multiprocessing
 import math
 import datetime
+import os
+import hashlib
+
+# Import NumPy for the vectorised power flow engine
+import numpy
 
 # Import PySolar for irradiance calculations
 import Pysolar
 
+# Import the NumPy version of the PySolar functions
+import SolarCalculator.Utils.VectorisedPysolar
+
+# Import the currency exchange module for hashing the costs of the assets
+import SolarCalculator.Utils.PyExchangeRates
+
+
+# --------------------------------------------------------------------------------------------------
+# CONSTANTS
+# --------------------------------------------------------------------------------------------------
+
+ENGINE_THREADED = 'threaded'        # Simulates each day in turn, one timestep at a time
+ENGINE_VECTORISED = 'vectorised'    # Simulates blocks of days at once using NumPy arrays
+VECTORISED_BLOCK_DAYS = 31          # Number of days simulated at once by the vectorised engine
+
+FINANCIAL_ENGINE_MONEY = 'money'    # Runs the financial simulation with PyExchangeRates Money objects
+FINANCIAL_ENGINE_FLOAT = 'float'    # Runs the financial simulation on plain floats in US dollars
+FINANCIAL_ENGINE_VECTORISED = 'vectorised'  # Runs the financial simulation on NumPy arrays in US dollars
+LOAN_BLOCK_DAYS = 64                # Number of days of the loan worked out at once by calcLoanSchedule to begin with
+LOAN_MAX_BLOCK_DAYS = 4096          # Most days of the loan worked out at once, the block doubles up to this size
+
+# Outputs of the power simulation for each day, and the amount each one is divided by when it's stored
+POWER_OUTPUT_FIELDS = ('electricalEnergy', 'electricalEffciency', 'totalEffciency', 'averagePower', 'sunnyTime',
+                       'peakCurrent_DC', 'peakCurrent_AC1', 'peakCurrent_AC2', 'powerMax')
+POWER_OUTPUT_DIVISORS = {'electricalEnergy' : 1000, 'averagePower' : 1000, 'powerMax' : 1000} # Converts to kWh and kW
+
+BACKEND_THREADS = 'threads'         # Runs the power simulation on a pool of threads within this process
+BACKEND_PROCESSES = 'processes'     # Runs the power simulation on a pool of worker processes, one per core
+PROCESS_CHUNKS_PER_WORKER = 4       # Number of chunks of work each worker process is given to balance the load
+SCHEDULER_JOBS_PER_WORKER = 8       # Number of jobs the threaded engine splits the days into for each worker thread
+NIGHT_STEP_COST = 0.5               # Cost of simulating a timestep at night relative to a sunny one
+
+EPHEMERIS_REFERENCE_YEAR = 2012    # Leap year used to hold one year of solar geometry so every calendar day has an entry
+EPHEMERIS_FILE_FORMAT = 'ephemeris_%.4f_%.4f_%g.npz'   # File name of a cached ephemeris given lat, lng and timestep
+
+RESULT_CACHE_VERSION = 2                # Change this when the simulation model changes so old cached results are ignored
+RESULT_CACHE_FILE_FORMAT = 'results_%s.npz'     # File name of cached simulation results given the hash of the inputs
+RESULT_CACHE_MAX_BYTES = 500 * 1024 * 1024      # Default size limit of the result cache before old results are removed
+FINANCIAL_OUTPUT_FIELDS = ('netAssetValue', 'loanValue', 'accumulativeRevenue')  # Daily financial results that are cached
+
+# Parameters of the simulation being run by a worker process, set by initSimulationProcess when the process starts
+PROCESS_SIMULATION = None
+
 
 # --------------------------------------------------------------------------------------------------
 # UTILITY FUNCTIONS
@@ -58,308 +107,1033 @@ def calcCableResistance(cable, temperature):
     return resistance
 
 
-# --------------------------------------------------------------------------------------------------
-# SIMULATION THREAD
-# --------------------------------------------------------------------------------------------------
+def calcCableResistanceTable(parameters):
+    ''' Calculates the resistance of each cable in the farm for every month of the year.
 
-class thread_SimulateDay(threading.Thread):
-    '''Thread to simulate the power flow over a given day.
+    The resistance of a cable only changes with the monthly temperature of the site, so it's worked out once per
+    simulation rather than at every timestep. Returns a dictionary with lists of 12 resistances (January to December)
+    for the 'DCCable', and the total resistance of all the strands for the 'AC1Cable' and 'AC2Cable'.'''
+    resistances = {'DCCable' : [], 'AC1Cable' : [], 'AC2Cable' : []}
 
-    Takes an input in the form of a queue of SimulationDay objects, gets a day from the queue, runs the simulation 
-    for that day and stores the result inside the SimulationDay object before pushing it to the output queue. Terminates
-    when there are not more days left in the input queue'''
+    for month in range(1, 13):
+        temperature = parameters['Site'].getTemperature(month)
 
-    def __init__(self, inputQueue, outputQueue, timestep_mins):
-        ''' Intantiates a simulation thread'''
-        threading.Thread.__init__(self)
-        self.timestep_mins = timestep_mins
-        self.inputQueue = inputQueue
-        self.outputQueue = outputQueue
-    
-    def run(self):
-        '''' Method thats invoked to run the thread.
+        resistances['DCCable'].append(calcCableResistance(parameters['DCCable'], temperature))
+        resistances['AC1Cable'].append(calcCableResistance(parameters['AC1Cable'], temperature) / parameters['AC1Cable'].getStrandNum())
+        resistances['AC2Cable'].append(calcCableResistance(parameters['AC2Cable'], temperature) / parameters['AC2Cable'].getStrandNum())
 
-        The thread will keep running until the input queue is empty, at which point it will terminate.
-        All the key simulation code is in here and is annotated to show what it does'''
-        
-        # Keep running the thread indefinitly until it terminates itself when it runs out of stuff to do
-        while True:
+    return resistances
 
-            # Check if there are any more days to simulate, if not then terminate
-            if self.inputQueue.empty():
-                return
 
-            # Day that is being simulated
-            simDay = self.inputQueue.get()
-            year = simDay.date.year
-            month = simDay.date.month
-            day = simDay.date.day
+def calcSolarGeometry(lat, lng, dates, timestepMins):
+    ''' Calculates the sun azimuth (degrees), altitude (degrees) and direct irradiance (W/m^2) at every timestep
+        of the given dates. Returns a tuple of (days x steps) arrays. '''
+    minutes = numpy.arange(int(1440.00 / float(timestepMins))) * float(timestepMins)
 
-            # Time steps
-            SIMULATION_TIMESTEP_MINS = float(self.timestep_mins)
-            MINS_PER_DAY = 1440.00 # Make it a float so it divides nicely
-            STEPS_PER_DAY = int(MINS_PER_DAY / SIMULATION_TIMESTEP_MINS)
-            
+    azimuth, altitude = SolarCalculator.Utils.VectorisedPysolar.get_sun_position(lat, lng, dates, minutes)
+    dayOfYear = SolarCalculator.Utils.VectorisedPysolar.get_day_of_year(dates)
+    irradiance = SolarCalculator.Utils.VectorisedPysolar.get_radiation_direct(dayOfYear, altitude)
 
-            # --------------------------------------------------------------------------------------------------
-            # SIMULATION PARAMETERS
-            # --------------------------------------------------------------------------------------------------
-            
-            totalArea = simDay.parameters['Site'].getArrayNum() * simDay.parameters['PVArray'].getArea()
-            panelNum = simDay.parameters['PVModule'].getPanelNum() * simDay.parameters['PVArray'].getModuleNum() * simDay.parameters['Site'].getArrayNum()
-            
-            solarVoltage = simDay.parameters['PVArray'].getVoltage() 
-            panelDegRate = simDay.parameters['PVPanel'].getDegradationRate()
-            panelAngle = simDay.parameters['PVArray'].getAngle()
-            panelRating = simDay.parameters['PVPanel'].getRating() 
-            
-            DCcable = simDay.parameters['DCCable']
-            
-            InvEff = simDay.parameters['Inverter'].getEfficiency()
-            InvPowerFactor = simDay.parameters['Inverter'].getPowerFactor()
-            InvOutVolt = simDay.parameters['Inverter'].getVoltage()
-            
-            TxEff = simDay.parameters['Transformer'].getEfficiency()
-            TxOutVolt = simDay.parameters['Transformer'].getVoltage()
+    return (azimuth, altitude, irradiance)
 
-            AC1Cable = simDay.parameters['AC1Cable']
-            AC1StrandNum = simDay.parameters['AC1Cable'].getStrandNum()
-            
-            AC2Cable = simDay.parameters['AC2Cable']
-            AC2StrandNum = simDay.parameters['AC2Cable'].getStrandNum()
-            
-            lat = simDay.parameters['Site'].getLatitude()
-            lng = simDay.parameters['Site'].getLongitude()
 
-            temperature =  simDay.parameters['Site'].getTemperature(month)
+def calcSunlightHours(lat, dayOfYear):
+    ''' Returns an array of the number of hours of sunlight at the given latitude for each day of the year in the 
+    dayOfYear array. See http://mathforum.org/library/drmath/view/56478.html'''
+    P = numpy.arcsin(0.39795 * numpy.cos(0.2163108 + 2 * numpy.arctan(0.9671396 * numpy.tan(0.00860 * (dayOfYear - 186)))))
+    numerator = math.sin(0.8333 * math.pi / 180) + math.sin(lat * math.pi / 180) * numpy.sin(P)
+    denominator = math.cos(lat * math.pi / 180) * numpy.cos(P)
+    return 24 - (24 / math.pi) * numpy.arccos(numerator / denominator)
 
 
+def estimateDayCosts(lat, dates):
+    ''' Returns an array of the relative cost of simulating each of the dates, used to split the simulation into jobs
+    that take about the same time. Sunny timesteps cost more than ones at night, so winter days are cheaper. '''
+    dayOfYear = numpy.array([date.timetuple().tm_yday for date in dates], dtype=float)
 
-            # Number of days into the simulation this day occurs
-            currentSimDay = (simDay.date - simDay.parameters['start']).days + 1
-            currentDayOfYear = (simDay.date - datetime.date(year, 1, 1)).days + 1
+    # Inside the polar circles there are days without a sunset or sunrise
+    with numpy.errstate(invalid='ignore'):
+        sunnyFraction = numpy.nan_to_num(calcSunlightHours(lat, dayOfYear) / 24.0)
+    sunnyFraction = numpy.clip(sunnyFraction, 0, 1)
 
+    return sunnyFraction + NIGHT_STEP_COST * (1 - sunnyFraction)
 
-            # --------------------------------------------------------------------------------------------------
-            # OUTPUT VARIABLES
-            # --------------------------------------------------------------------------------------------------
 
-            # Running totals for the total output energy effciencies at each timestep
-            energyOutput = 0
-            totalEffciency = 0
-            elecEff = 0
-            sunnyTimeSteps = 0
-            powerRunVal = 0
+def splitJobs(dayCosts, targetCost, offset=0):
+    ''' Splits consecutive days into jobs, each of which is a (start, stop) range of day indexes costing about the 
+    target cost. The indexes start from the given offset. Returns a tuple of (jobs, costs of the jobs) '''
+    jobs = []
+    costs = []
 
-            # Arrays to contain the current values so we can obtain the maximum
-            DCCurrents = []
-            AC1Currents = []
-            AC2Currents = []
-            powerDaily = []
+    start = 0
+    cost = 0.0
+    for i, dayCost in enumerate(dayCosts):
+        cost += dayCost
+        if cost >= targetCost:
+            jobs.append((offset + start, offset + i + 1))
+            costs.append(cost)
+            start = i + 1
+            cost = 0.0
 
+    # The last job takes what's left over
+    if start < len(dayCosts):
+        jobs.append((offset + start, offset + len(dayCosts)))
+        costs.append(cost)
 
+    return jobs, costs
 
-            # --------------------------------------------------------------------------------------------------
-            # TILTED IRRADIANCE CALCULATION
-            # --------------------------------------------------------------------------------------------------
 
-            # Declination angle of the sun
-            argRadians = math.radians((360 * (284 + currentDayOfYear)/ 365.0))
-            delta = 23.45 * math.sin(argRadians)
-            a = 90 - lat + delta
-                
-            # Calculates the irradiance on the panel for a day
-            a_Radians = math.radians(a)
-            panelAngle_rad = math.radians(panelAngle)
+def calcPanelIrradiance(lat, panelAngle, dates, azimuth, irradiance):
+    ''' Works out the irradiance on the tilted panels for a block of days given the sun position and irradiance at each
+    timestep. This only depends on the site and the panel angle, so it can be shared between simulations of different
+    electrical equipment at the same site (see Sweep.py).
 
-            # Check that latitude of the site and assign a panel azimuth accordingly
-            if lat > 0:
-                panelAzimuth = math.radians(180)
-            elif lat <= 0:
-                panelAzimuth = math.radians(0)
+    Every input array is shaped (days x steps). Returns a dictionary of the panel irradiance, which timesteps are sunny,
+    and the per day sunlight hours and sun angle needed by calcElectricalOutput.'''
 
-            # Calculate the amount of sunlight hours in the day
-            # http://mathforum.org/library/drmath/view/56478.html
-            P = math.asin(0.39795 * math.cos(0.2163108 + 2 * math.atan(0.9671396 * math.tan(0.00860 * (currentDayOfYear-186)))))
-            numerator = math.sin(0.8333 * math.pi/180) + math.sin(lat * math.pi/180) * math.sin(P)
-            denominator =  math.cos(lat * math.pi /180) * math.cos(P) 
-            sunlightHours = 24 - (24/math.pi) * math.acos( numerator / denominator )
+    currentDayOfYear = numpy.array([date.timetuple().tm_yday for date in dates], dtype=float)
 
-            
+    # --------------------------------------------------------------------------------------------------
+    # TILTED IRRADIANCE CALCULATION
+    # --------------------------------------------------------------------------------------------------
+
+    # Declination angle of the sun
+    argRadians = numpy.radians((360 * (284 + currentDayOfYear) / 365.0))
+    delta = 23.45 * numpy.sin(argRadians)
+    a = 90 - lat + delta
+
+    a_Radians = numpy.radians(a)[:, numpy.newaxis]
+    panelAngle_rad = math.radians(panelAngle)
+
+    # Check that latitude of the site and assign a panel azimuth accordingly
+    if lat > 0:
+        panelAzimuth = math.radians(180)
+    else:
+        panelAzimuth = math.radians(0)
+
+    # Calculate the amount of sunlight hours in the day
+    sunlightHours = calcSunlightHours(lat, currentDayOfYear)
+
+    # Only the timesteps where the sun is up count towards the outputs
+    sunny = irradiance > 0
 
+    # Factor in the panel angle
+    azimuth_rad = numpy.radians(azimuth)
+    tiltedFactor = numpy.cos(a_Radians) * math.sin(panelAngle_rad) * numpy.cos(panelAzimuth - azimuth_rad) + numpy.sin(a_Radians) * math.cos(panelAngle_rad)
 
-            # --------------------------------------------------------------------------------------------------
-            # SOLAR MODEL
-            # --------------------------------------------------------------------------------------------------
+    return {
+        'panelIrradiance' : irradiance * tiltedFactor,
+        'sunny' : sunny,
+        'sunlightHours' : sunlightHours,
+        'sunAngle' : a
+    }
+
+
+def calcElectricalOutput(parameters, dates, panel, timestepMins):
+    ''' Runs the electrical side of the power flow calculations for a block of days, given the tilted panel irradiance
+    from calcPanelIrradiance. The results are returned as a dictionary of arrays with one value per day, using the same
+    names and units as the outputs returned by simulateDay. Days without any sun are given outputs of zero.'''
+
+    # Time steps
+    SIMULATION_TIMESTEP_MINS = float(timestepMins)
+
+    # --------------------------------------------------------------------------------------------------
+    # SIMULATION PARAMETERS
+    # --------------------------------------------------------------------------------------------------
+
+    totalArea = parameters['Site'].getArrayNum() * parameters['PVArray'].getArea()
+    panelNum = parameters['PVModule'].getPanelNum() * parameters['PVArray'].getModuleNum() * parameters['Site'].getArrayNum()
 
-            # Simulate the irradiance over a day in the increment described by SIMULATION_TIMESTEP_MINS
-            for i in range(STEPS_PER_DAY):
+    solarVoltage = parameters['PVArray'].getVoltage()
+    panelDegRate = parameters['PVPanel'].getDegradationRate()
+    panelRating = parameters['PVPanel'].getRating()
+
+    InvEff = parameters['Inverter'].getEfficiency()
+    InvPowerFactor = parameters['Inverter'].getPowerFactor()
+    InvOutVolt = parameters['Inverter'].getVoltage()
+
+    TxEff = parameters['Transformer'].getEfficiency()
+    TxOutVolt = parameters['Transformer'].getVoltage()
 
-                # Create a datetime to represent the time of day on the given date
-                minutesIntoDay = i * SIMULATION_TIMESTEP_MINS
-                d = datetime.datetime(year, month, day) + datetime.timedelta(minutes=minutesIntoDay)
+    # Per day values as column vectors so they broadcast across the timesteps
+    monthIndex = numpy.array([date.month - 1 for date in dates])
+    DCresistance = numpy.array(parameters['CableResistances']['DCCable'])[monthIndex][:, numpy.newaxis]
+    AC1TotalResistance = numpy.array(parameters['CableResistances']['AC1Cable'])[monthIndex][:, numpy.newaxis]
+    totalResistance = numpy.array(parameters['CableResistances']['AC2Cable'])[monthIndex][:, numpy.newaxis]
+    currentSimDay = numpy.array([(date - parameters['start']).days + 1 for date in dates], dtype=float)[:, numpy.newaxis]
+
+    # --------------------------------------------------------------------------------------------------
+    # SOLAR MODEL
+    # --------------------------------------------------------------------------------------------------
+
+    sunny = panel['sunny']
+    panelIrradiance = panel['panelIrradiance']
+
+    # Calculate the solar power in W
+    solarOutput = panelIrradiance * panelRating * panelNum / 1000 * (1 - ((panelDegRate / 100.0) / 365.0) * currentSimDay)
 
-                # Get the sun altitude and irradiance for the day using Pysolar
-                azimuth_deg = Pysolar.GetAzimuth(lat, lng, d)
-                azimuth_rad = math.radians(azimuth_deg)
-                altitude = Pysolar.GetAltitude(lat, lng, d)
-                irradiance = Pysolar.radiation.GetRadiationDirect(d, altitude)
+    # DC cable calcs
+    DCcurrent = solarOutput / solarVoltage
+    DCloss = 2 * DCcurrent ** 2 * DCresistance
+    DCoutput = solarOutput - DCloss
 
-                # Factor in the panel angle
-                tiltedFactor = math.cos(a_Radians) * math.sin(panelAngle_rad) * math.cos(panelAzimuth - azimuth_rad) + math.sin(a_Radians) * math.cos(panelAngle_rad)
+    # Inverter calcs
+    invOutput = DCoutput * InvEff
 
-                # Check if it's nighttime, not point simulating solar at night!
-                if irradiance > 0:
+    # 3 Phase AC Cables to Tx calcs
+    IAC1 = invOutput / (math.sqrt(3) * InvPowerFactor * InvOutVolt)
+    AC1loss = 3 * IAC1 ** 2 * AC1TotalResistance
+    AC1Output = invOutput - AC1loss
+
+    # Transformer calcs
+    TxOut = AC1Output * TxEff
 
-                    # Calculate the amount of irradiance on the panel
-                    panelIrradiance = irradiance * tiltedFactor
-                    
-                    # Calculates the solar power in W for a whole day
-                    solarOutput = panelIrradiance * panelRating * panelNum / 1000 * (1 - ((panelDegRate / 100.0) / 365.0) * currentSimDay)
+    # 3 Phase tranmission lines to GXP calcs
+    IAC2 = TxOut / (math.sqrt(3) * InvPowerFactor * TxOutVolt)
+    AC2loss = 3 * IAC2 ** 2 * totalResistance
+    AC2Output = TxOut - AC2loss
+
+    # --------------------------------------------------------------------------------------------------
+    # DAILY RESULTS
+    # --------------------------------------------------------------------------------------------------
+
+    with numpy.errstate(divide='ignore', invalid='ignore'):
+        sunnyTimeSteps = sunny.sum(axis=1)
+        totalEffciency = numpy.where(sunny, (AC2Output / (panelIrradiance * totalArea)) * 100, 0).sum(axis=1)
+        elecEff = numpy.where(sunny, (AC2Output / solarOutput) * 100, 0).sum(axis=1)
+        powerRunVal = numpy.where(sunny, AC2Output, 0).sum(axis=1)
+        energyOutput = powerRunVal * (SIMULATION_TIMESTEP_MINS / 60) # Daily output in Wh
+
+        # Average the effciencies over the day
+        sunnyTime = panel['sunlightHours'] * float(60 / SIMULATION_TIMESTEP_MINS)
+        totalEffciency = numpy.where(sunnyTimeSteps > 0, totalEffciency / sunnyTimeSteps, 0)
+        elecEff = numpy.where(sunnyTimeSteps > 0, elecEff / sunnyTime, 0)
+        powerRunVal = numpy.where(sunnyTimeSteps > 0, powerRunVal / sunnyTime, 0)
+
+    # Find the maximum currents and power, ignoring the timesteps at night
+    def sunnyMax(values):
+        return numpy.where(sunnyTimeSteps > 0, numpy.where(sunny, values, -numpy.inf).max(axis=1), 0)
+
+    return {
+        'averagePower' : powerRunVal,
+        'electricalEffciency' : elecEff,
+        'totalEffciency' : totalEffciency,
+        'electricalEnergy' : energyOutput,
+        'sunnyTime' : panel['sunAngle'],
+        'peakCurrent_DC' : sunnyMax(DCcurrent),
+        'peakCurrent_AC1' : sunnyMax(IAC1),
+        'peakCurrent_AC2' : sunnyMax(IAC2),
+        'powerMax' : sunnyMax(AC2Output)
+    }
+
+
+def calcPowerFlow(parameters, dates, azimuth, irradiance, timestepMins):
+    ''' Runs the power flow calculations for a block of days given the sun position and irradiance at each timestep.
+
+    This is the array version of the calculations in simulateDay. Every input array is shaped
+    (days x steps) and the results are returned as a dictionary of arrays with one value per day, using the same
+    names and units as the outputs returned by simulateDay. Days without any sun are given outputs of zero.'''
+    panel = calcPanelIrradiance(parameters['Site'].getLatitude(), parameters['PVArray'].getAngle(), dates, azimuth, irradiance)
+    return calcElectricalOutput(parameters, dates, panel, timestepMins)
+
+
+# --------------------------------------------------------------------------------------------------
+# SIMULATION FUNCTIONS
+# --------------------------------------------------------------------------------------------------
+
+def calcLoanStep(loan, dailyExpenses, dailyRevenue, dailyInterest):
+    ''' Returns the loan at the end of a day, given the loan at the end of the day before. The daily expenses are 
+    added to the loan, the revenue is paid off and interest accumulates if there is still some loan left '''
+    loan = loan + dailyExpenses
+    loan -= dailyRevenue
+    if loan > 0:
+        loan *= dailyInterest
+    return loan
+
+
+def calcLoanSchedule(loan, dailyExpenses, dailyRevenue, dailyInterest):
+    ''' Returns an array of the loan at the end of each day given the starting loan, the daily expenses, an array of 
+    the daily revenue and the daily interest factor. Gives the same values as applying calcLoanStep each day.
+
+    The days are split into runs where the loan either accumulates interest or doesn't. While no interest is 
+    accumulated the loan is a running sum of the expenses and revenue, which is worked out with a cumulative sum in
+    the same order as calcLoanStep so the values are identical. While the loan accumulates interest the rounding of 
+    each day depends on the loan of the day before, so calcLoanStep is scanned over the revenue with a NumPy 
+    accumulate, which does the same operations in the same order. The runs are worked out in blocks that double in 
+    size while the loan stays in the same state, and the day the state changes is worked out with calcLoanStep.'''
+    numDays = len(dailyRevenue)
+    loanValue = numpy.empty(numDays)
+    blockDays = LOAN_BLOCK_DAYS
+
+    # Scan of the loan, each day's loan worked out from the loan before it and that day's revenue
+    loanScan = numpy.frompyfunc(lambda loan, revenue: calcLoanStep(loan, dailyExpenses, revenue, dailyInterest), 2, 1)
+
+    i = 0
+    while i < numDays:
+        stop = min(i + blockDays, numDays)
+        numBlockDays = stop - i
+        accumulating = loan + dailyExpenses - dailyRevenue[i] > 0
+
+        if accumulating and dailyInterest != 1:
+            # Step through each day of the loan while it accumulates interest
+            steps = numpy.empty(numBlockDays + 1, dtype=object)
+            steps[0] = loan
+            steps[1:] = dailyRevenue[i:stop]
+            values = loanScan.accumulate(steps).astype(float)[1:]
+            sameState = values > 0
+
+        else:
+            # Running sum of the loan, adding the expenses and then taking off the revenue each day
+            steps = numpy.empty(2 * numBlockDays + 1)
+            steps[0] = loan
+            steps[1::2] = dailyExpenses
+            steps[2::2] = -dailyRevenue[i:stop]
+            values = numpy.cumsum(steps)[2::2]
+            sameState = (values > 0) == accumulating
+
+        # Number of days before the loan changes state
+        numSameDays = numBlockDays if sameState.all() else sameState.argmin()
+        loanValue[i:i + numSameDays] = values[:numSameDays]
+        if numSameDays > 0:
+            loan = values[numSameDays - 1]
+        i += numSameDays
+
+        if numSameDays == numBlockDays:
+            blockDays = min(2 * blockDays, LOAN_MAX_BLOCK_DAYS)
+        else:
+            # Step through the day the state changes and start again with small blocks
+            loan = calcLoanStep(loan, dailyExpenses, dailyRevenue[i], dailyInterest)
+            loanValue[i] = loan
+            i += 1
+            blockDays = LOAN_BLOCK_DAYS
+
+    return loanValue
+
+
+def calcAccumulativeRevenue(revenue, dailyRevenue):
+    ''' Returns an array of the total revenue at the end of each day given the revenue before the first day. The 
+    revenue is added up in order so the totals are the same as adding it on one day at a time '''
+    return numpy.cumsum(numpy.concatenate(([revenue], dailyRevenue)))[1:]
+
+
+def simulateDay(date, parameters, timestep_mins):
+    ''' Runs the power flow simulation for a single day, one timestep at a time.
+
+    All the key simulation code is in here and is annotated to show what it does. Returns a dictionary of the 
+    outputs for the day'''
+
+    year = date.year
+    month = date.month
+    day = date.day
+
+    # Time steps
+    SIMULATION_TIMESTEP_MINS = float(timestep_mins)
+    MINS_PER_DAY = 1440.00 # Make it a float so it divides nicely
+    STEPS_PER_DAY = int(MINS_PER_DAY / SIMULATION_TIMESTEP_MINS)
+    
+
+    # --------------------------------------------------------------------------------------------------
+    # SIMULATION PARAMETERS
+    # --------------------------------------------------------------------------------------------------
+    
+    totalArea = parameters['Site'].getArrayNum() * parameters['PVArray'].getArea()
+    panelNum = parameters['PVModule'].getPanelNum() * parameters['PVArray'].getModuleNum() * parameters['Site'].getArrayNum()
+    
+    solarVoltage = parameters['PVArray'].getVoltage() 
+    panelDegRate = parameters['PVPanel'].getDegradationRate()
+    panelAngle = parameters['PVArray'].getAngle()
+    panelRating = parameters['PVPanel'].getRating() 
+    
+    InvEff = parameters['Inverter'].getEfficiency()
+    InvPowerFactor = parameters['Inverter'].getPowerFactor()
+    InvOutVolt = parameters['Inverter'].getVoltage()
+    
+    TxEff = parameters['Transformer'].getEfficiency()
+    TxOutVolt = parameters['Transformer'].getVoltage()
+
+    lat = parameters['Site'].getLatitude()
+    lng = parameters['Site'].getLongitude()
+
+    # Cable resistances for the month, these only depend on the temperature so are calculated once per simulation
+    DCresistance = parameters['CableResistances']['DCCable'][month - 1]
+    AC1TotalResistance = parameters['CableResistances']['AC1Cable'][month - 1]
+    totalResistance = parameters['CableResistances']['AC2Cable'][month - 1]
+
+
+
+    # Number of days into the simulation this day occurs
+    currentSimDay = (date - parameters['start']).days + 1
+    currentDayOfYear = (date - datetime.date(year, 1, 1)).days + 1
+
+
+    # --------------------------------------------------------------------------------------------------
+    # OUTPUT VARIABLES
+    # --------------------------------------------------------------------------------------------------
+
+    # Running totals for the total output energy effciencies at each timestep
+    energyOutput = 0
+    totalEffciency = 0
+    elecEff = 0
+    sunnyTimeSteps = 0
+    powerRunVal = 0
+
+    # Arrays to contain the current values so we can obtain the maximum
+    DCCurrents = []
+    AC1Currents = []
+    AC2Currents = []
+    powerDaily = []
+
+
+
+    # --------------------------------------------------------------------------------------------------
+    # TILTED IRRADIANCE CALCULATION
+    # --------------------------------------------------------------------------------------------------
+
+    # Declination angle of the sun
+    argRadians = math.radians((360 * (284 + currentDayOfYear)/ 365.0))
+    delta = 23.45 * math.sin(argRadians)
+    a = 90 - lat + delta
+        
+    # Calculates the irradiance on the panel for a day
+    a_Radians = math.radians(a)
+    panelAngle_rad = math.radians(panelAngle)
+
+    # Check that latitude of the site and assign a panel azimuth accordingly
+    if lat > 0:
+        panelAzimuth = math.radians(180)
+    elif lat <= 0:
+        panelAzimuth = math.radians(0)
+
+    # Calculate the amount of sunlight hours in the day
+    # http://mathforum.org/library/drmath/view/56478.html
+    P = math.asin(0.39795 * math.cos(0.2163108 + 2 * math.atan(0.9671396 * math.tan(0.00860 * (currentDayOfYear-186)))))
+    numerator = math.sin(0.8333 * math.pi/180) + math.sin(lat * math.pi/180) * math.sin(P)
+    denominator =  math.cos(lat * math.pi /180) * math.cos(P) 
+    sunlightHours = 24 - (24/math.pi) * math.acos( numerator / denominator )
+
+    
+
+
+    # --------------------------------------------------------------------------------------------------
+    # SOLAR MODEL
+    # --------------------------------------------------------------------------------------------------
+
+    # Look up the solar geometry for the whole day if it's been cached
+    ephemerisCache = parameters.get('EphemerisCache')
+    if ephemerisCache is not None:
+        cachedAzimuth, cachedAltitude, cachedIrradiance = [x[0].tolist() for x in 
+            ephemerisCache.getGeometry(lat, lng, [date], SIMULATION_TIMESTEP_MINS)]
+
+    # Simulate the irradiance over a day in the increment described by SIMULATION_TIMESTEP_MINS
+    for i in range(STEPS_PER_DAY):
+
+        # Create a datetime to represent the time of day on the given date
+        minutesIntoDay = i * SIMULATION_TIMESTEP_MINS
+        d = datetime.datetime(year, month, day) + datetime.timedelta(minutes=minutesIntoDay)
+
+        # Get the sun altitude and irradiance for the day from the ephemeris cache if there is one, otherwise
+        # use Pysolar
+        if ephemerisCache is not None:
+            azimuth_deg = cachedAzimuth[i]
+            altitude = cachedAltitude[i]
+            irradiance = cachedIrradiance[i]
+        else:
+            azimuth_deg = Pysolar.GetAzimuth(lat, lng, d)
+            altitude = Pysolar.GetAltitude(lat, lng, d)
+            irradiance = Pysolar.radiation.GetRadiationDirect(d, altitude)
+        azimuth_rad = math.radians(azimuth_deg)
+
+        # Factor in the panel angle
+        tiltedFactor = math.cos(a_Radians) * math.sin(panelAngle_rad) * math.cos(panelAzimuth - azimuth_rad) + math.sin(a_Radians) * math.cos(panelAngle_rad)
+
+        # Check if it's nighttime, not point simulating solar at night!
+        if irradiance > 0:
+
+            # Calculate the amount of irradiance on the panel
+            panelIrradiance = irradiance * tiltedFactor
             
-                    # DC cable calcs
-                    DCresistance = calcCableResistance(DCcable, temperature)
-                    DCcurrent = solarOutput / solarVoltage       
-                    DCloss = 2 * DCcurrent** 2 * DCresistance
-                    DCoutput = solarOutput - DCloss
-                
-                    # Inverter calcs
-                    invOutput = DCoutput * InvEff
-
-                    # 3 Phase AC Cables to Tx calcs
-                    AC1StrandResistance = calcCableResistance(AC1Cable, temperature)
-                    AC1TotalResistance = AC1StrandResistance / AC1StrandNum
-                    IAC1 = invOutput / (math.sqrt(3) * InvPowerFactor*InvOutVolt)                       
-                    AC1loss = 3 * IAC1**2 * AC1TotalResistance
-                    AC1Output = invOutput - AC1loss
-                    
-                    # Transformer calcs
-                    TxOut = AC1Output * TxEff                
-
-                    # 3 Phase tranmission lines to GXP calcs
-                    strandResistance = calcCableResistance(AC2Cable, temperature)
-                    totalResistance = strandResistance / AC2StrandNum
-                    IAC2 = TxOut / (math.sqrt(3) * InvPowerFactor * TxOutVolt)                         
-                    AC2loss = 3 * IAC2**2 * totalResistance
-                    AC2Output = TxOut - AC2loss
-          
-                    # Final outputs
-                    sunnyTimeSteps += 1
-                    totalEffciency += (AC2Output / (panelIrradiance * totalArea)) * 100
-                    elecEff += (AC2Output / solarOutput) * 100
-                    energyOutput += AC2Output * (float(SIMULATION_TIMESTEP_MINS) / 60) # Daily output in Wh
-                    powerRunVal += AC2Output
-
-                    # Save the DC, AC1, AC2 currents and output power
-                    DCCurrents.append(DCcurrent)
-                    AC1Currents.append(IAC1)
-                    AC2Currents.append(IAC2)
-                    powerDaily.append(AC2Output)
+            # Calculates the solar power in W for a whole day
+            solarOutput = panelIrradiance * panelRating * panelNum / 1000 * (1 - ((panelDegRate / 100.0) / 365.0) * currentSimDay)
+    
+            # DC cable calcs
+            DCcurrent = solarOutput / solarVoltage       
+            DCloss = 2 * DCcurrent** 2 * DCresistance
+            DCoutput = solarOutput - DCloss
+        
+            # Inverter calcs
+            invOutput = DCoutput * InvEff
 
+            # 3 Phase AC Cables to Tx calcs
+            IAC1 = invOutput / (math.sqrt(3) * InvPowerFactor*InvOutVolt)                       
+            AC1loss = 3 * IAC1**2 * AC1TotalResistance
+            AC1Output = invOutput - AC1loss
             
-            # --------------------------------------------------------------------------------------------------
-            # STORE RESULTS
-            # --------------------------------------------------------------------------------------------------
+            # Transformer calcs
+            TxOut = AC1Output * TxEff                
+
+            # 3 Phase tranmission lines to GXP calcs
+            IAC2 = TxOut / (math.sqrt(3) * InvPowerFactor * TxOutVolt)                         
+            AC2loss = 3 * IAC2**2 * totalResistance
+            AC2Output = TxOut - AC2loss
+  
+            # Final outputs
+            sunnyTimeSteps += 1
+            totalEffciency += (AC2Output / (panelIrradiance * totalArea)) * 100
+            elecEff += (AC2Output / solarOutput) * 100
+            energyOutput += AC2Output * (float(SIMULATION_TIMESTEP_MINS) / 60) # Daily output in Wh
+            powerRunVal += AC2Output
+
+            # Save the DC, AC1, AC2 currents and output power
+            DCCurrents.append(DCcurrent)
+            AC1Currents.append(IAC1)
+            AC2Currents.append(IAC2)
+            powerDaily.append(AC2Output)
+
+    
+    # --------------------------------------------------------------------------------------------------
+    # STORE RESULTS
+    # --------------------------------------------------------------------------------------------------
+
+    # Average the effciencies over the day
+    sunnyTime = sunlightHours * float(60 / SIMULATION_TIMESTEP_MINS)
+    totalEffciency /= sunnyTimeSteps
+    elecEff /= sunnyTime
+    powerRunVal /= sunnyTime
+
+    # Find the maximum currents
+    maxDC = max(DCCurrents)
+    maxAC1 = max(AC1Currents)
+    maxAC2 = max(AC2Currents)
+
+    # Find the maximum and minimum power for the day
+    # powerMin = min(powerDaily)
+    powerMax = max(powerDaily)
+
+    # Return the output data for the day
+    return {
+        'averagePower' : powerRunVal,
+        'electricalEffciency' : elecEff,
+        'totalEffciency' : totalEffciency,
+        'electricalEnergy' : energyOutput,
+        'sunnyTime' : a,
+        'peakCurrent_DC' : maxDC,
+        'peakCurrent_AC1' : maxAC1,
+        'peakCurrent_AC2' : maxAC2,
+        # 'powerMin' : powerMin,
+        'powerMax' : powerMax
+    }
+
+
+
+def simulateJob(job, parameters, days, timestep_mins, engine):
+    ''' Runs the power flow simulation for a job, which is a (start, stop) range of indexes into the list of days.
+
+    The threaded engine simulates the days one at a time with simulateDay, the vectorised engine simulates all of them
+    at once with NumPy arrays. Returns a dictionary of results with one value per day in the range'''
+    start, stop = job
+    dates = days[start:stop]
+
+    if engine == ENGINE_VECTORISED:
+        lat = parameters['Site'].getLatitude()
+        lng = parameters['Site'].getLongitude()
+
+        # Get the sun position and irradiance for every timestep in the job, then run the power flow
+        ephemerisCache = parameters.get('EphemerisCache')
+        if ephemerisCache is not None:
+            azimuth, altitude, irradiance = ephemerisCache.getGeometry(lat, lng, dates, timestep_mins)
+        else:
+            azimuth, altitude, irradiance = calcSolarGeometry(lat, lng, dates, timestep_mins)
+
+        return calcPowerFlow(parameters, dates, azimuth, irradiance, timestep_mins)
+
+    else:
+        dayResults = [simulateDay(date, parameters, timestep_mins) for date in dates]
+        return dict((field, [x[field] for x in dayResults]) for field in POWER_OUTPUT_FIELDS)
+
+
+
+def saveResultSet(resultSet, filename):
+    ''' Saves a result set from Simulation.getResultSet to an uncompressed NumPy file '''
+    arrays = {
+        'start' : resultSet['start'].toordinal(),
+        'finish' : resultSet['finish'].toordinal(),
+        'loanState' : resultSet['loanState'],
+        'revenueState' : resultSet['revenueState']
+    }
+    for field in POWER_OUTPUT_FIELDS:
+        arrays['power_' + field] = numpy.asarray(resultSet['power'][field], dtype=float)
+    for field in FINANCIAL_OUTPUT_FIELDS:
+        arrays['financial_' + field] = numpy.asarray(resultSet['financial'][field], dtype=float)
+
+    with open(filename, 'wb') as f:
+        numpy.savez(f, **arrays)
+
+
+def loadResultSet(filename):
+    ''' Loads a result set that was saved with saveResultSet '''
+    with open(filename, 'rb') as f:
+        files = numpy.load(f)
+        return {
+            'start' : datetime.date.fromordinal(int(files['start'])),
+            'finish' : datetime.date.fromordinal(int(files['finish'])),
+            'power' : dict((field, files['power_' + field]) for field in POWER_OUTPUT_FIELDS),
+            'financial' : dict((field, files['financial_' + field]) for field in FINANCIAL_OUTPUT_FIELDS),
+            'loanState' : float(files['loanState']),
+            'revenueState' : float(files['revenueState'])
+        }
 
-            # Average the effciencies over the day
-            sunnyTime = sunlightHours * float(60 / SIMULATION_TIMESTEP_MINS)
-            totalEffciency /= sunnyTimeSteps
-            elecEff /= sunnyTime
-            powerRunVal /= sunnyTime
 
-            # Find the maximum currents
-            maxDC = max(DCCurrents)
-            maxAC1 = max(AC1Currents)
-            maxAC2 = max(AC2Currents)
 
-            # Find the maximum and minimum power for the day
-            # powerMin = min(powerDaily)
-            powerMax = max(powerDaily)
+def initSimulationProcess(parameters, days, timestep_mins, engine):
+    ''' Initialises a worker process for the process pool backend.
 
-            # Save the output data to the SimulationDay object
-            simDay.averagePower = powerRunVal
-            simDay.electricalEffciency = elecEff
-            simDay.totalEffciency = totalEffciency
-            simDay.electricalEnergy = energyOutput
-            simDay.sunnyTime = a
-            simDay.peakCurrent_DC = maxDC
-            simDay.peakCurrent_AC1 = maxAC1
-            simDay.peakCurrent_AC2 = maxAC2
-            # simDay.powerMin = powerMin
-            simDay.powerMax = powerMax
+    The simulation parameters are sent to each worker process once here, rather than with every chunk of work'''
+    global PROCESS_SIMULATION
+    PROCESS_SIMULATION = (parameters, days, timestep_mins, engine)
 
-            # Push the completed simulation day to the output queue and tick it off the input queue
-            self.outputQueue.put(simDay)
-            self.inputQueue.task_done()
 
+def simulateChunk(jobs):
+    ''' Runs the power flow simulation for a chunk of jobs in a worker process, using the parameters the process
+    was initialised with. Returns a list of (job, results) tuples'''
+    parameters, days, timestep_mins, engine = PROCESS_SIMULATION
+    return [(job, simulateJob(job, parameters, days, timestep_mins, engine)) for job in jobs]
 
 
 
 # --------------------------------------------------------------------------------------------------
-# SIMULATION OBJECTS
+# SIMULATION THREAD
 # --------------------------------------------------------------------------------------------------
 
-class SimulationDay(object):
-    ''' Contains a date object with a day to simulate, as well as the output data from the
-    simulation.
+class thread_SimulatePower(threading.Thread):
+    '''Thread to simulate the power flow over a range of days.
 
-    This object represents a single day to simulate. The simulation threads treat each day as
-    independant so they can be run in parallel. This contains all the input parameters and 
-    a specific date to simulate. The outputs for the day are stored in there so they are able 
-    to be unpacked and passed back to the controller.'''
+    Gets jobs from the PowerScheduler, each of which is a (start, stop) range of indexes into the list of days to 
+    simulate. Runs the simulation for each job and writes the results straight into the PowerResultStore. Terminates
+    when the scheduler has no more jobs left, or if the simulation fails'''
 
-    def __init__(self, date, parameters):
-        ''' Initialises a simulation day at the given date using the given parameter dictionary'''    
-        # Date to simulate and the parameters of the simulation
-        self.date = date
+    def __init__(self, scheduler, worker, resultStore, parameters, days, timestep_mins, engine):
+        ''' Intantiates a simulation thread'''
+        threading.Thread.__init__(self)
+        self.timestep_mins = timestep_mins
+        self.scheduler = scheduler
+        self.worker = worker
+        self.resultStore = resultStore
         self.parameters = parameters
+        self.days = days
+        self.engine = engine
     
-        # Outputs are stored here
-        self.peakCurrent_DC = 0
-        self.peakCurrent_AC1 = 0
-        self.peakCurrent_AC2 = 0
-        # self.powerMin = 0
-        self.powerMax = 0
-        self.averagePower = 0
-        self.electricalEnergy = 0
-        self.electricalEffciency = 0
-        self.totalEffciency = 0
-        self.sunnyTime = 0
-
-    def setElectricalEnergy(self, electricalEnergy):
-        ''' Sets the electrical energy from the simulation '''
-        self.electricalEnergy = electricalEnergy
-
-    def getElectricalEnergy(self):
-        ''' Gets the electrical energy from the simulation '''
-        return self.electricalEnergy
-
-    def setElectricalEffciency(self, electricalEffciency):
-        ''' Sets the average electrical effciency from the day simulated, that is the 
-        effciency between the output of the solar panels and the grid connection point '''
-        self.electricalEffciency = electricalEffciency
-
-    def getElectricalEffciency(self):
-        ''' Gets the average electrical effciency from the day simulated, that is the 
-        effciency between the output of the solar panels and the grid connection point '''
-        return self.electricalEffciency
-
-    def setTotalEffciency(self, totalEffciency):
-        ''' Sets the average total effciency from the day simulated, that is the 
-        effciency between the solar energy in and the energy out at the grid connection point'''
-        self.totalEffciency = totalEffciency
-
-    def getTotalEffciency(self):
-        ''' Gets the average total effciency from the day simulated, that is the 
-        effciency between the solar energy in and the energy out at the grid connection point'''
-        return self.totalEffciency
+    def run(self):
+        '''' Method thats invoked to run the thread.
+
+        The thread will keep running until the scheduler runs out of jobs, at which point it will terminate.
+        The simulation code for each day is in simulateDay and calcPowerFlow'''
+        
+        # Keep running the thread indefinitly until it terminates itself when it runs out of stuff to do
+        while True:
+
+            # Range of days that is being simulated, None when there are no jobs left
+            job = self.scheduler.getJob(self.worker)
+            if job is None:
+                return
+
+            # Pass any error on to the scheduler so it can be raised when the results are asked for
+            try:
+                results = simulateJob(job, self.parameters, self.days, self.timestep_mins, self.engine)
+                self.resultStore.setResults(job[0], results)
+            except:
+                self.scheduler.jobFailed(sys.exc_info())
+                return
+
+            # Tick the job off
+            self.scheduler.jobDone(job)
+
+
+
+# --------------------------------------------------------------------------------------------------
+# SIMULATION OBJECTS
+# --------------------------------------------------------------------------------------------------
+
+class PowerScheduler(object):
+    ''' Hands out the jobs of the power simulation to the worker threads.
+
+    The jobs are ranges of consecutive days, and are split between the workers up front so each worker gets a 
+    contiguous run of jobs of about the same total cost. A worker takes jobs from the front of its own run, and when 
+    it runs out it steals a job from the back of the run of the worker with the most work left. One lock is taken per
+    job rather than per day, and a worker asking for a job never blocks - it gets a job or None if they're all gone.
+    The number of days that have been simulated is counted exactly for the progress.'''
+
+    def __init__(self, jobs, costs, numWorkers):
+        ''' Initialises a scheduler for the given jobs, and the estimated cost of each job '''
+        self.condition = threading.Condition()
+        self.numJobs = len(jobs)
+        self.totalDays = sum(stop - start for start, stop in jobs)
+        self.jobsDone = 0
+        self.daysDone = 0
+        self.error = None
+
+        # Split the jobs into a contiguous run for each worker
+        self.queues = [collections.deque() for i in range(numWorkers)]
+        self.queueCosts = [0.0] * numWorkers
+
+        totalCost = float(sum(costs))
+        cost = 0.0
+        for job, jobCost in zip(jobs, costs):
+            worker = min(int(cost / totalCost * numWorkers), numWorkers - 1) if totalCost > 0 else 0
+            self.queues[worker].append((job, jobCost))
+            self.queueCosts[worker] += jobCost
+            cost += jobCost
+
+    def getJob(self, worker):
+        ''' Returns the next job for the given worker, or None if there are no jobs left or the simulation failed '''
+        with self.condition:
+            if self.error is not None:
+                return None
+
+            # Take the next job from the worker's own run
+            queue = self.queues[worker]
+            if queue:
+                job, cost = queue.popleft()
+                self.queueCosts[worker] -= cost
+                return job
+
+            # Otherwise steal the last job of the worker with the most work left
+            victim = max(range(len(self.queues)), key=lambda i: self.queueCosts[i])
+            if self.queues[victim]:
+                job, cost = self.queues[victim].pop()
+                self.queueCosts[victim] -= cost
+                return job
+
+            return None
+
+    def takeAllJobs(self):
+        ''' Removes all the jobs that haven't been handed out yet and returns them in order '''
+        with self.condition:
+            jobs = sorted(job for queue in self.queues for job, cost in queue)
+            for queue in self.queues:
+                queue.clear()
+            self.queueCosts = [0.0] * len(self.queues)
+            return jobs
+
+    def jobDone(self, job):
+        ''' Ticks off a finished job '''
+        with self.condition:
+            self.jobsDone += 1
+            self.daysDone += job[1] - job[0]
+            if self.jobsDone == self.numJobs:
+                self.condition.notifyAll()
+
+    def jobFailed(self, error):
+        ''' Records the sys.exc_info() of a job that failed, which stops the other workers and is raised by wait() '''
+        with self.condition:
+            if self.error is None:
+                self.error = error
+            self.condition.notifyAll()
+
+    def getProgress(self):
+        ''' Returns the percentage of days that have been simulated '''
+        if self.totalDays == 0:
+            return 100.0
+        return 100.0 * self.daysDone / self.totalDays
+
+    def wait(self):
+        ''' Blocks until all the jobs are done, raising the error if a job failed '''
+        with self.condition:
+            while self.jobsDone < self.numJobs and self.error is None:
+                self.condition.wait()
+
+            if self.error is not None:
+                raise self.error[0], self.error[1], self.error[2]
+
+
+
+class PowerResultStore(object):
+    ''' Columnar store for the daily results of the power simulation.
+
+    Holds one preallocated NumPy array per output, indexed by the number of days into the simulation, which the 
+    simulation threads and processes write their results straight into. Energy and power are converted to kWh and 
+    kW as they're stored so the arrays can be handed out as the power results without being copied.'''
+
+    def __init__(self, numDays):
+        ''' Initialises a store for the given number of days '''
+        self.numDays = numDays
+        self.columns = dict((field, numpy.zeros(numDays)) for field in POWER_OUTPUT_FIELDS)
+
+        # Keeps track of which days have been stored so readers can wait for them
+        self.complete = numpy.zeros(numDays, dtype=bool)
+        self.condition = threading.Condition()
+
+    def setResults(self, start, results):
+        ''' Stores a dictionary of results for consecutive days, starting at the given number of days into the 
+        simulation '''
+        for field in POWER_OUTPUT_FIELDS:
+            stop = start + len(results[field])
+            self.columns[field][start:stop] = numpy.asarray(results[field]) / POWER_OUTPUT_DIVISORS.get(field, 1)
+
+        # Mark the days as done and wake up anything waiting for them
+        with self.condition:
+            self.complete[start:stop] = True
+            self.condition.notifyAll()
+
+    def loadColumns(self, columns, start=0):
+        ''' Stores results columns that are already in kWh and kW, such as those from a result cache or an earlier 
+        simulation, starting at the given number of days into the simulation '''
+        for field in POWER_OUTPUT_FIELDS:
+            stop = start + len(columns[field])
+            self.columns[field][start:stop] = columns[field]
+
+        with self.condition:
+            self.complete[start:stop] = True
+            self.condition.notifyAll()
+
+    def isComplete(self, start, stop):
+        ''' Returns True if the results for all the days in the range have been stored '''
+        return bool(self.complete[start:stop].all())
+
+    def waitForResults(self, start, stop, timeout=None):
+        ''' Blocks until the results for all the days in the range have been stored, or until the timeout (in 
+        seconds) runs out. Returns True if the results are ready '''
+        with self.condition:
+            if not self.isComplete(start, stop):
+                self.condition.wait(timeout)
+            return self.isComplete(start, stop)
+
+    def getColumn(self, field):
+        ''' Returns the array of results for the given output '''
+        return self.columns[field]
+
+
+class SolarEphemerisCache(object):
+    ''' Cache of the solar geometry (sun azimuth, altitude and direct irradiance) for a site.
+
+    The position of the sun over a site repeats almost exactly from year to year, so rather than working it out for
+    every timestep of every year, one year of it is calculated for each site and timestep and reused for every year
+    of every later simulation. The year is stored by calendar day using a leap year so that the 29th of February is
+    included. Each year is saved in the given directory as a compressed NumPy file of 32 bit floats, and tables
+    that have been used are also kept in memory. 
+
+    Using the cache means the results of a simulation are no longer exact, as the small differences in the sun's
+    position between years are ignored.'''
+
+    def __init__(self, directory):
+        ''' Initialises a cache which saves its files in the given directory '''
+        self.directory = directory
+        self.tables = {}
+        self.lock = threading.Lock()
+
+        if not os.path.isdir(self.directory):
+            os.makedirs(self.directory)
+
+    def __getstate__(self):
+        ''' Allows the cache to be sent to worker processes. The lock can't be pickled and the tables in memory are
+        left behind as the worker can load them from disk. '''
+        state = self.__dict__.copy()
+        del state['lock']
+        state['tables'] = {}
+        return state
+
+    def __setstate__(self, state):
+        ''' Restores a cache that was sent to a worker process '''
+        self.__dict__.update(state)
+        self.lock = threading.Lock()
+
+    def getFilename(self, lat, lng, timestepMins):
+        ''' Returns the path of the file the ephemeris for the given site and timestep is saved in '''
+        return os.path.join(self.directory, EPHEMERIS_FILE_FORMAT % (lat, lng, timestepMins))
+
+    def getTable(self, lat, lng, timestepMins):
+        ''' Returns a tuple of (azimuth, altitude, irradiance) arrays for a whole year at the given site and timestep,
+        shaped (366 x steps). The table is loaded from memory or disk if possible, otherwise it's calculated and saved. '''
+        key = (round(lat, 4), round(lng, 4), float(timestepMins))
+
+        with self.lock:
+            if key not in self.tables:
+                filename = self.getFilename(*key)
+
+                if os.path.isfile(filename):
+                    data = numpy.load(filename)
+                    table = (data['azimuth'], data['altitude'], data['irradiance'])
+                    data.close()
+                else:
+                    table = self.__calculateTable(key[0], key[1], key[2])
+                    self.__saveTable(filename, table)
+
+                self.tables[key] = table
+
+            return self.tables[key]
+
+    def getGeometry(self, lat, lng, dates, timestepMins):
+        ''' Returns a tuple of (azimuth, altitude, irradiance) arrays shaped (days x steps) for the given dates, looked up
+        by calendar day from the cached year. '''
+        azimuth, altitude, irradiance = self.getTable(lat, lng, timestepMins)
+
+        yearStart = datetime.date(EPHEMERIS_REFERENCE_YEAR, 1, 1)
+        index = [(date.replace(year=EPHEMERIS_REFERENCE_YEAR) - yearStart).days for date in dates]
+
+        return (azimuth[index].astype(float), altitude[index].astype(float), irradiance[index].astype(float))
+
+    def __calculateTable(self, lat, lng, timestepMins):
+        ''' Calculates the solar geometry for each day of the reference year '''
+        yearStart = datetime.date(EPHEMERIS_REFERENCE_YEAR, 1, 1)
+        dates = [yearStart + datetime.timedelta(days=x) for x in range(366)]
+
+        return tuple(x.astype(numpy.float32) for x in calcSolarGeometry(lat, lng, dates, timestepMins))
+
+    def __saveTable(self, filename, table):
+        ''' Saves a table to file. It's written to a temporary file first so other processes never load half a file '''
+        temporaryFilename = '%s.%d.tmp' % (filename, os.getpid())
+
+        with open(temporaryFilename, 'wb') as f:
+            numpy.savez_compressed(f, azimuth=table[0], altitude=table[1], irradiance=table[2])
+
+        os.rename(temporaryFilename, filename)
+
+
+
+class SimulationResultCache(object):
+    ''' Persistent cache of the power and financial results of simulations.
+
+    The results are stored in the given directory as uncompressed NumPy files, named by a hash of everything the 
+    results depend on - the assets, the site, the dates, the timestep and engines, and the exchange rates of the
+    currencies used. A simulation with the same inputs as one that has already been run gets its results from the
+    file straight away. When the files add up to more than maxBytes the least recently used ones are removed. 
+
+    invalidate() removes every cached result. It's registered with the currency exchange so the cache is cleared 
+    when the exchange rates are updated.'''
+
+    def __init__(self, directory, maxBytes=RESULT_CACHE_MAX_BYTES):
+        ''' Initialises a cache which saves its files in the given directory '''
+        self.directory = directory
+        self.maxBytes = maxBytes
+        self.lock = threading.Lock()
+
+        if not os.path.isdir(self.directory):
+            os.makedirs(self.directory)
+
+    def __fingerprint(self, value, hasher):
+        ''' Adds a value to the hash. Assets and other objects are hashed by their attributes, and Money by its amount,
+        currency and exchange rate rather than by the exchange it points to '''
+        if isinstance(value, SolarCalculator.Utils.PyExchangeRates.Money):
+            rate = value.getExchange().getRate(value.getCurrencyKey(), SolarCalculator.Utils.PyExchangeRates.UNITED_STATES_DOLLARS_KEY)
+            hasher.update('Money(%r,%s,%r)' % (value.getAmount(), value.getCurrencyKey(), rate))
+        elif isinstance(value, dict):
+            hasher.update('{')
+            for key in sorted(value.keys()):
+                hasher.update('%r:' % key)
+                self.__fingerprint(value[key], hasher)
+            hasher.update('}')
+        elif isinstance(value, (list, tuple, numpy.ndarray)):
+            hasher.update('[')
+            for item in value:
+                self.__fingerprint(item, hasher)
+                hasher.update(',')
+            hasher.update(']')
+        elif hasattr(value, '__dict__') and not isinstance(value, type):
+            # Skip the reference to the exchange, the Money objects already include the rates
+            attributes = dict((key, item) for key, item in value.__dict__.items() if key != 'exchange')
+            hasher.update(type(value).__name__)
+            self.__fingerprint(attributes, hasher)
+        else:
+            hasher.update(repr(value))
+
+    def getKey(self, simulation):
+        ''' Returns the key that a simulation's results are cached under '''
+        parameters = simulation.parameters
+        inputs = {
+            'version' : RESULT_CACHE_VERSION,
+            'start' : simulation.start,
+            'finish' : simulation.finish,
+            'timestep' : simulation.simulationTimestepMins,
+            'engine' : simulation.engine,
+            'financialEngine' : simulation.financialEngine,
+            'ephemeris' : parameters.get('EphemerisCache') is not None,
+            'assets' : dict((key, value) for key, value in parameters.items() if key not in ('EphemerisCache', 'CableResistances'))
+        }
+
+        hasher = hashlib.sha1()
+        self.__fingerprint(inputs, hasher)
+        return hasher.hexdigest()
+
+    def getFilename(self, key):
+        ''' Returns the name of the file that the results with the given key are saved in '''
+        return os.path.join(self.directory, RESULT_CACHE_FILE_FORMAT % key)
+
+    def load(self, key):
+        ''' Returns the cached result set (see Simulation.getResultSet) with the given key, or None if there isn't one '''
+        filename = self.getFilename(key)
+
+        with self.lock:
+            try:
+                resultSet = loadResultSet(filename)
+            except (IOError, KeyError, ValueError):
+                return None
+
+            # Mark the file as recently used
+            os.utime(filename, None)
+
+        return resultSet
+
+    def save(self, key, resultSet):
+        ''' Saves a result set under the given key, then removes the least recently used results if the cache is over
+        its size limit '''
+        filename = self.getFilename(key)
+        temporaryFilename = '%s.%d.tmp' % (filename, os.getpid())
+
+        with self.lock:
+            saveResultSet(resultSet, temporaryFilename)
+            os.rename(temporaryFilename, filename)
+            self.__evict()
+
+    def __getEntries(self):
+        ''' Returns a list of (last used time, size, filename) for each of the cached results '''
+        entries = []
+        for name in os.listdir(self.directory):
+            if name.startswith('results_') and name.endswith('.npz'):
+                filename = os.path.join(self.directory, name)
+                try:
+                    info = os.stat(filename)
+                except OSError:
+                    continue
+                entries.append((info.st_mtime, info.st_size, filename))
+
+        return entries
+
+    def __evict(self):
+        ''' Removes the least recently used results until the cache is within its size limit '''
+        entries = sorted(self.__getEntries())
+        totalBytes = sum(size for lastUsed, size, filename in entries)
+
+        for lastUsed, size, filename in entries:
+            if totalBytes <= self.maxBytes:
+                break
+            try:
+                os.remove(filename)
+            except OSError:
+                pass
+            totalBytes -= size
+
+    def invalidate(self):
+        ''' Removes all the cached results, used when the exchange rates change '''
+        with self.lock:
+            for lastUsed, size, filename in self.__getEntries():
+                try:
+                    os.remove(filename)
+                except OSError:
+                    pass
+
+    def getSize(self):
+        ''' Returns the total size in bytes of the cached results '''
+        return sum(size for lastUsed, size, filename in self.__getEntries())
+
+
 
 class Simulation(object):
     '''Object to contain the simulation parameters'''
     
     def __init__(self, start, finish, PVPanel, PVModule, PVArray, DCCable, 
                  Inverter, AC1Cable, Transformer, AC2Cable, CircuitBreaker, Site, Financial,
-                 numThreads=30, simulationTimestepMins=30):
+                 numThreads=30, simulationTimestepMins=30, engine=ENGINE_THREADED, backend=BACKEND_THREADS,
+                 numProcesses=None, ephemerisCache=None, financialEngine=FINANCIAL_ENGINE_MONEY, resultCache=None,
+                 previousResults=None):
         '''Initilise a simulation instance.
 
         This object is an instance of a simulation. It requires a set of input objects which provide the simulation
@@ -367,13 +1141,47 @@ class Simulation(object):
         solar farm, plus a start and finish date. The timestep for calculations can be adjusted, as can the amount of 
         execution threads (parallel processing elements). A larger timestep give a better resolution but will take 
         longer to calculate. A larger amount of threads will calculate the result faster but will place more strain on 
-        the PC running the computation'''
+        the PC running the computation. The power flow engine can be either ENGINE_THREADED, which simulates one 
+        timestep at a time, or ENGINE_VECTORISED which simulates blocks of days at once with NumPy and is much faster
+        for long simulations. 
+
+        The simulation runs on numThreads threads by default. Setting backend to BACKEND_PROCESSES runs it on a pool of
+        numProcesses worker processes instead (one per core if not given), which avoids the threads competing for
+        the interpreter lock on multi core machines. If a SolarEphemerisCache is given the solar geometry is taken 
+        from it rather than being calculated for every timestep. 
+
+        The financial simulation can use either FINANCIAL_ENGINE_MONEY, which does every calculation with Money 
+        objects, FINANCIAL_ENGINE_FLOAT which converts the costs to floats once and gives the same results much 
+        faster, or FINANCIAL_ENGINE_VECTORISED which works out the whole loan schedule with NumPy (see 
+        calcLoanSchedule). If a SimulationResultCache is given, a simulation with the same inputs as one that has already been 
+        run returns the saved results rather than being run again.
+
+        previousResults takes the result set (see getResultSet) of an earlier simulation of the same farm with the same
+        start date and an earlier finish date. Only the days after the earlier finish date are simulated, and the 
+        financial simulation carries on from where the earlier one left the loan.'''
+        if engine not in (ENGINE_THREADED, ENGINE_VECTORISED):
+            raise ValueError("%s is not a valid simulation engine" % engine)
+        if backend not in (BACKEND_THREADS, BACKEND_PROCESSES):
+            raise ValueError("%s is not a valid simulation backend" % backend)
+        if financialEngine not in (FINANCIAL_ENGINE_MONEY, FINANCIAL_ENGINE_FLOAT, FINANCIAL_ENGINE_VECTORISED):
+            raise ValueError("%s is not a valid financial engine" % financialEngine)
+
         self.start = start
         self.finish = finish
         self.numDays = (finish - start).days
         self.days = [self.start + datetime.timedelta(days=x) for x in range(0,self.numDays)]
         self.numThreads = numThreads
         self.simulationTimestepMins = simulationTimestepMins
+        self.engine = engine
+        self.backend = backend
+        self.financialEngine = financialEngine
+        self.numProcesses = numProcesses if numProcesses else multiprocessing.cpu_count()
+
+        # Simulation threads, process pool and the pending chunks of work for the process pool backend
+        self.pool = None
+        self.threads = []
+        self.asyncResults = []
+        self.powerRunning = False
 
         # Simulation parameters
         self.parameters = {
@@ -389,22 +1197,56 @@ class Simulation(object):
             'AC2Cable': AC2Cable, 
             'CircuitBreaker': CircuitBreaker, 
             'Site': Site,
-            'Financial' : Financial
+            'Financial' : Financial,
+            'EphemerisCache' : ephemerisCache
         }
 
+        # Work out the cable resistances for each month up front, they're the same for every day of the month
+        self.parameters['CableResistances'] = calcCableResistanceTable(self.parameters)
+
         # Simulation results - will be replaced by dictionary with array results when the 
         # simulations have been run
         self.powerResults = {}
         self.financialResults = {}
         
-        # Queues to store the input and output to the simulation
-        self.inputQueue = Queue.Queue()
-        self.outputQueue = Queue.Queue()
+        # Store the results are written to
+        self.resultStore = PowerResultStore(self.numDays)
+
+        # Fill in the days that have already been simulated from the previous results
+        self.previousResults = previousResults
+        self.numPreviousDays = 0
+        if self.previousResults is not None:
+            if self.previousResults['start'] != start or self.previousResults['finish'] > finish:
+                raise ValueError("The previous results must have the same start date and finish on or before %s" % finish)
 
-        # Queue up the list of days to simulate
-        for day in self.days:
-            simulationDay = SimulationDay(day, self.parameters)
-            self.inputQueue.put(simulationDay)
+            self.numPreviousDays = (self.previousResults['finish'] - start).days
+            self.resultStore.loadColumns(self.previousResults['power'])
+
+        # Split the days to simulate into jobs by their estimated cost. The vectorised engine takes blocks of about
+        # VECTORISED_BLOCK_DAYS days, the threaded engine splits the days evenly between the workers
+        numWorkers = self.numProcesses if self.backend == BACKEND_PROCESSES else self.numThreads
+        dayCosts = estimateDayCosts(Site.getLatitude(), self.days[self.numPreviousDays:])
+
+        if self.engine == ENGINE_VECTORISED:
+            targetCost = VECTORISED_BLOCK_DAYS * dayCosts.mean() if len(dayCosts) else 0
+        else:
+            targetCost = dayCosts.sum() / (numWorkers * SCHEDULER_JOBS_PER_WORKER)
+
+        jobs, costs = splitJobs(dayCosts, targetCost, self.numPreviousDays)
+        self.scheduler = PowerScheduler(jobs, costs, numWorkers)
+        self.numJobs = len(jobs)
+
+        # Work out the key of the results in the result cache now, before the financial simulation changes the loan
+        self.resultCache = resultCache
+        self.resultKey = None
+        self.cachedResults = None
+
+        # Where the loan and revenue in US dollars were left at the end of the financial simulation
+        self.financialState = None
+
+        if self.resultCache is not None:
+            self.resultKey = self.resultCache.getKey(self)
+            Financial.getCurrencyExchange().addUpdateListener(self.resultCache.invalidate)
 
 
     def getStartDate(self):
@@ -427,101 +1269,184 @@ class Simulation(object):
     def runPower(self):
         ''' Runs the power flow simulation.
 
-        This gets the simulation days that were created and queued up when the simulation was initialised and
-        starts a pool of simulation threads to start processing the queue. This method is non blocking - it merely
+        This gets the jobs that were planned when the simulation was initialised and starts a pool of simulation
+        threads that take them from the scheduler. This method is non blocking - it merely
         invokes the simulation which runs on seperate threads to the program'''
-        numberOfSimulationDays = self.inputQueue.qsize()
+        self.powerRunning = True
+
+        # Use the cached results if this simulation has been run before
+        if self.__loadCachedPowerResults():
+            return
+
+        # Hand the work to the process pool if that backend was chosen
+        if self.backend == BACKEND_PROCESSES:
+            self.__runPowerOnProcesses()
+            return
 
         # Spawn the threads
         for i in range(self.numThreads):
-            simulationThread = thread_SimulateDay(self.inputQueue, self.outputQueue, self.simulationTimestepMins)
+            simulationThread = thread_SimulatePower(self.scheduler, i, self.resultStore, self.parameters, self.days,
+                                                    self.simulationTimestepMins, self.engine)
             simulationThread.setDaemon(True)
             simulationThread.start()
+            self.threads.append(simulationThread)
 
-    def getPowerProgress(self):
-        ''' Returns percentage of days simulated in the power simulation as a number between 0 and 100. 
+    def takePowerJobs(self):
+        ''' Starts the power simulation without running any of it, and returns the list of (start, stop) jobs that are
+        left to simulate so they can be run somewhere else, such as on the shared workers of a Portfolio. The results 
+        of each job must be handed back with finishPowerJob, or the error with failPowerJob. The list is empty if the 
+        results came from the result cache. '''
+        self.powerRunning = True
+
+        if self.__loadCachedPowerResults():
+            return []
+
+        return self.scheduler.takeAllJobs()
+
+    def finishPowerJob(self, job, results):
+        ''' Saves the results of a job in the result store and ticks it off in the scheduler '''
+        self.resultStore.setResults(job[0], results)
+        self.scheduler.jobDone(job)
+
+    def failPowerJob(self, error):
+        ''' Records the sys.exc_info() of a job that failed, which getPowerResults raises '''
+        self.scheduler.jobFailed(error)
+
+    def __loadCachedPowerResults(self):
+        ''' Fills in the power results from the result cache if this simulation has been run before, ticking off all
+        the jobs. Returns True if the results were in the cache '''
+        if self.resultCache is None:
+            return False
+
+        self.cachedResults = self.resultCache.load(self.resultKey)
+        if self.cachedResults is None:
+            return False
+
+        self.resultStore.loadColumns(self.cachedResults['power'])
+        for job in self.scheduler.takeAllJobs():
+            self.scheduler.jobDone(job)
+        return True
+
+    def __runPowerOnProcesses(self):
+        ''' Shards the queued simulation jobs into chunks and runs them on a pool of worker processes.
+
+        The jobs are taken from the scheduler but not marked as done until their chunk comes back from a worker, so 
+        the progress and the results work the same way as they do with threads. This method is non blocking'''
+
+        # Take the jobs from the scheduler
+        jobs = self.scheduler.takeAllJobs()
+
+        # Split the jobs into a few chunks per worker so the load stays balanced as the workers finish
+        chunkSize = int(math.ceil(len(jobs) / float(self.numProcesses * PROCESS_CHUNKS_PER_WORKER)))
+        chunkSize = max(chunkSize, 1)
+
+        # Start the worker processes, they are sent the parameters once when they start
+        self.pool = multiprocessing.Pool(self.numProcesses, initSimulationProcess,
+                                         (self.parameters, self.days, self.simulationTimestepMins, self.engine))
 
-        This is used to update the progress bar in the GUI'''
-        # Get the total amount of day to be simulated and the amount of days left to simulate
-        itemsLeft = self.inputQueue.qsize()
-        totalItems = self.numDays
+        for i in range(0, len(jobs), chunkSize):
+            chunk = jobs[i:i + chunkSize]
+            self.asyncResults.append(self.pool.apply_async(simulateChunk, (chunk,), callback=self.__chunkFinished))
 
-        # Calculate a percentage between 0-100 of how far through the simulation we are
-        progress = ((float(totalItems - itemsLeft) / totalItems) * 100) + 1
-        progress = round(progress)
+        # No more work will be given to the pool
+        self.pool.close()
 
-        return progress
+    def __chunkFinished(self, jobResults):
+        ''' Callback for when a chunk of jobs has been simulated by a worker process.
+
+        Saves the results of each job in the result store and ticks them off in the scheduler'''
+        for job, results in jobResults:
+            self.finishPowerJob(job, results)
+
+    def getPowerProgress(self):
+        ''' Returns percentage of days simulated in the power simulation as a number between 0 and 100. 
+
+        This is used to update the progress bar in the GUI. The scheduler counts the days as they're finished so the 
+        progress is exact'''
+        return self.scheduler.getProgress()
 
 
     def getPowerResults(self):
         ''' Processes and gets the power results. 
 
-        Blocks until the power simulation is finished. When all the jobs are done this will retreieve all the results
-        from the output queue, sort them into order by date and unpack the data from each day into arrays which are saved
-        in a dictionary and returned to the caller.'''
+        Blocks until the power simulation is finished. When all the jobs are done the daily results are already in
+        order in the result store, so its arrays are saved in a dictionary and returned to the caller.'''
         
-        # Join threads from power simulation - this blocks until the simulation is complete
-        self.inputQueue.join()
-
-        # Dequeue the results
-        resultDays = []
-        while not self.outputQueue.empty():
-            resultDays.append(self.outputQueue.get())
-            self.outputQueue.task_done()
-
-        # Sort the resultant simulation dates into order
-        resultDays.sort(key=operator.attrgetter('date'))
-
-        # Create arrays to store the output data
-        days = []
-        electricalEnergy = []
-        totalEffciency = []
-        electricalEffciency = []
-        averagePower = []
-        sunnyTime = []
-        peakDC = []
-        peakAC1 = []
-        peakAC2 = []
-        # powerMin = []
-        powerMax = []
-
-        # Unpack the results for each day and store them in arrays
-        for day in resultDays:
-            days.append(day.date)
-            electricalEnergy.append(day.electricalEnergy / 1000) # Converts energy to kWh
-            electricalEffciency.append(day.electricalEffciency)
-            totalEffciency.append(day.totalEffciency)
-            averagePower.append(day.averagePower / 1000) # Converts power to kW
-            sunnyTime.append(day.sunnyTime)
-            peakDC.append(day.peakCurrent_DC)
-            peakAC1.append(day.peakCurrent_AC1)
-            peakAC2.append(day.peakCurrent_AC2)
-            # powerMin.append(day.powerMin / 1000) # Converts power to kW
-            powerMax.append(day.powerMax / 1000) # Converts power to kW
-
-        # Find the maximum currents
-        peakDC = max(peakDC)
-        peakAC1 = max(peakAC1)
-        peakAC2 = max(peakAC2)
+        # Wait for the worker processes if they were used, this raises any errors that happened in them
+        if self.backend == BACKEND_PROCESSES and self.pool is not None:
+            for result in self.asyncResults:
+                result.get()
+            self.pool.join()
+
+        # Wait for the jobs of the power simulation - this blocks until the simulation is complete
+        self.scheduler.wait()
+
+        # The threads finish as soon as they find the scheduler is out of jobs
+        for simulationThread in self.threads:
+            simulationThread.join()
 
         # Save the results within the simulation object
         self.powerResults = {
             'days' : self.days,
-            'electricalEnergy' : electricalEnergy,
-            'electricalEffciency' : electricalEffciency,
-            'totalEffciency' : totalEffciency,
-            'averagePower' : averagePower,
-            'sunnyTime' : sunnyTime,
-            'peakDC' : peakDC,
-            'peakAC1' : peakAC1,
-            'peakAC2': peakAC2,
+            'electricalEnergy' : self.resultStore.getColumn('electricalEnergy'),
+            'electricalEffciency' : self.resultStore.getColumn('electricalEffciency'),
+            'totalEffciency' : self.resultStore.getColumn('totalEffciency'),
+            'averagePower' : self.resultStore.getColumn('averagePower'),
+            'sunnyTime' : self.resultStore.getColumn('sunnyTime'),
+            'peakDC' : self.resultStore.getColumn('peakCurrent_DC').max(),
+            'peakAC1' : self.resultStore.getColumn('peakCurrent_AC1').max(),
+            'peakAC2': self.resultStore.getColumn('peakCurrent_AC2').max(),
             # 'powerMin' : powerMin,
-            "powerMax" : powerMax
+            "powerMax" : self.resultStore.getColumn('powerMax')
         }
 
         return self.powerResults
 
 
+    def iterPowerResults(self, chunkDays=1, byMonth=False):
+        ''' Iterates over the power results in date order as they become ready.
+
+        Rather than waiting for the whole simulation like getPowerResults, this yields a dictionary of results as soon
+        as each chunk of chunkDays consecutive days has been simulated, or each calendar month if byMonth is True. The
+        dictionaries have the same keys as the power results, except the peak currents are the daily values rather 
+        than the overall maximums. The power simulation is started if it hasn't been already.'''
+        if not self.powerRunning:
+            self.runPower()
+
+        # Work out where each chunk starts
+        if byMonth:
+            chunkStarts = [i for i, day in enumerate(self.days) if i == 0 or day.day == 1]
+        else:
+            chunkStarts = range(0, self.numDays, chunkDays)
+
+        chunkStops = chunkStarts[1:] + [self.numDays]
+
+        for start, stop in zip(chunkStarts, chunkStops):
+
+            # Wait for the chunk, checking the worker processes haven't failed while waiting
+            while not self.resultStore.waitForResults(start, stop, timeout=1):
+                self.__checkProcessErrors()
+
+            yield {
+                'days' : self.days[start:stop],
+                'electricalEnergy' : self.resultStore.getColumn('electricalEnergy')[start:stop],
+                'electricalEffciency' : self.resultStore.getColumn('electricalEffciency')[start:stop],
+                'totalEffciency' : self.resultStore.getColumn('totalEffciency')[start:stop],
+                'averagePower' : self.resultStore.getColumn('averagePower')[start:stop],
+                'sunnyTime' : self.resultStore.getColumn('sunnyTime')[start:stop],
+                'peakDC' : self.resultStore.getColumn('peakCurrent_DC')[start:stop],
+                'peakAC1' : self.resultStore.getColumn('peakCurrent_AC1')[start:stop],
+                'peakAC2' : self.resultStore.getColumn('peakCurrent_AC2')[start:stop],
+                'powerMax' : self.resultStore.getColumn('powerMax')[start:stop]
+            }
+
+    def __checkProcessErrors(self):
+        ''' Raises any error that has happened in a worker process of the process pool backend '''
+        for result in self.asyncResults:
+            if result.ready() and not result.successful():
+                result.get()
+
+
 
 
     def runFinancial(self):
@@ -531,44 +1456,52 @@ class Simulation(object):
         method is called. Blocks until complete. Once the simulation is done it will return a dictionary of arrays with the 
         simulation results.'''
 
-        # Sum the costs of all the assets 
-        initalCosts = self.parameters['PVArray'].getCost() * self.parameters['Site'].getArrayNum()
-        initalCosts += 2 * self.parameters['DCCable'].getCost() # Worth of DC cables
-        initalCosts += self.parameters['Inverter'].getCost() * self.parameters['Site'].getInverterNum() # Worth of the inverters
-        initalCosts += 3 * self.parameters['AC1Cable'].getCost() # Worth of AC1 cables
-        initalCosts += self.parameters['Transformer'].getCost() * self.parameters['Site'].getTransformerNum() # Worth of the transfomers
-        initalCosts += self.parameters['AC2Cable'].getCost() # Worth of the GEP transmission line
-        initalCosts += self.parameters['Site'].getCost()
+        # Use the cached results if the power results came from the cache
+        if self.cachedResults is not None:
+            self.__loadCachedFinancialResults()
+            return
+
+        # Use the float or vectorised engine if one was chosen
+        if self.financialEngine in (FINANCIAL_ENGINE_FLOAT, FINANCIAL_ENGINE_VECTORISED):
+            self.__runFinancialFloat()
+            return
+
+        exchange = self.parameters['Financial'].getCurrencyExchange()
 
-        # Add the inital asset costs to the loan
-        self.parameters['Financial'].addToLoan(initalCosts)
+        # Carry on from the loan and revenue of the previous results if there are some
+        if self.previousResults is not None:
+            self.parameters['Financial'].setCurrentLoanValue(exchange.withdraw(self.previousResults['loanState'], 'USD'))
+            revenueAccumulator = exchange.withdraw(self.previousResults['revenueState'], 'USD')
+
+        else:
+            # Sum the costs of all the assets 
+            initalCosts = self.parameters['PVArray'].getCost() * self.parameters['Site'].getArrayNum()
+            initalCosts += 2 * self.parameters['DCCable'].getCost() # Worth of DC cables
+            initalCosts += self.parameters['Inverter'].getCost() * self.parameters['Site'].getInverterNum() # Worth of the inverters
+            initalCosts += 3 * self.parameters['AC1Cable'].getCost() # Worth of AC1 cables
+            initalCosts += self.parameters['Transformer'].getCost() * self.parameters['Site'].getTransformerNum() # Worth of the transfomers
+            initalCosts += self.parameters['AC2Cable'].getCost() # Worth of the GEP transmission line
+            initalCosts += self.parameters['Site'].getCost()
+
+            # Add the inital asset costs to the loan
+            self.parameters['Financial'].addToLoan(initalCosts)
+
+            # Variable to accumlate revenue
+            revenueAccumulator = exchange.withdraw(0, 'USD')
 
         # Get the relevant results from the power simulation
         electricalEnergy = self.powerResults['electricalEnergy']
 
+        # Calculate the net value of all the assets for every day, factoring in depreciation
+        netAssetValue = self.__calcNetAssetValue()
+
         # Empty arrays for the results of the financial simulation
-        netAssetValue = []
         loanValue = []
         accumulativeRevenue = []
 
-        # Variable to accumlate revenue
-        revenueAccumulator = self.parameters['Financial'].getCurrencyExchange().withdraw(0, 'USD')
-
         # Simulate the financial life of the project
-        for i in range(self.numDays):
-
-            # Calculate the net value of all the assets, factoring in depreciation
-            dailyCapitalWorth = self.parameters['Site'].getDepreciatedValue(i) # Worth of the land
-            dailyCapitalWorth = self.parameters['PVArray'].getDepreciatedValue(i) * self.parameters['Site'].getArrayNum() # made the assumption only one input required (works out total panel worth)
-            dailyCapitalWorth += 2 * self.parameters['DCCable'].getDepreciatedValue(i) # Worth of DC cables
-            dailyCapitalWorth += self.parameters['Inverter'].getDepreciatedValue(i) * self.parameters['Site'].getInverterNum() # Worth of the inverters
-            dailyCapitalWorth += 3 * self.parameters['AC1Cable'].getDepreciatedValue(i) # Worth of AC1 cables
-            dailyCapitalWorth += self.parameters['Transformer'].getDepreciatedValue(i) * self.parameters['Site'].getTransformerNum() # Worth of the transfomers
-            dailyCapitalWorth += self.parameters['AC2Cable'].getDepreciatedValue(i) # Worth of the AC2 transmission line
-            
-            # Save the current net asset value
-            netAssetValue.append(dailyCapitalWorth)
-            
+        for i in range(self.numPreviousDays, self.numDays):
+
             # Calculate the daily expenses
             dailyExpenses = self.parameters['Financial'].getDailyMaintenance()
             
@@ -588,12 +1521,154 @@ class Simulation(object):
             loanValue.append(self.parameters['Financial'].getCurrentLoanValue())
 
 
+        # Save where the loan and revenue were left
+        self.financialState = {
+            'loan' : self.parameters['Financial'].getCurrentLoanValue().convert('USD').getAmount(),
+            'revenue' : revenueAccumulator.convert('USD').getAmount()
+        }
+
         # Convert all the results to float arrays in the base currency
-        netAssetValue = [self.parameters['Financial'].amountInBaseCurrency(x) for x in netAssetValue]
+        netAssetValue = netAssetValue * self.__getBaseCurrencyRate()
         loanValue = [self.parameters['Financial'].amountInBaseCurrency(x) for x in loanValue]
         accumulativeRevenue = [self.parameters['Financial'].amountInBaseCurrency(x) for x in accumulativeRevenue]
 
         # Save the financial simulation results
+        loanValue, accumulativeRevenue = self.__addPreviousFinancialResults(loanValue, accumulativeRevenue)
+        self.__saveFinancialResults(netAssetValue, loanValue, accumulativeRevenue)
+
+
+    def __runFinancialFloat(self):
+        ''' Runs the financial simulation on plain floats.
+
+        Every cost is turned into a float once at the start and the daily loop is done without any Money objects. The 
+        arithmetic follows what the Money objects do in runFinancial, so the results are the same. Note that when a
+        Money object is multiplied or divided by a number PyExchangeRates keeps the amount and labels it as US dollars
+        without converting it, whereas adding or subtracting two Money objects converts both of them to US dollars. 
+        All the running values are kept in US dollars and converted to the base currency at the end. The vectorised
+        engine does the same arithmetic on arrays rather than one day at a time.'''
+        financial = self.parameters['Financial']
+        site = self.parameters['Site']
+        exchange = financial.getCurrencyExchange()
+
+        # Carry on from the loan and revenue of the previous results if there are some
+        if self.previousResults is not None:
+            loan = self.previousResults['loanState']
+            revenueAccumulator = self.previousResults['revenueState']
+
+        else:
+            # Sum the costs of all the assets, the site cost is the only one that's converted to US dollars
+            initalCosts = sum(asset.getCost().getAmount() * number for asset, number in self.__getAssetNumbers())
+            initalCosts += site.getCost().convert('USD').getAmount()
+
+            # Add the inital asset costs to the loan
+            loan = financial.getCurrentLoanValue().convert('USD').getAmount() + initalCosts
+
+            # Variable to accumlate revenue
+            revenueAccumulator = 0.0
+
+        # Daily values that stay the same for the whole simulation
+        dailyExpenses = financial.getDailyMaintenance().getAmount()
+        powerPrice = financial.getPowerPrice().getAmount()
+        dailyInterest = (1 + financial.interestRate/(365*100))
+
+        # Get the relevant results from the power simulation
+        electricalEnergy = self.powerResults['electricalEnergy']
+
+        # Calculate the net value of all the assets for every day, factoring in depreciation
+        netAssetValue = self.__calcNetAssetValue()
+
+        if self.financialEngine == FINANCIAL_ENGINE_VECTORISED:
+            # Work out the whole loan and revenue schedule at once
+            dailyRevenue = powerPrice * numpy.asarray(electricalEnergy[self.numPreviousDays:self.numDays], dtype=float)
+            loanValue = calcLoanSchedule(loan, dailyExpenses, dailyRevenue, dailyInterest)
+            accumulativeRevenue = calcAccumulativeRevenue(revenueAccumulator, dailyRevenue)
+            if len(dailyRevenue) > 0:
+                loan = loanValue[-1]
+                revenueAccumulator = accumulativeRevenue[-1]
+
+        else:
+            # Empty arrays for the results of the financial simulation
+            loanValue = numpy.empty(self.numDays - self.numPreviousDays)
+            accumulativeRevenue = numpy.empty(self.numDays - self.numPreviousDays)
+
+            # Simulate the financial life of the project
+            for i in range(self.numPreviousDays, self.numDays):
+
+                # Calculate the value of the power sold for this day and accumulate it
+                dailyRevenue = powerPrice * electricalEnergy[i]
+                revenueAccumulator += dailyRevenue
+                accumulativeRevenue[i - self.numPreviousDays] = revenueAccumulator
+
+                # Add the daily expenses to the loan, make a payment with the revenue and accumulate some interest
+                loan += dailyExpenses
+                loan -= dailyRevenue
+                if loan > 0:
+                    loan *= dailyInterest
+                loanValue[i - self.numPreviousDays] = loan
+
+        # Keep the loan in the financial object up to date, as the Money version does
+        financial.setCurrentLoanValue(exchange.withdraw(float(loan), 'USD'))
+        self.financialState = {'loan' : float(loan), 'revenue' : float(revenueAccumulator)}
+
+        # Convert all the results to the base currency
+        toBaseCurrency = self.__getBaseCurrencyRate()
+        loanValue, accumulativeRevenue = self.__addPreviousFinancialResults(loanValue * toBaseCurrency, 
+                                                                            accumulativeRevenue * toBaseCurrency)
+        self.__saveFinancialResults(netAssetValue * toBaseCurrency, loanValue, accumulativeRevenue)
+
+
+    def __addPreviousFinancialResults(self, loanValue, accumulativeRevenue):
+        ''' Puts the daily loan and revenue values from the previous results in front of the newly simulated days '''
+        if self.previousResults is None:
+            return loanValue, accumulativeRevenue
+
+        previous = self.previousResults['financial']
+        loanValue = numpy.concatenate((previous['loanValue'], loanValue))
+        accumulativeRevenue = numpy.concatenate((previous['accumulativeRevenue'], accumulativeRevenue))
+        return loanValue, accumulativeRevenue
+
+    def getInitialLoan(self):
+        ''' Returns the loan at the start of the project in US dollars - the miscellaneous expenses plus the cost of the
+        assets and the site, added up the same way as the financial simulation does. Unlike the current loan value of
+        the Financial object this doesn't change when the financial simulation is run '''
+        initalCosts = sum(asset.getCost().getAmount() * number for asset, number in self.__getAssetNumbers())
+        initalCosts += self.parameters['Site'].getCost().convert('USD').getAmount()
+        return self.parameters['Financial'].getMiscExpenses().convert('USD').getAmount() + initalCosts
+
+    def __getAssetNumbers(self):
+        ''' Returns a list of (asset, number) tuples for each of the assets that make up the worth of the farm '''
+        site = self.parameters['Site']
+        return [
+            (self.parameters['PVArray'], site.getArrayNum()), # made the assumption only one input required (works out total panel worth)
+            (self.parameters['DCCable'], 2),                  # Worth of DC cables
+            (self.parameters['Inverter'], site.getInverterNum()), # Worth of the inverters
+            (self.parameters['AC1Cable'], 3),                 # Worth of AC1 cables
+            (self.parameters['Transformer'], site.getTransformerNum()), # Worth of the transfomers
+            (self.parameters['AC2Cable'], 1)                  # Worth of the AC2 transmission line
+        ]
+
+    def __getBaseCurrencyRate(self):
+        ''' Returns the rate that US dollars are multiplied by to convert them to the base currency '''
+        financial = self.parameters['Financial']
+        exchange = financial.getCurrencyExchange()
+        return exchange.getRate('USD', financial.getBaseCurrency())
+
+    def __calcNetAssetValue(self):
+        ''' Returns an array of the net value of the farm's assets for each day of the simulation.
+
+        The value is built from the depreciation schedule of each asset. Like the Money objects returned by 
+        getDepreciatedValue, the asset amounts are added up without being converted, and the total is treated as 
+        US dollars.'''
+        netAssetValue = numpy.zeros(self.numDays)
+        for asset, number in self.__getAssetNumbers():
+            netAssetValue += asset.getDepreciationSchedule(self.numDays) * number
+
+        return netAssetValue
+
+    def __saveFinancialResults(self, netAssetValue, loanValue, accumulativeRevenue):
+        ''' Saves the daily results of the financial simulation along with the costs of the assets, and the initial
+        cost, daily expenses and interest rate that the analytics in Analytics.py need '''
+        toBaseCurrency = self.__getBaseCurrencyRate()
         self.financialResults = {
             'days' : self.days,
             'netAssetValue' : netAssetValue,
@@ -606,11 +1681,41 @@ class Simulation(object):
             'AC1CableCost' : 3 * self.parameters['AC1Cable'].getCost().getAmount(),
             'transformerCost' : self.parameters['Transformer'].getCost().getAmount() * self.parameters['Site'].getTransformerNum(),
             'AC2CableCost' : self.parameters['AC2Cable'].getCost().getAmount(),
-            'siteCost' : self.parameters['Site'].getCost().getAmount()
+            'siteCost' : self.parameters['Site'].getCost().getAmount(),
+            'initialCost' : self.getInitialLoan() * toBaseCurrency,
+            'dailyExpenses' : self.parameters['Financial'].getDailyMaintenance().getAmount() * toBaseCurrency,
+            'interestRate' : self.parameters['Financial'].interestRate
         }
 
+        # Save the results of the simulation so an identical simulation doesn't need to be run again
+        if self.resultCache is not None and self.cachedResults is None:
+            self.resultCache.save(self.resultKey, self.getResultSet())
+
+    def __loadCachedFinancialResults(self):
+        ''' Saves the financial results from the result cache, and leaves the loan at its final value as if the 
+        financial simulation had been run '''
+        cached = self.cachedResults['financial']
+        self.__saveFinancialResults(cached['netAssetValue'], cached['loanValue'], cached['accumulativeRevenue'])
+
+        self.financialState = {'loan' : self.cachedResults['loanState'], 'revenue' : self.cachedResults['revenueState']}
+        financial = self.parameters['Financial']
+        financial.setCurrentLoanValue(financial.getCurrencyExchange().withdraw(self.cachedResults['loanState'], 'USD'))
+
 
 
     def getFinancialResults(self):
         ''' Returns the financial results'''
         return self.financialResults
+
+    def getResultSet(self):
+        ''' Returns everything needed to carry on from the end of this simulation - the daily power and financial 
+        results and where the loan and revenue were left. This can be given to a new Simulation with a later finish
+        date as previousResults, or saved with saveResultSet. The power and financial simulations must have been run.'''
+        return {
+            'start' : self.start,
+            'finish' : self.finish,
+            'power' : dict((field, self.resultStore.getColumn(field).copy()) for field in POWER_OUTPUT_FIELDS),
+            'financial' : dict((field, numpy.asarray(self.financialResults[field], dtype=float)) for field in FINANCIAL_OUTPUT_FIELDS),
+            'loanState' : self.financialState['loan'],
+            'revenueState' : self.financialState['revenue']
+        }
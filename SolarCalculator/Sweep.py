@@ -0,0 +1,241 @@
+'''@package Sweep.py
+
+Runs parameter sweeps of the power simulation - the same site and date range simulated with many different variants
+of the electrical equipment (cable sizes, inverter efficiencies, panel counts etc). The solar geometry and the
+irradiance on the panels only depend on the site and the panel angle, so they are worked out once for each block of
+up to SWEEP_BLOCK_STEPS timesteps and every variant is simulated over the block before moving on to the next. Each variant
+is then just one pass of the vectorised electrical calculations over the block's arrays, so a sweep of hundreds of
+variants costs about the same as one simulation, and only a block of days is held in memory however long the
+simulation is. Blocks are kept in a least recently used cache of up to SWEEP_CACHE_MAX_BYTES, so simulating the
+variants one at a time with simulateVariant reuses them too.
+
+Usage example:
+>>> simulation = SolarCalculator.Scenario.createSimulation(inputParameters, optionalInputParameters)
+>>> sweep = ParameterSweep(simulation)
+>>> variants = gridVariants({'DCCable' : [smallCable, bigCable], 'Inverter' : [inverter95, inverter98]})
+>>> results = sweep.run(variants)
+>>> results['totalEnergy']         # kWh of each variant, in the order of the variants
+'''
+
+# Import system modules
+import itertools
+import collections
+
+# Import NumPy
+import numpy
+
+# Import the simulation module
+import SolarCalculator.Simulation
+
+# --------------------------------------------------------------------------------------------------------------------
+# CONSTANTS
+# --------------------------------------------------------------------------------------------------------------------
+
+# Parameters of a simulation that a variant can replace. The financial parameters don't affect the power simulation
+SWEEP_PARAMETERS = ('PVPanel', 'PVModule', 'PVArray', 'DCCable', 'Inverter', 'AC1Cable', 'Transformer', 'AC2Cable',
+                    'CircuitBreaker', 'Site')
+
+# Columns of the sweep results, one value per variant
+SWEEP_RESULT_FIELDS = ('totalEnergy', 'averagePower', 'powerMax', 'electricalEffciency', 'totalEffciency',
+                       'peakDC', 'peakAC1', 'peakAC2')
+
+# How each column of the sweep results is reduced from the daily power outputs, as (output, 'sum', 'mean' or 'max')
+SWEEP_RESULT_REDUCTIONS = {
+    'totalEnergy' : ('electricalEnergy', 'sum'),                # kWh over the whole simulation
+    'averagePower' : ('averagePower', 'mean'),                  # kW
+    'powerMax' : ('powerMax', 'max'),                           # kW
+    'electricalEffciency' : ('electricalEffciency', 'mean'),    # %
+    'totalEffciency' : ('totalEffciency', 'mean'),              # %
+    'peakDC' : ('peakCurrent_DC', 'max'),                       # A
+    'peakAC1' : ('peakCurrent_AC1', 'max'),                     # A
+    'peakAC2' : ('peakCurrent_AC2', 'max')                      # A
+}
+
+SWEEP_BLOCK_STEPS = 1000000                 # Most timesteps (days x steps per day) simulated at once by default
+SWEEP_CACHE_MAX_BYTES = 256 * 1024 * 1024   # Most memory the cached blocks of geometry and panel irradiance can use
+
+# --------------------------------------------------------------------------------------------------------------------
+# FUNCTIONS
+# --------------------------------------------------------------------------------------------------------------------
+
+def gridVariants(options):
+    ''' Takes a dictionary of {parameter name : list of assets} and returns a list of variants, one for every
+    combination of the options. Each variant is a dictionary of {parameter name : asset}. '''
+    names = sorted(options.keys())
+    return [dict(zip(names, values)) for values in itertools.product(*[options[name] for name in names])]
+
+# --------------------------------------------------------------------------------------------------------------------
+# CLASSES
+# --------------------------------------------------------------------------------------------------------------------
+
+class ParameterSweep(object):
+    ''' Simulates variants of a base simulation, sharing the solar geometry and panel irradiance between them '''
+
+    def __init__(self, simulation, blockDays=None, maxCacheBytes=SWEEP_CACHE_MAX_BYTES):
+        ''' Initialise a sweep of the given simulation, which provides the site, dates, timestep and the parameters
+        that each variant doesn't replace. The days are simulated in blocks of blockDays days (as many as fit in
+        SWEEP_BLOCK_STEPS timesteps if not given), and up to maxCacheBytes of the geometry and panel irradiance of the 
+        blocks is cached. Nothing is calculated until the first variant is simulated. Raises ValueError if the 
+        simulation has no days to sweep. '''
+        if len(simulation.days) == 0:
+            raise ValueError("The simulation must finish after it starts to be swept")
+
+        self.simulation = simulation
+        self.parameters = simulation.parameters
+        self.days = simulation.days
+        self.timestepMins = simulation.simulationTimestepMins
+        self.blockDays = blockDays if blockDays else max(int(SWEEP_BLOCK_STEPS * self.timestepMins // 1440), 1)
+        self.maxCacheBytes = maxCacheBytes
+
+        self.cache = collections.OrderedDict()  # {key : (value, bytes)} of the cached blocks, least recently used first
+        self.cacheBytes = 0                     # Memory used by the cached blocks
+
+    def getBlocks(self):
+        ''' Returns the list of (start, stop) ranges of indexes into the days that the sweep is simulated in '''
+        return [(start, min(start + self.blockDays, len(self.days))) for start in range(0, len(self.days), self.blockDays)]
+
+    def __getCached(self, key, calculate):
+        ''' Returns the value cached under the key, calling calculate() to work it out and caching it if it isn't 
+        cached. The least recently used values are dropped once the cache uses more than maxCacheBytes '''
+        if key in self.cache:
+            value, numBytes = self.cache.pop(key)
+        else:
+            value = calculate()
+            arrays = value.values() if isinstance(value, dict) else value
+            numBytes = sum(x.nbytes for x in arrays if isinstance(x, numpy.ndarray))
+            self.cacheBytes += numBytes
+
+            while self.cache and self.cacheBytes > self.maxCacheBytes:
+                oldKey, (oldValue, oldBytes) = self.cache.popitem(last=False)
+                self.cacheBytes -= oldBytes
+
+        # Move the value to the most recently used end, unless it's too big to cache at all
+        if numBytes <= self.maxCacheBytes:
+            self.cache[key] = (value, numBytes)
+        else:
+            self.cacheBytes -= numBytes
+
+        return value
+
+    def getGeometry(self, start, stop):
+        ''' Returns the (azimuth, irradiance) arrays shaped (days x steps) for the days from start to stop, which must
+        be one of the blocks of the sweep '''
+        def calculate():
+            lat = self.parameters['Site'].getLatitude()
+            lng = self.parameters['Site'].getLongitude()
+            dates = self.days[start:stop]
+
+            # Use the ephemeris cache if the simulation has one
+            ephemerisCache = self.parameters.get('EphemerisCache')
+            if ephemerisCache is not None:
+                azimuth, altitude, irradiance = ephemerisCache.getGeometry(lat, lng, dates, self.timestepMins)
+            else:
+                azimuth, altitude, irradiance = SolarCalculator.Simulation.calcSolarGeometry(lat, lng, dates, self.timestepMins)
+
+            return (azimuth, irradiance)
+
+        return self.__getCached(('geometry', start, stop), calculate)
+
+    def getPanelIrradiance(self, panelAngle, start, stop):
+        ''' Returns the irradiance on panels at the given angle for the days from start to stop, which must be one of
+        the blocks of the sweep (see calcPanelIrradiance) '''
+        def calculate():
+            azimuth, irradiance = self.getGeometry(start, stop)
+            lat = self.parameters['Site'].getLatitude()
+            return SolarCalculator.Simulation.calcPanelIrradiance(lat, panelAngle, self.days[start:stop], azimuth, irradiance)
+
+        return self.__getCached(('panel', panelAngle, start, stop), calculate)
+
+    def getVariantParameters(self, variant):
+        ''' Returns a copy of the simulation parameters with the assets in the variant swapped in '''
+        for name in variant.keys():
+            if name not in SWEEP_PARAMETERS:
+                raise ValueError("%s is not a parameter that can be swept" % name)
+
+        # The solar geometry is shared so the site has to stay in the same place
+        if 'Site' in variant:
+            site = variant['Site']
+            baseSite = self.parameters['Site']
+            if (site.getLatitude(), site.getLongitude()) != (baseSite.getLatitude(), baseSite.getLongitude()):
+                raise ValueError("The site of a variant must be at the same location as the simulation")
+
+        parameters = dict(self.parameters)
+        parameters.update(variant)
+
+        # The cable resistances depend on the cables and the site temperature so they're worked out for each variant
+        parameters['CableResistances'] = SolarCalculator.Simulation.calcCableResistanceTable(parameters)
+
+        return parameters
+
+    def simulateBlock(self, parameters, start, stop):
+        ''' Runs the power simulation for the days from start to stop, which must be one of the blocks of the sweep, 
+        with the parameters of a variant (see getVariantParameters). Returns a dictionary of arrays of the daily 
+        results in the units of the simulation results '''
+        panel = self.getPanelIrradiance(parameters['PVArray'].getAngle(), start, stop)
+        results = SolarCalculator.Simulation.calcElectricalOutput(parameters, self.days[start:stop], panel, self.timestepMins)
+
+        # Convert to the units of the simulation results
+        for field, divisor in SolarCalculator.Simulation.POWER_OUTPUT_DIVISORS.items():
+            results[field] = results[field] / divisor
+
+        return results
+
+    def simulateVariant(self, variant):
+        ''' Runs the power simulation for one variant, given as a dictionary of {parameter name : asset}. Returns a
+        dictionary of results in the same form as Simulation.getPowerResults '''
+        parameters = self.getVariantParameters(variant)
+        blockResults = [self.simulateBlock(parameters, start, stop) for start, stop in self.getBlocks()]
+
+        results = {'days' : self.days}
+        for field in SolarCalculator.Simulation.POWER_OUTPUT_FIELDS:
+            results[field] = numpy.concatenate([block[field] for block in blockResults])
+
+        results['peakDC'] = results['peakCurrent_DC'].max()
+        results['peakAC1'] = results['peakCurrent_AC1'].max()
+        results['peakAC2'] = results['peakCurrent_AC2'].max()
+
+        return results
+
+    def summariseVariant(self, results):
+        ''' Reduces the daily results of a variant to a row of the sweep results table '''
+        row = {}
+        for field, (output, reduction) in SWEEP_RESULT_REDUCTIONS.items():
+            row[field] = getattr(numpy.asarray(results[output]), reduction)()
+
+        return row
+
+    def run(self, variants):
+        ''' Simulates each of the variants and returns a table of the results as a dictionary of columns, with one
+        row per variant in the order they were given. The 'variant' column holds the variants themselves. 
+
+        The days are simulated a block at a time, with every variant simulated over a block before the next one, and 
+        the results are added up as they go so the daily results of the variants are never all held at once. '''
+        parameters = [self.getVariantParameters(variant) for variant in variants]
+
+        # Simulate the variants with the same panel angle together, so each block of panel irradiance is only needed
+        # for as long as it takes to simulate them
+        angles = collections.OrderedDict()
+        for i, variantParameters in enumerate(parameters):
+            angles.setdefault(variantParameters['PVArray'].getAngle(), []).append(i)
+
+        table = {}
+        for field, (output, reduction) in SWEEP_RESULT_REDUCTIONS.items():
+            table[field] = numpy.repeat(-numpy.inf if reduction == 'max' else 0.0, len(variants))
+        table['variant'] = list(variants)
+
+        for start, stop in self.getBlocks():
+            for angle, indexes in angles.items():
+                for i in indexes:
+                    results = self.simulateBlock(parameters[i], start, stop)
+
+                    for field, (output, reduction) in SWEEP_RESULT_REDUCTIONS.items():
+                        if reduction == 'max':
+                            table[field][i] = max(table[field][i], results[output].max())
+                        else:
+                            table[field][i] += results[output].sum()
+
+        for field, (output, reduction) in SWEEP_RESULT_REDUCTIONS.items():
+            if reduction == 'mean':
+                table[field] /= len(self.days)
+
+        return table
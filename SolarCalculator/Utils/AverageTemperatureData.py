@@ -6,7326 +6,141 @@ FUTURE is based on future calculations from 2020 to 2039
 
 SOURCE: http://data.worldbank.org/developers/climate-data-api
 
+The data is stored in a binary file (AverageTemperatureData.dat) rather than as a Python dictionary, so only the
+countries that are asked for are read into memory. The file starts with a 4 byte little endian length, followed by
+a JSON index of {country code : [record number, long name]}, followed by one record per country of 24 little endian
+doubles - the 12 PAST temperatures then the 12 FUTURE temperatures.
+
+Usage example:
+>>> import AverageTemperatureData
+>>> AverageTemperatureData.TEMPERATURE_DATA['NZL']['PAST']
+[15.485036650508404, 15.850485882871068, ...
+
 Author: Ashok Fernandez
 Date: 16/09/2013
 '''
 
+import os
+import json
+import struct
+import threading
+
+# --------------------------------------------------------------------------------------------------------------------
+# CONSTANTS
+# --------------------------------------------------------------------------------------------------------------------
+
+TEMPERATURE_FILE = 'AverageTemperatureData.dat'     # Name of the binary file that holds the temperature data
+HEADER_FORMAT = '<I'                                 # Length of the JSON index at the start of the file
+RECORD_FORMAT = '<24d'                               # 12 PAST temperatures followed by 12 FUTURE temperatures
+MONTHS = 12                                          # Number of temperatures in each series
+
+# --------------------------------------------------------------------------------------------------------------------
+# FUNCTIONS
+# --------------------------------------------------------------------------------------------------------------------
+
+def findTemperatureFile():
+    ''' Returns the path to the temperature data file. The file is looked for next to this module first, then in the
+    current working directory (the Resources folder when running as an OSX bundle) '''
+    moduleDir = os.path.dirname(os.path.abspath(__file__))
+    for directory in [moduleDir, os.getcwd()]:
+        filename = os.path.join(directory, TEMPERATURE_FILE)
+        if os.path.isfile(filename):
+            return filename
+
+    raise IOError("Unable to find the temperature data file %s" % TEMPERATURE_FILE)
+
+def writeTemperatureFile(data, filename):
+    ''' Writes a dictionary of {country code : {'PAST' : [...], 'FUTURE' : [...], 'LONG_NAME' : name}} to a binary
+    temperature data file, used to rebuild the file when the source data is updated '''
+    codes = sorted(data.keys())
+    index = dict((code, [i, data[code]['LONG_NAME']]) for i, code in enumerate(codes))
+    header = json.dumps(index, sort_keys=True)
+
+    with open(filename, 'wb') as f:
+        f.write(struct.pack(HEADER_FORMAT, len(header)))
+        f.write(header)
+        for code in codes:
+            f.write(struct.pack(RECORD_FORMAT, *(data[code]['PAST'] + data[code]['FUTURE'])))
+
+# --------------------------------------------------------------------------------------------------------------------
+# CLASSES
+# --------------------------------------------------------------------------------------------------------------------
+
+class TemperatureData(object):
+    ''' Read only dictionary of temperature data that loads each country from the binary file when it's first asked for.
+    Each item is a dictionary with the keys 'PAST', 'FUTURE' and 'LONG_NAME', the same as the original data '''
+
+    def __init__(self, filename=None):
+        ''' Initialise the data, nothing is read from the file until it's needed '''
+        self.filename = filename        # Path to the data file, found when the index is loaded if not given
+        self.index = None               # Dictionary of {country code : (record number, long name)}
+        self.dataOffset = None          # Position in the file of the first record
+        self.countries = {}             # Countries that have already been loaded
+        self.lock = threading.Lock()    # Protects the index and cache when used from the simulation threads
+
+    def __loadIndex(self):
+        ''' Reads the JSON index from the start of the data file '''
+        if self.filename is None:
+            self.filename = findTemperatureFile()
+
+        with open(self.filename, 'rb') as f:
+            headerSize = struct.calcsize(HEADER_FORMAT)
+            (length,) = struct.unpack(HEADER_FORMAT, f.read(headerSize))
+            decodedIndex = json.loads(f.read(length))
+
+        self.index = dict((str(code), (record, str(name))) for code, (record, name) in decodedIndex.items())
+        self.dataOffset = headerSize + length
+
+    def __loadCountry(self, code):
+        ''' Reads a single country's record from the data file '''
+        record, longName = self.index[code]
+        recordSize = struct.calcsize(RECORD_FORMAT)
+
+        with open(self.filename, 'rb') as f:
+            f.seek(self.dataOffset + record * recordSize)
+            values = list(struct.unpack(RECORD_FORMAT, f.read(recordSize)))
+
+        return {'PAST' : values[:MONTHS], 'FUTURE' : values[MONTHS:], 'LONG_NAME' : longName}
+
+    def getIndex(self):
+        ''' Returns the index of country codes, loading it from the file if needed '''
+        with self.lock:
+            if self.index is None:
+                self.__loadIndex()
+            return self.index
+
+    def __getitem__(self, code):
+        ''' Returns the temperature data for the given country code, raises a KeyError if there isn't any '''
+        index = self.getIndex()
+        with self.lock:
+            if code not in self.countries:
+                if code not in index:
+                    raise KeyError(code)
+                self.countries[code] = self.__loadCountry(code)
+            return self.countries[code]
+
+    def get(self, code, default=None):
+        ''' Returns the temperature data for the given country code, or the default if there isn't any '''
+        try:
+            return self[code]
+        except KeyError:
+            return default
+
+    def __contains__(self, code):
+        return code in self.getIndex()
+
+    def __iter__(self):
+        return iter(self.keys())
+
+    def __len__(self):
+        return len(self.getIndex())
+
+    def keys(self):
+        ''' Returns a sorted list of the country codes that have temperature data '''
+        return sorted(self.getIndex().keys())
+
+# --------------------------------------------------------------------------------------------------------------------
+# DATA
+# --------------------------------------------------------------------------------------------------------------------
 
-TEMPERATURE_DATA = {
-    "ABW": {
-        "FUTURE": [
-            25.21432713030714,
-            25.15916987852857,
-            25.44019208645357,
-            25.83973584792142,
-            26.058126177096426,
-            26.16638837560357,
-            26.494420733392847,
-            26.99456787094286,
-            27.30193219851429,
-            27.198112487903575,
-            26.70765250089642,
-            25.83140672983214
-        ],
-        "LONG_NAME": "Aruba",
-        "PAST": [
-            24.4076782235,
-            24.299399820419996,
-            24.584834797986666,
-            24.988802083226666,
-            25.270420328833332,
-            25.41199747702,
-            25.719504801193334,
-            26.295347086640003,
-            26.65791626032667,
-            26.58381144170667,
-            26.103031413319993,
-            25.10644531253333
-        ]
-    },
-    "AFG": {
-        "FUTURE": [
-            -1.3176499867769453,
-            1.5136499857931205,
-            6.508558091563252,
-            12.122643752081645,
-            17.538630168030526,
-            22.53465757838924,
-            24.69129991099764,
-            22.92455066525887,
-            18.018476867825246,
-            11.592430259749168,
-            4.852915155355157,
-            -0.18173230479952052
-        ],
-        "LONG_NAME": "Afghanistan",
-        "PAST": [
-            -3.361674397847376,
-            -0.6535342745978618,
-            4.649288669136445,
-            10.377975599159745,
-            16.294960800862366,
-            21.44542880658584,
-            24.214751043938627,
-            22.472757094199288,
-            17.3751665584746,
-            10.677632988634262,
-            3.6975497097275136,
-            -1.7042443170107462
-        ]
-    },
-    "AGO": {
-        "FUTURE": [
-            23.887148389304347,
-            23.946893135073843,
-            24.078001911325078,
-            23.814747425108003,
-            22.69860816112182,
-            21.306612074127873,
-            21.242443250215178,
-            22.959208162211336,
-            25.119106031766467,
-            25.68132504773649,
-            24.786504591637033,
-            24.07461979108867
-        ],
-        "LONG_NAME": "Angola",
-        "PAST": [
-            22.91433839630725,
-            23.097067570182613,
-            23.2280786041158,
-            22.87254758097479,
-            21.6033181011684,
-            20.24374646181577,
-            20.145174374510393,
-            21.899451214902612,
-            24.09535420703826,
-            24.607865352867826,
-            23.72793990375087,
-            23.086718175116673
-        ]
-    },
-    "AIA": {
-        "FUTURE": [
-            25.09233583676251,
-            24.672460828517863,
-            24.62116677408571,
-            24.95768247395714,
-            25.586800711494647,
-            26.20804868471964,
-            26.789200919182147,
-            27.304177420798215,
-            27.523457118521428,
-            27.35356957580536,
-            26.764751434453576,
-            25.872390202185706
-        ],
-        "LONG_NAME": "Anguilla",
-        "PAST": [
-            24.422656249479996,
-            23.968024698539995,
-            23.894942219266667,
-            24.264575195200003,
-            24.940915934693333,
-            25.597347005273335,
-            26.21445007326333,
-            26.72649332725,
-            26.936359660100003,
-            26.763864135709994,
-            26.16891072516666,
-            25.237490845486665
-        ]
-    },
-    "ALB": {
-        "FUTURE": [
-            6.052463349790607,
-            6.778387523811512,
-            8.919838678085359,
-            12.198169890145476,
-            16.479806809315477,
-            21.261943271815472,
-            24.726327805915485,
-            24.45449211446666,
-            19.715959821450003,
-            14.37924811975048,
-            9.923925490499524,
-            7.271595909489832
-        ],
-        "LONG_NAME": "Albania",
-        "PAST": [
-            4.7379055443954226,
-            5.296609157866401,
-            7.577845594823779,
-            10.959543864113332,
-            15.30910780159778,
-            20.332863363473333,
-            23.851559787373333,
-            23.570191107433335,
-            19.002111816084444,
-            13.678346761638,
-            9.274844699710002,
-            6.345684136336085
-        ]
-    },
-    "AND": {
-        "FUTURE": [
-            8.785665239633571,
-            9.479131426132144,
-            10.824868338582856,
-            12.832859584214287,
-            15.767558507078567,
-            19.592740740407145,
-            22.47031293568571,
-            22.260216849321427,
-            19.218331473399996,
-            15.259169442257146,
-            11.740152631475004,
-            9.549895150414285
-        ],
-        "LONG_NAME": "Andorra",
-        "PAST": [
-            7.504054769196001,
-            7.942602539015334,
-            9.697503662288002,
-            11.641973877502664,
-            14.694590250440001,
-            18.803745523826667,
-            21.90782470724,
-            21.594864909453335,
-            18.579895018920002,
-            14.548107910173334,
-            10.978881836294669,
-            8.534171549397335
-        ]
-    },
-    "ARE": {
-        "FUTURE": [
-            17.56820974579745,
-            20.018983178951526,
-            24.656917649777046,
-            29.658905340443884,
-            33.860258763945914,
-            37.084832950243374,
-            37.851346230399486,
-            36.81662298685817,
-            34.20575340437653,
-            29.447545576843368,
-            23.82474517811122,
-            18.86652358670102
-        ],
-        "LONG_NAME": "United Arab Emirates",
-        "PAST": [
-            16.120681617794194,
-            18.463119070084762,
-            23.329006521285713,
-            28.216993640045715,
-            32.68746483198666,
-            35.989671398550485,
-            36.96022455132096,
-            36.1845979241019,
-            33.517352295062864,
-            28.688359723778092,
-            22.687781924794287,
-            17.50838710249333
-        ]
-    },
-    "ARG": {
-        "FUTURE": [
-            20.63624099059538,
-            20.191020326658208,
-            18.006368962225192,
-            14.389796215069556,
-            10.739385866760363,
-            8.333221403906487,
-            7.831360282279107,
-            9.091245210976526,
-            11.361818806376363,
-            14.035045518809218,
-            17.0120244914279,
-            19.454129648976448
-        ],
-        "LONG_NAME": "Argentina",
-        "PAST": [
-            20.203472195947448,
-            19.857155746222286,
-            17.668204185019363,
-            13.896485021138746,
-            10.09972332631848,
-            7.502184902122925,
-            6.7069257883133675,
-            8.025838196583354,
-            10.302505590889018,
-            13.053321877494675,
-            16.199270198482115,
-            18.82664256962742
-        ]
-    },
-    "ARM": {
-        "FUTURE": [
-            -1.5974788119512429,
-            -0.17965175081630877,
-            3.445742143856036,
-            8.212363760821928,
-            13.358625793497927,
-            18.293775721537855,
-            22.149304852792856,
-            21.805818612387863,
-            16.360330636272145,
-            10.098982892750929,
-            3.9328397478328996,
-            0.026139831397902918
-        ],
-        "LONG_NAME": "Armenia",
-        "PAST": [
-            -3.0377555338271467,
-            -1.7644384765683652,
-            1.8361437988000946,
-            6.662524414089201,
-            12.02683024101907,
-            17.45604980491733,
-            21.281394857021333,
-            20.950099284320004,
-            15.562850341512,
-            9.223312988440133,
-            2.96251057947854,
-            -0.9608426919793572
-        ]
-    },
-    "ASM": {
-        "FUTURE": [
-            28.288068499642858,
-            28.494337899007146,
-            28.523503985132148,
-            28.435259138324998,
-            27.98995426751785,
-            27.292148044853576,
-            26.730613708214285,
-            26.554397582849997,
-            26.73826599136786,
-            27.14194052516786,
-            27.59658595496786,
-            27.992304120842864
-        ],
-        "LONG_NAME": "American Samoa",
-        "PAST": [
-            27.642146809999996,
-            27.87388102268,
-            27.89712117502,
-            27.776147460906667,
-            27.364272054433336,
-            26.610357666259997,
-            26.05925496476667,
-            25.875966390066665,
-            26.089097086566664,
-            26.483176676626663,
-            26.92483520468667,
-            27.34435628278667
-        ]
-    },
-    "ATF": {
-        "FUTURE": [
-            27.75056457511786,
-            27.8636899677,
-            28.11063602971429,
-            28.048085893792862,
-            27.240255082807145,
-            26.059498378000004,
-            25.17615291062143,
-            24.85051945243572,
-            25.012248448135715,
-            25.731941223017856,
-            26.77287401459643,
-            27.564868382121432
-        ],
-        "LONG_NAME": "French Southern Territories",
-        "PAST": [
-            27.087565103639996,
-            27.160319009913334,
-            27.50770263687333,
-            27.544779460153336,
-            26.72295532253333,
-            25.47506917252667,
-            24.53456420844,
-            24.16447143635333,
-            24.333581543033333,
-            25.008127848179996,
-            26.04576416008667,
-            26.858628335826666
-        ]
-    },
-    "ATG": {
-        "FUTURE": [
-            25.1298550195125,
-            24.71382849538393,
-            24.67983845326071,
-            25.025353022614286,
-            25.634575980242854,
-            26.227610452023217,
-            26.782398224046432,
-            27.301798683594644,
-            27.535432542903568,
-            27.37930243363929,
-            26.80713871529286,
-            25.913369859969638
-        ],
-        "LONG_NAME": "Antigua and Barbuda",
-        "PAST": [
-            24.470631917616668,
-            24.015067545423335,
-            23.959956868290007,
-            24.33469238272333,
-            24.984174601076663,
-            25.61501363096,
-            26.206916300413337,
-            26.721433512363333,
-            26.94333394421667,
-            26.78644714366,
-            26.21452738471333,
-            25.287220255226668
-        ]
-    },
-    "AUS": {
-        "FUTURE": [
-            27.338835415618668,
-            26.781202344261356,
-            25.362382546043968,
-            22.69638938784318,
-            19.176820426738654,
-            16.297473377089883,
-            15.545219959050522,
-            17.197620200312794,
-            20.248542548417664,
-            23.445154787088196,
-            25.63317854161591,
-            26.890332389755976
-        ],
-        "LONG_NAME": "Australia",
-        "PAST": [
-            26.723476237333546,
-            26.384698459645627,
-            24.859803458581904,
-            22.011528122137616,
-            18.239496572980716,
-            15.181065239353579,
-            14.387236174952161,
-            15.966201561041544,
-            19.03720855034377,
-            22.33857506917264,
-            24.712108842150723,
-            26.171955964562677
-        ]
-    },
-    "AUT": {
-        "FUTURE": [
-            0.1479037394739338,
-            0.9394456938917041,
-            3.275607716004688,
-            7.050096883455908,
-            11.790333536705388,
-            16.036448094382465,
-            18.30251530226331,
-            17.165012904839937,
-            12.955625955300878,
-            8.13596056661159,
-            3.900072073011588,
-            1.1826880318442246
-        ],
-        "LONG_NAME": "Austria",
-        "PAST": [
-            -1.5625183105869236,
-            -0.9601986047081053,
-            1.9406122380330555,
-            5.823041696243395,
-            10.864902936152122,
-            15.41956824048618,
-            17.77975870782606,
-            16.531962261688243,
-            12.335473448161395,
-            7.553975423099515,
-            3.0223599520686397,
-            -0.012480764695612271
-        ]
-    },
-    "AZE": {
-        "FUTURE": [
-            1.7926607006663995,
-            2.8639297486758695,
-            5.890084006476739,
-            10.076997831225778,
-            14.966850974420812,
-            19.863170078646426,
-            23.518961225111365,
-            23.13679880899838,
-            18.390772040001625,
-            12.847865216295391,
-            7.211337201006188,
-            3.4432519690791543
-        ],
-        "LONG_NAME": "Azerbaijan",
-        "PAST": [
-            0.6055935946047242,
-            1.5021684127013333,
-            4.410761792728648,
-            8.648943721866607,
-            13.763741603778243,
-            19.048662775135156,
-            22.70151940514061,
-            22.371087276500003,
-            17.71013368534909,
-            12.097413034362429,
-            6.443509558524427,
-            2.656422193072443
-        ]
-    },
-    "BDI": {
-        "FUTURE": [
-            20.50689079655595,
-            21.14927636988214,
-            21.55356270914524,
-            21.61755225736071,
-            21.187109810982147,
-            20.77732522112024,
-            20.92111496686905,
-            21.86236499584524,
-            22.390958150491667,
-            21.748300824392857,
-            20.694431486616672,
-            20.222205025520235
-        ],
-        "LONG_NAME": "Burundi",
-        "PAST": [
-            19.51105685829556,
-            20.139173040995555,
-            20.639318169768885,
-            20.70829739018,
-            20.22121310757778,
-            19.833099365340004,
-            20.041944037091113,
-            20.96411471928889,
-            21.44293212962667,
-            20.84660983654889,
-            19.736813693479995,
-            19.24705267976
-        ]
-    },
-    "BEL": {
-        "FUTURE": [
-            4.178563617485126,
-            4.538157690209048,
-            5.917069752980774,
-            8.565423874663214,
-            12.040496462657675,
-            15.606682913701784,
-            17.730494544725598,
-            17.097221192738097,
-            14.183769771001192,
-            10.29090336403881,
-            7.026128496450001,
-            4.991824740401905
-        ],
-        "LONG_NAME": "Belgium",
-        "PAST": [
-            3.1062947591105887,
-            3.320568508623268,
-            4.926498413082,
-            7.388958401159333,
-            11.280121528264775,
-            15.079128010603329,
-            17.394768948228887,
-            16.66935492666111,
-            13.652006699735555,
-            9.832288953960445,
-            6.3447292751955535,
-            4.208667331236333
-        ]
-    },
-    "BEN": {
-        "FUTURE": [
-            24.05907521928884,
-            26.566914967756695,
-            29.376423699260272,
-            30.04775701243661,
-            28.982789584335713,
-            27.850952285032132,
-            26.75667353994509,
-            26.037893023073217,
-            26.58336530399285,
-            27.1795830042875,
-            26.391478129892867,
-            24.160363061079465
-        ],
-        "LONG_NAME": "Benin",
-        "PAST": [
-            22.89313532587333,
-            25.590793609375833,
-            28.62620188356,
-            29.196810659004168,
-            28.201989238225842,
-            26.942876434365832,
-            25.793502044873332,
-            25.186410268114162,
-            25.698958333195833,
-            26.23052647866917,
-            25.274907430599164,
-            22.994942474075838
-        ]
-    },
-    "BFA": {
-        "FUTURE": [
-            22.910533905421943,
-            25.79421934810051,
-            29.316805313852296,
-            31.180595631826783,
-            30.760388743860712,
-            29.575604808390306,
-            28.260430861056374,
-            27.228135011427046,
-            27.75054464537424,
-            28.044362671357646,
-            26.23361478558954,
-            23.125025378947445
-        ],
-        "LONG_NAME": "Burkina Faso",
-        "PAST": [
-            21.448422532229525,
-            24.54843139603571,
-            28.386716279608095,
-            30.159728568063805,
-            29.865054612148572,
-            28.56612258157714,
-            27.207811918960477,
-            26.442403884279994,
-            26.9204341337,
-            27.060757301152382,
-            25.0109592981719,
-            21.76872340633524
-        ]
-    },
-    "BGD": {
-        "FUTURE": [
-            17.03577793703932,
-            19.76864482316707,
-            23.65140511631571,
-            27.02494376073142,
-            28.495700291004994,
-            28.25278788978465,
-            27.044157627999994,
-            26.449010794458218,
-            25.680377415121068,
-            23.570459202234993,
-            20.233461870390077,
-            17.341220856191892
-        ],
-        "LONG_NAME": "Bangladesh",
-        "PAST": [
-            15.830254516138131,
-            18.564627074613202,
-            22.79850341780587,
-            26.350387370207333,
-            27.996681111113332,
-            27.842018636093336,
-            26.62095723508133,
-            26.17589131696667,
-            25.337335204240667,
-            23.126969400873996,
-            19.39865885370914,
-            16.260830688893137
-        ]
-    },
-    "BGR": {
-        "FUTURE": [
-            2.6950915199112484,
-            3.6319040570730627,
-            6.404568399581919,
-            10.583042145117815,
-            15.485148838235713,
-            20.27273872969018,
-            23.44882474671116,
-            22.996660232339284,
-            17.819953101128124,
-            12.06153692499643,
-            7.0577635084144195,
-            4.082874843215661
-        ],
-        "LONG_NAME": "Bulgaria",
-        "PAST": [
-            1.2438501993718032,
-            2.0464711507268833,
-            5.037000020354141,
-            9.339825439247834,
-            14.356741078614002,
-            19.4505917863675,
-            22.595619964812496,
-            22.138447570297497,
-            17.18657964076,
-            11.447696177027753,
-            6.415839894541002,
-            3.1306617736694817
-        ]
-    },
-    "BHR": {
-        "FUTURE": [
-            16.07763562888572,
-            18.35872650147143,
-            22.444670540703573,
-            26.78942108179643,
-            31.163113184917854,
-            35.12539454868572,
-            36.87447030185357,
-            36.352212088603565,
-            33.58822958808572,
-            28.829269409046425,
-            22.705450876025,
-            17.47830527236786
-        ],
-        "LONG_NAME": "Bahrain",
-        "PAST": [
-            14.768678792580001,
-            16.982098388380003,
-            21.134033202926666,
-            25.35813598614,
-            30.049399820746665,
-            34.06648559610001,
-            35.910548909993324,
-            35.54013671863333,
-            32.71067708361333,
-            27.995843506386663,
-            21.70184529631334,
-            16.25613403308
-        ]
-    },
-    "BHS": {
-        "FUTURE": [
-            24.012550899191073,
-            23.688806942303575,
-            23.86152335589286,
-            24.61481162448884,
-            25.766716276170087,
-            26.975680759821877,
-            27.842741012820536,
-            28.22665051049554,
-            28.12972463869152,
-            27.410605294536158,
-            26.172772270782144,
-            24.908182279961164
-        ],
-        "LONG_NAME": "Bahamas",
-        "PAST": [
-            23.30444895401917,
-            22.93424708057,
-            23.042960866463332,
-            23.7690648397875,
-            25.019109344103335,
-            26.233978525539996,
-            27.1182904561025,
-            27.603026835391667,
-            27.551520537802503,
-            26.833573659279164,
-            25.50578308109917,
-            24.242945098434163
-        ]
-    },
-    "BIH": {
-        "FUTURE": [
-            3.129967462620427,
-            3.98096011934977,
-            6.378547668488693,
-            10.029385339457022,
-            14.556496211204108,
-            19.142074221612496,
-            22.17912492273809,
-            21.672376723436315,
-            16.915873391822025,
-            11.630709330092916,
-            7.137175060222321,
-            4.318335396866136
-        ],
-        "LONG_NAME": "Bosnia and Herzegovina",
-        "PAST": [
-            1.743209499815716,
-            2.4019188774891376,
-            5.1187438964945455,
-            8.847575886791557,
-            13.547697956951888,
-            18.294550916753334,
-            21.303478665052218,
-            20.73659464516778,
-            16.179793633293333,
-            10.941030206235114,
-            6.370060221553777,
-            3.295815361824637
-        ]
-    },
-    "BLR": {
-        "FUTURE": [
-            -5.723276099470047,
-            -5.22261631243502,
-            -1.2790460391903749,
-            5.13194352747133,
-            12.067483396135177,
-            17.14915263865357,
-            19.51427124906122,
-            17.782123020153318,
-            12.027130905472143,
-            5.946133360579158,
-            0.4840934130949703,
-            -3.58607249360699
-        ],
-        "LONG_NAME": "Belarus",
-        "PAST": [
-            -7.810736665404495,
-            -7.226326497379728,
-            -2.6799849737180383,
-            3.913543119861447,
-            11.315929013068477,
-            16.71876685735238,
-            19.098284040784286,
-            17.477548072505716,
-            11.583402942963858,
-            5.549400256913763,
-            -0.6093364897741177,
-            -5.278061349019562
-        ]
-    },
-    "BLZ": {
-        "FUTURE": [
-            22.965982709835714,
-            23.68757493170804,
-            25.571089335513392,
-            27.45955494479375,
-            27.886265345420536,
-            27.570246015788396,
-            27.681417737991968,
-            27.817690440762505,
-            27.23374639214464,
-            25.988948276753568,
-            24.590438025266966,
-            23.356863293686608
-        ],
-        "LONG_NAME": "Belize",
-        "PAST": [
-            21.82837015818167,
-            22.577012125601666,
-            24.287015279398336,
-            26.302682495178335,
-            26.899449666008334,
-            26.594487508311666,
-            26.637235514068333,
-            26.875034586703336,
-            26.525226338171667,
-            25.200906372598332,
-            23.596673584934997,
-            22.399258422575
-        ]
-    },
-    "BMU": {
-        "FUTURE": [
-            19.237731933225,
-            18.753009251560716,
-            18.726401193189282,
-            19.39907291945,
-            20.97980499193571,
-            23.374468122471423,
-            25.396997724178572,
-            26.323577880799995,
-            25.967572893132143,
-            24.39781624878929,
-            22.16195351780357,
-            20.30576760393214
-        ],
-        "LONG_NAME": "Bermuda",
-        "PAST": [
-            18.523752848220003,
-            17.998547362906667,
-            17.904199218766667,
-            18.467500813879997,
-            20.142559814353334,
-            22.661077880940002,
-            24.823297119393334,
-            25.855293782846665,
-            25.501792398273338,
-            23.847680664053332,
-            21.55349731413333,
-            19.671793619366667
-        ]
-    },
-    "BOL": {
-        "FUTURE": [
-            22.637986434519878,
-            22.406403304236363,
-            21.83410007768961,
-            20.792330146273635,
-            19.087381865164353,
-            17.441859224043,
-            17.559547882909023,
-            20.263501704727133,
-            23.212722204275888,
-            23.918007412928493,
-            23.549320048776536,
-            22.973069269681506
-        ],
-        "LONG_NAME": "Bolivia, Plurinational State of",
-        "PAST": [
-            21.69850522743168,
-            21.47723559968633,
-            20.990035688907277,
-            19.64540683703398,
-            17.925955682014425,
-            16.19375567492103,
-            16.12537370623512,
-            18.88093716756182,
-            21.897121496525838,
-            22.808690014720753,
-            22.539790531526968,
-            22.009319051809126
-        ]
-    },
-    "BRA": {
-        "FUTURE": [
-            26.274798121776687,
-            26.285041399369085,
-            26.069757136105412,
-            25.391451216719734,
-            24.24641042237892,
-            23.163928850171747,
-            23.329747162836497,
-            25.239404748281753,
-            27.338145326951658,
-            27.9551405492649,
-            27.348350312239194,
-            26.553134247950933
-        ],
-        "LONG_NAME": "Brazil",
-        "PAST": [
-            25.413292971258876,
-            25.472035986530383,
-            25.264315597345743,
-            24.400025458133268,
-            23.209819125529997,
-            22.087122878387888,
-            22.193604667670666,
-            24.12781334264939,
-            26.248107828946992,
-            26.93972479452274,
-            26.404432701224597,
-            25.653412459187166
-        ]
-    },
-    "BRB": {
-        "FUTURE": [
-            25.347020830346427,
-            24.96954127753214,
-            24.996167864696428,
-            25.3724506924893,
-            25.92732456739643,
-            26.441932678100013,
-            26.93521009160714,
-            27.442510332321433,
-            27.662722996810707,
-            27.50210898253215,
-            27.002167838042855,
-            26.11850302529643
-        ],
-        "LONG_NAME": "Barbados",
-        "PAST": [
-            24.69458821654,
-            24.27409871414,
-            24.291477457966664,
-            24.691078694693335,
-            25.278275553486665,
-            25.817148844240002,
-            26.31683756525333,
-            26.83662923117333,
-            27.050148518253334,
-            26.902614340233338,
-            26.404062906186667,
-            25.496966552760004
-        ]
-    },
-    "BRN": {
-        "FUTURE": [
-            25.967217854819644,
-            25.96434947400804,
-            26.480597632160713,
-            26.955366679172325,
-            27.212427684144643,
-            27.155717032192847,
-            26.90569223660893,
-            26.87293488644553,
-            26.856786183336595,
-            26.718904495973216,
-            26.629941395086604,
-            26.358544758263395
-        ],
-        "LONG_NAME": "Brunei Darussalam",
-        "PAST": [
-            25.289532979095,
-            25.25375773116,
-            25.71513163208167,
-            26.19911549937833,
-            26.471032207051664,
-            26.406224059526668,
-            26.18076782227667,
-            26.149792480636673,
-            26.17583516394667,
-            26.08113555893,
-            25.965647379809997,
-            25.65516103140334
-        ]
-    },
-    "BTN": {
-        "FUTURE": [
-            4.083520253396506,
-            6.7888470604071305,
-            11.110725402660098,
-            15.597358340729405,
-            18.387586139477857,
-            19.226513998852084,
-            18.724271502172915,
-            18.092630477533515,
-            16.541285197016254,
-            12.897512707924523,
-            8.147831326522956,
-            4.6680652074028375
-        ],
-        "LONG_NAME": "Bhutan",
-        "PAST": [
-            2.656053670146122,
-            5.253214518205132,
-            9.900560845178711,
-            14.393525186978444,
-            17.46582811086578,
-            18.69969584174367,
-            18.249282158753886,
-            17.806136406227555,
-            16.226755778076555,
-            12.393126084629221,
-            7.2609764946515005,
-            3.425701226145954
-        ]
-    },
-    "BWA": {
-        "FUTURE": [
-            25.001878647686308,
-            24.401232992083635,
-            23.50789242681801,
-            21.49029195823601,
-            18.133254732323067,
-            15.445977801645133,
-            15.219042414729126,
-            18.156827563091973,
-            22.87041514247321,
-            25.871434166703125,
-            25.886875424887055,
-            25.430320058806547
-        ],
-        "LONG_NAME": "Botswana",
-        "PAST": [
-            24.10610478709333,
-            23.706350198745838,
-            22.67250442501861,
-            20.509100680375557,
-            16.867966545844446,
-            14.039461771806584,
-            13.77092251256828,
-            16.771748182673498,
-            21.621624925406387,
-            24.703628963710557,
-            24.745630815014998,
-            24.377247705252778
-        ]
-    },
-    "CAF": {
-        "FUTURE": [
-            24.280984270640527,
-            26.24504563087802,
-            27.555548783205634,
-            26.93552193230879,
-            25.91214089913448,
-            25.234640645735713,
-            24.844428052031866,
-            24.547920477860995,
-            24.74663409568956,
-            25.038806160384613,
-            24.77175127834656,
-            23.781848363123903
-        ],
-        "LONG_NAME": "Central African Republic",
-        "PAST": [
-            23.341280580238205,
-            25.409552159057952,
-            26.782234778817177,
-            26.140079596308976,
-            25.077505884428454,
-            24.327954649748207,
-            23.878692705294103,
-            23.582651931504355,
-            23.783899630066404,
-            24.003261311350002,
-            23.695284799453596,
-            22.74411323704693
-        ]
-    },
-    "CAN": {
-        "FUTURE": [
-            -20.562086616385677,
-            -20.45295422576211,
-            -15.852395091168615,
-            -7.56493250377273,
-            1.194310622935863,
-            7.655822700357413,
-            10.470157625145257,
-            8.462096290595976,
-            3.0815119946258065,
-            -3.6690283801359347,
-            -10.760814059279264,
-            -16.751738211393555
-        ],
-        "LONG_NAME": "Canada",
-        "PAST": [
-            -23.280186305947574,
-            -23.273367704840027,
-            -18.462198599169906,
-            -9.274709088975081,
-            0.11685268386611215,
-            7.250395012216316,
-            10.360453390584382,
-            8.518282370258706,
-            2.844190660536317,
-            -4.761167152266061,
-            -12.42869494526727,
-            -19.010127104919427
-        ]
-    },
-    "CCK": {
-        "FUTURE": [
-            27.503773280839283,
-            27.880104065250002,
-            28.16521780800357,
-            28.176312038171424,
-            27.705713544396435,
-            26.865782601514276,
-            26.259150913825003,
-            25.96309988844643,
-            25.902186802253567,
-            26.117236545850005,
-            26.590880257135716,
-            27.056242806649998
-        ],
-        "LONG_NAME": "Cocos (Keeling) Islands",
-        "PAST": [
-            26.88912557014667,
-            27.322298177226667,
-            27.587274170759997,
-            27.588045247480004,
-            27.07966105188667,
-            26.25253906236667,
-            25.653975423466665,
-            25.326377360586672,
-            25.222100829733332,
-            25.432137043793333,
-            25.90478515560666,
-            26.396008300533335
-        ]
-    },
-    "CHE": {
-        "FUTURE": [
-            1.0114989508096637,
-            1.7595874241963538,
-            3.6858753021411514,
-            6.852497282623572,
-            10.970260075010954,
-            14.994140807002974,
-            17.22278831180893,
-            16.237321580905355,
-            12.526061285418097,
-            8.076058524010296,
-            4.294623965292321,
-            1.941274733740892
-        ],
-        "LONG_NAME": "Switzerland",
-        "PAST": [
-            -0.5919569226677112,
-            -0.07120734326056799,
-            2.4212195502815774,
-            5.575910101965222,
-            10.009310913171,
-            14.390219116856775,
-            16.758653767969996,
-            15.55831434408778,
-            11.92553236201511,
-            7.4627373589448895,
-            3.4342725965970953,
-            0.7961140949893244
-        ]
-    },
-    "CHL": {
-        "FUTURE": [
-            14.220973442514666,
-            14.335123354204923,
-            13.187500525543195,
-            10.84876093571838,
-            8.40206671733898,
-            6.650324860413937,
-            6.013769539134218,
-            6.478238436509771,
-            7.65912898698461,
-            9.273023430140771,
-            11.165219307262417,
-            13.000078396176649
-        ],
-        "LONG_NAME": "Chile",
-        "PAST": [
-            13.68451516258526,
-            13.888421267070035,
-            12.710730598448272,
-            10.325262632467403,
-            7.696752421137499,
-            5.819890957800341,
-            5.0752145676469995,
-            5.540614791106262,
-            6.682686215323719,
-            8.351007988187643,
-            10.343816920693808,
-            12.372647821069787
-        ]
-    },
-    "CHN": {
-        "FUTURE": [
-            -8.665359106407763,
-            -5.657774274438958,
-            0.2869650905029643,
-            6.725093384462584,
-            12.270259936104111,
-            16.705973894063394,
-            18.841047835241735,
-            17.4088929524501,
-            12.580412855887378,
-            5.991077573634947,
-            -0.9072969605260729,
-            -6.835437256716866
-        ],
-        "LONG_NAME": "China",
-        "PAST": [
-            -10.79970385901879,
-            -7.932184938714382,
-            -1.658913378097535,
-            5.248831290538719,
-            11.239965425662149,
-            16.1276208984673,
-            18.652444558362188,
-            17.41814786062808,
-            12.388485838653537,
-            5.512930655926165,
-            -2.070979814398532,
-            -8.613449876304564
-        ]
-    },
-    "CIV": {
-        "FUTURE": [
-            25.35815126030842,
-            27.279833969164798,
-            28.795826114306376,
-            28.63862158296556,
-            27.680006688910968,
-            26.61824603958878,
-            25.650180738840046,
-            25.168541343286734,
-            25.527482791644896,
-            26.107681119094135,
-            26.164720029081384,
-            25.142106192889536
-        ],
-        "LONG_NAME": "Cote d'Ivoire",
-        "PAST": [
-            24.349063401584285,
-            26.45534246635953,
-            28.10805489664905,
-            27.84461800704143,
-            26.804814365272858,
-            25.683632550682383,
-            24.691129557266667,
-            24.285105678036192,
-            24.64171970928048,
-            25.18322463254619,
-            25.110002936222376,
-            24.084511166835235
-        ]
-    },
-    "CMR": {
-        "FUTURE": [
-            23.677374703166226,
-            25.541582652428726,
-            27.15828287029762,
-            27.083110083228572,
-            26.307944843372468,
-            25.646775473039884,
-            25.05180940160714,
-            24.669046447383923,
-            24.94865680847306,
-            25.28738585010357,
-            24.80334027641101,
-            23.465006238133036
-        ],
-        "LONG_NAME": "Cameroon",
-        "PAST": [
-            22.676276651626385,
-            24.66141323557944,
-            26.38233269559528,
-            26.326784600719723,
-            25.510903929923618,
-            24.75163311439889,
-            24.12575547994139,
-            23.743511792971944,
-            24.025231424883888,
-            24.313943905461112,
-            23.738645849688055,
-            22.396077897109446
-        ]
-    },
-    "COD": {
-        "FUTURE": [
-            23.594573601192764,
-            24.355937740917717,
-            24.64652474625592,
-            24.315869967604506,
-            23.72075874011204,
-            23.18151909272554,
-            23.382845287202407,
-            24.216466302948582,
-            24.880311685778572,
-            24.636671196939975,
-            23.75556221695808,
-            23.220164394213352
-        ],
-        "LONG_NAME": "Congo, the Democratic Republic of the",
-        "PAST": [
-            22.702805833497077,
-            23.535829810376168,
-            23.817918333465208,
-            23.435317644009128,
-            22.766329969650418,
-            22.243999604194162,
-            22.451347344425667,
-            23.292466226804844,
-            23.955657261488682,
-            23.65626033906548,
-            22.827106298387218,
-            22.30223032009882
-        ]
-    },
-    "COG": {
-        "FUTURE": [
-            25.045260088486152,
-            25.869271823400222,
-            26.118584428684596,
-            25.67724888656361,
-            25.262700694059824,
-            25.074566636616517,
-            25.187155519488392,
-            25.26644986015089,
-            25.25407552752746,
-            25.06186471631898,
-            24.69486856420379,
-            24.49411324149509
-        ],
-        "LONG_NAME": "Congo",
-        "PAST": [
-            24.195541635560833,
-            25.108925247102086,
-            25.293687947125,
-            24.836161677416253,
-            24.380165863323334,
-            24.19239832618583,
-            24.286878458250836,
-            24.34098981247333,
-            24.325223159965415,
-            24.09956626817917,
-            23.78056271858625,
-            23.596587880519166
-        ]
-    },
-    "COK": {
-        "FUTURE": [
-            26.95795026503571,
-            27.495080130427855,
-            27.57377798905429,
-            27.04664023267929,
-            25.95599278056857,
-            24.84693080379,
-            24.066162109572854,
-            23.773163931587852,
-            23.877720423885727,
-            24.381189182932854,
-            25.16507720949,
-            26.106836374124992
-        ],
-        "LONG_NAME": "Cook Islands",
-        "PAST": [
-            26.355324707068,
-            26.95003051711734,
-            27.023844400916,
-            26.491093750318665,
-            25.426667073066668,
-            24.240190430396005,
-            23.505091145738664,
-            23.166688640140006,
-            23.296027425116005,
-            23.717050374657337,
-            24.478463134787997,
-            25.477127686157335
-        ]
-    },
-    "COL": {
-        "FUTURE": [
-            25.37212407224589,
-            25.956699071500264,
-            26.193946402588832,
-            25.828907939316704,
-            25.059709112540265,
-            24.464449773887317,
-            24.729877526097315,
-            25.824667657688032,
-            26.296190534366332,
-            26.010902459684026,
-            25.485100419242503,
-            25.184677614785183
-        ],
-        "LONG_NAME": "Colombia",
-        "PAST": [
-            24.483821919569497,
-            25.07171081566,
-            25.284598438824496,
-            24.800134582709664,
-            24.021061808244337,
-            23.432616526059828,
-            23.66025894185833,
-            24.797364044675493,
-            25.329694569764833,
-            25.085328114991164,
-            24.59734954857766,
-            24.306577199811503
-        ]
-    },
-    "COM": {
-        "FUTURE": [
-            28.068264552646433,
-            28.136438641971434,
-            28.36980329225715,
-            28.343322753678574,
-            27.541762215046422,
-            26.31661442365,
-            25.390565054914287,
-            25.053400312110714,
-            25.208188738578574,
-            25.910515921717856,
-            26.96936580147857,
-            27.872508457553568
-        ],
-        "LONG_NAME": "Comoros",
-        "PAST": [
-            27.40925699923333,
-            27.41476033558667,
-            27.729498291100004,
-            27.808382161206666,
-            26.9999613444,
-            25.719718424986674,
-            24.735557046946663,
-            24.326127116266665,
-            24.478440348646664,
-            25.155822754733332,
-            26.200433350146668,
-            27.127793375686664
-        ]
-    },
-    "CPV": {
-        "FUTURE": [
-            22.061538151957738,
-            21.61242203466488,
-            21.81037884666667,
-            22.208491371044648,
-            22.612734840420234,
-            23.31640116359285,
-            24.31949942445476,
-            25.232900347320243,
-            25.69502221972858,
-            25.618880135467258,
-            24.794320968893455,
-            23.334235055043447
-        ],
-        "LONG_NAME": "Cape Verde",
-        "PAST": [
-            21.352241346470002,
-            20.812471178045556,
-            20.95006137435,
-            21.391939629628883,
-            21.843967013722217,
-            22.596438260111107,
-            23.691014267929997,
-            24.633781941345557,
-            25.108865017112223,
-            25.038192750000004,
-            24.169733005393336,
-            22.668200682811115
-        ]
-    },
-    "CRI": {
-        "FUTURE": [
-            26.71586593341173,
-            27.03612845307551,
-            27.640037536459186,
-            28.176105110294902,
-            27.99507841798827,
-            27.263201499752558,
-            27.12248572549235,
-            27.359838524348465,
-            27.394938566443876,
-            27.11175147858214,
-            26.887229920039793,
-            26.735311702583676
-        ],
-        "LONG_NAME": "Costa Rica",
-        "PAST": [
-            25.723832194074284,
-            26.08319847444762,
-            26.69623732796666,
-            27.248651123217144,
-            27.11645798457429,
-            26.403148832698093,
-            26.207530866017144,
-            26.50368245369714,
-            26.607750883886663,
-            26.334390113659996,
-            26.09289085738667,
-            25.858817836672376
-        ]
-    },
-    "CUB": {
-        "FUTURE": [
-            24.381964646261363,
-            24.231466417168182,
-            24.718832536663314,
-            25.788182741591232,
-            26.888831993081492,
-            27.80691320290681,
-            28.54995806841493,
-            28.827320148170124,
-            28.510908646846097,
-            27.66066206889416,
-            26.460242531743177,
-            25.201565036461368
-        ],
-        "LONG_NAME": "Cuba",
-        "PAST": [
-            23.597584672051514,
-            23.447762598495153,
-            23.859166740315157,
-            24.919216086945458,
-            26.08706701984303,
-            27.015449477626664,
-            27.7971476234,
-            28.20342333216121,
-            27.960707601430297,
-            27.073185961109093,
-            25.74153164953091,
-            24.477195785610906
-        ]
-    },
-    "CXR": {
-        "FUTURE": [
-            28.358484540600006,
-            28.416042872628573,
-            28.55077144097143,
-            28.62878962902143,
-            28.405688694739286,
-            27.848246982617862,
-            27.123568943671422,
-            26.55970328191072,
-            26.45653206980715,
-            26.930248805739286,
-            27.673763820078563,
-            28.165009634496425
-        ],
-        "LONG_NAME": "Christmas Island",
-        "PAST": [
-            27.734387206766666,
-            27.806803385573332,
-            27.932257079880003,
-            28.09472859686,
-            27.888718668519996,
-            27.287367756980004,
-            26.5314554852,
-            25.871335856586665,
-            25.760146077213335,
-            26.217502848720002,
-            27.01254882827333,
-            27.52431030362
-        ]
-    },
-    "CYM": {
-        "FUTURE": [
-            25.553957257939288,
-            25.234692164878577,
-            25.472157069510722,
-            26.263982500039283,
-            27.153891427085718,
-            27.786324637410708,
-            28.367817470567864,
-            28.68200029629643,
-            28.583885193246427,
-            28.126296996575,
-            27.303381783414284,
-            26.313194275435716
-        ],
-        "LONG_NAME": "Cayman Islands",
-        "PAST": [
-            24.80573120099334,
-            24.511612955580002,
-            24.67216796828,
-            25.470290119906668,
-            26.40810343504,
-            27.071761067666667,
-            27.669927978506664,
-            28.110166422046667,
-            28.05964965744666,
-            27.572760009759996,
-            26.64466552712667,
-            25.63713378862667
-        ]
-    },
-    "CYP": {
-        "FUTURE": [
-            12.250425066169731,
-            12.422405787910268,
-            13.747430801312593,
-            16.000113623405355,
-            19.182484490634824,
-            22.62349482928661,
-            25.472970690222322,
-            26.17755235946339,
-            24.1007690428259,
-            20.633745739002677,
-            16.627383913519644,
-            13.690357208338396
-        ],
-        "LONG_NAME": "Cyprus",
-        "PAST": [
-            11.398310851712834,
-            11.450557454501164,
-            12.753338114680998,
-            15.019318644038334,
-            18.091368611458336,
-            21.868074544101667,
-            24.830668131896662,
-            25.61242675811,
-            23.635691324926665,
-            20.158521525048336,
-            16.091873169186666,
-            13.023686726854834
-        ]
-    },
-    "CZE": {
-        "FUTURE": [
-            -0.08921281104550285,
-            0.5757465666895877,
-            2.975709824291686,
-            7.048261854248572,
-            12.05084543382036,
-            16.21018267503135,
-            18.28990827281746,
-            16.97964332196508,
-            12.788622174878133,
-            7.982915605785755,
-            3.6932715763637622,
-            0.9423403058068004
-        ],
-        "LONG_NAME": "Czech Republic",
-        "PAST": [
-            -1.7884015118147631,
-            -1.3172349717559186,
-            1.673410373274442,
-            5.862302653047408,
-            11.239290365557482,
-            15.742702682120003,
-            17.947767695851848,
-            16.561127161471113,
-            12.257252333255629,
-            7.477532506839186,
-            2.8387349445887655,
-            -0.23699046947235106
-        ]
-    },
-    "DEU": {
-        "FUTURE": [
-            1.4808378490875111,
-            1.8755189078175802,
-            3.6325004033914445,
-            6.971123123240017,
-            11.258749226008536,
-            15.114725167241161,
-            17.154589898149467,
-            16.19491773343786,
-            12.81096033379973,
-            8.599938419766733,
-            4.872268077288082,
-            2.4549497877272657
-        ],
-        "LONG_NAME": "Germany",
-        "PAST": [
-            0.019489135738839147,
-            0.23686991373192964,
-            2.4288368733965457,
-            5.759833170556202,
-            10.4590148926855,
-            14.634955545848568,
-            16.831819559352667,
-            15.837168884457538,
-            12.316583963846732,
-            8.1135119629812,
-            4.060271097821727,
-            1.4365812174334747
-        ]
-    },
-    "DJI": {
-        "FUTURE": [
-            21.595336913529763,
-            23.066796076264286,
-            25.458356584453576,
-            27.67469533283691,
-            29.397818429521426,
-            30.428031920958336,
-            29.427311125116663,
-            28.517188299669048,
-            28.70221673905238,
-            26.759853544558332,
-            24.201140994471427,
-            22.158729190225
-        ],
-        "LONG_NAME": "Djibouti",
-        "PAST": [
-            20.393925645551114,
-            21.73397962788222,
-            24.25701226232667,
-            26.518650308926663,
-            28.275636799679994,
-            29.69895765453556,
-            28.78389960393111,
-            27.987334526395557,
-            28.13137681759333,
-            26.091345893042224,
-            23.37412787534667,
-            20.95791829465556
-        ]
-    },
-    "DMA": {
-        "FUTURE": [
-            25.26592254621071,
-            24.856203351467855,
-            24.83375985302857,
-            25.182858057592863,
-            25.7782592771,
-            26.343958173232142,
-            26.868640354807145,
-            27.37985556449643,
-            27.61704690061428,
-            27.469533647557142,
-            26.92614746106786,
-            26.044727870532146
-        ],
-        "LONG_NAME": "Dominica",
-        "PAST": [
-            24.612994385186667,
-            24.160139973939998,
-            24.11828816703333,
-            24.491827392099996,
-            25.12279663128,
-            25.728332520006667,
-            26.285150146686668,
-            26.79186604826667,
-            27.016585286233333,
-            26.87183227483333,
-            26.333355713,
-            25.426961262706662
-        ]
-    },
-    "DNK": {
-        "FUTURE": [
-            1.5914828891048363,
-            1.2970584688270501,
-            2.4132899328839916,
-            5.374680201053125,
-            9.568481990302384,
-            13.523826871424376,
-            15.781956173162891,
-            15.237254641813992,
-            12.417745953883633,
-            8.76898992643137,
-            5.4008880796861245,
-            2.9054482778187176
-        ],
-        "LONG_NAME": "Denmark",
-        "PAST": [
-            0.2113650851857655,
-            -0.21332007512914286,
-            1.2130318536234945,
-            4.128316243556496,
-            8.683257887104276,
-            12.888268534482169,
-            15.322495523422056,
-            14.962211099618893,
-            11.998403930839386,
-            8.381008402483333,
-            4.582937282952019,
-            1.830605400938611
-        ]
-    },
-    "DOM": {
-        "FUTURE": [
-            25.25770914039286,
-            25.022191183957737,
-            25.162656511522624,
-            25.629379635961303,
-            26.259746551628574,
-            26.913112821825592,
-            27.517133077078572,
-            27.926882788786315,
-            27.963489533194046,
-            27.5639279684625,
-            26.84042431097976,
-            25.939076196347024
-        ],
-        "LONG_NAME": "Dominican Republic",
-        "PAST": [
-            24.466467963267778,
-            24.19371541361445,
-            24.32697448719889,
-            24.82077365368667,
-            25.514991930083337,
-            26.150584920827782,
-            26.809557766527778,
-            27.25440097398,
-            27.30085415290667,
-            26.879073757787776,
-            26.12815212616,
-            25.220109049875557
-        ]
-    },
-    "DZA": {
-        "FUTURE": [
-            11.293656382626198,
-            13.99899085805868,
-            18.06184020452319,
-            22.16765045116545,
-            26.38206346407332,
-            30.10282434075367,
-            32.012100249052466,
-            31.14502066516593,
-            27.579297540356613,
-            22.23944788467723,
-            16.13654249359539,
-            11.906589346309257
-        ],
-        "LONG_NAME": "Algeria",
-        "PAST": [
-            9.578979849293129,
-            12.175866397160535,
-            16.512242498184992,
-            20.64973240755757,
-            25.09208635244262,
-            29.123860677254324,
-            31.35671854070036,
-            30.59921088647559,
-            26.942754301935683,
-            21.3979052290237,
-            14.98429474637692,
-            10.51190812390409
-        ]
-    },
-    "ECU": {
-        "FUTURE": [
-            23.706075177805477,
-            23.94072905088358,
-            24.106342279120003,
-            24.155228169611906,
-            23.842705572026667,
-            23.283784993152377,
-            23.150766135980234,
-            23.51638205415738,
-            23.552573140788336,
-            23.45062154140762,
-            23.466420346434997,
-            23.55134313726547
-        ],
-        "LONG_NAME": "Ecuador",
-        "PAST": [
-            22.819010688819553,
-            23.09027452283067,
-            23.269265815093775,
-            23.27928236194178,
-            22.962100965767107,
-            22.392989772824446,
-            22.208204210286222,
-            22.62220445423867,
-            22.686299913089332,
-            22.55693617135822,
-            22.59956108917822,
-            22.69217664906133
-        ]
-    },
-    "EGY": {
-        "FUTURE": [
-            13.137405542792488,
-            15.009501600629777,
-            18.55552735208127,
-            22.32376334267539,
-            26.015691720014285,
-            29.187804674900583,
-            30.538364189581753,
-            30.30517416163254,
-            27.761723021237835,
-            23.748710985571527,
-            18.33508695547037,
-            14.225530764694662
-        ],
-        "LONG_NAME": "Egypt",
-        "PAST": [
-            11.688268933460343,
-            13.676304227689567,
-            17.251212620247564,
-            21.255149827285944,
-            25.065797603235136,
-            28.4324137372937,
-            29.887925485964683,
-            29.753281271783603,
-            27.204655772303248,
-            22.983727202448108,
-            17.35314347528667,
-            12.98456250447935
-        ]
-    },
-    "ERI": {
-        "FUTURE": [
-            22.3518591383125,
-            23.79852031586993,
-            26.359384355190773,
-            28.773557208430955,
-            30.515883037139282,
-            31.66337866987143,
-            30.947334108311008,
-            30.08627482834702,
-            30.057013284793154,
-            28.47100430398691,
-            25.730144228950298,
-            23.139817646915777
-        ],
-        "LONG_NAME": "Eritrea",
-        "PAST": [
-            21.14689449712278,
-            22.541202460516107,
-            25.18959554086889,
-            27.58478122378722,
-            29.32169986306555,
-            30.71608581555722,
-            30.083475748774447,
-            29.386973910649996,
-            29.26123521567389,
-            27.619794379275554,
-            24.753771294204444,
-            21.912477621094446
-        ]
-    },
-    "ESH": {
-        "FUTURE": [
-            16.681517669530603,
-            18.641807624340622,
-            21.247042724475225,
-            23.27382550961362,
-            25.123974799818967,
-            27.183873517135048,
-            29.247720446132806,
-            29.516486099892187,
-            28.19456141321786,
-            25.204856259603577,
-            20.90335675648326,
-            17.383567196909954
-        ],
-        "LONG_NAME": "Western Sahara",
-        "PAST": [
-            15.35558865858121,
-            17.25012067160667,
-            19.927869670026666,
-            22.03558705699208,
-            23.88916956539875,
-            26.19491729697834,
-            28.56014137262458,
-            28.922411219978756,
-            27.411617151231667,
-            24.289313507462502,
-            19.816690191047083,
-            16.246317672514788
-        ]
-    },
-    "ESP": {
-        "FUTURE": [
-            10.746248451624783,
-            11.259346503719739,
-            12.385363690278657,
-            13.972174211165527,
-            16.42206560307528,
-            19.682075500583007,
-            22.44435730652392,
-            22.594186989357357,
-            20.3885939292632,
-            16.807939306966325,
-            13.602282833385368,
-            11.542672558304728
-        ],
-        "LONG_NAME": "Spain",
-        "PAST": [
-            9.765194856296889,
-            10.102066810936526,
-            11.476592586158969,
-            12.942442861164142,
-            15.344138590902121,
-            18.876466508732726,
-            21.763574218917782,
-            21.874154014604844,
-            19.72950285318465,
-            16.16993660959856,
-            12.9990318835103,
-            10.774915167220122
-        ]
-    },
-    "EST": {
-        "FUTURE": [
-            -5.7980713165868085,
-            -6.115741048925683,
-            -3.070862088959402,
-            2.549325534377878,
-            8.68800517487,
-            13.755405561770976,
-            16.29074192066643,
-            14.767610822479416,
-            10.13435731628366,
-            5.037186213929947,
-            0.34723826819186693,
-            -3.5510696683917886
-        ],
-        "LONG_NAME": "Estonia",
-        "PAST": [
-            -8.060148620732457,
-            -8.210125986773248,
-            -4.4515716553319,
-            1.1520019531565875,
-            7.769296773193999,
-            13.088163503356416,
-            15.801092020645585,
-            14.506797790364836,
-            9.772093200568666,
-            4.790786488827666,
-            -0.78695195513548,
-            -5.571630350766059
-        ]
-    },
-    "ETH": {
-        "FUTURE": [
-            22.430782068193345,
-            23.991120356574815,
-            25.619691237527228,
-            26.14915775587818,
-            25.718645603798652,
-            25.36587182724894,
-            24.485667283632434,
-            24.191167558800874,
-            24.697398418270847,
-            24.09282799203504,
-            23.023949258480602,
-            22.202116830460426
-        ],
-        "LONG_NAME": "Ethiopia",
-        "PAST": [
-            21.385060903815315,
-            22.955711020810806,
-            24.7220473280636,
-            25.238310007666843,
-            24.753587491860184,
-            24.506479954496932,
-            23.61302319781874,
-            23.346568009792428,
-            23.83777691254721,
-            23.18894389356594,
-            22.113754080039463,
-            21.11892705736703
-        ]
-    },
-    "FIN": {
-        "FUTURE": [
-            -11.889890806988086,
-            -11.801154630275816,
-            -7.946348513583598,
-            -1.4581196306834492,
-            5.015836204787105,
-            10.83626461031962,
-            13.20357857431903,
-            11.075646945100258,
-            6.136750323473515,
-            0.6933438438502044,
-            -4.745146887622515,
-            -9.388951659604867
-        ],
-        "LONG_NAME": "Finland",
-        "PAST": [
-            -14.740490309235948,
-            -14.604132016346066,
-            -9.562040137775732,
-            -3.0457560220860933,
-            3.9354455947907057,
-            10.121311377805833,
-            12.82654832213625,
-            11.018245060864249,
-            5.901359748868445,
-            0.29744885762993506,
-            -6.287398497198861,
-            -12.001302210684544
-        ]
-    },
-    "FJI": {
-        "FUTURE": [
-            27.599093845508037,
-            28.037190573498215,
-            28.02493422402768,
-            27.545964104615184,
-            26.53456905956786,
-            25.38905525213036,
-            24.536434173674998,
-            24.247604914920537,
-            24.467623029345532,
-            25.009851182811612,
-            25.848015649454464,
-            26.7953395842375
-        ],
-        "LONG_NAME": "Fiji",
-        "PAST": [
-            27.006208292661665,
-            27.4965164185,
-            27.489074707423335,
-            26.98824005201,
-            25.98742879217667,
-            24.787097167755004,
-            23.953081766774993,
-            23.58273061192667,
-            23.781917317255,
-            24.327036539533335,
-            25.144770813211668,
-            26.137115478526667
-        ]
-    },
-    "FLK": {
-        "FUTURE": [
-            9.721041543056073,
-            10.131122043994464,
-            9.391202654263214,
-            7.7607759747800005,
-            6.137563977881965,
-            4.886023385183571,
-            4.208994184246428,
-            4.144773210805893,
-            4.484301430808571,
-            5.244876861453214,
-            6.628834315845537,
-            8.32316807333375
-        ],
-        "LONG_NAME": "Falkland Islands (Malvinas)",
-        "PAST": [
-            9.398591105393667,
-            9.861516315958,
-            9.104494222109334,
-            7.522321573890666,
-            5.731535847999667,
-            4.370927937853334,
-            3.7106618245138003,
-            3.5272521972923667,
-            3.783521525131334,
-            4.595415242494666,
-            6.065655517586666,
-            7.9460337321429995
-        ]
-    },
-    "FRA": {
-        "FUTURE": [
-            5.787683858612503,
-            6.33971094573913,
-            7.737647878241254,
-            10.063280774742426,
-            13.273379900273852,
-            16.961455836452917,
-            19.456256156616558,
-            19.0456324657039,
-            16.010058151276006,
-            11.975177913796768,
-            8.635492233872641,
-            6.594316754817422
-        ],
-        "LONG_NAME": "France",
-        "PAST": [
-            4.6382092408495,
-            4.957215773447921,
-            6.717093727890562,
-            8.925589020110912,
-            12.366239482114707,
-            16.338389078656164,
-            18.981768182168288,
-            18.44191296537758,
-            15.442847234557473,
-            11.43182860118309,
-            7.97276666841807,
-            5.734530485543857
-        ]
-    },
-    "FRO": {
-        "FUTURE": [
-            5.764702388217857,
-            5.572862352707321,
-            5.708463396255536,
-            6.4185344151967865,
-            7.6109864371973215,
-            9.314609527600357,
-            10.925776345458928,
-            11.366579873256429,
-            10.403683798631963,
-            8.603749411452322,
-            7.071292877214643,
-            6.139151436930178
-        ],
-        "LONG_NAME": "Faroe Islands",
-        "PAST": [
-            5.294448852585666,
-            5.036479695734999,
-            5.190531412806333,
-            5.735390218017,
-            7.111362711613333,
-            9.022396850578666,
-            10.654092407153001,
-            11.182476807023999,
-            10.131555176187332,
-            8.300053914361667,
-            6.694471232101,
-            5.744061279348667
-        ]
-    },
-    "FSM": {
-        "FUTURE": [
-            28.096126011653574,
-            27.967120579221437,
-            28.044207254971433,
-            28.177356174817856,
-            28.28428468212738,
-            28.349296570280952,
-            28.376919700536906,
-            28.459663390713096,
-            28.453207833623814,
-            28.398735772916663,
-            28.421394711298806,
-            28.374812897791667
-        ],
-        "LONG_NAME": "Micronesia, Federated States of",
-        "PAST": [
-            27.46499904998222,
-            27.30850287575111,
-            27.352105035397773,
-            27.478586833082222,
-            27.584608289395554,
-            27.665966119133326,
-            27.69381985100889,
-            27.800903320602224,
-            27.81105414521111,
-            27.76197170704445,
-            27.78193291580667,
-            27.73256768139778
-        ]
-    },
-    "GAB": {
-        "FUTURE": [
-            25.46645237842665,
-            26.065349956046436,
-            26.427792895243414,
-            26.28322785730605,
-            25.922918130848622,
-            25.587955013720883,
-            25.317736531068952,
-            25.25787722473489,
-            25.421810443558247,
-            25.46894719096181,
-            25.261652097660715,
-            25.15169038821099
-        ],
-        "LONG_NAME": "Gabon",
-        "PAST": [
-            24.641199512959485,
-            25.31964549561128,
-            25.668998365732822,
-            25.504224102268207,
-            25.10392706440923,
-            24.74887710984359,
-            24.45930692293179,
-            24.361686980113845,
-            24.507191037700515,
-            24.585414006011277,
-            24.387341777812306,
-            24.27134055068872
-        ]
-    },
-    "GBR": {
-        "FUTURE": [
-            5.588575570104906,
-            5.60725394115216,
-            6.355843069996598,
-            8.05150268546477,
-            10.459315054732627,
-            13.194499468266958,
-            14.938542043957,
-            14.718644671416007,
-            12.914377049154513,
-            10.174215087985242,
-            7.784093279142655,
-            6.232088012702481
-        ],
-        "LONG_NAME": "United Kingdom",
-        "PAST": [
-            4.835169108127007,
-            4.825475911468647,
-            5.614327473990467,
-            7.100496663412267,
-            9.803944010222933,
-            12.744039062682905,
-            14.681631591390426,
-            14.483836751188585,
-            12.56921313418888,
-            9.829462564968134,
-            7.253223470072613,
-            5.7160059408257515
-        ]
-    },
-    "GEO": {
-        "FUTURE": [
-            0.3907165525750735,
-            1.2062300080201551,
-            4.1645911080317,
-            8.673538363694437,
-            13.621915077997398,
-            18.202828543641836,
-            21.773399975744386,
-            21.85390036495357,
-            16.609237204256125,
-            10.898894485465409,
-            5.570067736544999,
-            2.101139924994173
-        ],
-        "LONG_NAME": "Georgia",
-        "PAST": [
-            -0.7316353934046365,
-            -0.10740647088318657,
-            2.775204322381153,
-            7.365967378183523,
-            12.549977039474095,
-            17.596895926561903,
-            21.05262422052476,
-            21.07893880222095,
-            15.910507347251428,
-            10.257713390787618,
-            4.881949869801915,
-            1.3622500464870877
-        ]
-    },
-    "GGY": {
-        "FUTURE": [
-            6.904841831611785,
-            7.006546020350714,
-            7.798290797693928,
-            9.615514482463928,
-            12.214757646414286,
-            15.311432974850003,
-            17.34137943814643,
-            17.14777701244285,
-            15.047574724589285,
-            11.924507141104641,
-            9.305002485152501,
-            7.648558480453929
-        ],
-        "LONG_NAME": "Guernsey",
-        "PAST": [
-            6.117486572245332,
-            6.062227376342666,
-            6.975828043584,
-            8.57254842139933,
-            11.480200195451333,
-            14.724678548659998,
-            16.985064696873334,
-            16.714794921533333,
-            14.569637043753335,
-            11.557157389422667,
-            8.859521484209333,
-            7.166949462539333
-        ]
-    },
-    "GHA": {
-        "FUTURE": [
-            25.43818573676458,
-            27.458614712266673,
-            29.25995054679434,
-            29.317301522976777,
-            28.364601225739587,
-            27.326860064418753,
-            26.359689349374406,
-            25.769993100833634,
-            26.147168386682136,
-            26.718757447912196,
-            26.61431149065149,
-            25.31914974381786
-        ],
-        "LONG_NAME": "Ghana",
-        "PAST": [
-            24.405261400108333,
-            26.592018467006664,
-            28.547211880350556,
-            28.499739074549442,
-            27.537838406095556,
-            26.420887926928334,
-            25.397929382403333,
-            24.893048435384447,
-            25.264419385407777,
-            25.80488179584667,
-            25.581331380673337,
-            24.273549227826667
-        ]
-    },
-    "GIB": {
-        "FUTURE": [
-            12.198219299315356,
-            13.067974635110714,
-            14.71906171565,
-            16.80899483785714,
-            19.93857138530357,
-            23.80402156278214,
-            27.01694052521072,
-            26.993948800124997,
-            24.370729719307146,
-            19.744559151907144,
-            15.602343967846428,
-            13.037900652424998
-        ],
-        "LONG_NAME": "Gibraltar",
-        "PAST": [
-            11.103029378163335,
-            11.906778971731997,
-            13.715472412379999,
-            15.61280517513333,
-            18.520701091079996,
-            22.74373168894666,
-            26.207649739726662,
-            26.201688638746667,
-            23.538002522899998,
-            18.964912922886665,
-            14.854748535239999,
-            12.203184000530666
-        ]
-    },
-    "GIN": {
-        "FUTURE": [
-            24.632667938087337,
-            26.617758416243827,
-            28.568685061187328,
-            29.081287830239937,
-            28.525259042464285,
-            27.303191246631815,
-            26.1380504258815,
-            25.535154664982475,
-            25.884983012809744,
-            26.5216133812224,
-            26.309547523489933,
-            24.680778998337342
-        ],
-        "LONG_NAME": "Guinea",
-        "PAST": [
-            23.476980868281206,
-            25.648003965952732,
-            27.808171867680606,
-            28.289388020673336,
-            27.632143148129092,
-            26.34247362623394,
-            25.125404126744847,
-            24.61346010111212,
-            24.974584220541217,
-            25.505245324583637,
-            25.14936948808424,
-            23.514428710502425
-        ]
-    },
-    "GLP": {
-        "FUTURE": [
-            25.26592254621071,
-            24.856203351467855,
-            24.83375985302857,
-            25.182858057592863,
-            25.7782592771,
-            26.343958173232142,
-            26.868640354807145,
-            27.37985556449643,
-            27.61704690061428,
-            27.469533647557142,
-            26.92614746106786,
-            26.044727870532146
-        ],
-        "LONG_NAME": "Guadeloupe",
-        "PAST": [
-            24.612994385186667,
-            24.160139973939998,
-            24.11828816703333,
-            24.491827392099996,
-            25.12279663128,
-            25.728332520006667,
-            26.285150146686668,
-            26.79186604826667,
-            27.016585286233333,
-            26.87183227483333,
-            26.333355713,
-            25.426961262706662
-        ]
-    },
-    "GMB": {
-        "FUTURE": [
-            24.858540126366076,
-            26.85202189838929,
-            29.12125342217679,
-            30.417909894907144,
-            30.593571799067856,
-            30.025575910003575,
-            29.032914843078565,
-            28.384108407212494,
-            28.765408107117853,
-            29.280003139173214,
-            28.243226732394646,
-            25.466029575516067
-        ],
-        "LONG_NAME": "Gambia",
-        "PAST": [
-            23.75384012844,
-            25.816126505910002,
-            28.264302571446667,
-            29.569265746716663,
-            29.837635294810003,
-            29.075504557153334,
-            28.057360839486666,
-            27.589276123233336,
-            27.97597961497667,
-            28.357644653330002,
-            27.109826660073335,
-            24.354809570306664
-        ]
-    },
-    "GNB": {
-        "FUTURE": [
-            26.33117348789643,
-            27.185298647547317,
-            28.085877826747318,
-            28.288464137126777,
-            28.087950297472315,
-            27.771938868283037,
-            27.295566831161608,
-            26.845775604164285,
-            27.123263223046433,
-            27.763433456299108,
-            27.93097005575803,
-            26.77834946739286
-        ],
-        "LONG_NAME": "Guinea-Bissau",
-        "PAST": [
-            25.48349711011,
-            26.415712992308332,
-            27.427168273853333,
-            27.615871174906665,
-            27.35109761554833,
-            26.955448913323334,
-            26.373084004218338,
-            25.942316691031667,
-            26.259759012391665,
-            26.870797729571667,
-            26.965781148311674,
-            25.88117828345166
-        ]
-    },
-    "GNQ": {
-        "FUTURE": [
-            25.50271824432946,
-            26.13036128439464,
-            26.445676803617854,
-            26.23294258106696,
-            25.824695042248216,
-            25.42061751192768,
-            25.137596947974117,
-            25.059915270358932,
-            25.183408737098212,
-            25.232700620100896,
-            25.194799151031255,
-            25.20639228859732
-        ],
-        "LONG_NAME": "Equatorial Guinea",
-        "PAST": [
-            24.72195383667167,
-            25.405292765586672,
-            25.695376587371666,
-            25.477806091575005,
-            25.03653004897834,
-            24.60565694203167,
-            24.295981343919998,
-            24.160170491921658,
-            24.268153381008336,
-            24.37035878532,
-            24.344595845528332,
-            24.374921671188325
-        ]
-    },
-    "GRC": {
-        "FUTURE": [
-            9.62226710262413,
-            9.91210507584257,
-            11.435214572595177,
-            13.974587758364345,
-            17.513846564103368,
-            21.688627091971433,
-            24.983897133482344,
-            25.255039215430944,
-            21.84061062486111,
-            17.54317595458814,
-            13.591153826510512,
-            11.005210634054166
-        ],
-        "LONG_NAME": "Greece",
-        "PAST": [
-            8.604753734689757,
-            8.763166865782186,
-            10.29978502050603,
-            12.910233335306446,
-            16.465150620634592,
-            20.85056242774518,
-            24.20428082506222,
-            24.469276711207407,
-            21.201031946378887,
-            16.958412113616223,
-            13.061135863841555,
-            10.285410449750177
-        ]
-    },
-    "GRD": {
-        "FUTURE": [
-            25.514857701074998,
-            25.327813284792853,
-            25.540966578982147,
-            26.013347080871434,
-            26.463684082253575,
-            26.753531319828575,
-            27.099961417160706,
-            27.557078769624997,
-            27.69197409476428,
-            27.50732530888928,
-            26.986114502007137,
-            26.181943621039288
-        ],
-        "LONG_NAME": "Grenada",
-        "PAST": [
-            24.800394694459996,
-            24.585386149146665,
-            24.810933430933332,
-            25.30324503569333,
-            25.767523193886667,
-            26.062581380246666,
-            26.401344808566666,
-            26.872735596000002,
-            27.041404215740002,
-            26.86134846996667,
-            26.32255249058,
-            25.487858072993333
-        ]
-    },
-    "GRL": {
-        "FUTURE": [
-            -27.215451042048052,
-            -27.438827499371836,
-            -25.589109474329128,
-            -20.205475324487363,
-            -12.291477656628203,
-            -6.066611971107244,
-            -3.6290520879673487,
-            -5.797719135104094,
-            -12.07709514431012,
-            -18.041382955678326,
-            -22.52079230052933,
-            -25.67681519881088
-        ],
-        "LONG_NAME": "Greenland",
-        "PAST": [
-            -28.88730420109594,
-            -29.638833076114008,
-            -27.584624967764324,
-            -21.64475885504301,
-            -13.061584213093344,
-            -6.11751949468062,
-            -3.553008966870651,
-            -6.021529493439575,
-            -12.328529910524288,
-            -19.044112157914196,
-            -23.704136562825468,
-            -27.111428838024327
-        ]
-    },
-    "GTM": {
-        "FUTURE": [
-            23.115735268360712,
-            23.957687533761224,
-            25.94404804451275,
-            27.81530964134898,
-            28.053169405878574,
-            27.47974582582704,
-            27.550738120733154,
-            27.622646720587756,
-            26.958417308450503,
-            25.783478561320923,
-            24.553518645662756,
-            23.422676086679083
-        ],
-        "LONG_NAME": "Guatemala",
-        "PAST": [
-            21.877464658002857,
-            22.801513381560003,
-            24.656354922574284,
-            26.63367164289524,
-            27.01854945587238,
-            26.40961710617905,
-            26.38024553505524,
-            26.56696196026286,
-            26.109083194511427,
-            24.871211751649522,
-            23.464761207437142,
-            22.33337693025238
-        ]
-    },
-    "GUF": {
-        "FUTURE": [
-            26.73992556606905,
-            26.97952561134286,
-            27.437530698980357,
-            27.46817997521548,
-            26.846345629118453,
-            26.273269107862497,
-            26.700684683597018,
-            27.759945460554174,
-            28.31143769789523,
-            28.49654570094346,
-            28.05711037784226,
-            27.157997858227983
-        ],
-        "LONG_NAME": "French Guiana",
-        "PAST": [
-            25.887736681173333,
-            26.167228529263333,
-            26.59378933348666,
-            26.674458143375553,
-            26.048289319983333,
-            25.477126735682223,
-            25.88870408812667,
-            26.92032402880889,
-            27.496880086004445,
-            27.69279615570111,
-            27.187042575914443,
-            26.262565443318888
-        ]
-    },
-    "GUM": {
-        "FUTURE": [
-            26.80909075063928,
-            26.48714011106429,
-            26.630550929400005,
-            27.13504028264286,
-            27.69922528962142,
-            28.216303144660717,
-            28.42615727040715,
-            28.532269069199998,
-            28.607063293192862,
-            28.560756138592858,
-            28.214961461007142,
-            27.48783220518215
-        ],
-        "LONG_NAME": "Guam",
-        "PAST": [
-            26.137530517073333,
-            25.825998942246667,
-            26.00325317340667,
-            26.491811116673333,
-            27.032430013213336,
-            27.51683349539333,
-            27.788077799160003,
-            27.916247558753334,
-            27.980033366066667,
-            27.94403076214,
-            27.58693644168,
-            26.852732341066666
-        ]
-    },
-    "GUY": {
-        "FUTURE": [
-            26.832172720616427,
-            27.415738459805,
-            28.14692055858179,
-            28.175224958219992,
-            27.12489133561607,
-            25.906959534016785,
-            26.087445831169283,
-            27.67166911560357,
-            29.094806017133568,
-            29.19689647078928,
-            28.129890769094285,
-            27.059761374395002
-        ],
-        "LONG_NAME": "Guyana",
-        "PAST": [
-            25.863956705979998,
-            26.45070536318333,
-            27.09658894849867,
-            27.109666544547995,
-            26.098310140249335,
-            24.878095704095326,
-            24.99087463353666,
-            26.606990966902003,
-            28.06541239425533,
-            28.137451579030664,
-            27.05927429219467,
-            26.013781941368002
-        ]
-    },
-    "HKG": {
-        "FUTURE": [
-            16.61959620894643,
-            18.293724059889286,
-            21.296139308107144,
-            24.28719656792143,
-            26.468750000300002,
-            27.61946759894642,
-            27.88204847097499,
-            27.758555820989283,
-            26.978814260957154,
-            24.744187491167857,
-            21.496368408139286,
-            17.9342019217
-        ],
-        "LONG_NAME": "Hong Kong",
-        "PAST": [
-            15.778129068480002,
-            17.250364176166666,
-            20.361523437540004,
-            23.481679280686667,
-            25.769197591173334,
-            27.03639526317333,
-            27.542848714220003,
-            27.657521565593335,
-            26.78634643558,
-            24.510858154113333,
-            21.035839843279994,
-            17.127565511060002
-        ]
-    },
-    "HND": {
-        "FUTURE": [
-            24.56891656282381,
-            25.096051292123807,
-            26.325791979724613,
-            27.559159778199994,
-            27.718976702288092,
-            27.17405579614484,
-            27.23461417527301,
-            27.416644262794446,
-            27.14842320994563,
-            26.48337712424127,
-            25.63901774069206,
-            24.84920198980159
-        ],
-        "LONG_NAME": "Honduras",
-        "PAST": [
-            23.474142794905926,
-            24.01823979129408,
-            25.212102140972593,
-            26.481627513224442,
-            26.786133265217778,
-            26.22714097734148,
-            26.186137560163704,
-            26.468290880276292,
-            26.362958893988885,
-            25.669077555356296,
-            24.723530409284443,
-            23.890094672581487
-        ]
-    },
-    "HRV": {
-        "FUTURE": [
-            3.4557418823513517,
-            4.278329249854245,
-            6.598411778141787,
-            10.13310503280675,
-            14.574014281848894,
-            19.102244786434287,
-            22.111229269633217,
-            21.622535705618215,
-            17.037636239394992,
-            11.863953290592999,
-            7.4364388602809655,
-            4.6297337125060745
-        ],
-        "LONG_NAME": "Croatia",
-        "PAST": [
-            2.073433430971887,
-            2.7101281738591685,
-            5.3704073079867864,
-            8.981858927258465,
-            13.583805948443398,
-            18.287905883658002,
-            21.285926106884,
-            20.75073526995733,
-            16.331495768376666,
-            11.20966227187087,
-            6.677349446823134,
-            3.6215148925203757
-        ]
-    },
-    "HTI": {
-        "FUTURE": [
-            25.470419202975002,
-            25.315321786365185,
-            25.549450193163384,
-            26.11691311438125,
-            26.75236783678929,
-            27.387157167518755,
-            27.996051243251788,
-            28.339517593763393,
-            28.25700841678036,
-            27.763338361487495,
-            27.019506726729457,
-            26.117054258310713
-        ],
-        "LONG_NAME": "Haiti",
-        "PAST": [
-            24.679827880660003,
-            24.485720825165,
-            24.703501383733332,
-            25.27822774223667,
-            25.974539692990003,
-            26.57939758285666,
-            27.23131815614333,
-            27.636388651535004,
-            27.57823944126333,
-            27.06491750108,
-            26.315679423083328,
-            25.414138285355
-        ]
-    },
-    "HUN": {
-        "FUTURE": [
-            0.07718372333890984,
-            1.052831513451723,
-            3.8966516765695483,
-            8.271508489569241,
-            13.405102184813751,
-            17.86004856683393,
-            20.389748845400444,
-            19.378406797495096,
-            14.460887500341071,
-            9.05758939455616,
-            4.293597902567162,
-            1.287283761153682
-        ],
-        "LONG_NAME": "Hungary",
-        "PAST": [
-            -1.563855997723304,
-            -0.7942339579269614,
-            2.609167226163117,
-            7.148557027205666,
-            12.546998596201583,
-            17.24616724679667,
-            19.762446340060002,
-            18.6687733966675,
-            13.835918171813082,
-            8.499907430053918,
-            3.484444427520592,
-            0.12581532800241063
-        ]
-    },
-    "IDN": {
-        "FUTURE": [
-            27.425496666061587,
-            27.404766976971455,
-            27.63250849751745,
-            27.831291831257552,
-            27.855130135913818,
-            27.598535219481565,
-            27.26231979200774,
-            27.18175565658071,
-            27.328578861586553,
-            27.559671998506353,
-            27.697455794179746,
-            27.624032680985557
-        ],
-        "LONG_NAME": "Indonesia",
-        "PAST": [
-            26.740622407223313,
-            26.737729681950736,
-            26.93772811355766,
-            27.157578609607835,
-            27.160389146761123,
-            26.87307986148427,
-            26.520150733717248,
-            26.443850592033478,
-            26.600438940618933,
-            26.852536500139493,
-            27.000479413858116,
-            26.924475719683713
-        ]
-    },
-    "IMN": {
-        "FUTURE": [
-            4.305258614542143,
-            4.497671944707143,
-            5.651451111050713,
-            7.94945199145107,
-            10.917100088820716,
-            14.005834307660717,
-            15.539784022614286,
-            14.765171596192857,
-            12.486232212289286,
-            9.303833007810356,
-            6.612803867912858,
-            4.884437561015714
-        ],
-        "LONG_NAME": "Isle of Man",
-        "PAST": [
-            3.4274902343512665,
-            3.667816162114733,
-            4.877117919990667,
-            6.907725016353333,
-            10.244734700163999,
-            13.583158366473334,
-            15.401674397106662,
-            14.631280516786665,
-            12.191465250713332,
-            8.978529866469334,
-            6.020758056605333,
-            4.345619710275999
-        ]
-    },
-    "IND": {
-        "FUTURE": [
-            15.968594407435848,
-            18.291495042398548,
-            22.01249329755181,
-            25.71869826259269,
-            28.04191824684353,
-            28.325956081388856,
-            26.844978043899694,
-            25.810764423691104,
-            24.735776657723594,
-            22.544382531786727,
-            19.384189822708866,
-            16.48282044090883
-        ],
-        "LONG_NAME": "India",
-        "PAST": [
-            14.604868498612484,
-            16.83227205960639,
-            20.908650473593266,
-            24.771927555029645,
-            27.27791784046229,
-            27.725834435133947,
-            26.357052945968782,
-            25.45033338918404,
-            24.337455583478473,
-            21.960303742370137,
-            18.389742555975317,
-            15.265510780100099
-        ]
-    },
-    "IOT": {
-        "FUTURE": [
-            27.990258352785713,
-            28.001249040596427,
-            28.143233162760716,
-            28.281867980332148,
-            27.94638279505715,
-            27.12957763613571,
-            26.545705522992854,
-            26.45570373515714,
-            26.682568141428572,
-            27.135695321275,
-            27.630597795532143,
-            27.926065717574993
-        ],
-        "LONG_NAME": "British Indian Ocean Territory",
-        "PAST": [
-            27.228251139439998,
-            27.237093099066673,
-            27.48105875638,
-            27.645082601646667,
-            27.287274169766665,
-            26.455149332993336,
-            25.7846903487,
-            25.680118814713335,
-            25.914329020573334,
-            26.378835042340004,
-            26.865869141039997,
-            27.17345581003333
-        ]
-    },
-    "IRL": {
-        "FUTURE": [
-            6.556644575904378,
-            6.530940191945222,
-            7.163263184727812,
-            8.641095978743929,
-            10.777091299221519,
-            13.261875969810268,
-            14.847212383518746,
-            14.69204929912009,
-            13.198838642723663,
-            10.765723091906564,
-            8.565395900214641,
-            7.141772679028749
-        ],
-        "LONG_NAME": "Ireland",
-        "PAST": [
-            5.9266375223778915,
-            5.915352376265283,
-            6.547316487539082,
-            7.834235382042084,
-            10.251646677753252,
-            12.9135650633625,
-            14.687333679450834,
-            14.564067586321668,
-            12.978710175006832,
-            10.480024719277584,
-            8.118758646692331,
-            6.752398681668918
-        ]
-    },
-    "IRN": {
-        "FUTURE": [
-            5.336162665495893,
-            7.815936300508389,
-            12.40294784777552,
-            17.68570587751296,
-            23.069469175592754,
-            28.074851471046667,
-            30.249976968753224,
-            28.727067023076938,
-            24.273946364549477,
-            18.19571287344986,
-            11.305598917532418,
-            6.437876734745606
-        ],
-        "LONG_NAME": "Iran, Islamic Republic of",
-        "PAST": [
-            3.762222640183387,
-            6.15106001049088,
-            10.796578629668288,
-            16.004313584901368,
-            21.829439890257255,
-            27.135919523405576,
-            29.592351894261416,
-            28.170353222835963,
-            23.648463581538472,
-            17.410527897617474,
-            10.280841865146751,
-            5.196217688023252
-        ]
-    },
-    "IRQ": {
-        "FUTURE": [
-            5.884629222420851,
-            8.572171728760825,
-            13.4138212479756,
-            18.8781265805765,
-            24.504156548591077,
-            29.865259605769104,
-            32.630907222184995,
-            31.69582366980143,
-            26.77972717324428,
-            20.098390470302515,
-            12.27172927871214,
-            7.023692212754127
-        ],
-        "LONG_NAME": "Iraq",
-        "PAST": [
-            4.322835184794238,
-            6.984519449916919,
-            11.89573852536122,
-            17.3001019289315,
-            23.129889729578565,
-            28.961207173853666,
-            31.934940592977004,
-            31.15305084181,
-            26.223886006649995,
-            19.312437947751132,
-            11.240240071572286,
-            5.7437213134189875
-        ]
-    },
-    "ISL": {
-        "FUTURE": [
-            -1.2664570580951475,
-            -1.595178422454938,
-            -0.9900160289932656,
-            0.9006616501601583,
-            3.4960944766092505,
-            5.8973587580703875,
-            7.744651067797979,
-            7.739497411855714,
-            6.048542022728334,
-            3.651524407538595,
-            1.3684489840956078,
-            -0.3235330127786889
-        ],
-        "LONG_NAME": "Iceland",
-        "PAST": [
-            -2.2915617201188327,
-            -2.9663004556817665,
-            -2.1743106418237454,
-            -0.09994116886706673,
-            2.945761108417229,
-            5.619264390727261,
-            7.425109354719945,
-            7.55950639513189,
-            5.9274371677104,
-            3.2064656576410706,
-            0.6856024848652329,
-            -1.1718967013701116
-        ]
-    },
-    "ISR": {
-        "FUTURE": [
-            10.141617693352929,
-            11.646795654326569,
-            14.809916469792142,
-            18.54673331118857,
-            22.58379712806643,
-            26.372796195237136,
-            28.578742762318573,
-            28.646560014752858,
-            25.780364772614288,
-            21.24681832473428,
-            15.494374738118283,
-            11.370331682692788
-        ],
-        "LONG_NAME": "Israel",
-        "PAST": [
-            8.991306559121199,
-            10.483739827561601,
-            13.659173991440268,
-            17.379218750012,
-            21.429947916741337,
-            25.5397131351,
-            27.78854736292133,
-            27.974600829742666,
-            25.105810546402665,
-            20.49486490799467,
-            14.623851318150798,
-            10.342323404891735
-        ]
-    },
-    "ITA": {
-        "FUTURE": [
-            8.573927597817793,
-            8.871068536604529,
-            10.134036763547474,
-            12.307852136872594,
-            15.505412765002037,
-            19.334230876885957,
-            22.294220152006783,
-            22.497863841862024,
-            19.560231090970298,
-            15.715097481619917,
-            12.178783162687557,
-            9.719582294362796
-        ],
-        "LONG_NAME": "Italy",
-        "PAST": [
-            7.391800468994828,
-            7.5187373859989695,
-            9.031408284320618,
-            11.228324381782,
-            14.517505764253176,
-            18.570255059380468,
-            21.641900362935335,
-            21.833100992447463,
-            18.956367390897423,
-            15.107585042698332,
-            11.48902011429344,
-            8.86183152965088
-        ]
-    },
-    "JAM": {
-        "FUTURE": [
-            26.0855625694625,
-            25.7919376919625,
-            25.883876255803568,
-            26.378058296803577,
-            26.99172810215,
-            27.532877786083933,
-            28.061416626160714,
-            28.417497907323217,
-            28.417104993266076,
-            28.131258283285714,
-            27.604767390803577,
-            26.775568280376785
-        ],
-        "LONG_NAME": "Jamaica",
-        "PAST": [
-            25.407936604363332,
-            25.07902933793333,
-            25.12395019498,
-            25.60328267361,
-            26.26107381213,
-            26.784163411496664,
-            27.319833374026665,
-            27.747744750699997,
-            27.794701131283336,
-            27.520648193556667,
-            27.000199381296667,
-            26.164326985859997
-        ]
-    },
-    "JEY": {
-        "FUTURE": [
-            6.904841831611785,
-            7.006546020350714,
-            7.798290797693928,
-            9.615514482463928,
-            12.214757646414286,
-            15.311432974850003,
-            17.34137943814643,
-            17.14777701244285,
-            15.047574724589285,
-            11.924507141104641,
-            9.305002485152501,
-            7.648558480453929
-        ],
-        "LONG_NAME": "Jersey",
-        "PAST": [
-            6.117486572245332,
-            6.062227376342666,
-            6.975828043584,
-            8.57254842139933,
-            11.480200195451333,
-            14.724678548659998,
-            16.985064696873334,
-            16.714794921533333,
-            14.569637043753335,
-            11.557157389422667,
-            8.859521484209333,
-            7.166949462539333
-        ]
-    },
-    "JOR": {
-        "FUTURE": [
-            7.928042820407805,
-            10.186265595098977,
-            14.352843148389287,
-            18.998434261400003,
-            23.76083592005867,
-            28.183791647248977,
-            30.413115520506633,
-            30.062567263147958,
-            26.299285888740823,
-            20.669492293825506,
-            13.747601411396683,
-            9.010510970061173
-        ],
-        "LONG_NAME": "Jordan",
-        "PAST": [
-            6.562799362882857,
-            8.82779192227,
-            13.03941970115343,
-            17.643774704456188,
-            22.469074358410474,
-            27.29420340424571,
-            29.585765148261903,
-            29.398010835690474,
-            25.603865560362856,
-            19.809116907963812,
-            12.713997976884572,
-            7.792031714978094
-        ]
-    },
-    "JPN": {
-        "FUTURE": [
-            5.848777398173746,
-            6.0446902538881355,
-            8.434525998702378,
-            12.026564835014055,
-            15.745792331381287,
-            19.22530866915694,
-            21.941656986805828,
-            22.958133554372733,
-            21.14422148518761,
-            16.794206921137228,
-            12.038114590373466,
-            8.178325050744231
-        ],
-        "LONG_NAME": "Japan",
-        "PAST": [
-            4.517302744004149,
-            4.5282886171119525,
-            7.0226862856399626,
-            10.792559600629064,
-            14.713846092591531,
-            18.483566711921718,
-            21.550467401095116,
-            22.760761569196728,
-            20.844725063780775,
-            16.430715513957,
-            11.452051530299885,
-            7.251242547342455
-        ]
-    },
-    "KAZ": {
-        "FUTURE": [
-            -8.118683180829041,
-            -6.469806711369268,
-            -0.632213308675598,
-            7.180069294039085,
-            15.104607132818058,
-            21.262514197574152,
-            24.11468543701754,
-            21.8895144782385,
-            14.828659300573715,
-            6.530736335477555,
-            -0.6145433068093281,
-            -5.850150665690441
-        ],
-        "LONG_NAME": "Kazakhstan",
-        "PAST": [
-            -10.453035078408274,
-            -8.97618176183422,
-            -3.0611722331682225,
-            5.3317362804850585,
-            14.00158908334607,
-            20.828025712377645,
-            23.79335767615993,
-            21.44170239688751,
-            14.47054986436238,
-            5.842074542964268,
-            -1.8103147564213127,
-            -7.265903239619318
-        ]
-    },
-    "KEN": {
-        "FUTURE": [
-            24.739235271004873,
-            25.730198550405515,
-            26.34490248464269,
-            26.001320231865584,
-            24.9351875503224,
-            24.21992462922987,
-            23.727733166071268,
-            24.01356714407126,
-            24.805986032573866,
-            24.944607028592703,
-            24.253676575684416,
-            24.060415787741878
-        ],
-        "LONG_NAME": "Kenya",
-        "PAST": [
-            23.93107494026818,
-            24.89767419045455,
-            25.55407002778454,
-            25.321877311999085,
-            24.113100086551515,
-            23.32297686915182,
-            22.895619894881513,
-            23.096320227228784,
-            23.86892903670879,
-            24.007371197154548,
-            23.410105572664243,
-            23.255687921408185
-        ]
-    },
-    "KGZ": {
-        "FUTURE": [
-            -8.828713825940232,
-            -6.520403998360119,
-            -1.3320505958235764,
-            4.636474972765498,
-            10.026129858710588,
-            14.700190862279372,
-            17.598494302703095,
-            16.263807659841575,
-            10.781340462669494,
-            3.9262508210383062,
-            -2.193695431676773,
-            -7.108594394701626
-        ],
-        "LONG_NAME": "Kyrgyzstan",
-        "PAST": [
-            -11.069459957148945,
-            -8.840598381719456,
-            -3.5131295098030555,
-            2.999966091648584,
-            8.815685356858259,
-            13.817731220940056,
-            16.972209167655944,
-            15.672420925408941,
-            10.140672810752278,
-            3.040038384325133,
-            -3.2940043131037444,
-            -8.771694353065602
-        ]
-    },
-    "KHM": {
-        "FUTURE": [
-            23.621832384251782,
-            25.298127419889642,
-            27.68348737405785,
-            28.898668234792147,
-            28.54949874885214,
-            27.54285975838678,
-            26.933508627947504,
-            26.72561340359143,
-            26.503139931312507,
-            26.02085669411607,
-            25.105297960693935,
-            23.7568212233875
-        ],
-        "LONG_NAME": "Cambodia",
-        "PAST": [
-            22.773514607712666,
-            24.57704121944933,
-            26.958250935718002,
-            28.199936319890003,
-            27.756214599548002,
-            26.756360066971332,
-            26.267769165570005,
-            26.12978495237066,
-            25.877103474930664,
-            25.424031982776,
-            24.43933410669267,
-            22.883421630604666
-        ]
-    },
-    "KIR": {
-        "FUTURE": [
-            26.14840371335357,
-            26.194856916250007,
-            26.267451695460718,
-            26.41528647306786,
-            26.725565228982152,
-            26.89162445019642,
-            26.482843671582142,
-            25.894271850464285,
-            25.531436375124997,
-            25.57232992999999,
-            25.849436078817856,
-            26.061514718617854
-        ],
-        "LONG_NAME": "Kiribati",
-        "PAST": [
-            25.326778157786666,
-            25.354636637486667,
-            25.496221924133337,
-            25.65575561515334,
-            25.926328532393327,
-            26.06376953062666,
-            25.746712239933334,
-            25.160805256680003,
-            24.726143391913332,
-            24.796384684559996,
-            25.055122883266662,
-            25.27153320306666
-        ]
-    },
-    "KNA": {
-        "FUTURE": [
-            24.99378749245715,
-            24.57145363894286,
-            24.52591705313571,
-            24.867847987992857,
-            25.490892682314286,
-            26.111262730457145,
-            26.696156092928568,
-            27.223741804478575,
-            27.45381818519286,
-            27.289071219007145,
-            26.68812997058929,
-            25.782011849407144
-        ],
-        "LONG_NAME": "Saint Kitts and Nevis",
-        "PAST": [
-            24.32826944938,
-            23.86999511690666,
-            23.801625568880002,
-            24.17755737268,
-            24.84555257154,
-            25.501694742579996,
-            26.12868245480667,
-            26.65100097646,
-            26.870082601533333,
-            26.70106201182,
-            26.09569905576,
-            25.147479247746666
-        ]
-    },
-    "KOR": {
-        "FUTURE": [
-            2.0263398033145643,
-            2.9397764204836925,
-            6.566564014896434,
-            10.970900535534645,
-            15.295797347956249,
-            19.218590600665625,
-            22.0822196687634,
-            23.03068828590312,
-            20.539761951989732,
-            15.485138893289244,
-            9.937129974427663,
-            4.840700694449393
-        ],
-        "LONG_NAME": "Korea, Republic of",
-        "PAST": [
-            0.5124033610607749,
-            1.2912780762346616,
-            5.0524119059087536,
-            9.587365722752832,
-            14.157068124828331,
-            18.418520864298333,
-            21.625925445640828,
-            22.888261159331662,
-            20.295553080131665,
-            15.179720815700417,
-            9.369456227314911,
-            3.7415463764946284
-        ]
-    },
-    "KWT": {
-        "FUTURE": [
-            11.802533830782378,
-            14.62667483376512,
-            19.4964214506131,
-            24.73086547831191,
-            30.050799778361913,
-            34.997397649796426,
-            37.16227358865357,
-            36.27592213918691,
-            32.241209121060706,
-            26.30573781326547,
-            18.79464503702024,
-            13.071982610707739
-        ],
-        "LONG_NAME": "Kuwait",
-        "PAST": [
-            10.175183105644003,
-            13.028105333262223,
-            18.07414957712444,
-            23.202792697459998,
-            28.895159234519998,
-            34.10361124737778,
-            36.449881999093336,
-            35.68181762762889,
-            31.64209119980889,
-            25.548201497702216,
-            17.724947102984444,
-            11.700699191905109
-        ]
-    },
-    "LAO": {
-        "FUTURE": [
-            16.86326366586302,
-            19.79166346956857,
-            24.14771561404762,
-            27.175355820534044,
-            27.369855244566907,
-            26.146685355293577,
-            25.338964625772856,
-            24.972865368389286,
-            24.079930986400235,
-            22.04464852462881,
-            19.506228928004997,
-            17.002468799195096
-        ],
-        "LONG_NAME": "Lao People's Democratic Republic",
-        "PAST": [
-            15.924938014884667,
-            18.914081624550228,
-            23.27572469090045,
-            26.44810275519022,
-            26.47093031096889,
-            25.364042833214224,
-            24.879826524124,
-            24.631764187738668,
-            23.60612508077378,
-            21.598012559187115,
-            18.857188449650664,
-            15.958522542411467
-        ]
-    },
-    "LBN": {
-        "FUTURE": [
-            9.48417009651143,
-            10.573044913444289,
-            13.297897338599999,
-            17.039688110625,
-            21.383165632353574,
-            25.54530770446786,
-            28.162699018349993,
-            28.221048627425002,
-            25.05433981805,
-            20.291138785485714,
-            14.619931902095002,
-            10.774777003512499
-        ],
-        "LONG_NAME": "Lebanon",
-        "PAST": [
-            8.535113525648667,
-            9.551963297503333,
-            12.225966389628,
-            15.854046631373333,
-            20.071476237633338,
-            24.52341105212667,
-            27.172953288373332,
-            27.358428955066664,
-            24.258327230120003,
-            19.55756225562,
-            13.85208536719333,
-            9.931333415039331
-        ]
-    },
-    "LBR": {
-        "FUTURE": [
-            26.31465612088572,
-            27.33613559218036,
-            28.026084354955355,
-            27.81287329523259,
-            27.178817749530804,
-            26.396666254270976,
-            25.628354617445094,
-            25.243347712878574,
-            25.491375378383033,
-            26.007019179517865,
-            26.35927595400983,
-            26.142266137189285
-        ],
-        "LONG_NAME": "Liberia",
-        "PAST": [
-            25.51244989964583,
-            26.649141947649998,
-            27.40894673621584,
-            27.06307118677917,
-            26.306394957961672,
-            25.502467345707494,
-            24.746521504250833,
-            24.383668772418332,
-            24.642654165071665,
-            25.154007212024997,
-            25.429243215247503,
-            25.243841552585
-        ]
-    },
-    "LBY": {
-        "FUTURE": [
-            11.464106910257673,
-            13.730595608308539,
-            17.656964418532844,
-            21.70569048146652,
-            25.660219270361864,
-            28.993880116341018,
-            30.012669349192358,
-            29.266500648272455,
-            26.318460250303254,
-            22.013328455357016,
-            16.420215217765563,
-            12.305842321855678
-        ],
-        "LONG_NAME": "Libya",
-        "PAST": [
-            9.922802770466856,
-            12.268516649620677,
-            16.312848227306784,
-            20.61797928632297,
-            24.761157154131787,
-            28.166412789731552,
-            29.35688167721238,
-            28.747844441724755,
-            25.80723789675131,
-            21.32229864919869,
-            15.440319351428416,
-            11.040347254132117
-        ]
-    },
-    "LCA": {
-        "FUTURE": [
-            25.342349461450002,
-            24.96454838284464,
-            24.99868828978571,
-            25.38127572191072,
-            25.938710348480356,
-            26.457129342014287,
-            26.954474313380356,
-            27.441232953830358,
-            27.640602656862505,
-            27.471591949432145,
-            26.980086735175,
-            26.11341694387321
-        ],
-        "LONG_NAME": "Saint Lucia",
-        "PAST": [
-            24.69419860874333,
-            24.27843729655,
-            24.304301961516664,
-            24.71210734060333,
-            25.29790039105,
-            25.841032918709995,
-            26.347680663483334,
-            26.84024047895,
-            27.037665811536666,
-            26.88176167875,
-            26.390064493670003,
-            25.498572794073326
-        ]
-    },
-    "LIE": {
-        "FUTURE": [
-            -0.18795340404717858,
-            0.46522521994423555,
-            2.4399087089656786,
-            5.8995906285610715,
-            10.296335492698928,
-            14.315962655457145,
-            16.33727155427857,
-            15.175775800421428,
-            11.510486057966073,
-            7.141796657075714,
-            3.267687116312857,
-            0.799418858098143
-        ],
-        "LONG_NAME": "Liechtenstein",
-        "PAST": [
-            -1.8314453125020667,
-            -1.4178202310346,
-            1.165030924409333,
-            4.636279296849334,
-            9.373352050794667,
-            13.720859782034003,
-            15.91709187914,
-            14.574696858366666,
-            10.926456705800002,
-            6.563726806636,
-            2.4154602050248664,
-            -0.31722615561933326
-        ]
-    },
-    "LKA": {
-        "FUTURE": [
-            26.860525948242145,
-            27.14953678689285,
-            28.221809169177856,
-            29.32804848753714,
-            29.473040989695,
-            28.523975045072145,
-            27.938650948677857,
-            27.76000039194785,
-            27.745763506125,
-            27.766939871802865,
-            27.64235512869714,
-            27.175420052411425
-        ],
-        "LONG_NAME": "Sri Lanka",
-        "PAST": [
-            26.017813314030665,
-            26.399035644580007,
-            27.562949625629336,
-            28.69767659518933,
-            28.77581054731733,
-            27.833975422821332,
-            27.22800211610267,
-            27.142015380913335,
-            27.16944457982667,
-            27.159197998059998,
-            26.897736409270667,
-            26.351509195446667
-        ]
-    },
-    "LSO": {
-        "FUTURE": [
-            20.330811091281248,
-            20.034701756531252,
-            18.93168285905179,
-            16.48509189085893,
-            12.823327745692323,
-            10.192538670003929,
-            9.915624618455984,
-            12.254758289960177,
-            15.628695624275894,
-            17.737239837833037,
-            18.833483832191963,
-            19.90040888092143
-        ],
-        "LONG_NAME": "Lesotho",
-        "PAST": [
-            19.613465372314998,
-            19.39698130346167,
-            18.253451029101665,
-            15.575447591876669,
-            11.758681233891167,
-            8.9963607786295,
-            8.623595173888834,
-            10.846958923368334,
-            14.300068155633333,
-            16.575803629486668,
-            17.97909088133333,
-            18.97187449122667
-        ]
-    },
-    "LTU": {
-        "FUTURE": [
-            -3.0421664180203067,
-            -2.987951317482429,
-            -0.17447927029699267,
-            5.09935511381602,
-            11.131887319332247,
-            15.858136391259848,
-            18.259137678731122,
-            16.871899196238775,
-            12.103329405607964,
-            6.886777293930664,
-            2.1703525465311517,
-            -1.2358326815148533
-        ],
-        "LONG_NAME": "Lithuania",
-        "PAST": [
-            -5.026850818493782,
-            -4.927681187199029,
-            -1.4939703078357214,
-            3.8521798270450174,
-            10.339973958575523,
-            15.312866211043143,
-            17.787625849109336,
-            16.503641763884765,
-            11.626120431790858,
-            6.482041713188762,
-            1.0561264764338,
-            -2.8635024298295657
-        ]
-    },
-    "LUX": {
-        "FUTURE": [
-            2.7935725621064647,
-            3.4346934728128566,
-            5.179917471635714,
-            8.272144862545357,
-            12.112229483054282,
-            15.824786595328566,
-            17.795039585817857,
-            16.793727330114283,
-            13.447495597028572,
-            9.207107543914644,
-            5.690867832697856,
-            3.5657512119935713
-        ],
-        "LONG_NAME": "Luxembourg",
-        "PAST": [
-            1.5334391275648003,
-            1.9608886718550667,
-            4.102921549446,
-            7.052150471969332,
-            11.380513509363333,
-            15.39923706129333,
-            17.568184407039997,
-            16.391123453266665,
-            12.946382649486667,
-            8.71307169606133,
-            4.942354329507999,
-            2.64854329433
-        ]
-    },
-    "LVA": {
-        "FUTURE": [
-            -4.230066208532331,
-            -4.382480560860277,
-            -1.5020242116642881,
-            3.8811440846024388,
-            10.015044923802579,
-            14.857641431730432,
-            17.356445433918495,
-            15.936745295145672,
-            11.25446743463869,
-            6.1156962561471415,
-            1.4349764869456183,
-            -2.1969612969759162
-        ],
-        "LONG_NAME": "Latvia",
-        "PAST": [
-            -6.300328459879628,
-            -6.333261673545304,
-            -2.839461036979466,
-            2.5949659559282017,
-            9.174861653780075,
-            14.253337266911332,
-            16.866671188152075,
-            15.61463012679111,
-            10.818671106581629,
-            5.772071442792592,
-            0.2921309859910844,
-            -4.007663755100781
-        ]
-    },
-    "MAC": {
-        "FUTURE": [
-            16.61959620894643,
-            18.293724059889286,
-            21.296139308107144,
-            24.28719656792143,
-            26.468750000300002,
-            27.61946759894642,
-            27.88204847097499,
-            27.758555820989283,
-            26.978814260957154,
-            24.744187491167857,
-            21.496368408139286,
-            17.9342019217
-        ],
-        "LONG_NAME": "Macao",
-        "PAST": [
-            15.778129068480002,
-            17.250364176166666,
-            20.361523437540004,
-            23.481679280686667,
-            25.769197591173334,
-            27.03639526317333,
-            27.542848714220003,
-            27.657521565593335,
-            26.78634643558,
-            24.510858154113333,
-            21.035839843279994,
-            17.127565511060002
-        ]
-    },
-    "MAR": {
-        "FUTURE": [
-            11.357065636900641,
-            13.158959361443197,
-            15.794621930589841,
-            18.4604146145791,
-            21.56722177737179,
-            24.86634728574304,
-            27.69027715401464,
-            27.569548688241973,
-            24.696013259865897,
-            20.072030149963215,
-            15.273533957724803,
-            12.03359614747684
-        ],
-        "LONG_NAME": "Morocco",
-        "PAST": [
-            9.9901028442881,
-            11.697918700833467,
-            14.477702331324933,
-            17.068945109435667,
-            20.096275024572332,
-            23.810493977954664,
-            26.982076924707663,
-            26.862184651166,
-            23.894865418155334,
-            19.213460795722998,
-            14.312198078904535,
-            10.921089884580333
-        ]
-    },
-    "MCO": {
-        "FUTURE": [
-            6.328267778564286,
-            6.893639700899643,
-            8.347649710369643,
-            10.668619428119644,
-            14.005117144228572,
-            17.893571036067858,
-            20.834250314021432,
-            20.70268249491429,
-            17.33439527266071,
-            13.13710348950714,
-            9.586321149376785,
-            7.272011893053214
-        ],
-        "LONG_NAME": "Monaco",
-        "PAST": [
-            4.962821451807333,
-            5.319156900979333,
-            7.152199300114668,
-            9.510734049357332,
-            13.032253011506668,
-            17.279089355913335,
-            20.383166503406667,
-            20.176045734973336,
-            16.849070231253332,
-            12.573708089246667,
-            8.864190673817332,
-            6.320450846334
-        ]
-    },
-    "MDA": {
-        "FUTURE": [
-            -0.5839120048187186,
-            0.25526101260740286,
-            3.649630301173493,
-            8.965912955188855,
-            14.87629307344429,
-            19.78436715291857,
-            22.719967433369995,
-            21.76481279650786,
-            16.128975569028572,
-            9.959058053482716,
-            4.463934762126669,
-            1.0192940849297183
-        ],
-        "LONG_NAME": "Moldova, Republic of",
-        "PAST": [
-            -2.3039876302105307,
-            -1.5853491210364414,
-            2.241916910808107,
-            7.773628336304534,
-            13.850093994775467,
-            19.154790445899998,
-            22.017415364252,
-            21.166229654512,
-            15.490387777142667,
-            9.426149495268133,
-            3.735017089820784,
-            -0.01874023434886518
-        ]
-    },
-    "MDG": {
-        "FUTURE": [
-            26.346965332181576,
-            26.369903434216855,
-            26.13015136725543,
-            25.314189671295143,
-            23.75436902763315,
-            22.211761431327428,
-            21.444876796193856,
-            21.81471413741871,
-            23.11173427062314,
-            24.755093906848142,
-            25.75859004424957,
-            26.172214224453143
-        ],
-        "LONG_NAME": "Madagascar",
-        "PAST": [
-            25.659851644061597,
-            25.72145100870746,
-            25.508802652994135,
-            24.670838541795725,
-            23.022981770379733,
-            21.3672020676408,
-            20.57536629271893,
-            20.943562093579462,
-            22.315824137348535,
-            23.926765054797333,
-            24.953956786730668,
-            25.40403694621254
-        ]
-    },
-    "MDV": {
-        "FUTURE": [
-            27.885249546952224,
-            27.82481588612009,
-            28.10362734105535,
-            28.6673740659143,
-            28.877300126477234,
-            28.558781760193295,
-            28.236409595687945,
-            28.123351233387943,
-            28.09944261884777,
-            28.092134475807146,
-            28.216136114870977,
-            28.10899135081875
-        ],
-        "LONG_NAME": "Maldives",
-        "PAST": [
-            27.11276321422917,
-            27.09215494774584,
-            27.450977070830827,
-            28.0455960590225,
-            28.178774770211668,
-            27.849913278994162,
-            27.518697356818333,
-            27.42397410125417,
-            27.38118108160416,
-            27.404099527263334,
-            27.495162455090004,
-            27.340990448096665
-        ]
-    },
-    "MEX": {
-        "FUTURE": [
-            16.190672213445122,
-            17.222104592643117,
-            19.336358301022763,
-            22.05010396940973,
-            24.379694553365876,
-            25.94688676580763,
-            26.593819580291406,
-            26.549004838832854,
-            25.265204885640788,
-            22.63258178862875,
-            19.407835016710127,
-            16.784915378822074
-        ],
-        "LONG_NAME": "Mexico",
-        "PAST": [
-            14.986949051167612,
-            16.083965335369268,
-            18.159587944552648,
-            20.914118863314187,
-            23.345212080129627,
-            25.02291571211507,
-            25.77966321216724,
-            25.858831484985352,
-            24.630970795762227,
-            21.860132764600387,
-            18.363744138179843,
-            15.661771597436212
-        ]
-    },
-    "MHL": {
-        "FUTURE": [
-            26.910802568378056,
-            26.73117174434132,
-            26.897984407161232,
-            27.20072516607704,
-            27.512881220323468,
-            27.817142409026022,
-            28.025531846509697,
-            28.22661030072194,
-            28.311681007880612,
-            28.222330209843875,
-            27.945195412258165,
-            27.439154800022443
-        ],
-        "LONG_NAME": "Marshall Islands",
-        "PAST": [
-            26.238020833731422,
-            26.035019066490477,
-            26.149546886306666,
-            26.428625778957144,
-            26.754442486764756,
-            27.07263677734667,
-            27.30669613806857,
-            27.553752209342857,
-            27.676264880951432,
-            27.592432512570472,
-            27.290315173679996,
-            26.759270077474284
-        ]
-    },
-    "MKD": {
-        "FUTURE": [
-            4.730523245724973,
-            5.568105643056799,
-            7.949860491157001,
-            11.533408028861073,
-            16.02267107307714,
-            20.82801818864929,
-            24.207551356749295,
-            23.85418265157214,
-            18.857329014525,
-            13.304918779698287,
-            8.679124886752,
-            5.970799909445546
-        ],
-        "LONG_NAME": "Macedonia, the former Yugoslav Republic of",
-        "PAST": [
-            3.3086869303526267,
-            3.9930456542729917,
-            6.5273453776519865,
-            10.231136881183334,
-            14.8126314293432,
-            19.881385498297334,
-            23.287684326570663,
-            22.916058349390664,
-            18.12288004542667,
-            12.579875080963735,
-            7.991156006239733,
-            4.980352783227625
-        ]
-    },
-    "MLI": {
-        "FUTURE": [
-            19.737978675556324,
-            22.716770791184747,
-            26.648108444703325,
-            29.98117045628597,
-            32.06905469060869,
-            32.75274187526851,
-            32.21885874310731,
-            31.219099663935797,
-            30.45748133483296,
-            28.51349503607646,
-            24.33090683036185,
-            20.234330164385764
-        ],
-        "LONG_NAME": "Mali",
-        "PAST": [
-            18.03632761671853,
-            21.049897950995607,
-            25.32311480008728,
-            28.596733925311522,
-            30.929065450480305,
-            31.65822837146772,
-            31.2778595430047,
-            30.516486011948484,
-            29.67123450074651,
-            27.503248364483035,
-            22.951001901447572,
-            18.69596700926798
-        ]
-    },
-    "MLT": {
-        "FUTURE": [
-            14.596578325210713,
-            14.396454947878572,
-            14.896473475950001,
-            15.987821306614284,
-            18.008277892775,
-            20.950872148053573,
-            23.90448542958214,
-            25.10896083304643,
-            23.760286603946437,
-            21.294944763457142,
-            18.429490225860715,
-            15.954500470400001
-        ],
-        "LONG_NAME": "Malta",
-        "PAST": [
-            13.749121093640001,
-            13.406190999173335,
-            13.909708659286668,
-            15.073899332466665,
-            17.090663655353335,
-            20.157340495066666,
-            23.20744628884667,
-            24.47218831384,
-            23.218894449213334,
-            20.749241129739996,
-            17.864119465679998,
-            15.321476236913332
-        ]
-    },
-    "MMR": {
-        "FUTURE": [
-            17.036429746177067,
-            19.632604769777366,
-            23.21989154806067,
-            26.038082293248944,
-            26.70998849211175,
-            25.800498451571652,
-            24.92889462190424,
-            24.608469179709594,
-            24.014951740060386,
-            22.307849372790383,
-            19.697068656872112,
-            17.231695549895367
-        ],
-        "LONG_NAME": "Myanmar",
-        "PAST": [
-            16.046579360663863,
-            18.64668649022636,
-            22.36673291550632,
-            25.238289451844818,
-            25.898246383287418,
-            25.056202061935206,
-            24.37578182157896,
-            24.184374427982505,
-            23.517940394012854,
-            21.818613751630245,
-            19.01931832697675,
-            16.236779721310285
-        ]
-    },
-    "MNE": {
-        "FUTURE": [
-            3.915317535394204,
-            4.711653845447089,
-            7.0090312958034815,
-            10.578510011958658,
-            15.005392619545534,
-            19.66087041575535,
-            22.893051964414287,
-            22.574041638527685,
-            17.72810282037589,
-            12.37149974265768,
-            7.885510853135714,
-            5.136244092583603
-        ],
-        "LONG_NAME": "Montenegro",
-        "PAST": [
-            2.618751525954692,
-            3.20335998543454,
-            5.729904175007166,
-            9.339892578465166,
-            13.898851521166666,
-            18.71299082377666,
-            21.903466287471666,
-            21.534893799021667,
-            16.945218404066665,
-            11.6341562899885,
-            7.1822519940894995,
-            4.18763122576888
-        ]
-    },
-    "MNG": {
-        "FUTURE": [
-            -17.923470960416978,
-            -14.768708295354001,
-            -7.31748558362959,
-            1.007699818601835,
-            8.745809671843839,
-            15.247871118750016,
-            18.27172476328706,
-            15.534817489404176,
-            8.411902828661653,
-            0.05634955602052353,
-            -8.418851369757954,
-            -15.727161220642065
-        ],
-        "LONG_NAME": "Mongolia",
-        "PAST": [
-            -20.527810553167907,
-            -17.473025963044,
-            -9.844018990562308,
-            -0.630480346673893,
-            7.748999692170384,
-            14.858341791368392,
-            18.315286632918163,
-            15.676712443736976,
-            8.28655180428669,
-            -0.338348214254963,
-            -9.850032319178256,
-            -17.63825866670895
-        ]
-    },
-    "MNP": {
-        "FUTURE": [
-            26.540075029700002,
-            26.15751266518393,
-            26.30176980163929,
-            26.846899304960715,
-            27.474794660521436,
-            28.08905301766607,
-            28.362969534707137,
-            28.500105176476787,
-            28.586240495746427,
-            28.510938372408926,
-            28.07251903019465,
-            27.286624363010706
-        ],
-        "LONG_NAME": "Northern Mariana Islands",
-        "PAST": [
-            25.873534139253334,
-            25.506388347216667,
-            25.672837320919996,
-            26.208832804276668,
-            26.82444865010333,
-            27.40211588523667,
-            27.74496053034,
-            27.89451700779,
-            27.969551594966664,
-            27.895889282289996,
-            27.456416828403334,
-            26.65416666677
-        ]
-    },
-    "MOZ": {
-        "FUTURE": [
-            25.83858182858907,
-            25.57477252500325,
-            25.086579723074347,
-            24.060369053600542,
-            22.16775829758669,
-            20.499913963167863,
-            20.121078557458222,
-            21.47860575790346,
-            24.149814687905085,
-            26.35234707207175,
-            26.701788700228466,
-            26.113920401583766
-        ],
-        "LONG_NAME": "Mozambique",
-        "PAST": [
-            25.049683973120604,
-            24.930976698794552,
-            24.43236231994727,
-            23.310713088571106,
-            21.30458515896909,
-            19.542670109491112,
-            19.096465201430096,
-            20.50810787335172,
-            23.29440467875899,
-            25.48748877986707,
-            25.883779321248888,
-            25.213330078515355
-        ]
-    },
-    "MRT": {
-        "FUTURE": [
-            18.305897332563518,
-            21.015017610879852,
-            24.551702590579218,
-            27.54277480112893,
-            30.11648612672574,
-            32.08931164879524,
-            32.85263083866612,
-            32.32129364611209,
-            30.991109044760258,
-            28.016714969509618,
-            23.145111391603756,
-            18.92729287599229
-        ],
-        "LONG_NAME": "Mauritania",
-        "PAST": [
-            16.737056008339845,
-            19.336528081087007,
-            23.069273911743416,
-            26.105243754673335,
-            28.88266252020667,
-            30.9810709116918,
-            32.063846216044105,
-            31.709580954764615,
-            30.19511572706735,
-            27.021724656008033,
-            21.824865983368888,
-            17.535330956527332
-        ]
-    },
-    "MSR": {
-        "FUTURE": [
-            25.26592254621071,
-            24.856203351467855,
-            24.83375985302857,
-            25.182858057592863,
-            25.7782592771,
-            26.343958173232142,
-            26.868640354807145,
-            27.37985556449643,
-            27.61704690061428,
-            27.469533647557142,
-            26.92614746106786,
-            26.044727870532146
-        ],
-        "LONG_NAME": "Montserrat",
-        "PAST": [
-            24.612994385186667,
-            24.160139973939998,
-            24.11828816703333,
-            24.491827392099996,
-            25.12279663128,
-            25.728332520006667,
-            26.285150146686668,
-            26.79186604826667,
-            27.016585286233333,
-            26.87183227483333,
-            26.333355713,
-            25.426961262706662
-        ]
-    },
-    "MTQ": {
-        "FUTURE": [
-            25.342349461450002,
-            24.96454838284464,
-            24.99868828978571,
-            25.38127572191072,
-            25.938710348480356,
-            26.457129342014287,
-            26.954474313380356,
-            27.441232953830358,
-            27.640602656862505,
-            27.471591949432145,
-            26.980086735175,
-            26.11341694387321
-        ],
-        "LONG_NAME": "Martinique",
-        "PAST": [
-            24.69419860874333,
-            24.27843729655,
-            24.304301961516664,
-            24.71210734060333,
-            25.29790039105,
-            25.841032918709995,
-            26.347680663483334,
-            26.84024047895,
-            27.037665811536666,
-            26.88176167875,
-            26.390064493670003,
-            25.498572794073326
-        ]
-    },
-    "MUS": {
-        "FUTURE": [
-            26.752205439942866,
-            27.252279009410717,
-            27.240474700416076,
-            26.56435557797857,
-            25.28106907449286,
-            23.86568178416964,
-            22.821166991760716,
-            22.3860898697375,
-            22.42413766074107,
-            23.098417010130362,
-            24.387217385812498,
-            25.787149157046425
-        ],
-        "LONG_NAME": "Mauritius",
-        "PAST": [
-            26.24088948564334,
-            26.771563720346666,
-            26.818973795873337,
-            26.148710123596672,
-            24.82331746421,
-            23.319785562743334,
-            22.206069946229995,
-            21.71411641459001,
-            21.758555094236662,
-            22.46061197980334,
-            23.794843546643328,
-            25.23058980351333
-        ]
-    },
-    "MWI": {
-        "FUTURE": [
-            23.73934914659179,
-            23.48086133655143,
-            23.09260984168286,
-            22.22007457143107,
-            20.456873757562857,
-            18.844655609255003,
-            18.68408878880393,
-            20.417363084538213,
-            23.562519945543578,
-            26.104978397426063,
-            26.038667187944643,
-            24.45182865658214
-        ],
-        "LONG_NAME": "Malawi",
-        "PAST": [
-            22.83256164548333,
-            22.754534098038,
-            22.372670288257332,
-            21.370309041704665,
-            19.486465047652665,
-            17.76505920391133,
-            17.549768269858664,
-            19.375476277478,
-            22.725652669781333,
-            25.20244222044,
-            25.170095418613336,
-            23.466440429652664
-        ]
-    },
-    "MYS": {
-        "FUTURE": [
-            26.152488423748448,
-            26.298239050544563,
-            26.855670763039758,
-            27.334767644154663,
-            27.59574795381584,
-            27.487575507462886,
-            27.220519166489286,
-            27.149227829583374,
-            27.130348774151248,
-            27.016531902998597,
-            26.844175823927483,
-            26.47788759778788
-        ],
-        "LONG_NAME": "Malaysia",
-        "PAST": [
-            25.428931637195365,
-            25.56362402019188,
-            26.092686749777393,
-            26.607454692064348,
-            26.870206086071594,
-            26.75444132530754,
-            26.503426194845215,
-            26.4532172605174,
-            26.44697115266116,
-            26.350510572420287,
-            26.15663213353942,
-            25.746932762127535
-        ]
-    },
-    "MYT": {
-        "FUTURE": [
-            28.002053397114285,
-            28.082639421849994,
-            28.328374590725,
-            28.314153398885715,
-            27.514481680617866,
-            26.300120762771424,
-            25.398537772228572,
-            25.06480516773571,
-            25.21660505046429,
-            25.909451076139284,
-            26.973631722314288,
-            27.83283342597857
-        ],
-        "LONG_NAME": "Mayotte",
-        "PAST": [
-            27.346801758366663,
-            27.373101807593333,
-            27.702705891893338,
-            27.783203124153328,
-            26.972141520546664,
-            25.7061645508,
-            24.734606933766667,
-            24.33978474934,
-            24.50216267926,
-            25.160791014786664,
-            26.22976684546,
-            27.105391438846667
-        ]
-    },
-    "NAM": {
-        "FUTURE": [
-            25.006051853695595,
-            24.76784275619155,
-            24.308023143996195,
-            22.640283057692503,
-            19.671344466366186,
-            17.058093624464416,
-            16.49908476345411,
-            18.418813469219707,
-            21.543680318297024,
-            23.986752465565598,
-            24.903710501628574,
-            25.119051033989766
-        ],
-        "LONG_NAME": "Namibia",
-        "PAST": [
-            24.083757324740006,
-            24.034551255291774,
-            23.49645867243289,
-            21.750497572198228,
-            18.548639729710448,
-            15.800354071678978,
-            15.204705065360825,
-            17.087611762274424,
-            20.31619805283111,
-            22.820158827496662,
-            23.742320081543333,
-            24.060985785276443
-        ]
-    },
-    "NCL": {
-        "FUTURE": [
-            26.710672287589283,
-            27.316414969502382,
-            27.139798300150602,
-            26.18672416333928,
-            24.623179299389882,
-            23.179158165308923,
-            22.14691289279048,
-            21.787093207880357,
-            22.064713614029763,
-            22.81159519045654,
-            24.06125877042619,
-            25.55473545592916
-        ],
-        "LONG_NAME": "New Caledonia",
-        "PAST": [
-            26.163639322700003,
-            26.863905504057772,
-            26.71854485460222,
-            25.674401516460005,
-            24.13959215002222,
-            22.634665934361113,
-            21.55068969676,
-            21.07439405642111,
-            21.246651883211108,
-            21.981955634463336,
-            23.277052476585556,
-            24.860086059378887
-        ]
-    },
-    "NER": {
-        "FUTURE": [
-            17.31788584593922,
-            20.209271884585572,
-            24.581333172546596,
-            28.58317418862143,
-            30.734442751926743,
-            31.558384968131474,
-            31.205435312195192,
-            30.16338178564552,
-            29.30824396359908,
-            27.135449558177157,
-            22.36770662794634,
-            17.964974336806655
-        ],
-        "LONG_NAME": "Niger",
-        "PAST": [
-            15.62412918490048,
-            18.73486697153921,
-            23.331968085576744,
-            27.359694749018914,
-            29.732806443917674,
-            30.595366391240777,
-            30.29815503463504,
-            29.47783463384713,
-            28.571424285395967,
-            26.234747362244185,
-            21.082388045395348,
-            16.416010798442993
-        ]
-    },
-    "NFK": {
-        "FUTURE": [
-            22.9440133228,
-            23.623462132571426,
-            23.189461844532143,
-            21.907799857049998,
-            20.244591849167854,
-            18.771103995578574,
-            17.774574279535713,
-            17.379787989539288,
-            17.560522896914286,
-            18.270383562682138,
-            19.7068590437,
-            21.49864087845714
-        ],
-        "LONG_NAME": "Norfolk Island",
-        "PAST": [
-            22.485384114333332,
-            23.166143799653334,
-            22.829465738580005,
-            21.43717854823333,
-            19.771067301586662,
-            18.297367350040002,
-            17.184320068086663,
-            16.687329101606668,
-            16.74607543974,
-            17.478647867453333,
-            18.933237712053334,
-            20.87238362678666
-        ]
-    },
-    "NGA": {
-        "FUTURE": [
-            23.222585405978684,
-            25.53481580100336,
-            28.166989809359414,
-            29.024769143150973,
-            28.375467870547624,
-            27.560404822764717,
-            26.622464861562438,
-            25.952341121100005,
-            26.42196074011927,
-            26.78229258528312,
-            25.6435181922974,
-            23.378067776661577
-        ],
-        "LONG_NAME": "Nigeria",
-        "PAST": [
-            22.089130995156363,
-            24.545678093927673,
-            27.38006012265495,
-            28.21364672064363,
-            27.595244621720607,
-            26.670301279410108,
-            25.708116072363836,
-            25.111046500847475,
-            25.55056953886505,
-            25.83104007566525,
-            24.509063844026873,
-            22.207547583327074
-        ]
-    },
-    "NIC": {
-        "FUTURE": [
-            25.796948023954368,
-            26.227852473311906,
-            27.128361050994442,
-            28.034949408792066,
-            28.059274341075003,
-            27.372232588700005,
-            27.351045880783726,
-            27.606414068748418,
-            27.499774266921822,
-            27.044060843184525,
-            26.50674620156071,
-            25.98206123430199
-        ],
-        "LONG_NAME": "Nicaragua",
-        "PAST": [
-            24.764227972334076,
-            25.20804556380296,
-            26.114108841213334,
-            27.033358199582963,
-            27.16707311557111,
-            26.461007125774813,
-            26.34792276977926,
-            26.69501184547407,
-            26.706433105570365,
-            26.256701208050377,
-            25.67751690891629,
-            25.073243543362956
-        ]
-    },
-    "NIU": {
-        "FUTURE": [
-            27.172943115141077,
-            27.73781858230536,
-            27.796600341737502,
-            27.22740990792499,
-            26.0726748871625,
-            24.82955714618929,
-            23.95402199889822,
-            23.60614177130179,
-            23.7425046647375,
-            24.331837791025006,
-            25.210757664614285,
-            26.261027745023217
-        ],
-        "LONG_NAME": "Niue",
-        "PAST": [
-            26.612417602663335,
-            27.217372639369998,
-            27.251779174436663,
-            26.685957845333334,
-            25.551375325346672,
-            24.21887613989667,
-            23.391835531559998,
-            22.990686035426666,
-            23.139258830076663,
-            23.65512797048,
-            24.496669515689995,
-            25.599385579503334
-        ]
-    },
-    "NLD": {
-        "FUTURE": [
-            3.96824505871034,
-            4.060233602738093,
-            5.173452104906938,
-            7.668090353154133,
-            11.10276483023495,
-            14.55585152741449,
-            16.693514143022448,
-            16.339863368339792,
-            13.802725344273977,
-            10.270586597465714,
-            7.098311288064082,
-            4.9489490743303985
-        ],
-        "LONG_NAME": "Netherlands",
-        "PAST": [
-            2.8568696522060644,
-            2.8010698590907,
-            4.109366861917057,
-            6.469584437776572,
-            10.288889276102191,
-            13.982625325720479,
-            16.300377836905714,
-            15.995930699387618,
-            13.339658610200953,
-            9.843529983053049,
-            6.4136093866649535,
-            4.168280610508657
-        ]
-    },
-    "NOR": {
-        "FUTURE": [
-            -5.859585898305539,
-            -6.029154242380021,
-            -4.188275260710889,
-            -0.15460585225398787,
-            4.385317599748696,
-            8.866755548591097,
-            10.959251669642322,
-            9.80861653194667,
-            6.530010741796794,
-            2.4718908117311615,
-            -1.4256658254979815,
-            -4.395653302660214
-        ],
-        "LONG_NAME": "Norway",
-        "PAST": [
-            -7.997144075975998,
-            -8.166362656870206,
-            -5.625582985027121,
-            -1.6491841137307135,
-            3.3414812785812997,
-            8.080168883712954,
-            10.509787706846454,
-            9.583530035402342,
-            6.182285513543699,
-            1.9821501941675232,
-            -2.6322112541162586,
-            -6.27301973189833
-        ]
-    },
-    "NPL": {
-        "FUTURE": [
-            2.3545913202205973,
-            4.957149703909283,
-            9.412091639054426,
-            14.319835415190726,
-            18.190590896017138,
-            19.873855986863862,
-            19.177013843491494,
-            17.890516900578117,
-            15.772874707999524,
-            11.558858103786806,
-            6.794156557695414,
-            3.127974473102228
-        ],
-        "LONG_NAME": "Nepal",
-        "PAST": [
-            0.8284580115516091,
-            3.1324544271119947,
-            7.970542028945399,
-            13.129055693357826,
-            17.260984849424784,
-            19.41863976646138,
-            18.84018536140667,
-            17.71601599452588,
-            15.61711037345748,
-            11.088194506307598,
-            5.82576700840348,
-            1.7965040727967139
-        ]
-    },
-    "NRU": {
-        "FUTURE": [
-            27.447567531082143,
-            27.325246538603572,
-            27.388525826200002,
-            27.443347386121424,
-            27.539826529935713,
-            27.67830657935,
-            27.661146980767853,
-            27.46406991153928,
-            27.315424238342853,
-            27.29458400162857,
-            27.47767639108215,
-            27.602176121628563
-        ],
-        "LONG_NAME": "Nauru",
-        "PAST": [
-            26.726715087759995,
-            26.612298583833333,
-            26.661531576086666,
-            26.710841878799997,
-            26.729052734999996,
-            26.80430704738,
-            26.818723551560005,
-            26.703127034446666,
-            26.487817382939998,
-            26.493931070833337,
-            26.669340005966667,
-            26.81821899313999
-        ]
-    },
-    "NZL": {
-        "FUTURE": [
-            15.85181586614954,
-            16.231346948112513,
-            15.422386947727295,
-            13.824863239209032,
-            12.09744099178648,
-            10.702279849631541,
-            9.987822746791144,
-            10.051010054039834,
-            10.648568873542402,
-            11.425137383727668,
-            12.704038230931427,
-            14.434522239905814
-        ],
-        "LONG_NAME": "New Zealand",
-        "PAST": [
-            15.485036650508404,
-            15.850485882871068,
-            15.020406450920188,
-            13.356900315152858,
-            11.534260631898668,
-            10.07212444457938,
-            9.236582292951786,
-            9.25532967714057,
-            9.782746088343382,
-            10.70537756046645,
-            12.074298531277144,
-            13.950248718054668
-        ]
-    },
-    "OMN": {
-        "FUTURE": [
-            20.055918076720584,
-            21.518080702978573,
-            24.63152653075651,
-            28.317937963277107,
-            31.459631719271215,
-            33.39596378087752,
-            33.02592070720903,
-            32.18321016432101,
-            31.06034504843172,
-            28.451506607252945,
-            24.9430497113458,
-            21.298448194306093
-        ],
-        "LONG_NAME": "Oman",
-        "PAST": [
-            18.744266644178,
-            20.119668399687843,
-            23.449508726722744,
-            27.16012046654627,
-            30.462482646941176,
-            32.56441231525725,
-            32.37042176439451,
-            31.696388753168627,
-            30.51921374754196,
-            27.76654639209373,
-            23.93160065303412,
-            20.098684273997257
-        ]
-    },
-    "PAK": {
-        "FUTURE": [
-            4.668859614636941,
-            7.756697867540873,
-            12.880468752914496,
-            18.36024885950923,
-            23.026442586351475,
-            26.45566762883256,
-            27.082126435879026,
-            25.68255939375777,
-            22.48851499473069,
-            17.26592587222862,
-            10.925386072265194,
-            5.669001876230969
-        ],
-        "LONG_NAME": "Pakistan",
-        "PAST": [
-            2.6936480921249597,
-            5.691238925014602,
-            11.18315586186428,
-            16.75968028016772,
-            21.874401490228816,
-            25.522215544598758,
-            26.596199858019055,
-            25.353822939528147,
-            21.990258424401695,
-            16.479500273347895,
-            9.633156331390767,
-            4.018729681025879
-        ]
-    },
-    "PAN": {
-        "FUTURE": [
-            27.099078431272456,
-            27.25112946198571,
-            27.5706035070398,
-            27.745225867129587,
-            27.465370800700004,
-            27.00146406547347,
-            26.893141299165812,
-            27.0788510377403,
-            27.190834356671935,
-            27.014066268191332,
-            26.952284365637247,
-            27.049851397883156
-        ],
-        "LONG_NAME": "Panama",
-        "PAST": [
-            26.161374046858096,
-            26.370023890806667,
-            26.679016985444765,
-            26.867250279708568,
-            26.599439929258093,
-            26.238323102695237,
-            26.119167364353327,
-            26.312275913997144,
-            26.44619402155619,
-            26.273233758621902,
-            26.18203095928762,
-            26.21259591288857
-        ]
-    },
-    "PCN": {
-        "FUTURE": [
-            24.9256003240875,
-            25.730262210894644,
-            25.798232487103576,
-            24.855461665632138,
-            23.257685525205353,
-            21.7654484334625,
-            20.731189183017857,
-            20.10704639951607,
-            20.130283355648213,
-            20.737348284103568,
-            21.9854175020875,
-            23.573906489921423
-        ],
-        "LONG_NAME": "Pitcairn",
-        "PAST": [
-            24.40177408877667,
-            25.335484823010002,
-            25.41736653634333,
-            24.49854125954333,
-            22.88250223845,
-            21.46211140959333,
-            20.28920186365,
-            19.63145446800333,
-            19.470085653169996,
-            20.042143758510004,
-            21.263226319123337,
-            22.904916381943334
-        ]
-    },
-    "PER": {
-        "FUTURE": [
-            22.183628195477723,
-            22.335900919605425,
-            22.247280075390336,
-            21.876849446683423,
-            21.001677762669107,
-            20.20228878685066,
-            20.424005144949074,
-            22.143231619220053,
-            23.1489700357952,
-            22.96118806679205,
-            22.531434218227673,
-            22.226243087195332
-        ],
-        "LONG_NAME": "Peru",
-        "PAST": [
-            21.271432325572015,
-            21.402035735114193,
-            21.32606586916329,
-            20.773618316668774,
-            19.86661639712995,
-            19.03097606319407,
-            19.186217456803753,
-            20.935220761086857,
-            22.05040613785878,
-            21.919411765408444,
-            21.538446553656627,
-            21.28112195363424
-        ]
-    },
-    "PHL": {
-        "FUTURE": [
-            26.288936069505628,
-            26.267902877162225,
-            26.985344603305766,
-            27.896509946179663,
-            28.463071928326645,
-            28.456591092370605,
-            28.142105060889975,
-            28.071621318302608,
-            28.048471723557288,
-            27.872632665414976,
-            27.521609212300824,
-            26.867917113221008
-        ],
-        "LONG_NAME": "Philippines",
-        "PAST": [
-            25.589019305689227,
-            25.613384774902052,
-            26.31290024968667,
-            27.252388586703074,
-            27.812261415370255,
-            27.746260579615896,
-            27.495194577319236,
-            27.441481370249235,
-            27.428546768243333,
-            27.247031108647185,
-            26.88293089232718,
-            26.19873743270487
-        ]
-    },
-    "PLW": {
-        "FUTURE": [
-            28.05958230156428,
-            27.87501307908214,
-            27.995980398632145,
-            28.29176548555714,
-            28.597676958775008,
-            28.765251160014284,
-            28.70130920425,
-            28.698632376057144,
-            28.73405565531428,
-            28.646294730160722,
-            28.641521998764286,
-            28.46448407856071
-        ],
-        "LONG_NAME": "Palau",
-        "PAST": [
-            27.412388102053338,
-            27.23798014386,
-            27.372117106706664,
-            27.651332601399996,
-            27.93779296799333,
-            28.08481648765333,
-            28.031606038099998,
-            28.04523518854667,
-            28.071421304853335,
-            28.011244710366668,
-            28.011783854013334,
-            27.8042928067
-        ]
-    },
-    "PNG": {
-        "FUTURE": [
-            27.415483284544155,
-            27.370571053845563,
-            27.37085317572316,
-            27.25830206939275,
-            26.969302222940577,
-            26.543791205378025,
-            26.20529904700909,
-            26.210128420681716,
-            26.447976942032792,
-            26.745379988453255,
-            27.088006650435826,
-            27.377675539569484
-        ],
-        "LONG_NAME": "Papua New Guinea",
-        "PAST": [
-            26.745330070591923,
-            26.77971043434566,
-            26.746424818976365,
-            26.61142615102505,
-            26.271332588851518,
-            25.82065244632586,
-            25.468072633007676,
-            25.461386263302227,
-            25.676564657532726,
-            25.987371395164036,
-            26.319594689640603,
-            26.66754853274182
-        ]
-    },
-    "POL": {
-        "FUTURE": [
-            -0.7413618299603166,
-            -0.3341263667074127,
-            2.1615240915283236,
-            6.675050160374246,
-            12.099944644340221,
-            16.452313498668094,
-            18.65902007571746,
-            17.356804257053174,
-            12.94494562274445,
-            7.987360152145356,
-            3.5082849169855295,
-            0.5666395519821296
-        ],
-        "LONG_NAME": "Poland",
-        "PAST": [
-            -2.510242377429932,
-            -2.234703120497269,
-            0.8507212320564249,
-            5.459078188339851,
-            11.291688480940591,
-            15.9845898668913,
-            18.270954387232962,
-            16.97617051873074,
-            12.427744773839184,
-            7.52138479724174,
-            2.5760713930388848,
-            -0.7236116762163511
-        ]
-    },
-    "PRI": {
-        "FUTURE": [
-            25.362104688807143,
-            25.00121797833214,
-            24.99651336695,
-            25.34516688755357,
-            25.974808829158935,
-            26.586801801455355,
-            27.14698573552322,
-            27.59903063103215,
-            27.75081634487322,
-            27.515325818276786,
-            26.935003008216068,
-            26.087164197430365
-        ],
-        "LONG_NAME": "Puerto Rico",
-        "PAST": [
-            24.672372436593328,
-            24.275047811433335,
-            24.248431396066668,
-            24.625650024779997,
-            25.31204630550333,
-            25.938955688276668,
-            26.515395100566668,
-            26.985866292826667,
-            27.147868855883342,
-            26.90871887184334,
-            26.315927123763334,
-            25.44567464236
-        ]
-    },
-    "PRK": {
-        "FUTURE": [
-            -9.15834441754953,
-            -6.636202873779936,
-            -0.22012111123965192,
-            6.842532566722637,
-            13.200388326042434,
-            18.05021360325844,
-            20.728451320254546,
-            20.300228862076303,
-            15.798415741143831,
-            9.018307376011105,
-            1.276953660032866,
-            -5.908325343791795
-        ],
-        "LONG_NAME": "Korea, Democratic People's Republic of",
-        "PAST": [
-            -11.42981733875193,
-            -8.884272534904103,
-            -1.997837690828699,
-            5.362867135734358,
-            12.19311893334667,
-            17.525035695979394,
-            20.546965442795152,
-            20.414878891150305,
-            15.7879786634517,
-            8.845101466163863,
-            0.39455677383016613,
-            -7.6087753758332095
-        ]
-    },
-    "PRT": {
-        "FUTURE": [
-            12.946609185861506,
-            13.002582394460665,
-            13.574181459410665,
-            14.60360616583137,
-            16.41271015063368,
-            18.969643650605867,
-            21.338122620370665,
-            21.949511547652552,
-            20.786903770420157,
-            18.073650827195156,
-            15.556157949136047,
-            13.841499017605381
-        ],
-        "LONG_NAME": "Portugal",
-        "PAST": [
-            12.171156383568952,
-            12.073733811392762,
-            12.80517272924662,
-            13.766430373476526,
-            15.51968020472238,
-            18.33689313640667,
-            20.835044498184285,
-            21.40199919137714,
-            20.24995364233714,
-            17.540442185607148,
-            15.01715145974081,
-            13.191649664467622
-        ]
-    },
-    "PRY": {
-        "FUTURE": [
-            28.625432631339077,
-            28.092763756268067,
-            26.661254946610505,
-            24.249039528894535,
-            20.96012461669475,
-            18.2908659223376,
-            18.284098200010398,
-            21.053664391892855,
-            24.44411718569013,
-            26.443351104725,
-            27.759182521579827,
-            28.492763808122692
-        ],
-        "LONG_NAME": "Paraguay",
-        "PAST": [
-            27.895423559936074,
-            27.53857780843804,
-            26.116301292982747,
-            23.309456858931373,
-            20.090377029969797,
-            17.315229588248236,
-            16.97229745869204,
-            19.78047760592863,
-            23.195225016703134,
-            25.459135526379217,
-            26.8855759569102,
-            27.55814292716706
-        ]
-    },
-    "PSE": {
-        "FUTURE": [
-            11.159194401034105,
-            12.261475699576069,
-            14.876931326662499,
-            18.116901397425,
-            21.794709886814285,
-            25.379442487530362,
-            27.622648511194637,
-            27.903050558871428,
-            25.458351680396426,
-            21.465595790164294,
-            16.292695726598215,
-            12.461877550571431
-        ],
-        "LONG_NAME": "Palestine, State of",
-        "PAST": [
-            10.167548624483667,
-            11.231309000721666,
-            13.815959675993334,
-            17.025180053560003,
-            20.720143636423337,
-            24.57213338205,
-            26.847686767246667,
-            27.236536661946666,
-            24.813352457720004,
-            20.786585489573334,
-            15.538109334697001,
-            11.578054809262998
-        ]
-    },
-    "PYF": {
-        "FUTURE": [
-            27.528236825143573,
-            27.82928030844072,
-            28.00853968964214,
-            27.955565752448564,
-            27.567995997667854,
-            26.964312961986423,
-            26.45477600125571,
-            26.194916643645715,
-            26.23337925512643,
-            26.49705004013572,
-            26.84290400913643,
-            27.19954725013715
-        ],
-        "LONG_NAME": "French Polynesia",
-        "PAST": [
-            26.818806966224,
-            27.14705607093333,
-            27.343063558436004,
-            27.300295409763997,
-            26.94060384137866,
-            26.325810140218664,
-            25.799145915256005,
-            25.531444498283996,
-            25.567285563379997,
-            25.79951822916267,
-            26.163411051850673,
-            26.524114583278667
-        ]
-    },
-    "QAT": {
-        "FUTURE": [
-            16.61022486028125,
-            18.980707440994646,
-            23.288089752075894,
-            27.85660171488482,
-            32.192289080460704,
-            35.910436630076795,
-            37.4129698610866,
-            36.738047735758926,
-            33.98948533164643,
-            29.19922774164732,
-            23.208922795114283,
-            18.004664285099107
-        ],
-        "LONG_NAME": "Qatar",
-        "PAST": [
-            15.288486735224835,
-            17.568770344816663,
-            21.998448181375004,
-            26.42590586425167,
-            31.03124440526,
-            34.752651469296666,
-            36.36590881339833,
-            35.886352030480005,
-            33.04975229877333,
-            28.374942525334998,
-            22.169745381400002,
-            16.751235453514166
-        ]
-    },
-    "REU": {
-        "FUTURE": [
-            26.815032959050004,
-            27.280504499448206,
-            27.1785861428125,
-            26.34737941212143,
-            24.960487910758932,
-            23.553288050553572,
-            22.507817949703572,
-            22.057345799437492,
-            22.147380828594642,
-            22.962394169507142,
-            24.367882864942864,
-            25.821106501892853
-        ],
-        "LONG_NAME": "Reunion",
-        "PAST": [
-            26.32027689628,
-            26.801119995576663,
-            26.738170369576665,
-            25.930750529326662,
-            24.47753499395667,
-            22.983024088506667,
-            21.875760904886665,
-            21.349585977820002,
-            21.46094970612,
-            22.28531494149,
-            23.761446126816665,
-            25.286802165409995
-        ]
-    },
-    "ROU": {
-        "FUTURE": [
-            0.4683109828586546,
-            1.361527143318856,
-            4.381659298853805,
-            9.081943766560856,
-            14.433593677326188,
-            19.114303080339763,
-            21.97463269932309,
-            21.242468697430954,
-            16.028321765827616,
-            10.253862507982642,
-            5.110877482099492,
-            1.916665286176165
-        ],
-        "LONG_NAME": "Romania",
-        "PAST": [
-            -1.0910055880506462,
-            -0.3583203124894742,
-            3.0684966363461195,
-            7.922035048023644,
-            13.443505995009424,
-            18.442662082301336,
-            21.233656277163558,
-            20.51341783321822,
-            15.381698540541603,
-            9.695691867262308,
-            4.403884412925145,
-            0.9158780924797703
-        ]
-    },
-    "RUS": {
-        "FUTURE": [
-            -23.461459644541744,
-            -22.385569922153334,
-            -16.405680307518534,
-            -7.433956774198571,
-            2.2478859625409577,
-            9.919739121020266,
-            12.658200842021339,
-            9.904486568801932,
-            3.5490430563698925,
-            -4.930640678210898,
-            -14.330876253276335,
-            -20.72370197371426
-        ],
-        "LONG_NAME": "Russian Federation",
-        "PAST": [
-            -26.508149085404497,
-            -25.204289768601857,
-            -18.8380590001704,
-            -9.151660952535524,
-            1.2521387321851158,
-            9.620161916748309,
-            12.81624471072504,
-            10.181830781266138,
-            3.5231483942872894,
-            -5.919037264516302,
-            -16.51180204766829,
-            -23.493992558321906
-        ]
-    },
-    "RWA": {
-        "FUTURE": [
-            20.472094944769648,
-            21.16370664292679,
-            21.55846677503928,
-            21.564641135010714,
-            21.107005527721423,
-            20.817491803796425,
-            21.041622162000003,
-            21.757087161932144,
-            21.975973402112498,
-            21.303665160919643,
-            20.501519339333928,
-            20.135032108964293
-        ],
-        "LONG_NAME": "Rwanda",
-        "PAST": [
-            19.48813985157,
-            20.160422770649998,
-            20.623441568566662,
-            20.638307698983333,
-            20.13535563158333,
-            19.869353231283334,
-            20.12097066213,
-            20.81511942527,
-            20.97928059925,
-            20.382237751653335,
-            19.5303253178,
-            19.159465535523335
-        ]
-    },
-    "SAU": {
-        "FUTURE": [
-            13.747978093326415,
-            16.45789778118171,
-            21.01089487607769,
-            25.556393617093743,
-            29.59204950001078,
-            32.97368242875082,
-            34.097064863225214,
-            33.34510182792165,
-            30.600210772557308,
-            25.895538011234176,
-            19.92464047923519,
-            14.894542853167327
-        ],
-        "LONG_NAME": "Saudi Arabia",
-        "PAST": [
-            12.24080441241509,
-            14.921257574837036,
-            19.68885457325458,
-            24.183279967091796,
-            28.345426275818262,
-            31.97797873475293,
-            33.28541109519734,
-            32.72826929391015,
-            29.868977551161034,
-            25.016425061098257,
-            18.715365115685774,
-            13.413024245128687
-        ]
-    },
-    "SDN": {
-        "FUTURE": [
-            20.97828931644211,
-            23.11869020317525,
-            26.100880365322922,
-            28.076999694864494,
-            28.86718241388954,
-            29.36930290115615,
-            29.01485270559842,
-            28.44957646894822,
-            28.1439619215867,
-            26.967090288687153,
-            24.170784722853373,
-            21.357393946036915
-        ],
-        "LONG_NAME": "Sudan",
-        "PAST": [
-            19.652073499578766,
-            21.972186674323893,
-            25.05791074924084,
-            27.103381885194167,
-            27.856070766095925,
-            28.404628895356396,
-            28.06339012413399,
-            27.601412681881666,
-            27.27105026250047,
-            25.9688612760526,
-            22.98027097920204,
-            20.04962610299144
-        ]
-    },
-    "SEN": {
-        "FUTURE": [
-            24.244125762746755,
-            26.040572228890255,
-            28.175419795282142,
-            29.456062317300326,
-            29.843693721058433,
-            29.483630588950323,
-            28.632157263808445,
-            28.095409145472406,
-            28.47887519711688,
-            28.873412194058762,
-            27.672273908555525,
-            24.890233820315906
-        ],
-        "LONG_NAME": "Senegal",
-        "PAST": [
-            23.095127729996364,
-            24.935095770219394,
-            27.223006184083633,
-            28.5429498848394,
-            29.01047289358061,
-            28.506481748566056,
-            27.65604581006122,
-            27.286831942479395,
-            27.698536450856974,
-            27.948509817747883,
-            26.539228959866666,
-            23.765933320013946
-        ]
-    },
-    "SGP": {
-        "FUTURE": [
-            26.915952410185717,
-            26.947826930410713,
-            27.561992100078566,
-            28.26428876588928,
-            28.686943054421437,
-            28.623847961367854,
-            28.34162248886429,
-            28.176975794975,
-            28.1345509121,
-            28.066961015967852,
-            27.838581630592852,
-            27.392446245028566
-        ],
-        "LONG_NAME": "Singapore",
-        "PAST": [
-            26.196905518386664,
-            26.274279785399997,
-            26.899412028393336,
-            27.639634195979998,
-            28.065140788366662,
-            27.964298502426665,
-            27.66104736337333,
-            27.51382649792667,
-            27.489634196386667,
-            27.44049682578667,
-            27.1958028162,
-            26.679429117713333
-        ]
-    },
-    "SHN": {
-        "FUTURE": [
-            23.28089250865715,
-            24.18229784267143,
-            24.571523393657145,
-            24.211126054882154,
-            23.07328360371429,
-            21.781714303057147,
-            20.66519165033929,
-            19.971303667046424,
-            19.859010969025,
-            20.356513977067852,
-            21.19780295203929,
-            22.194888523132143
-        ],
-        "LONG_NAME": "Saint Helena, Ascension and Tristan da Cunha",
-        "PAST": [
-            22.635447184933334,
-            23.63623860688667,
-            24.113759358373336,
-            23.778202310826668,
-            22.63819580076,
-            21.23472086616666,
-            20.04487508101333,
-            19.276645914866666,
-            19.090004476220006,
-            19.559712727593332,
-            20.413777669279998,
-            21.477622476746664
-        ]
-    },
-    "SJM": {
-        "FUTURE": [
-            -16.244204833451725,
-            -17.474538658704184,
-            -17.58674509380338,
-            -12.612902729245857,
-            -4.555980970884818,
-            -0.5119081384301436,
-            0.7558159066962803,
-            0.28622702577872844,
-            -2.062008256519707,
-            -6.390016058686095,
-            -10.756113164754053,
-            -14.133244714609017
-        ],
-        "LONG_NAME": "Svalbard and Jan Mayen",
-        "PAST": [
-            -19.493270334888074,
-            -21.29698731651008,
-            -20.62362646876153,
-            -15.152941954714509,
-            -5.8824961942381035,
-            -0.8276373172167588,
-            0.7654343548106864,
-            0.26005213122333876,
-            -2.710743623538319,
-            -8.036269363369248,
-            -13.185173243746107,
-            -17.782464300404744
-        ]
-    },
-    "SLB": {
-        "FUTURE": [
-            28.6533642065013,
-            28.66441999140779,
-            28.643334722939933,
-            28.60830143483767,
-            28.439087211774677,
-            28.08342336661493,
-            27.702209671032787,
-            27.58384873008215,
-            27.71905408575,
-            27.950446290302917,
-            28.235995106603244,
-            28.539523731475008
-        ],
-        "LONG_NAME": "Solomon Islands",
-        "PAST": [
-            27.994043153930303,
-            28.061825098976364,
-            28.032076009411515,
-            27.987523305058183,
-            27.779845452076362,
-            27.413853131255756,
-            27.042021225369083,
-            26.889473470318183,
-            26.993236010380606,
-            27.241721228501817,
-            27.52538859041636,
-            27.854222523596366
-        ]
-    },
-    "SLE": {
-        "FUTURE": [
-            25.945414640917857,
-            27.185208534760203,
-            28.225478658867356,
-            28.174620492368366,
-            27.517457767532136,
-            26.567020337960713,
-            25.740848774629594,
-            25.341062273369385,
-            25.628712712767854,
-            26.213165438920917,
-            26.529989904328065,
-            25.87499330462193
-        ],
-        "LONG_NAME": "Sierra Leone",
-        "PAST": [
-            25.01370471710191,
-            26.39662679067809,
-            27.58362775548285,
-            27.440916225353327,
-            26.652663457752382,
-            25.676081484439056,
-            24.831711251863812,
-            24.45758696036572,
-            24.761465308080954,
-            25.328805396648573,
-            25.545713587998097,
-            24.91495128815238
-        ]
-    },
-    "SLV": {
-        "FUTURE": [
-            24.709696088769643,
-            25.49159022782322,
-            26.95965957659643,
-            28.21426119206787,
-            28.10730143941072,
-            27.223964690785717,
-            27.25242451256072,
-            27.36137226655,
-            26.91478184250357,
-            26.204427446712508,
-            25.501380375082142,
-            24.814736502748215
-        ],
-        "LONG_NAME": "El Salvador",
-        "PAST": [
-            23.452998860463335,
-            24.32624410051,
-            25.81209411639667,
-            27.076848347323335,
-            27.0886678062,
-            26.114005533056666,
-            25.972796631473333,
-            26.22363891574667,
-            25.93434855108,
-            25.221497599216665,
-            24.41977539046667,
-            23.68204854383
-        ]
-    },
-    "SMR": {
-        "FUTURE": [
-            4.6893419538131065,
-            5.584423610026428,
-            7.777946472312857,
-            10.899395533873216,
-            15.147893633264285,
-            19.869493756974997,
-            23.125559125839285,
-            22.440084185328573,
-            17.82673862933214,
-            12.661550249842856,
-            8.433929443137142,
-            5.712564740710714
-        ],
-        "LONG_NAME": "San Marino",
-        "PAST": [
-            3.181254069052266,
-            3.9309692382473336,
-            6.529058838139334,
-            9.737856038118666,
-            14.079703775866664,
-            19.076586914026667,
-            22.39975178992667,
-            21.657423910060004,
-            17.155725098066668,
-            12.013810220797334,
-            7.590818278082001,
-            4.620402018243333
-        ]
-    },
-    "SOM": {
-        "FUTURE": [
-            25.03262209190226,
-            25.809190986480594,
-            27.093662733715952,
-            28.250509316646674,
-            28.74689806993416,
-            28.601279522004642,
-            27.664087313268215,
-            27.441327231394176,
-            27.849538021755595,
-            27.14052614505,
-            26.159564208698566,
-            25.27533358615738
-        ],
-        "LONG_NAME": "Somalia",
-        "PAST": [
-            24.009059108853556,
-            24.681627875548667,
-            26.085074056046892,
-            27.374175279753114,
-            27.834840562590223,
-            27.843412950392224,
-            26.976124199668664,
-            26.80205118798267,
-            27.179025471610217,
-            26.386357014801114,
-            25.387625936328448,
-            24.306969468821112
-        ]
-    },
-    "SRB": {
-        "FUTURE": [
-            1.4559828893453666,
-            2.4845128738705013,
-            5.296419007609955,
-            9.505214418863572,
-            14.399654115663882,
-            19.029412133779015,
-            22.000590597337055,
-            21.391651834433038,
-            16.16155242923393,
-            10.459068162014685,
-            5.6317146846121435,
-            2.7109500339377486
-        ],
-        "LONG_NAME": "Serbia",
-        "PAST": [
-            -0.06252797442311249,
-            0.7817141214731014,
-            3.9485168456399746,
-            8.282894897296,
-            13.368328348754915,
-            18.23170649226334,
-            21.142168935008335,
-            20.475831857859998,
-            15.464691416648332,
-            9.804740650890166,
-            4.8941009520593015,
-            1.66534449262438
-        ]
-    },
-    "STP": {
-        "FUTURE": [
-            27.317983899646432,
-            27.69737788647143,
-            28.175820486796418,
-            28.29986953734286,
-            28.095840999416065,
-            27.594773974308925,
-            26.94649669028036,
-            26.57345526538393,
-            26.691555568046425,
-            26.965103694583934,
-            27.146026611292857,
-            27.27299663010714
-        ],
-        "LONG_NAME": "Sao Tome and Principe",
-        "PAST": [
-            26.617294311610003,
-            27.06026306091,
-            27.561722819170004,
-            27.702328490516667,
-            27.454907226243336,
-            26.921330769220003,
-            26.205721027913334,
-            25.766971842433335,
-            25.86484680167,
-            26.169438680029998,
-            26.360991415143335,
-            26.491052246149998
-        ]
-    },
-    "SUR": {
-        "FUTURE": [
-            27.151505122203183,
-            27.630847506740878,
-            28.291861518696432,
-            28.23870123019008,
-            27.175678798234525,
-            26.14244757773096,
-            26.558845277604764,
-            28.265670534743656,
-            29.48035164518809,
-            29.626898629467853,
-            28.676271105696827,
-            27.49977923212619
-        ],
-        "LONG_NAME": "Suriname",
-        "PAST": [
-            26.25926310245185,
-            26.762147805063705,
-            27.324171956054823,
-            27.294335711212586,
-            26.24671110993704,
-            25.216501871972593,
-            25.58738584228593,
-            27.290061441796297,
-            28.553927273004444,
-            28.686286983265187,
-            27.69404432588963,
-            26.527678313040003
-        ]
-    },
-    "SVK": {
-        "FUTURE": [
-            -0.81695385347709,
-            -0.011794576755249983,
-            2.7992360639898335,
-            7.390561629348164,
-            12.782069147942753,
-            17.142323707803573,
-            19.395402558056126,
-            18.123699421798463,
-            13.371866342750002,
-            8.15576327596551,
-            3.434606435361092,
-            0.41597171708287956
-        ],
-        "LONG_NAME": "Slovakia",
-        "PAST": [
-            -2.5817321778033464,
-            -1.9968412852882365,
-            1.4629603795270447,
-            6.227462623267143,
-            11.93367425761876,
-            16.602218191921903,
-            18.88410005084381,
-            17.54655965188095,
-            12.77624104771914,
-            7.634110223635333,
-            2.5644676571188385,
-            -0.8514177595572667
-        ]
-    },
-    "SVN": {
-        "FUTURE": [
-            1.293185097836696,
-            2.239371163597201,
-            4.715305328253393,
-            8.390004839204463,
-            13.023557935853217,
-            17.484711783612504,
-            20.124371664951788,
-            19.23474066633036,
-            14.691657474830356,
-            9.57113320464411,
-            5.184655325755179,
-            2.3701487951456746
-        ],
-        "LONG_NAME": "Slovenia",
-        "PAST": [
-            -0.33889465325648005,
-            0.45320129403143355,
-            3.3740529378959327,
-            7.194434610952333,
-            12.06338094064,
-            16.76834615043333,
-            19.420757039269997,
-            18.44979654896333,
-            14.011454264183334,
-            8.958422851423668,
-            4.316552734415667,
-            1.195882161511913
-        ]
-    },
-    "SWE": {
-        "FUTURE": [
-            -6.946233552936701,
-            -7.122078940743072,
-            -4.614295066415493,
-            0.2902074842931156,
-            5.74953388029125,
-            11.00144586105606,
-            13.351109973584238,
-            11.755333098141582,
-            7.667593365632312,
-            2.953753395687344,
-            -1.5211903405700067,
-            -5.13657426087884
-        ],
-        "LONG_NAME": "Sweden",
-        "PAST": [
-            -9.245360847263,
-            -9.435964909762577,
-            -6.008202785692201,
-            -1.199686007981961,
-            4.6751274956196855,
-            10.259132780846743,
-            12.943087090300317,
-            11.584652258857664,
-            7.348729168890519,
-            2.5874996045063603,
-            -2.692795958413961,
-            -7.065207219875069
-        ]
-    },
-    "SWZ": {
-        "FUTURE": [
-            22.270534242811607,
-            22.16862542277411,
-            21.315317426393744,
-            19.367137909459824,
-            16.279484612479465,
-            13.945609773653754,
-            13.60220364192455,
-            15.720711299372324,
-            18.79638780849643,
-            20.440243312721428,
-            20.985827582297325,
-            21.77706609428571
-        ],
-        "LONG_NAME": "Swaziland",
-        "PAST": [
-            21.599965413375003,
-            21.570857747945,
-            20.693550618301668,
-            18.56091461203167,
-            15.337560017912832,
-            12.87970225032333,
-            12.516087341923333,
-            14.559067280878335,
-            17.650768025923337,
-            19.417505391914997,
-            20.184233602128334,
-            20.897121683898334
-        ]
-    },
-    "SYC": {
-        "FUTURE": [
-            27.74717003936964,
-            27.8398421150875,
-            28.154478890500002,
-            28.337789263185716,
-            27.935576302505357,
-            26.957778930571425,
-            26.144135611287506,
-            25.937918526721425,
-            26.16730880715178,
-            26.689835684782146,
-            27.344887869774997,
-            27.749354771142865
-        ],
-        "LONG_NAME": "Seychelles",
-        "PAST": [
-            27.036362711046667,
-            27.11666259790667,
-            27.474513753223334,
-            27.73761901870333,
-            27.324405924606666,
-            26.31952819791667,
-            25.43363240561333,
-            25.200779215633336,
-            25.43193562808,
-            25.924108886910002,
-            26.57348836223333,
-            27.00081380253
-        ]
-    },
-    "SYR": {
-        "FUTURE": [
-            5.389668510066856,
-            7.413416544406262,
-            11.441544396484732,
-            16.385111218435508,
-            21.678427287328567,
-            26.767669859628267,
-            29.729523431516963,
-            29.190581094349106,
-            24.48425710768899,
-            18.139713105573694,
-            11.058388210485743,
-            6.540258044253032
-        ],
-        "LONG_NAME": "Syrian Arab Republic",
-        "PAST": [
-            4.051733907053003,
-            6.036512417626451,
-            10.087161424208874,
-            14.975618490575334,
-            20.327266100267227,
-            25.926368882859446,
-            29.012448967367778,
-            28.584852091601668,
-            23.879194132344995,
-            17.423122321514445,
-            10.16197068930228,
-            5.454805501342439
-        ]
-    },
-    "TCA": {
-        "FUTURE": [
-            24.729020254892863,
-            24.38380977076786,
-            24.42481449682857,
-            24.97201865077857,
-            25.87688991043214,
-            26.811695643721425,
-            27.54827444921072,
-            27.942731584924992,
-            28.00195312448215,
-            27.557996477292853,
-            26.628161838953577,
-            25.548363822164276
-        ],
-        "LONG_NAME": "Turks and Caicos Islands",
-        "PAST": [
-            24.004093424306674,
-            23.607529704260003,
-            23.622074381326673,
-            24.145229085033336,
-            25.162040202520004,
-            26.090100097586667,
-            26.846169026393333,
-            27.323358153933334,
-            27.398793538940005,
-            26.96466064516,
-            25.97990926104,
-            24.887841797053333
-        ]
-    },
-    "TCD": {
-        "FUTURE": [
-            18.28068521711614,
-            21.03468992292756,
-            24.974267635562338,
-            27.913653418908506,
-            29.36348584265995,
-            30.092519902638518,
-            29.674622412704164,
-            28.734519698952557,
-            28.039833172903922,
-            26.42585417051939,
-            22.64735695443631,
-            18.840522584564063
-        ],
-        "LONG_NAME": "Chad",
-        "PAST": [
-            16.805100310865463,
-            19.737082248768875,
-            23.841076272175876,
-            26.92262568398651,
-            28.397540962334123,
-            29.13962489498334,
-            28.748158870005398,
-            27.98427385596905,
-            27.265083385252378,
-            25.46151554227667,
-            21.388020446244447,
-            17.39398619587113
-        ]
-    },
-    "TGO": {
-        "FUTURE": [
-            25.112250191429588,
-            27.31840639704439,
-            29.418470421814792,
-            29.449645528679593,
-            28.389905501952544,
-            27.34829571728265,
-            26.389920915870924,
-            25.804398050015816,
-            26.22242378705204,
-            26.822875665632143,
-            26.630407683838264,
-            25.08771016617143
-        ],
-        "LONG_NAME": "Togo",
-        "PAST": [
-            24.037306721488573,
-            26.42538917138857,
-            28.70804821163238,
-            28.631931268289527,
-            27.58232654315238,
-            26.444103422077145,
-            25.413826788349525,
-            24.90963832313905,
-            25.317229643880957,
-            25.893408493397143,
-            25.571797397941904,
-            23.997860573058098
-        ]
-    },
-    "THA": {
-        "FUTURE": [
-            21.627673689053,
-            23.97414886466885,
-            27.164995247822,
-            28.96647208050829,
-            28.635568193593,
-            27.25831516773085,
-            26.459126020191142,
-            26.200093601695716,
-            25.84593205021386,
-            24.882825665958425,
-            23.383657357583434,
-            21.633526611447852
-        ],
-        "LONG_NAME": "Thailand",
-        "PAST": [
-            20.759898844404805,
-            23.201616536062136,
-            26.40662044264987,
-            28.2847928879312,
-            27.7987002762328,
-            26.484549641374937,
-            25.858200114332796,
-            25.681156005744,
-            25.267566568860268,
-            24.34656250047254,
-            22.7378411455088,
-            20.694708821666374
-        ]
-    },
-    "TJK": {
-        "FUTURE": [
-            -8.95080897921439,
-            -6.719674836745818,
-            -1.9581764311601304,
-            3.4940289997703036,
-            8.672537939738705,
-            13.657141458172445,
-            16.67615272895661,
-            15.421709878013273,
-            10.24505070241058,
-            3.773105530570914,
-            -2.3903287251464684,
-            -7.339715003866088
-        ],
-        "LONG_NAME": "Tajikistan",
-        "PAST": [
-            -11.233711072877036,
-            -9.073180898087363,
-            -4.066182115381109,
-            1.8318403455601207,
-            7.376647610174623,
-            12.580914306268147,
-            16.073387315936998,
-            14.878206041339777,
-            9.605133395814443,
-            2.8441445244558663,
-            -3.5500718858703872,
-            -8.992066277089128
-        ]
-    },
-    "TKL": {
-        "FUTURE": [
-            28.527271815842855,
-            28.573241097007138,
-            28.579692295825,
-            28.631246294225,
-            28.556563240907142,
-            28.320999145457133,
-            28.040403093135712,
-            27.923785617974993,
-            28.010627746678576,
-            28.168186732503575,
-            28.347668239178578,
-            28.4707794194
-        ],
-        "LONG_NAME": "Tokelau",
-        "PAST": [
-            27.82339477578667,
-            27.88358561201333,
-            27.89401448544,
-            27.925087483760002,
-            27.866418457280005,
-            27.622418212613333,
-            27.331046549706667,
-            27.21700439446,
-            27.31451415961333,
-            27.51361490941333,
-            27.68460082998,
-            27.822127278419998
-        ]
-    },
-    "TKM": {
-        "FUTURE": [
-            3.089043327072457,
-            5.215949870195305,
-            9.808739087935729,
-            15.866937578512049,
-            22.37380327558773,
-            28.046179682615684,
-            30.55199892035264,
-            28.408915976049535,
-            22.289963953328417,
-            15.201207652498882,
-            8.41433910131239,
-            4.236001151021263
-        ],
-        "LONG_NAME": "Turkmenistan",
-        "PAST": [
-            1.389832427575852,
-            3.395168669307298,
-            8.062363157511605,
-            14.290578914177479,
-            21.27428792320493,
-            27.271986809480577,
-            30.113901067257395,
-            27.88025114636232,
-            21.747761070977095,
-            14.349841396297654,
-            7.551418138612485,
-            3.2512950952492465
-        ]
-    },
-    "TLS": {
-        "FUTURE": [
-            28.89935498899572,
-            28.644109453893577,
-            28.647327749850717,
-            28.75812094558571,
-            28.483224923386434,
-            27.84843226833428,
-            27.25287933357214,
-            27.0838531494,
-            27.332858058008576,
-            27.965733773625,
-            28.776306370769998,
-            29.157250104178576
-        ],
-        "LONG_NAME": "Timor-Leste",
-        "PAST": [
-            28.230727539489333,
-            28.039431966628005,
-            28.010897623994666,
-            28.119405924362663,
-            27.822749430319995,
-            27.116903483389333,
-            26.476117350507998,
-            26.281012369025333,
-            26.573623860666665,
-            27.248125814223997,
-            28.052072754145335,
-            28.476243896505334
-        ]
-    },
-    "TON": {
-        "FUTURE": [
-            26.89055034125,
-            27.505230495260715,
-            27.509742737167866,
-            26.81061444999465,
-            25.534976959285718,
-            24.212607792817856,
-            23.284476143860726,
-            22.89423751826428,
-            23.020517621667846,
-            23.619729177883926,
-            24.61892591189643,
-            25.826913560732148
-        ],
-        "LONG_NAME": "Tonga",
-        "PAST": [
-            26.32397766180667,
-            27.005289713443332,
-            27.01054382389333,
-            26.290435791506663,
-            25.022724405953337,
-            23.632109577866668,
-            22.735048420696664,
-            22.274332682850005,
-            22.38303324325334,
-            22.934251913143335,
-            23.895991007520003,
-            25.16715291311667
-        ]
-    },
-    "TTO": {
-        "FUTURE": [
-            25.877207437982143,
-            25.820366996091668,
-            26.147996812029756,
-            26.653519039998805,
-            26.9981478732988,
-            27.015778314780952,
-            27.17288571300238,
-            27.70506468305238,
-            27.952503750033326,
-            27.79344177199643,
-            27.24138459735357,
-            26.450940813625
-        ],
-        "LONG_NAME": "Trinidad and Tobago",
-        "PAST": [
-            25.093375651028886,
-            25.01175808358,
-            25.344330512171116,
-            25.853708902708895,
-            26.24575195268222,
-            26.26424085798666,
-            26.38680691132445,
-            26.946510145164446,
-            27.24146931966222,
-            27.08638373474667,
-            26.509680175626674,
-            25.68242119681111
-        ]
-    },
-    "TUN": {
-        "FUTURE": [
-            11.896277710695964,
-            13.035785633570246,
-            15.308557531557971,
-            17.91380997544203,
-            21.269189436509617,
-            24.995935796739285,
-            27.544402740756322,
-            27.500511001265387,
-            24.650288005683244,
-            20.46911637839835,
-            16.030172997530766,
-            12.847064259887116
-        ],
-        "LONG_NAME": "Tunisia",
-        "PAST": [
-            10.631611202629436,
-            11.622894443717692,
-            14.090057060389077,
-            16.850624436358462,
-            20.290078188619997,
-            24.18430363633077,
-            26.914197559456408,
-            26.954314872408208,
-            24.093765649794875,
-            19.79137228982462,
-            15.217799730119333,
-            11.844570374814872
-        ]
-    },
-    "TUR": {
-        "FUTURE": [
-            3.903548075613954,
-            4.796178889599584,
-            7.452350587930739,
-            11.36200421587759,
-            15.987046435079558,
-            20.695891359145673,
-            24.104420453783934,
-            24.07082432890968,
-            19.59108587897732,
-            14.126839315285961,
-            8.741138343516486,
-            5.360099534227648
-        ],
-        "LONG_NAME": "Turkey",
-        "PAST": [
-            2.7716195625051987,
-            3.5154434471142437,
-            6.1609885767330335,
-            10.105842242258825,
-            14.764434868226123,
-            19.89687837287579,
-            23.345391417961576,
-            23.372904031809473,
-            18.98605020123681,
-            13.527374749468512,
-            8.07265924815521,
-            4.5724281177704285
-        ]
-    },
-    "TUV": {
-        "FUTURE": [
-            28.40599350689048,
-            28.383598690760717,
-            28.393991016200005,
-            28.452315921014282,
-            28.480018251750007,
-            28.436442420211907,
-            28.33567773719167,
-            28.271040416717856,
-            28.2664071945262,
-            28.294535318886908,
-            28.377073378467855,
-            28.438069662010715
-        ],
-        "LONG_NAME": "Tuvalu",
-        "PAST": [
-            27.72925821926667,
-            27.701239013437778,
-            27.691200087111113,
-            27.742193603171113,
-            27.739759657604445,
-            27.69271782803111,
-            27.598474120884443,
-            27.563286675175554,
-            27.56440972235111,
-            27.620124647702223,
-            27.698166910002218,
-            27.781915283060002
-        ]
-    },
-    "TWN": {
-        "FUTURE": [
-            18.165917896290477,
-            18.793429783225,
-            20.840655917480948,
-            23.345273880517855,
-            25.684694926076784,
-            27.257439204324406,
-            27.939951760626194,
-            27.94124912141428,
-            27.160031818442853,
-            25.123790559344645,
-            22.515807741754166,
-            19.75546028448988
-        ],
-        "LONG_NAME": "Taiwan, Province of China",
-        "PAST": [
-            17.394222343975557,
-            17.825899590102225,
-            19.91403774642111,
-            22.526460096267776,
-            24.929407415558885,
-            26.63676249166999,
-            27.484816826686664,
-            27.645077514447774,
-            26.829248724467778,
-            24.7527903235,
-            22.04506293415778,
-            19.00747951855333
-        ]
-    },
-    "TZA": {
-        "FUTURE": [
-            22.840233658838674,
-            23.192797072812755,
-            23.385539152003876,
-            23.01899504331766,
-            22.030345994802143,
-            20.992994285366738,
-            20.780364149232756,
-            21.782690180678166,
-            23.240642470160402,
-            24.10409573937969,
-            23.73628241112653,
-            22.93226237331694
-        ],
-        "LONG_NAME": "Tanzania, United Republic of",
-        "PAST": [
-            22.004616699255806,
-            22.39338971863581,
-            22.651370674452956,
-            22.282838890433712,
-            21.211834308967052,
-            20.092039096664386,
-            19.90955403639581,
-            20.909082903277902,
-            22.37328322582381,
-            23.23098609479562,
-            22.899971168157904,
-            22.069296351997913
-        ]
-    },
-    "UGA": {
-        "FUTURE": [
-            22.25700386824423,
-            23.331495515203297,
-            23.841765100117858,
-            23.420108334865926,
-            22.49146555818434,
-            22.117767753228577,
-            22.05462503990302,
-            22.4008649048445,
-            22.854298685806867,
-            22.64979410688984,
-            21.883739513048624,
-            21.567731836532424
-        ],
-        "LONG_NAME": "Uganda",
-        "PAST": [
-            21.42624809091641,
-            22.58391911401385,
-            23.133212671937436,
-            22.689725279438463,
-            21.634466709277437,
-            21.19700020038923,
-            21.133473557777435,
-            21.444195087222052,
-            21.8486165361682,
-            21.691702191896926,
-            20.99022936674205,
-            20.683279810019485
-        ]
-    },
-    "UKR": {
-        "FUTURE": [
-            -1.7565324744604038,
-            -1.0962118653068542,
-            2.4945904168589528,
-            8.24283995344781,
-            14.525236573261315,
-            19.57394564862408,
-            22.557404187275203,
-            21.501757843895003,
-            15.641040350211487,
-            9.33274981417205,
-            3.801047562612669,
-            0.1373437999544501
-        ],
-        "LONG_NAME": "Ukraine",
-        "PAST": [
-            -3.470961100224235,
-            -2.8715145437965055,
-            1.0794037737509297,
-            7.04593244272117,
-            13.60788301055143,
-            19.02244867310343,
-            21.95170846082057,
-            20.982258068133525,
-            15.065686093177199,
-            8.812828834008458,
-            3.019244094159965,
-            -0.9766206868794881
-        ]
-    },
-    "UMI": {
-        "FUTURE": [
-            25.90154157326786,
-            25.916896275535716,
-            25.98187146890357,
-            26.16474805561429,
-            26.495294843460723,
-            26.638589041425,
-            26.21627807643929,
-            25.627572195617855,
-            25.279453822685717,
-            25.267953055235715,
-            25.54059491843214,
-            25.810180664278572
-        ],
-        "LONG_NAME": "United States Minor Outlying Islands",
-        "PAST": [
-            25.044173177093334,
-            25.028656005466665,
-            25.153137206406665,
-            25.36048380468667,
-            25.65569458064,
-            25.76703084268,
-            25.457938639353333,
-            24.87676188112,
-            24.47333170547333,
-            24.509446207379998,
-            24.75297648076667,
-            25.009442138753336
-        ]
-    },
-    "URY": {
-        "FUTURE": [
-            26.702813557143752,
-            26.230821609679463,
-            23.849290303070536,
-            19.96951498284866,
-            15.575621332564285,
-            12.612193380150359,
-            12.24327400721853,
-            14.037249428174196,
-            16.68639973206911,
-            19.599777085316074,
-            22.919183458060274,
-            25.524704251842415
-        ],
-        "LONG_NAME": "Uruguay",
-        "PAST": [
-            26.312614694970826,
-            25.919650014344167,
-            23.6869618736125,
-            19.503302001493335,
-            15.130501047476665,
-            12.000279490491833,
-            11.193485260169082,
-            13.05581588731217,
-            15.68681538943,
-            18.620473734576667,
-            22.167238362740004,
-            24.81230545055917
-        ]
-    },
-    "USA": {
-        "FUTURE": [
-            -3.5306544221879044,
-            -2.3340513732300137,
-            1.119519519359639,
-            6.294055107019745,
-            11.81646268102075,
-            16.48454333066751,
-            18.995610355958714,
-            18.235374272656944,
-            14.13202129764223,
-            8.238007930336343,
-            2.2690251048008867,
-            -1.9204395839050759
-        ],
-        "LONG_NAME": "United States",
-        "PAST": [
-            -5.284470061103638,
-            -4.1716657782969735,
-            -0.7578690906376638,
-            4.743528685398051,
-            10.696786024821682,
-            15.816237330223972,
-            18.60260366942481,
-            17.88943558532865,
-            13.70823409838859,
-            7.376156725253518,
-            1.0162811812028558,
-            -3.5031675572249195
-        ]
-    },
-    "UZB": {
-        "FUTURE": [
-            -1.7097843911622466,
-            0.46143496772844345,
-            5.718427113034145,
-            12.607900969963442,
-            19.55236045675934,
-            25.22138171346881,
-            27.745437699566843,
-            25.516436479309498,
-            18.830040095168073,
-            11.06595833474256,
-            4.075529526667827,
-            -0.34701689893615434
-        ],
-        "LONG_NAME": "Uzbekistan",
-        "PAST": [
-            -3.8310295831281063,
-            -1.797737775578741,
-            3.677925909107971,
-            10.952287510017051,
-            18.43288879364297,
-            24.54765806629307,
-            27.379903303393643,
-            24.97787671776069,
-            18.289321391090546,
-            10.187446303460641,
-            3.0953244164299636,
-            -1.5498750959353351
-        ]
-    },
-    "VCT": {
-        "FUTURE": [
-            25.337678092196427,
-            24.959555489585714,
-            25.001208713803575,
-            25.39010075133214,
-            25.95009612992143,
-            26.472326006642852,
-            26.973738533725005,
-            27.43995557533929,
-            27.618482317271422,
-            27.441074915975005,
-            26.958005632307138,
-            26.10833086316429
-        ],
-        "LONG_NAME": "Saint Vincent and the Grenadines",
-        "PAST": [
-            24.69380900028,
-            24.28277587896,
-            24.3171264644,
-            24.733135986513332,
-            25.317525227946668,
-            25.86491699251333,
-            26.37852376371333,
-            26.84385172472667,
-            27.02518310548667,
-            26.860909016599997,
-            26.37606608048667,
-            25.500179036053332
-        ]
-    },
-    "VEN": {
-        "FUTURE": [
-            26.14485336664225,
-            26.857180942109384,
-            27.551726890475916,
-            27.62222174773562,
-            26.803255135812957,
-            25.79266077100531,
-            25.648653302450505,
-            26.721615039955918,
-            27.725734632983478,
-            27.690573494102857,
-            26.88138810723378,
-            26.180581664887658
-        ],
-        "LONG_NAME": "Venezuela, Bolivarian Republic of",
-        "PAST": [
-            25.15488484712762,
-            25.861273193154474,
-            26.54177699531429,
-            26.525085507608757,
-            25.717377115903616,
-            24.717159249579048,
-            24.543847017238864,
-            25.66063139343657,
-            26.706248663372758,
-            26.655915062675618,
-            25.884961053829713,
-            25.172439138928002
-        ]
-    },
-    "VGB": {
-        "FUTURE": [
-            25.190884181424998,
-            24.77346801737857,
-            24.716416495035723,
-            25.047516959207144,
-            25.682708739960713,
-            26.304834637910716,
-            26.882245744721427,
-            27.384613037117855,
-            27.59309605256428,
-            27.418067932246426,
-            26.841372899032145,
-            25.96276855496429
-        ],
-        "LONG_NAME": "Virgin Islands, British",
-        "PAST": [
-            24.517043050246667,
-            24.066054280839996,
-            23.988258870320003,
-            24.351593017720003,
-            25.036279296513328,
-            25.692999267300003,
-            26.30021769105333,
-            26.801985677373334,
-            27.00263671933333,
-            26.8266662596,
-            26.242122396573333,
-            25.327502441893333
-        ]
-    },
-    "VIR": {
-        "FUTURE": [
-            25.190884181424998,
-            24.77346801737857,
-            24.716416495035723,
-            25.047516959207144,
-            25.682708739960713,
-            26.304834637910716,
-            26.882245744721427,
-            27.384613037117855,
-            27.59309605256428,
-            27.418067932246426,
-            26.841372899032145,
-            25.96276855496429
-        ],
-        "LONG_NAME": "Virgin Islands, U.S.",
-        "PAST": [
-            24.517043050246667,
-            24.066054280839996,
-            23.988258870320003,
-            24.351593017720003,
-            25.036279296513328,
-            25.692999267300003,
-            26.30021769105333,
-            26.801985677373334,
-            27.00263671933333,
-            26.8266662596,
-            26.242122396573333,
-            25.327502441893333
-        ]
-    },
-    "VNM": {
-        "FUTURE": [
-            18.857781183149672,
-            20.729853947957782,
-            23.91034712110208,
-            26.52138696397917,
-            27.377042634143606,
-            27.120188803900003,
-            26.683798426675445,
-            26.32732650211934,
-            25.432156381152673,
-            23.7594025929756,
-            21.615332194738006,
-            19.345596495130017
-        ],
-        "LONG_NAME": "Viet Nam",
-        "PAST": [
-            17.997454155815166,
-            19.87431411742983,
-            23.027191670733053,
-            25.780436791314166,
-            26.582459259030834,
-            26.38720186021361,
-            26.1976192050475,
-            25.947142283120552,
-            24.967363399931106,
-            23.325228966606108,
-            21.03418867323133,
-            18.463701036243084
-        ]
-    },
-    "VUT": {
-        "FUTURE": [
-            27.871914454535204,
-            28.22921021155102,
-            28.184034075049997,
-            27.705552548821938,
-            26.69204291507653,
-            25.577679380907142,
-            24.718352337071938,
-            24.4352658324255,
-            24.708426962190313,
-            25.308896590204593,
-            26.180657990310202,
-            27.15129182807092
-        ],
-        "LONG_NAME": "Vanuatu",
-        "PAST": [
-            27.280487351224757,
-            27.710318138580003,
-            27.66046607598476,
-            27.15174240838,
-            26.14701799679524,
-            24.997415597321904,
-            24.124206543100957,
-            23.733666411217147,
-            23.917628406721903,
-            24.553553118291426,
-            25.458103143907618,
-            26.457187034898098
-        ]
-    },
-    "WLF": {
-        "FUTURE": [
-            28.325440543153572,
-            28.506482260164287,
-            28.52594375635,
-            28.409731183241067,
-            27.93590000683393,
-            27.209948403466075,
-            26.627366746975003,
-            26.438093457896432,
-            26.609304700430354,
-            26.999046870587495,
-            27.513698033125,
-            27.98986925364286
-        ],
-        "LONG_NAME": "Wallis and Futuna",
-        "PAST": [
-            27.67719828335333,
-            27.898810831770003,
-            27.900791421989997,
-            27.764133707606668,
-            27.321382649440004,
-            26.566278076336662,
-            25.985183716276666,
-            25.773631795236664,
-            25.958690389196665,
-            26.348675536646667,
-            26.810855102109997,
-            27.317224120629998
-        ]
-    },
-    "WSM": {
-        "FUTURE": [
-            28.283181326442865,
-            28.484973362407146,
-            28.502166747914288,
-            28.407531738503568,
-            27.960367475714285,
-            27.260661534071428,
-            26.694351196600003,
-            26.506653921500007,
-            26.689864022310708,
-            27.095548356821432,
-            27.563115800778572,
-            27.976998465371423
-        ],
-        "LONG_NAME": "Samoa",
-        "PAST": [
-            27.64136555940667,
-            27.86551106784667,
-            27.88063151002,
-            27.752347820140002,
-            27.33255004942667,
-            26.58702799478,
-            26.027246093533332,
-            25.834865315326667,
-            26.03911132766,
-            26.43672078508,
-            26.886285401026665,
-            27.327189128300002
-        ]
-    },
-    "YEM": {
-        "FUTURE": [
-            19.91212993456055,
-            21.522082391135232,
-            24.3007871949789,
-            27.20624249948003,
-            29.814733778207145,
-            31.545883178591236,
-            31.02432275728636,
-            30.19001145831185,
-            29.505712137269644,
-            27.008652476637337,
-            24.007362960556495,
-            20.871931942497245
-        ],
-        "LONG_NAME": "Yemen",
-        "PAST": [
-            18.655887025793028,
-            20.14320188520788,
-            23.140024636535752,
-            26.116527857912725,
-            28.71527025611606,
-            30.653399195667273,
-            30.32483483579212,
-            29.607483650509394,
-            28.781354314753028,
-            26.226465491067884,
-            22.957481708137877,
-            19.574820501504245
-        ]
-    },
-    "ZAF": {
-        "FUTURE": [
-            23.008625887018173,
-            22.82590813816709,
-            21.7248840332345,
-            19.170672736942034,
-            15.62711574502967,
-            13.055675962881727,
-            12.503335936040271,
-            14.263437588252867,
-            17.2299251722556,
-            19.719745802887672,
-            21.24061791354402,
-            22.445601060564606
-        ],
-        "LONG_NAME": "South Africa",
-        "PAST": [
-            22.31493895719718,
-            22.26777613672046,
-            21.116753983855087,
-            18.393988286070517,
-            14.666854921058775,
-            11.939171034654029,
-            11.30301787658691,
-            12.974768356676368,
-            15.99261163210325,
-            18.59669280713883,
-            20.281600682092197,
-            21.550552223364996
-        ]
-    },
-    "ZMB": {
-        "FUTURE": [
-            22.658847082635123,
-            22.560481262295948,
-            22.447131565390002,
-            21.834060523862263,
-            20.20757083037024,
-            18.45599746718464,
-            18.41169077547881,
-            20.670237041988454,
-            24.226367841104288,
-            26.02988902495286,
-            24.66068707437369,
-            23.114810144734637
-        ],
-        "LONG_NAME": "Zambia",
-        "PAST": [
-            21.691549275876227,
-            21.738733045787775,
-            21.609969211441776,
-            20.87666293635778,
-            19.08518615739155,
-            17.327652858796668,
-            17.29002420974,
-            19.65826354978244,
-            23.371382989259118,
-            25.064922282201557,
-            23.69215881311978,
-            22.120715331586446
-        ]
-    },
-    "ZWE": {
-        "FUTURE": [
-            24.555918557728564,
-            24.152473586082372,
-            23.59045144493437,
-            22.23302112289486,
-            19.66959626295491,
-            17.490968295012497,
-            17.263989516859148,
-            19.623576163853794,
-            23.916663237797316,
-            26.753997666813166,
-            26.110335895319643,
-            24.903312819255582
-        ],
-        "LONG_NAME": "Zimbabwe",
-        "PAST": [
-            23.669484583465835,
-            23.481125258788335,
-            22.834349314878338,
-            21.333324305491665,
-            18.57626228409375,
-            16.31430282616625,
-            16.034658177995833,
-            18.56534538263958,
-            22.969179408434165,
-            25.774723053086248,
-            25.127779642745836,
-            23.833675002789583
-        ]
-    }
-}
\ No newline at end of file
+TEMPERATURE_DATA = TemperatureData()
@@ -7,13 +7,15 @@ Date  : 23 / 09 / 2013
 Description: 
 Downloads the latest exchange rates from http://openexchangerates.org/ and saves them to a file. If the file can be
 found the module will load the rates from the file if the file is less than one day old. Otherwise the file is updated
-with the newest rates. There are money objects which can be manipulated with addition, substraction, multiplication
+with the newest rates. The rates can also come from a file that is never updated (FileRatesProvider) or from memory
+(MemoryRatesProvider) so the exchange can be used offline. The rates are only loaded when the exchange is first used. There are money objects which can be manipulated with addition, substraction, multiplication
 and division - with the results always being in USD. Money values can be converted to other currencies. See the example
 below for more details
 
 Usage example: 
 >>> import PyExchangeRates
 >>> exchange = PyExchangeRates.Exchange('YOUR API KEY HERE')
+>>> offlineExchange = PyExchangeRates.Exchange(provider=PyExchangeRates.MemoryRatesProvider({'USD' : 1.0, 'NZD' : 1.2}))
 >>> a = exchange.withdraw(1000, 'USD')
 >>> b = exchange.withdraw(1000, 'EUR')
 >>> print a + b
@@ -44,6 +46,7 @@ import platform
 MAC_OSX = True if platform.system() == 'Darwin' else False
 
 import os
+import threading                  # Protects the lazy loading of the rates
 import urllib2                    # For downloading the currency data
 import json                       # Allows the data to be decoded
 from datetime import datetime     # For timestamping
@@ -83,6 +86,53 @@ def internet_on():
     return connectionAvaliable
 
 
+def readRatesFile(filename):
+    ''' Reads a file of exchange rates and returns a tuple of ({currency key : Currency}, time the rates were saved). 
+    The file is either one written by writeRatesFile, or a dictionary of {currency key : rate against USD} in which 
+    case the time is when the file was last modified. Raises an IOError if the file can't be read '''
+    debug("Loading data from Exchange file")
+
+    with open(filename, 'r') as f:
+        decodedFile = json.load(f)
+
+    currencies = {}
+    lastUpdated = datetime.fromtimestamp(os.path.getmtime(filename))
+
+    # Convert the dictionary items to currency objects
+    for key, value in decodedFile.items():
+        key = str(key)
+
+        # Check if the item isn't the timestamp
+        if key == 'timestamp':
+            lastUpdated = datetime.fromtimestamp(value)
+
+        # Plain rates against USD
+        elif isinstance(value, (int, long, float)):
+            currencies[key] = Currency(key, UNITED_STATES_DOLLARS_KEY, float(value), key)
+
+        # Get the parameters for the currency from the file
+        else:
+            currencies[key] = Currency(key, str(value['baseKey']), float(value['rate']), str(value['name']))
+
+    return currencies, lastUpdated
+
+
+def writeRatesFile(filename, currencies):
+    ''' Saves a dictionary of {currency key : Currency} to a file, along with the current time '''
+    debug("Saving data to Exchange file")
+
+    # Get the currency data, convert to a JSON string 
+    jsonExchange = json.dumps(currencies, cls=SimpleObjectEncoder)
+    
+    # Remove the last bracket from the json and add on the timestamp
+    timestamp = json.dumps({'timestamp': time.time()})
+    jsonExchange = jsonExchange[:-1] + ',' + timestamp[1:]
+    
+    # Write exchange data to a file
+    with open(filename, 'w+') as f:
+        f.write(jsonExchange)
+
+
 def debug(message):
     ''' Prints debugging messages if debug mode is set to true'''
     if DEBUG_MODE:
@@ -156,23 +206,22 @@ class Money(object):
         currencyKey = currencyKey.upper()        
 
         # Check if the given currencies are valid
-        if currencyKey not in self.exchange.currencies.keys():
+        if not self.exchange.hasCurrency(currencyKey):
             raise InvalidCurrencyKey("%s was not found in the exchange" % currencyKey)
-        elif self.getCurrencyKey() not in self.exchange.currencies.keys():
+        elif not self.exchange.hasCurrency(self.getCurrencyKey()):
             raise InvalidCurrencyKey("%s was not found in the exchange" % self.getCurrencyKey())
         
         # If they are, convert the amount and return the new Money object
         else:
-            # Get the two currency objects
-            oldCurrency = self.exchange.currencies[self.getCurrencyKey()]
-            newCurrency = self.exchange.currencies[currencyKey]
-
-            # Convert the old amount to the new amount
-            oldAmount = self.getAmount()
-            newAmount = oldAmount * (newCurrency.rate / oldCurrency.rate)
+            # Convert the old amount to the new amount using the exchange's rate table
+            newAmount = self.exchange.convertAmount(self.getAmount(), self.getCurrencyKey(), currencyKey)
 
             # Create the new Money object with the appropriate currency and amount
             return Money(newAmount, currencyKey, self.exchange)
+
+    def getAmountInUSD(self):
+        ''' Returns the amount converted to United States Dollars, without creating a new Money object '''
+        return self.exchange.convertAmount(self.amount, self.currencyKey, UNITED_STATES_DOLLARS_KEY)
             
     def __str__(self):
         ''' Allows the object to be printed using "print" '''
@@ -181,8 +230,8 @@ class Money(object):
     def __add__(self, other):
         ''' Adds two currencies together. The resulting currency is United States Dollars'''
         if isinstance(other, Money):
-            firstAmount = self.convert(UNITED_STATES_DOLLARS_KEY).getAmount()
-            secondAmount = other.convert(UNITED_STATES_DOLLARS_KEY).getAmount()
+            firstAmount = self.getAmountInUSD()
+            secondAmount = other.getAmountInUSD()
             finalAmount = firstAmount + secondAmount
             return Money(finalAmount, UNITED_STATES_DOLLARS_KEY, self.exchange)
 
@@ -193,8 +242,8 @@ class Money(object):
     def __sub__(self, other):
         ''' Subtracts two currencies together. The resulting currency is United States Dollars'''
         if isinstance(other, Money):
-            firstAmount = self.convert(UNITED_STATES_DOLLARS_KEY).getAmount()
-            secondAmount = other.convert(UNITED_STATES_DOLLARS_KEY).getAmount()
+            firstAmount = self.getAmountInUSD()
+            secondAmount = other.getAmountInUSD()
             finalAmount = firstAmount - secondAmount
             return Money(finalAmount, UNITED_STATES_DOLLARS_KEY, self.exchange)
 
@@ -205,8 +254,8 @@ class Money(object):
     def __mul__(self, other):
         ''' Multiplies currencies together. The resulting currency is United States Dollars by default'''
         if isinstance(other,Money):
-            firstAmount = self.convert(UNITED_STATES_DOLLARS_KEY).getAmount()
-            secondAmount = other.convert(UNITED_STATES_DOLLARS_KEY).getAmount()
+            firstAmount = self.getAmountInUSD()
+            secondAmount = other.getAmountInUSD()
             finalAmount = firstAmount * secondAmount
             return Money(finalAmount, UNITED_STATES_DOLLARS_KEY, self.exchange)
 
@@ -226,8 +275,8 @@ class Money(object):
     def __div__(self, other):
         ''' Divides two currencies together. The resulting currency is United States Dollars by default'''
         if isinstance(other,Money):
-            firstAmount = self.convert(UNITED_STATES_DOLLARS_KEY).getAmount()
-            secondAmount = other.convert(UNITED_STATES_DOLLARS_KEY).getAmount()
+            firstAmount = self.getAmountInUSD()
+            secondAmount = other.getAmountInUSD()
             finalAmount = firstAmount / secondAmount
             return Money(finalAmount, UNITED_STATES_DOLLARS_KEY, self.exchange)
 
@@ -241,17 +290,18 @@ class Money(object):
         else:
             raise TypeError("unsupported operand type(s) for /: '%s' and '%s'" % (type(self), type(other)))
 
-    
 
 
+# --------------------------------------------------------------------------------------------------------------------
+# RATES PROVIDERS
+# --------------------------------------------------------------------------------------------------------------------
 
-class Exchange(object):
-    ''' Object to store currencies and update them with the OpenExchangeRates API'''
+class OpenExchangeRatesProvider(object):
+    ''' Provides the latest rates from the OpenExchangeRates API. The rates are saved to a file, and are loaded from
+    the file rather than downloaded again if the file is less than UPDATE_THRESHOLD_DAYS old '''
 
     def __init__(self, appID):
         self.appID = appID                # The OpenExchangeRates API key to use
-        self.currencies = {}              # Stores the currencies
-        self.lastUpdated = None
 
         if not MAC_OSX:
             self.filename = appID + '.json'   # Filename where the exchange rates are stored
@@ -259,98 +309,54 @@ class Exchange(object):
             # Store the saved rates in the users home dir
             home = os.path.expanduser("~")
             self.filename = os.path.join(home, '.SolarFarmExchangeRates-' + appID + '.json')
-            
-        
+
+    def load(self):
+        ''' Returns a dictionary of {currency key : Currency}, from the file if it's recent enough or otherwise from
+        the API '''
+
         # Load currencies from a JSON file that is storing the latest versions of the currencies if it exists
-        fileFound = self.__loadFromFile()
+        try:
+            currencies, lastUpdated = readRatesFile(self.filename)
+        except IOError:
+            currencies = None
 
-        if fileFound:
+        if currencies is not None:
             debug("Currency file found")
 
             # Check timestamp is above threshold
             now = datetime.fromtimestamp(time.time())
-            difference = now - self.lastUpdated
+            difference = now - lastUpdated
 
-            # If the last time the file was updated was greater than the threshold, update the exhange rates
-            if difference.days > UPDATE_THRESHOLD_DAYS:
+            # If the last time the file was updated was greater than the threshold, update the exhange rates. Stick
+            # with the old rates if there's no internet to update them with
+            if difference.days > UPDATE_THRESHOLD_DAYS and internet_on():
                 debug("Timestamp shows file is %d days old, which is older than %d day, updating the Exchange data..." % (difference.days, UPDATE_THRESHOLD_DAYS))
-                self.__loadFromOpenExhangeRatesAPI()
-                self.__saveToFile()
+                return self.update() or currencies
             else:
-                debug("Timestamp shows file is %d days old, which is less than %d day, loading Exchange data from file..." % (difference.days, UPDATE_THRESHOLD_DAYS))
-
+                debug("Timestamp shows file is %d days old, loading Exchange data from file..." % difference.days)
+                return currencies
 
         else: # No currency file found
             # If the internet is connected, download the exhange rates and save them to a file
             if internet_on():
                 debug("Internet connection found!")
-                self.__loadFromOpenExhangeRatesAPI()
-                self.__saveToFile()
+                return self.update()
             else: # No currency file and no internet, thrown an exception 
                 raise AccessDataFailure("No currency file or internet connection avaliable - cannot retreive currency data")
-        
-
-    def __saveToFile(self):
-        ''' Saves the current exchange to file '''
-        debug("Saving data to Exchange file")
-
-        # Get the currency data, convert to a JSON string 
-        jsonExchange = json.dumps(self.currencies, cls=SimpleObjectEncoder)
-        
-        # Remove the last bracket from the json and add on the timestamp
-        timestamp = json.dumps({'timestamp': time.time()})
-        jsonExchange = jsonExchange[:-1] + ',' + timestamp[1:]
-        
-        # Write exchange data to a file
-        with open(self.filename, 'w+') as f:
-            f.write(jsonExchange)
-            f.close()
-
-    def __loadFromFile(self):
-        ''' Loads the latest currency data from the input file '''
-        debug("Loading data from Exchange file")
 
-        # Keep track of wether the file exists or not
-        fileFound = True
-        
-        try:
-            # If the file exists open it
-            with open(self.filename, 'r') as f:
-                # Read the lines of the files and concatenate them into a single string
-                lines = f.readlines()
-                jsonExchange = ''.join(lines)
-
-                # Decode the JSON into a dictionary
-                decodedFile = json.loads(jsonExchange)
-                
-                # Convert the dictionary items to currency objects
-                for key in decodedFile.keys():
-
-                    # Check if the item isn't the timestamp
-                    if key != 'timestamp':
-                    
-                        # Get the parameters for the currency from the file
-                        rate = float(decodedFile[key]['rate'])
-                        name = str(decodedFile[key]['name'])
-                        baseKey = str(decodedFile[key]['baseKey'])
-                
-                        # Add the currency to the Exchange            
-                        self.currencies[key] = Currency(key, baseKey, rate, name)
-                    
-                    else: # It's the timestamp of the file
-                        self.lastUpdated = datetime.fromtimestamp(decodedFile[key])
-
-        except IOError:
-            # Otherwise mark that the file wasn't found
-            fileFound = False
-
-        return fileFound
+    def update(self):
+        ''' Downloads the latest rates, saves them to the file and returns them '''
+        currencies = self.__loadFromOpenExhangeRatesAPI()
+        if currencies:
+            writeRatesFile(self.filename, currencies)
+        return currencies
 
     def __loadFromOpenExhangeRatesAPI(self):
         debug("Loading data from Open Exchange Rates API")
 
         # Access variables from API
         API_KEY = '?app_id=' + self.appID
+        currencies = {}
 
         # Get the latest currency rates from the API
         try:
@@ -374,20 +380,139 @@ class Exchange(object):
                 rate = float(latestValuesDecoded['rates'][key])
                 name = str(currencyNamesDecoded[key])
                 
-                # Create a currency object for each currency, then store it in the exchange
-                currency = Currency(key, baseKey, rate, name)
-                self.currencies[key] = currency
-
-            # Add the current timestamp to the currency dictionary so we know when it was updated
-            self.lastUpdated = time.time()
+                # Create a currency object for each currency
+                currencies[str(key)] = Currency(str(key), str(baseKey), rate, name)
 
         # Handle bad app ID keys
         except urllib2.HTTPError as e:
             if e.code == 401:
                 raise BadAppID("%s is an invalid app ID for openexchangerates.org" % self.appID)
 
+        return currencies
+
+
+class FileRatesProvider(object):
+    ''' Provides the rates saved in a file, no matter how old they are, and never goes online. The file is either one 
+    saved by the OpenExchangeRatesProvider or a JSON dictionary of {currency key : rate against USD} '''
+
+    def __init__(self, filename):
+        self.filename = filename
+
+    def load(self):
+        ''' Returns a dictionary of {currency key : Currency} read from the file '''
+        try:
+            currencies, lastUpdated = readRatesFile(self.filename)
+        except IOError:
+            raise AccessDataFailure("Unable to read the currency file %s" % self.filename)
+        return currencies
+
+    def update(self):
+        ''' Reads the file again, in case it has been changed '''
+        return self.load()
+
+
+class MemoryRatesProvider(object):
+    ''' Provides a fixed set of rates held in memory, given as a dictionary of {currency key : rate against the base 
+    currency}. Used for tests and benchmarks, and anything else that has to run offline '''
+
+    def __init__(self, rates, baseKey=UNITED_STATES_DOLLARS_KEY):
+        self.rates = dict(rates)
+        self.baseKey = baseKey
+
+    def load(self):
+        ''' Returns a dictionary of {currency key : Currency} for the rates '''
+        return dict((key, Currency(key, self.baseKey, float(rate), key)) for key, rate in self.rates.items())
+
+    def update(self):
+        ''' The rates never change '''
+        return self.load()
+
+# --------------------------------------------------------------------------------------------------------------------
+# EXCHANGE
+# --------------------------------------------------------------------------------------------------------------------
+
+class Exchange(object):
+    ''' Object to store currencies and convert amounts between them.
+
+    The rates come from a provider, by default the OpenExchangeRatesProvider for the given API key. Nothing is loaded
+    until the exchange is first used, so creating an exchange never waits on a file or the network. '''
+
+    def __init__(self, appID=None, provider=None):
+        if provider is None:
+            provider = OpenExchangeRatesProvider(appID)
+
+        self.appID = appID                # The OpenExchangeRates API key to use
+        self.provider = provider          # Where the rates are loaded from
+        self.currencies = {}              # Stores the currencies
+        self.currencyIndex = {}           # Maps each currency key to its row/column in the rate table
+        self.rateTable = []               # rateTable[i][j] converts an amount of currency i into currency j
+        self.updateListeners = []         # Functions that are called when the rates are updated
+        self.loaded = False               # True once the rates have been loaded from the provider
+        self.lock = threading.Lock()      # Stops two threads loading the rates at once
+
+    def __getstate__(self):
+        ''' Locks can't be pickled, so leave it out when the exchange is sent to another process '''
+        state = dict(self.__dict__)
+        del state['lock']
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self.lock = threading.Lock()
+
+    def load(self):
+        ''' Loads the rates from the provider if they haven't been loaded yet. This is called the first time the 
+        exchange is used, so there's no need to call it directly '''
+        if not self.loaded:
+            with self.lock:
+                if not self.loaded:
+                    self.__setCurrencies(self.provider.load())
+
+    def update(self):
+        ''' Gets the latest exchange rates from the provider and lets the update listeners know the rates have 
+        changed '''
+        with self.lock:
+            self.__setCurrencies(self.provider.update())
+
+        self.__notifyUpdateListeners()
+
+    def setProvider(self, provider):
+        ''' Changes where the rates come from. If the rates were already loaded they're loaded again from the new 
+        provider straight away, otherwise they're loaded when the exchange is first used '''
+        with self.lock:
+            self.provider = provider
+            reload = self.loaded
+            if reload:
+                self.__setCurrencies(provider.load())
+
+        if reload:
+            self.__notifyUpdateListeners()
+
+    def addUpdateListener(self, listener):
+        ''' Adds a function that is called with no arguments whenever the exchange rates are updated, such as a cache 
+        of results that depend on the rates '''
+        if listener not in self.updateListeners:
+            self.updateListeners.append(listener)
+
+    def __notifyUpdateListeners(self):
+        ''' Calls each of the update listeners '''
+        for listener in self.updateListeners:
+            listener()
+
+    def __setCurrencies(self, currencies):
+        ''' Stores the currencies, interns the currency keys and precomputes the conversion rate between every pair of
+        currencies '''
+        keys = sorted(currencies.keys())
+        rates = [currencies[key].rate for key in keys]
+
+        self.currencies = currencies
+        self.currencyIndex = dict((key, i) for i, key in enumerate(keys))
+        self.rateTable = [[newRate / oldRate for newRate in rates] for oldRate in rates]
+        self.loaded = True
+
     def withdraw(self, amount, currencyKey):
         ''' Creates a money object that points to this exchange with the given amount of the given currency '''
+        self.load()
         
         # Check the amount is a numeric value
         if not (isinstance(amount, int) or isinstance(amount,float) or isinstance(amount,long)):
@@ -401,12 +526,34 @@ class Exchange(object):
         currencyKey = currencyKey.upper()
 
         # Check if the given currency are valid
-        if currencyKey not in self.currencies.keys():
+        if currencyKey not in self.currencyIndex:
             raise InvalidCurrencyKey("%s was not found in the exchange" % currencyKey)
         
         # If it is return the Money requested
         else:
             return Money(amount, currencyKey, self)
+
+    def hasCurrency(self, currencyKey):
+        ''' Returns True if the given (uppercase) currency key is in the exchange '''
+        self.load()
+        return currencyKey in self.currencyIndex
+
+    def getRate(self, fromKey, toKey):
+        ''' Returns the rate that an amount of one currency is multiplied by to convert it to another currency '''
+        self.load()
+        try:
+            return self.rateTable[self.currencyIndex[fromKey]][self.currencyIndex[toKey]]
+        except KeyError as e:
+            raise InvalidCurrencyKey("%s was not found in the exchange" % e.args[0])
+
+    def convertAmount(self, amount, fromKey, toKey):
+        ''' Converts a plain amount between two currencies. This is the fast path used by Money, the keys are
+        expected to be valid uppercase keys and are only checked if the lookup fails. Money can only be withdrawn
+        once the rates are loaded so they aren't checked here either '''
+        try:
+            return amount * self.rateTable[self.currencyIndex[fromKey]][self.currencyIndex[toKey]]
+        except KeyError as e:
+            raise InvalidCurrencyKey("%s was not found in the exchange" % e.args[0])
         
         
 
@@ -1,19 +1,81 @@
 '''@package ReverseGeocode.py
 
-Thin wrapper around the Google Maps reverse geocoding API to allow searches for locations via
-latitude and longitude. The search returns many possible locations by we are only interested in
-the country so this is all that is kept.
+Finds the country at a latitude and longitude. When the country boundaries file (CountryBoundaries.npz) is 
+installed the country is looked up offline in a spatial index of the boundary polygons, which takes tens of 
+microseconds and doesn't need the internet. Otherwise this is a thin wrapper around the Google Maps reverse geocoding 
+API. The search returns many possible locations by we are only interested in the country so this is all that is kept.
+
+The boundaries file can be built from any GeoJSON file of country boundaries that has the ISO ALPHA-2 code of each
+country, such as the Natural Earth admin 0 countries (http://www.naturalearthdata.com/) using build_boundaries_file.
+The rings of the polygons are clipped to a grid of GRID_CELL_DEGREES when it's built, so the index doesn't have to be
+worked out each time it's loaded. It's a compressed NumPy file of these arrays, with the points in 
+10^-BOUNDARY_PRECISION degrees:
+ - codes: the ALPHA-2 code of each country
+ - scale, cellSize: the number of points in a degree and in the side of a cell
+ - cellKeys: the (column, row) of each cell that has some land in it
+ - cellCountries: the country a cell is inside, or -1 if it has edges of more than one country or the sea in it
+ - cellEdgeStarts: where the edges of each cell start, the edges of cell i are cellEdgeStarts[i]:cellEdgeStarts[i + 1]
+ - edges: the [x1, y1, x2, y2] edges of the clipped rings of each cell, outsides of polygons and holes alike
+ - edgeCountries, edgeCoasts: the country of each edge, and whether it's a real edge rather than a side of the cell
+The coasts of the boundaries are simplified, so a point in the sea within COAST_TOLERANCE_DEGREES of a country is 
+taken to be in that country.
+
+The boundaries file that ships with the program was built from the Natural Earth 1:10m admin 0 countries (version
+5.1.1). Running this module checks that the boundaries are installed and that KNOWN_POINTS are found offline:
+$ python ReverseGeocode.py
+
+Usage example:
+>>> import ReverseGeocode
+>>> ReverseGeocode.build_boundaries_file('ne_10m_admin_0_countries.geojson', 'CountryBoundaries.npz')
+>>> ReverseGeocode.get_country_code(-21.0928, -175.1050)
+'TON'
+
+Many sites can be looked up at once with get_country_codes, which returns the codes and any errors for each site:
+>>> codes, errors = ReverseGeocode.get_country_codes([-21.0928, -41.2865], [-175.1050, 174.7762])
+
+Country codes that have been found are cached in GEOCODE_CACHE, which is saved in the user's home folder. Set it to
+None to turn the cache off, or to a GeocodeCache with a different file, grid precision, time to live or size.
 
 Author: Ashok Fernandez
 Date: 16/09/2013
 '''
 
+import os
+import math
+import tempfile                   # Names the file the geocode cache is written to before it replaces the old one
+import time
+import collections
+import numpy                      # Holds the clipped boundaries and tests the points against them
+import threading                  # Protects the lazy loading of the boundaries and the cache
+import multiprocessing.pool       # Looks up batches of points concurrently
 import Countries				  # Contains all the countrie codes and names
 import urllib2                    # For downloading the currency data
 import json                       # Allows the data to be decoded
 
 BASE_URL = "http://maps.googleapis.com/maps/api/geocode/json?latlng=%f,%f&sensor=false"
 
+BOUNDARIES_FILE = 'CountryBoundaries.npz'			# Country boundary polygons used for offline lookups
+GRID_CELL_DEGREES = 1.0								# Size of the cells of the spatial index of the boundaries
+BOUNDARY_PRECISION = 4								# Decimal places the boundaries are rounded to when they're built
+CODE_PROPERTIES = ['ISO_A2', 'ISO_A2_EH', 'WB_A2']	# GeoJSON properties that the ALPHA-2 code is looked for in
+COAST_TOLERANCE_DEGREES = 0.1						# Points in the sea this close to a country are taken to be in it
+
+# Points that the boundaries file is checked against, as (description, latitude, longitude, ALPHA-3 code)
+KNOWN_POINTS = [('Nuku\'alofa, Tonga', -21.0928, -175.1050, 'TON'),
+				('Vava\'u, Tonga', -18.6500, -173.9800, 'TON'),
+				('Wellington, New Zealand', -41.2865, 174.7762, 'NZL'),
+				('Christchurch, New Zealand', -43.5321, 172.6362, 'NZL'),
+				('Maseru, Lesotho (a hole in South Africa)', -29.3151, 27.4869, 'LSO'),
+				('Johannesburg, South Africa', -26.2041, 28.0473, 'ZAF'),
+				('Suva, Fiji', -18.1248, 178.4501, 'FJI'),
+				('Middle of the Atlantic', 0.0, -30.0, False)]
+
+GEOCODE_CACHE_FILE = os.path.join(os.path.expanduser("~"), '.SolarFarmGeocodeCache.json')	# Where lookups are saved
+GEOCODE_CACHE_PRECISION = 0.01						# Points within the same grid cell of this many degrees share a lookup
+GEOCODE_CACHE_TTL_DAYS = 90							# Lookups older than this are done again
+GEOCODE_CACHE_MAX_ENTRIES = 10000					# The least recently used lookups are dropped beyond this
+GEOCODE_BATCH_WORKERS = 8							# Most points of a batch that are looked up online at once
+
 
 # --------------------------------------------------------------------------------------------------------------------
 # EXCEPTIONS
@@ -35,6 +97,194 @@ def debug(message):
     if DEBUG_MODE:
         print message
 
+def find_boundaries_file():
+	''' Returns the path to the country boundaries file, looking next to this module first then in the current 
+	working directory (the Resources folder when running as an OSX bundle). Returns None if it isn't installed '''
+	moduleDir = os.path.dirname(os.path.abspath(__file__))
+	for directory in [moduleDir, os.getcwd()]:
+		filename = os.path.join(directory, BOUNDARIES_FILE)
+		if os.path.isfile(filename):
+			return filename
+
+	return None
+
+def build_boundaries_file(geojsonFilename, filename):
+	''' Converts a GeoJSON file of country boundaries to a boundaries file. Countries without an ALPHA-2 code that the
+	rest of the program supports are left out. The rings of the polygons are clipped to the cells of a grid of 
+	GRID_CELL_DEGREES and the points are rounded to BOUNDARY_PRECISION decimal places, then the cells are saved as 
+	the NumPy arrays described at the top of this module '''
+	with open(geojsonFilename, 'r') as f:
+		features = json.load(f)['features']
+
+	scale = 10 ** BOUNDARY_PRECISION
+	cellSize = int(round(GRID_CELL_DEGREES * scale))
+
+	# Clip every ring to the cells, as a dictionary of {(column, row) : list of (country number, is a hole, points)}
+	codes = []
+	cells = {}
+	for feature in features:
+
+		# Find the country code in the properties
+		code = None
+		for codeProperty in CODE_PROPERTIES:
+			code = feature['properties'].get(codeProperty)
+			if code in Countries.SHORT_CODE_TO_LONG_CODE:
+				break
+
+		if code not in Countries.SHORT_CODE_TO_LONG_CODE or feature['geometry'] is None:
+			continue
+
+		if str(code) not in codes:
+			codes.append(str(code))
+		country = codes.index(str(code))
+
+		# Polygons are stored as MultiPolygons with a single polygon
+		geometry = feature['geometry']
+		polygons = geometry['coordinates'] if geometry['type'] == 'MultiPolygon' else [geometry['coordinates']]
+
+		for polygon in polygons:
+			for ringNumber, ring in enumerate(polygon):
+				points = numpy.array(ring, dtype=float)[:, :2] * scale
+				for cell, cellPoints in clip_ring_to_cells(points, cellSize):
+					cellPoints = numpy.round(cellPoints).astype(numpy.int64)
+
+					# Drop the points that are the same after rounding, and rings that are left without an area
+					cellPoints = cellPoints[numpy.any(cellPoints != numpy.roll(cellPoints, 1, axis=0), axis=1)]
+					if len(cellPoints) >= 3 and ring_area(cellPoints) != 0:
+						cells.setdefault(cell, []).append((country, ringNumber > 0, cellPoints))
+
+	cellKeys = sorted(cells)
+	cellCountries = numpy.empty(len(cellKeys), dtype=numpy.int16)
+	cellEdgeStarts = numpy.zeros(len(cellKeys) + 1, dtype=numpy.int32)
+	edges = []
+	edgeCountries = []
+	edgeCoasts = []
+	for number, (column, row) in enumerate(cellKeys):
+		rings = cells[(column, row)]
+
+		# A cell covered by the outside of a single country doesn't need its edges
+		countries = set(country for country, hole, points in rings)
+		area = sum(abs(ring_area(points)) for country, hole, points in rings)
+		if len(countries) == 1 and not any(hole for country, hole, points in rings) and area == cellSize ** 2:
+			cellCountries[number] = rings[0][0]
+			cellEdgeStarts[number + 1] = cellEdgeStarts[number]
+			continue
+
+		cellCountries[number] = -1
+		for country, hole, points in rings:
+			cellEdges = numpy.hstack((points, numpy.roll(points, -1, axis=0)))
+			x1, y1, x2, y2 = cellEdges.T
+
+			# Edges along the sides of the cell were made by the clipping, they aren't the coast of the country
+			west, south = column * cellSize, row * cellSize
+			onSide = (((x1 == x2) & ((x1 == west) | (x1 == west + cellSize))) | 
+					  ((y1 == y2) & ((y1 == south) | (y1 == south + cellSize))))
+
+			edges.append(cellEdges)
+			edgeCountries.append(numpy.repeat(country, len(cellEdges)))
+			edgeCoasts.append(~onSide)
+
+		cellEdgeStarts[number + 1] = cellEdgeStarts[number] + sum(len(points) for country, hole, points in rings)
+
+	with open(filename, 'wb') as f:
+		numpy.savez_compressed(f, codes=numpy.array(codes), scale=scale, cellSize=cellSize,
+							   cellKeys=numpy.array(cellKeys, dtype=numpy.int32).reshape(-1, 2), 
+							   cellCountries=cellCountries, cellEdgeStarts=cellEdgeStarts, 
+							   edges=numpy.concatenate(edges).astype(numpy.int32),
+							   edgeCountries=numpy.concatenate(edgeCountries).astype(numpy.int16),
+							   edgeCoasts=numpy.concatenate(edgeCoasts))
+
+def clip_ring(points, axis, value, keepAbove):
+	''' Clips a ring of [x, y] points to the side of the line where the x (axis 0) or y (axis 1) coordinate is value, 
+	keeping the part above the line if keepAbove is True or below it otherwise. This is one step of the 
+	Sutherland-Hodgman algorithm. Returns None if none of the ring is on that side '''
+	coordinates = points[:, axis]
+	inside = coordinates >= value if keepAbove else coordinates <= value
+	if inside.all():
+		return points
+	if not inside.any():
+		return None
+
+	# Find where the edges from each point to the next cross the line
+	nextPoints = numpy.roll(points, -1, axis=0)
+	crossing = inside != numpy.roll(inside, -1)
+	crossings = numpy.zeros_like(points)
+	t = (value - coordinates[crossing]) / (nextPoints[crossing, axis] - coordinates[crossing])
+	crossings[crossing] = points[crossing] + t[:, numpy.newaxis] * (nextPoints[crossing] - points[crossing])
+	crossings[crossing, axis] = value
+
+	# Each point is kept if it's inside, followed by where its edge crosses the line
+	return numpy.stack((points, crossings), axis=1)[numpy.column_stack((inside, crossing))]
+
+def clip_ring_to_cells(points, cellSize, bounds=None):
+	''' Clips a ring of [x, y] points to the cells of a grid of cellSize, returning a list of ((column, row), points) 
+	of the cells the ring covers. The ring is split in half until each part is in a single cell, the bounds of the 
+	part being split are (west, south, east, north) in cells '''
+	if bounds is None:
+		west, south = numpy.floor(points.min(axis=0) / cellSize).astype(int)
+		east, north = numpy.floor(points.max(axis=0) / cellSize).astype(int) + 1
+		bounds = (west, south, east, north)
+
+	west, south, east, north = bounds
+	if east - west == 1 and north - south == 1:
+		return [((west, south), points)]
+
+	# Split along the longer side
+	if east - west >= north - south:
+		middle = (west + east) // 2
+		halves = [(0, False, (west, south, middle, north)), (0, True, (middle, south, east, north))]
+	else:
+		middle = (south + north) // 2
+		halves = [(1, False, (west, south, east, middle)), (1, True, (west, middle, east, north))]
+
+	cells = []
+	for axis, keepAbove, halfBounds in halves:
+		half = clip_ring(points, axis, middle * cellSize, keepAbove)
+		if half is not None and len(half) >= 3:
+			cells.extend(clip_ring_to_cells(half, cellSize, halfBounds))
+
+	return cells
+
+def ring_area(points):
+	''' Returns the signed area of a ring of [x, y] points, positive if they go anticlockwise '''
+	x, y = points[:, 0], points[:, 1]
+	return (numpy.dot(x, numpy.roll(y, -1)) - numpy.dot(numpy.roll(x, -1), y)) / 2.0
+
+def crosses_edges(x, y, edges):
+	''' Returns an array of whether a ray going right from the point crosses each of the [x1, y1, x2, y2] edges. The 
+	point is inside a set of rings if it crosses an odd number of their edges (the even-odd rule) '''
+	x1, y1, x2, y2 = edges.T
+	crosses = (y1 > y) != (y2 > y)
+	numbers = crosses.nonzero()[0]
+	crosses[numbers] = x < (x2[numbers] - x1[numbers]) * (y - y1[numbers]) / (y2[numbers] - y1[numbers]) + x1[numbers]
+	return crosses
+
+def distance_to_edges(x, y, edges):
+	''' Returns an array of the distance from the point to the nearest point on each of the [x1, y1, x2, y2] edges '''
+	x1, y1, x2, y2 = edges.T
+	dx, dy = x2 - x1, y2 - y1
+
+	# Find the closest point on each edge, clamped to its ends
+	length = (dx * dx + dy * dy).astype(float)
+	t = numpy.clip(((x - x1) * dx + (y - y1) * dy) / numpy.where(length == 0, 1.0, length), 0.0, 1.0)
+	return numpy.hypot(x - (x1 + t * dx), y - (y1 + t * dy))
+
+def check_boundaries(points=KNOWN_POINTS):
+	''' Looks up the (description, latitude, longitude, ALPHA-3 code) points in the offline country index, without 
+	the cache or the internet. Returns a list of (description, code expected, code found) of the points that weren't 
+	found in the right country. Raises IOError if the boundaries file isn't installed '''
+	if not COUNTRY_INDEX.is_available():
+		raise IOError("Unable to find the country boundaries file %s" % BOUNDARIES_FILE)
+
+	failures = []
+	for description, lat, lng, expected in points:
+		shortCountryCode = COUNTRY_INDEX.get_short_country_code(lat, lng)
+		code = Countries.SHORT_CODE_TO_LONG_CODE.get(shortCountryCode, False)
+		if code != expected:
+			failures.append((description, expected, code))
+
+	return failures
+
 def find_short_country_code(result):
 	''' Takes a result from the Google reverse GeoCoding API and finds a short country code'''
 	
@@ -53,10 +303,9 @@ def find_short_country_code(result):
 	return shortCountryCode
 
 
-def get_country_code(lat, lng):
-	''' Takes a Latitude and Longtitude value and uses Google Maps to reverse Geocode it 
-	into a three letter ISO ALPHA-3 country code if possible. Returns false if the Geocoding
-	failed or if the country found wasn't supported. '''
+def get_google_short_country_code(lat, lng):
+	''' Takes a Latitude and Longtitude value and uses Google Maps to reverse Geocode it into a two letter ISO ALPHA-2
+	country code. Returns false if the Geocoding failed '''
 
 	# Generate the URL for a reverse GeoCode search to Google Maps
 	GMAPS_URL = BASE_URL % (lat, lng)
@@ -82,17 +331,375 @@ def get_country_code(lat, lng):
 			# If one was found, stop looking
 			if shortCountryCode != False:
 				break
-		
-		# Convert to the standard three letter ALPHA-3 country code used by the rest of the program
-		longCountryCode = Countries.SHORT_CODE_TO_LONG_CODE[shortCountryCode]
 
-		return longCountryCode
+		return shortCountryCode
 	
 	else:
 		debug("Google lookup failed for lat,lng: %f,%f" % (lat,lng))
 		return False
 
 
+def get_country_code(lat, lng):
+	''' Takes a Latitude and Longtitude value and reverse Geocodes it into a three letter ISO ALPHA-3 country code if
+	possible. Returns false if the Geocoding failed or if the country found wasn't supported. The codes that are found
+	are kept in GEOCODE_CACHE, so looking up the same site again doesn't need the boundaries or the internet '''
+	if GEOCODE_CACHE is None:
+		return lookup_country_code(lat, lng)
+
+	code = GEOCODE_CACHE.get_country_code(lat, lng, lookup_country_code)
+	GEOCODE_CACHE.flush()
+	return code
+
+
+def get_country_codes(lats, lngs, maxWorkers=GEOCODE_BATCH_WORKERS):
+	''' Reverse Geocodes lists (or arrays) of Latitudes and Longtitudes into three letter ISO ALPHA-3 country codes. 
+	
+	Each distinct point is only looked up once. The lookups are done one after the other in the offline country 
+	index if the boundaries are installed, otherwise up to maxWorkers points are looked up online at once. A point 
+	that fails doesn't stop the others. Returns a tuple of (codes, errors) which line up with the points - each code 
+	is False if the country wasn't found or the lookup failed, and each error is None or the exception the lookup of
+	that point raised, such as the ValueError of a coordinate that isn't a number. The cache is saved once, after all
+	the points have been looked up. Raises ValueError if there aren't the same number of latitudes and longtitudes '''
+	lats = list(lats)
+	lngs = list(lngs)
+	if len(lats) != len(lngs):
+		raise ValueError("There are %d latitudes but %d longtitudes" % (len(lats), len(lngs)))
+
+	# Convert each point on its own, so a bad coordinate only fails its own point
+	points = []
+	for lat, lng in zip(lats, lngs):
+		try:
+			points.append((float(lat), float(lng)))
+		except (TypeError, ValueError) as e:
+			points.append(e)
+
+	uniquePoints = sorted(set(point for point in points if isinstance(point, tuple)))
+	cache = GEOCODE_CACHE
+
+	def lookup(point):
+		''' Looks up a single point, returning (code, error) '''
+		try:
+			if cache is None:
+				return lookup_country_code(point[0], point[1]), None
+			return cache.get_country_code(point[0], point[1], lookup_country_code), None
+		except Exception as e:
+			return False, e
+
+	if COUNTRY_INDEX.is_available() or len(uniquePoints) <= 1:
+		results = [lookup(point) for point in uniquePoints]
+	else:
+		pool = multiprocessing.pool.ThreadPool(min(maxWorkers, len(uniquePoints)))
+		try:
+			results = pool.map(lookup, uniquePoints)
+		finally:
+			pool.close()
+			pool.join()
+
+	if cache is not None:
+		cache.flush()
+
+	# Line the results up with the points that were given
+	resultsByPoint = dict(zip(uniquePoints, results))
+	results = [resultsByPoint[point] if isinstance(point, tuple) else (False, point) for point in points]
+	codes = [code for code, error in results]
+	errors = [error for code, error in results]
+
+	return codes, errors
+
+
+def lookup_country_code(lat, lng):
+	''' Reverse Geocodes a Latitude and Longtitude value into a three letter ISO ALPHA-3 country code without the 
+	cache, using the offline country index if the boundaries are installed or Google Maps if they aren't. Returns 
+	false if the Geocoding failed or if the country found wasn't supported. '''
+	if COUNTRY_INDEX.is_available():
+		shortCountryCode = COUNTRY_INDEX.get_short_country_code(lat, lng)
+	else:
+		shortCountryCode = get_google_short_country_code(lat, lng)
+
+	# Convert to the standard three letter ALPHA-3 country code used by the rest of the program
+	return Countries.SHORT_CODE_TO_LONG_CODE.get(shortCountryCode, False)
+
+
+# --------------------------------------------------------------------------------------------------------------------
+# CLASSES
+# --------------------------------------------------------------------------------------------------------------------
+
+class CountryIndex(object):
+	''' Spatial index of the country boundaries for looking up countries offline. 
+
+	The boundaries file is loaded the first time a country is looked up. A point in a cell that's inside a single 
+	country is found straight away, otherwise it's only tested against the edges of the rings that were clipped to
+	its cell, so a lookup takes tens of microseconds. '''
+
+	def __init__(self, filename=None):
+		''' Initialise the index, nothing is read from the file until it's needed '''
+		self.filename = filename        # Path to the boundaries file, found when it's loaded if not given
+		self.codes = None               # List of the ALPHA-2 codes of the countries
+		self.cells = None               # Dictionary of {(column, row) : cell number}
+		self.boundaries = None          # Dictionary of the arrays in the boundaries file
+		self.lock = threading.Lock()    # Protects the index when used from several threads
+
+	def is_available(self):
+		''' Returns True if there are boundaries to look countries up in '''
+		if self.filename is None:
+			self.filename = find_boundaries_file()
+		return self.filename is not None
+
+	def __get_cell(self, x, y):
+		''' Returns the grid cell that the point, in the units of the boundaries file, is in '''
+		cellSize = self.boundaries['cellSize']
+		return (int(math.floor(x / cellSize)), int(math.floor(y / cellSize)))
+
+	def __load(self):
+		''' Reads the arrays from the boundaries file and indexes its cells '''
+		with numpy.load(self.filename) as arrays:
+			boundaries = dict((name, arrays[name]) for name in arrays.files)
+
+		boundaries['scale'] = float(boundaries['scale'])
+		boundaries['cellSize'] = float(boundaries['cellSize'])
+		self.codes = [str(code) for code in boundaries['codes']]
+		self.boundaries = boundaries
+		self.cells = dict((tuple(key), number) for number, key in enumerate(boundaries['cellKeys'].tolist()))
+
+	def __get_edges(self, number):
+		''' Returns a slice of the edges of the cell with the given number '''
+		starts = self.boundaries['cellEdgeStarts']
+		return slice(starts[number], starts[number + 1])
+
+	def get_short_country_code(self, lat, lng):
+		''' Returns the two letter ISO ALPHA-2 code of the country at the given latitude and longitude, or False if 
+		the point isn't in a country. A point that isn't in any country is given the nearest country within
+		COAST_TOLERANCE_DEGREES, as the coasts are simplified '''
+		if self.cells is None:
+			with self.lock:
+				if self.cells is None:
+					if not self.is_available():
+						raise IOError("Unable to find the country boundaries file %s" % BOUNDARIES_FILE)
+					self.__load()
+
+		x, y = lng * self.boundaries['scale'], lat * self.boundaries['scale']
+		number = self.cells.get(self.__get_cell(x, y))
+		if number is None:
+			return self.__get_nearest_code(x, y)
+
+		# The cell is inside a single country
+		country = self.boundaries['cellCountries'][number]
+		if country >= 0:
+			return self.codes[country]
+
+		# Count the edges of each country the point crosses, it's inside the country with an odd number
+		edges = self.__get_edges(number)
+		crosses = crosses_edges(x, y, self.boundaries['edges'][edges])
+		counts = numpy.bincount(self.boundaries['edgeCountries'][edges][crosses], minlength=len(self.codes))
+		countries = (counts % 2).nonzero()[0]
+		if len(countries) > 0:
+			return self.codes[countries[0]]
+
+		return self.__get_nearest_code(x, y)
+
+	def __get_nearest_code(self, x, y):
+		''' Returns the code of the country whose coast is nearest to the point, or False if none are within 
+		COAST_TOLERANCE_DEGREES '''
+		tolerance = COAST_TOLERANCE_DEGREES * self.boundaries['scale']
+		west, south = self.__get_cell(x - tolerance, y - tolerance)
+		east, north = self.__get_cell(x + tolerance, y + tolerance)
+
+		nearestCode = False
+		nearestDistance = tolerance
+		for column in range(west, east + 1):
+			for row in range(south, north + 1):
+				number = self.cells.get((column, row))
+				if number is None:
+					continue
+
+				# A cell inside a single country has no coast
+				edges = self.__get_edges(number)
+				coasts = self.boundaries['edgeCoasts'][edges]
+				if not coasts.any():
+					continue
+
+				distances = distance_to_edges(x, y, self.boundaries['edges'][edges][coasts])
+				nearest = distances.argmin()
+				if distances[nearest] <= nearestDistance:
+					nearestDistance = distances[nearest]
+					nearestCode = self.codes[self.boundaries['edgeCountries'][edges][coasts][nearest]]
+
+		return nearestCode
+
+
+class GeocodeCache(object):
+	''' Least recently used cache of country codes that have been looked up, saved to a small JSON file.
+
+	The latitude and longitude are rounded to a grid of the given precision in degrees, so nearby points share one
+	lookup. Entries older than the time to live are looked up again, and once there are more than the maximum number
+	of entries the least recently used ones are dropped. Only countries that were found are kept, so a failed lookup
+	(such as when the internet is down) is tried again next time. 
+
+	New entries are only kept in memory until flush is called, so a batch of lookups writes the file once. '''
+
+	def __init__(self, filename=None, precision=GEOCODE_CACHE_PRECISION, ttlDays=GEOCODE_CACHE_TTL_DAYS,
+				 maxEntries=GEOCODE_CACHE_MAX_ENTRIES):
+		''' Initialise the cache, the file is read the first time it's needed. No file means it's only kept in memory '''
+		self.filename = filename        # File the cache is saved to
+		self.precision = precision      # Size of the grid cells in degrees
+		self.ttl = ttlDays * 86400.0    # Time to live of each entry in seconds
+		self.maxEntries = maxEntries    # Maximum number of entries to keep
+		self.entries = None             # Ordered dictionary of {(row, column) : (code, time looked up)}, oldest first
+		self.dirty = False              # True when there are entries that haven't been saved
+		self.keyLocks = {}              # Dictionary of {(row, column) : [lock, number of threads using it]}
+		self.lock = threading.Lock()    # Protects the entries and the key locks
+		self.saveLock = threading.Lock()    # Stops two threads writing the file at once
+
+	def get_key(self, lat, lng):
+		''' Returns the grid cell the point is in '''
+		return (int(round(lat / self.precision)), int(round(lng / self.precision)))
+
+	def __load(self):
+		''' Reads the entries from the file, ignoring it if it's missing, unreadable or used a different precision '''
+		self.entries = collections.OrderedDict()
+		if self.filename is None:
+			return
+
+		try:
+			with open(self.filename, 'r') as f:
+				saved = json.load(f)
+		except (IOError, ValueError):
+			return
 
+		if saved.get('precision') == self.precision:
+			for row, column, code, lookedUp in saved['entries']:
+				self.entries[(row, column)] = (str(code), lookedUp)
+
+	def __save(self, entries):
+		''' Writes the list of entries to the file, replacing it in one go so other processes never read half a file.
+		Returns False if the file couldn't be written '''
+		saved = {'precision' : self.precision,
+				 'entries' : [[row, column, code, lookedUp] for (row, column), (code, lookedUp) in entries]}
+
+		directory = os.path.dirname(os.path.abspath(self.filename))
+		temporaryFilename = None
+		try:
+			# Each save gets its own temporary file, so processes sharing the cache don't write over each other's
+			fileNumber, temporaryFilename = tempfile.mkstemp(suffix='.tmp', prefix=os.path.basename(self.filename) + '.',
+															  dir=directory)
+			with os.fdopen(fileNumber, 'w') as f:
+				json.dump(saved, f)
+
+			# Windows can't rename over an existing file
+			try:
+				os.rename(temporaryFilename, self.filename)
+			except OSError:
+				os.remove(self.filename)
+				os.rename(temporaryFilename, self.filename)
+
+		except (IOError, OSError) as e:
+			debug("Failed to save the geocode cache to %s: %s" % (self.filename, e))
+			if temporaryFilename is not None and os.path.exists(temporaryFilename):
+				os.remove(temporaryFilename)
+			return False
+
+		return True
+
+	def flush(self):
+		''' Saves the cache if there are entries that haven't been saved. The entries are copied while the cache is
+		locked and written after it's unlocked, so lookups carry on while the file is written '''
+		if self.filename is None:
+			return
+
+		with self.saveLock:
+			with self.lock:
+				if not self.dirty:
+					return
+				entries = list(self.entries.items())
+				self.dirty = False
+
+			# Try again at the next flush if it couldn't be written
+			if not self.__save(entries):
+				with self.lock:
+					self.dirty = True
+
+	def get(self, lat, lng):
+		''' Returns the cached country code of the point, or None if it isn't cached or has expired '''
+		key = self.get_key(lat, lng)
+		with self.lock:
+			if self.entries is None:
+				self.__load()
+
+			if key not in self.entries:
+				return None
+
+			code, lookedUp = self.entries.pop(key)
+			if time.time() - lookedUp > self.ttl:
+				return None
+
+			# Move the entry to the most recently used end
+			self.entries[key] = (code, lookedUp)
+			return code
+
+	def put(self, lat, lng, code):
+		''' Caches the country code of the point. It's saved at the next flush '''
+		key = self.get_key(lat, lng)
+		with self.lock:
+			if self.entries is None:
+				self.__load()
+
+			self.entries.pop(key, None)
+			self.entries[key] = (code, time.time())
+
+			while len(self.entries) > self.maxEntries:
+				self.entries.popitem(last=False)
+
+			self.dirty = True
+
+	def get_country_code(self, lat, lng, lookup):
+		''' Returns the country code of the point from the cache, or calls lookup(lat, lng) and caches its result if 
+		it isn't cached. Threads looking up points in the same cell wait for the first one rather than all doing the
+		lookup. The lock of the cell is dropped once no thread is using it '''
+		key = self.get_key(lat, lng)
+		with self.lock:
+			keyLock = self.keyLocks.setdefault(key, [threading.Lock(), 0])
+			keyLock[1] += 1
+
+		try:
+			with keyLock[0]:
+				code = self.get(lat, lng)
+				if code is None:
+					code = lookup(lat, lng)
+					if code:
+						self.put(lat, lng, code)
+		finally:
+			with self.lock:
+				keyLock[1] -= 1
+				if keyLock[1] == 0:
+					del self.keyLocks[key]
+
+		return code
+
+	def clear(self):
+		''' Removes all the cached country codes '''
+		with self.lock:
+			self.entries = collections.OrderedDict()
+			self.dirty = True
+
+		self.flush()
+
+
+# --------------------------------------------------------------------------------------------------------------------
+# DATA
+# --------------------------------------------------------------------------------------------------------------------
+
+COUNTRY_INDEX = CountryIndex()
+GEOCODE_CACHE = GeocodeCache(GEOCODE_CACHE_FILE)
+
+
+# --------------------------------------------------------------------------------------------------------------------
+# MAIN
+# --------------------------------------------------------------------------------------------------------------------
 
+if __name__ == '__main__':
+	failures = check_boundaries()
+	for description, expected, code in failures:
+		print "%s was found in %s rather than %s" % (description, code, expected)
 
+	print "%d of %d known points were found in the right country" % (len(KNOWN_POINTS) - len(failures), len(KNOWN_POINTS))
+	raise SystemExit(1 if failures else 0)
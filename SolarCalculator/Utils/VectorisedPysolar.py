@@ -0,0 +1,222 @@
+'''@package VectorisedPysolar.py
+
+NumPy versions of the Pysolar functions used by the power flow simulation. Pysolar works on one datetime at a time
+which makes it the dominant cost of a long simulation with a small timestep. The functions in here take arrays of
+times and follow the same steps (and the same coefficient tables) as Pysolar.GetAltitude, Pysolar.GetAzimuth and
+Pysolar.radiation.GetRadiationDirect, so the results agree with Pysolar to within floating point rounding.
+
+Times are given as a list of dates plus an array of minutes into the day, and all the results are returned as 2D
+arrays shaped (days x steps). All times are UTC, the same as Pysolar.
+'''
+
+import math
+import numpy
+
+# Pysolar's coefficient tables and location functions are reused as is
+import Pysolar
+
+
+# --------------------------------------------------------------------------------------------------------------------
+# CONSTANTS
+# --------------------------------------------------------------------------------------------------------------------
+
+DELTA_T_SECONDS = 65                 # Pysolar.GetAltitude and Pysolar.GetAzimuth both use a Delta-T of 65 seconds
+PRESSURE_MILLIBARS = 1013.25         # Default pressure used by Pysolar for the refraction correction
+TEMPERATURE_CELSIUS = 25             # Default temperature used by Pysolar for the refraction correction
+ELEVATION = 0                        # Default site elevation used by Pysolar
+
+
+# --------------------------------------------------------------------------------------------------------------------
+# TIME FUNCTIONS
+# --------------------------------------------------------------------------------------------------------------------
+
+def get_julian_days(dates, minutes):
+    ''' Returns a (days x steps) array of Julian days for each of the given dates at each of the given minutes into
+    the day. Follows Pysolar.julian.GetJulianDay. '''
+
+    # The whole part of the Julian day only depends on the date so it is calculated once per day
+    wholeDays = numpy.empty(len(dates))
+    dayOfMonth = numpy.empty(len(dates))
+    gregorianOffset = numpy.empty(len(dates))
+
+    for i, date in enumerate(dates):
+        year = date.year
+        month = date.month
+        if month <= 2.0:
+            year = year - 1.0
+            month = month + 12.0
+
+        wholeDays[i] = math.floor(365.25 * (year + 4716.0)) + math.floor(30.6001 * (month + 1.0))
+        dayOfMonth[i] = date.day
+        gregorianOffset[i] = 2.0 - (year // 100.0) + ((year // 100.0) // 4.0)
+
+    # Fraction of the day for each timestep, rounded to the microsecond like a datetime would be
+    seconds = numpy.round(numpy.asarray(minutes, dtype=float) * 60.0 * 1e6) / 1e6
+    dayFraction = seconds / 86400.0
+
+    day = dayOfMonth[:, numpy.newaxis] + dayFraction[numpy.newaxis, :]
+    julianDays = wholeDays[:, numpy.newaxis] + day - 1524.5
+
+    # Dates after October 1582 get the Gregorian correction
+    return numpy.where(julianDays <= 2299160.0, julianDays, julianDays + gregorianOffset[:, numpy.newaxis])
+
+
+def get_day_of_year(dates):
+    ''' Returns an array with the zero based day of the year for each date, as Pysolar.GetDayOfYear does '''
+    return numpy.array([date.timetuple().tm_yday - 1 for date in dates], dtype=float)
+
+
+# --------------------------------------------------------------------------------------------------------------------
+# SOLAR POSITION
+# --------------------------------------------------------------------------------------------------------------------
+
+def get_coefficient(jme, constantArray):
+    ''' Array version of Pysolar.GetCoefficient. Sums the terms one at a time to keep the memory use down. '''
+    total = numpy.zeros_like(jme)
+    for a, b, c in constantArray:
+        total += a * numpy.cos(b + (c * jme))
+    return total
+
+
+def get_nutation(jde):
+    ''' Array version of Pysolar.GetNutation. Returns a tuple of the (longitude, obliquity) nutation arrays. '''
+    jce = (jde - 2451545.0) / 36525.0
+
+    # Same order as Pysolar.PrecalculateAberrations
+    polynomials = Pysolar.constants.buildPolyDict()
+    x = [polynomials['MeanElongationOfMoon'](jce),
+         polynomials['MeanAnomalyOfSun'](jce),
+         polynomials['MeanAnomalyOfMoon'](jce),
+         polynomials['ArgumentOfLatitudeOfMoon'](jce),
+         polynomials['LongitudeOfAscendingNode'](jce)]
+
+    nutationLongitude = numpy.zeros_like(jde)
+    nutationObliquity = numpy.zeros_like(jde)
+
+    for abcd, y in zip(Pysolar.constants.nutation_coefficients, Pysolar.constants.aberration_sin_terms):
+        sigmaxy = numpy.zeros_like(jde)
+        for j in range(len(x)):
+            sigmaxy += x[j] * y[j]
+
+        nutationLongitude += (abcd[0] + (abcd[1] * jce)) * numpy.sin(numpy.radians(sigmaxy))
+        nutationObliquity += (abcd[2] + (abcd[3] * jce)) * numpy.cos(numpy.radians(sigmaxy))
+
+    # 36000000 scales from 0.0001 arcseconds to degrees
+    return (nutationLongitude / 36000000.0, nutationObliquity / 36000000.0)
+
+
+def get_sun_position(latitude, longitude, dates, minutes):
+    ''' Returns a tuple of (azimuth, altitude) arrays in degrees for the sun at the given location.
+
+    This is the array version of Pysolar.GetAzimuth and Pysolar.GetAltitude, which share all of their workings up
+    to the topocentric sun declination. The returned arrays are shaped (days x steps) '''
+
+    # Location dependent calculations
+    projectedRadialDistance = Pysolar.GetProjectedRadialDistance(ELEVATION, latitude)
+    projectedAxialDistance = Pysolar.GetProjectedAxialDistance(ELEVATION, latitude)
+    latitudeRad = math.radians(latitude)
+
+    # Time dependent calculations
+    jd = get_julian_days(dates, minutes)
+    jde = jd + (DELTA_T_SECONDS / 86400.0)
+    jce = (jde - 2451545.0) / 36525.0
+    jme = jce / 10.0
+
+    # Heliocentric longitude, latitude and the radius vector
+    l = (get_coefficient(jme, Pysolar.constants.L0) + get_coefficient(jme, Pysolar.constants.L1) * jme +
+         get_coefficient(jme, Pysolar.constants.L2) * jme ** 2 + get_coefficient(jme, Pysolar.constants.L3) * jme ** 3 +
+         get_coefficient(jme, Pysolar.constants.L4) * jme ** 4 + get_coefficient(jme, Pysolar.constants.L5) * jme ** 5) / 10 ** 8
+    heliocentricLongitude = numpy.degrees(l) % 360
+
+    b = get_coefficient(jme, Pysolar.constants.B0) + (get_coefficient(jme, Pysolar.constants.B1) * jme)
+    heliocentricLatitude = numpy.degrees(b / 10 ** 8)
+
+    radiusVector = (get_coefficient(jme, Pysolar.constants.R0) + get_coefficient(jme, Pysolar.constants.R1) * jme +
+                    get_coefficient(jme, Pysolar.constants.R2) * jme ** 2 + get_coefficient(jme, Pysolar.constants.R3) * jme ** 3 +
+                    get_coefficient(jme, Pysolar.constants.R4) * jme ** 4) / 10 ** 8
+
+    geocentricLongitude = (heliocentricLongitude + 180) % 360
+    geocentricLatitude = -1 * heliocentricLatitude
+    aberrationCorrection = -20.4898 / (3600.0 * radiusVector)
+    equatorialHorizontalParallax = 8.794 / (3600 / radiusVector)
+    nutationLongitude, nutationObliquity = get_nutation(jde)
+
+    # True ecliptic obliquity
+    u = jme / 10.0
+    meanObliquity = 84381.448 - (4680.93 * u) - (1.55 * u ** 2) + (1999.25 * u ** 3) \
+        - (51.38 * u ** 4) - (249.67 * u ** 5) - (39.05 * u ** 6) + (7.12 * u ** 7) \
+        + (27.87 * u ** 8) + (5.79 * u ** 9) + (2.45 * u ** 10)
+    trueEclipticObliquity = (meanObliquity / 3600.0) + nutationObliquity
+
+    # Apparent sidereal time. Note Pysolar takes the cosine of the obliquity in degrees, this is kept to match it
+    jc = (jd - 2451545.0) / 36525.0
+    meanSiderealTime = (280.46061837 + (360.98564736629 * (jd - 2451545.0)) + (0.000387933 * jc ** 2) - (jc ** 3 / 38710000)) % 360
+    apparentSiderealTime = meanSiderealTime + nutationLongitude * numpy.cos(trueEclipticObliquity)
+
+    # Geocentric sun right ascension and declination
+    apparentSunLongitudeRad = numpy.radians(geocentricLongitude + nutationLongitude + aberrationCorrection)
+    trueEclipticObliquityRad = numpy.radians(trueEclipticObliquity)
+    geocentricLatitudeRad = numpy.radians(geocentricLatitude)
+
+    a = numpy.sin(apparentSunLongitudeRad) * numpy.cos(trueEclipticObliquityRad)
+    b = numpy.tan(geocentricLatitudeRad) * numpy.sin(trueEclipticObliquityRad)
+    c = numpy.cos(apparentSunLongitudeRad)
+    geocentricSunRightAscension = numpy.degrees(numpy.arctan2((a - b), c)) % 360
+
+    a = numpy.sin(geocentricLatitudeRad) * numpy.cos(trueEclipticObliquityRad)
+    b = numpy.cos(geocentricLatitudeRad) * numpy.sin(trueEclipticObliquityRad) * numpy.sin(apparentSunLongitudeRad)
+    geocentricSunDeclination = numpy.degrees(numpy.arcsin(a + b))
+
+    # Local hour angle and the parallax in the sun right ascension
+    localHourAngle = (apparentSiderealTime + longitude - geocentricSunRightAscension) % 360
+
+    ehpRad = numpy.radians(equatorialHorizontalParallax)
+    lhaRad = numpy.radians(localHourAngle)
+    gsdRad = numpy.radians(geocentricSunDeclination)
+    a = -1 * projectedRadialDistance * numpy.sin(ehpRad) * numpy.sin(lhaRad)
+    b = numpy.cos(gsdRad) - projectedRadialDistance * numpy.sin(ehpRad) * numpy.cos(lhaRad)
+    parallaxSunRightAscension = numpy.degrees(numpy.arctan2(a, b))
+
+    # Topocentric values
+    topocentricLocalHourAngle = localHourAngle - parallaxSunRightAscension
+
+    a = (numpy.sin(gsdRad) - projectedAxialDistance * numpy.sin(ehpRad)) * numpy.cos(numpy.radians(parallaxSunRightAscension))
+    b = numpy.cos(gsdRad) - (projectedAxialDistance * numpy.sin(ehpRad) * numpy.cos(lhaRad))
+    topocentricSunDeclination = numpy.degrees(numpy.arctan2(a, b))
+
+    tsdRad = numpy.radians(topocentricSunDeclination)
+    tlhaRad = numpy.radians(topocentricLocalHourAngle)
+
+    # Altitude including the refraction correction
+    elevationAngle = numpy.degrees(numpy.arcsin((math.sin(latitudeRad) * numpy.sin(tsdRad)) +
+                                                math.cos(latitudeRad) * numpy.cos(tsdRad) * numpy.cos(tlhaRad)))
+    refractionA = PRESSURE_MILLIBARS * 283.0 * 1.02
+    refractionB = 1010.0 * (TEMPERATURE_CELSIUS + 273.15) * 60.0 * numpy.tan(numpy.radians(elevationAngle + (10.3 / (elevationAngle + 5.11))))
+    altitude = elevationAngle + refractionA / refractionB
+
+    # Azimuth, measured the same way as Pysolar.GetAzimuth
+    a = numpy.sin(tlhaRad)
+    b = numpy.cos(tlhaRad) * math.sin(latitudeRad) - numpy.tan(tsdRad) * math.cos(latitudeRad)
+    azimuth = 180 - (180.0 + numpy.degrees(numpy.arctan2(a, b)) % 360)
+
+    return (azimuth, altitude)
+
+
+# --------------------------------------------------------------------------------------------------------------------
+# RADIATION
+# --------------------------------------------------------------------------------------------------------------------
+
+def get_radiation_direct(dayOfYear, altitude):
+    ''' Array version of Pysolar.radiation.GetRadiationDirect.
+
+    Takes an array of zero based days of the year (one per row of altitude) and a (days x steps) array of sun
+    altitudes in degrees. Returns zero for any timestep where the sun is below the horizon. '''
+    day = numpy.asarray(dayOfYear, dtype=float)[:, numpy.newaxis]
+    flux = 1160 + (75 * numpy.sin(numpy.radians((360. / 365) * (day - 275))))
+    opticalDepth = 0.174 + (0.035 * numpy.sin(numpy.radians((360. / 365) * (day - 100))))
+
+    # Only calculate the air mass ratio when the sun is up, it blows up at the horizon
+    sunUp = altitude > 0
+    airMassRatio = 1 / numpy.sin(numpy.radians(numpy.where(sunUp, altitude, 90.0)))
+
+    return numpy.where(sunUp, flux * numpy.exp(-1 * opticalDepth * airMassRatio), 0.0)
@@ -0,0 +1,288 @@
+'''@package batch.py
+
+Headless entry point of the solar calculator for running simulations on servers. Each scenario file given on the
+command line is a JSON file of the input parameters (see Scenario.py). The simulations are created the same way as
+in the GUI, the power and financial simulations are run, and the results are written as JSON to the output folder.
+Nothing from wxPython or matplotlib is imported.
+
+Usage:
+    python batch.py scenario1.json scenario2.json --output results
+    python batch.py site1.json site2.json site3.json --portfolio pacific --workers 8 --output results
+'''
+
+# Import system modules
+import os
+import sys
+import json
+import time
+import datetime
+import argparse
+import traceback
+
+# Import NumPy
+import numpy
+
+# Load the SolarCalculator modules
+import SolarCalculator.Simulation
+import SolarCalculator.Scenario
+import SolarCalculator.Analytics
+import SolarCalculator.Portfolio
+import SolarCalculator.Export
+import SolarCalculator.Assets
+import SolarCalculator.Utils.PyExchangeRates
+
+# --------------------------------------------------------------------------------------------------------------------
+# CONSTANTS
+# --------------------------------------------------------------------------------------------------------------------
+
+RESULTS_SUFFIX = '.results.json'        # Added to the name of each scenario file to get the name of its results file
+EXPORT_SUFFIX = '.columns'              # Added to the name of each scenario file to get the name of its export folder
+
+# --------------------------------------------------------------------------------------------------------------------
+# CLASSES
+# --------------------------------------------------------------------------------------------------------------------
+
+class ResultsEncoder(json.JSONEncoder):
+    ''' Allows the simulation results to be encoded by converting NumPy arrays to lists and dates to strings '''
+    def default(self, obj):
+        if isinstance(obj, numpy.ndarray):
+            return obj.tolist()
+        elif isinstance(obj, numpy.generic):
+            return obj.item()
+        elif isinstance(obj, (datetime.date, datetime.datetime)):
+            return obj.isoformat()
+        return json.JSONEncoder.default(self, obj)
+
+# --------------------------------------------------------------------------------------------------------------------
+# FUNCTIONS
+# --------------------------------------------------------------------------------------------------------------------
+
+def summariseResults(powerResults, financialResults):
+    ''' Returns a dictionary of the headline results, the same values shown in the GUI's results dialog. The initial
+    cost is the cost of the assets, the site and the miscellaneous expenses, rather than the loan at the end of the 
+    first day that the GUI shows '''
+    electricalEnergy = numpy.asarray(powerResults['electricalEnergy'])
+    averagePower = numpy.asarray(powerResults['averagePower'])
+
+    summary = {}
+
+    # Peak currents in each conductor (A)
+    summary['peakDC'] = powerResults['peakDC']
+    summary['peakAC1'] = powerResults['peakAC1']
+    summary['peakAC2'] = powerResults['peakAC2']
+
+    # Average daily power (kW)
+    summary['maxAveragePower'] = averagePower.max()
+    summary['minAveragePower'] = averagePower.min()
+
+    # Energy exported to the grid (MWh)
+    summary['totalEnergy'] = electricalEnergy.sum() / 1000.0
+    summary['dailyAverageEnergy'] = electricalEnergy.mean() / 1000.0
+
+    # Efficiencies (%)
+    summary['electricalEfficiency'] = numpy.mean(powerResults['electricalEffciency'])
+    summary['totalEfficiency'] = numpy.mean(powerResults['totalEffciency'])
+
+    # Financial information in the base currency
+    summary['baseCurrency'] = financialResults['baseCurrency']
+    summary['initialCost'] = financialResults['initialCost']
+    summary['initialNetAssetValue'] = financialResults['netAssetValue'][0]
+    summary['finalNetAssetValue'] = financialResults['netAssetValue'][-1]
+    summary['finalLoanValue'] = financialResults['loanValue'][-1]
+    summary['totalRevenue'] = financialResults['accumulativeRevenue'][-1]
+
+    # Investment metrics discounted at the interest rate of the loan
+    analytics = SolarCalculator.Analytics.summariseFinancialResults(powerResults, financialResults)
+    for field in ['discountRate', 'npv', 'irr', 'lcoe', 'paybackDate', 'discountedPaybackDate', 'loanPaidOffDate']:
+        summary[field] = analytics[field]
+
+    return summary
+
+
+def runScenario(filename, simulationOptions, exportDirectory=None, compress=False):
+    ''' Loads a scenario file, runs the power and financial simulations and returns a dictionary of the results. If an
+    export folder is given the daily results are also exported to it as NumPy columns (see Export.py) '''
+    inputParameters, optionalInputParameters = SolarCalculator.Scenario.loadScenario(filename)
+    simulation = SolarCalculator.Scenario.createSimulation(inputParameters, optionalInputParameters, **simulationOptions)
+
+    # Run the power simulation, getPowerResults blocks until it is done so there's no need to poll the progress
+    simulation.runPower()
+    powerResults = simulation.getPowerResults()
+
+    # Run the financial simulation
+    simulation.runFinancial()
+    financialResults = simulation.getFinancialResults()
+
+    if exportDirectory is not None:
+        SolarCalculator.Export.exportSimulation(simulation, exportDirectory, compress)
+
+    return {'scenario' : os.path.basename(filename),
+            'summary' : summariseResults(powerResults, financialResults),
+            'power' : powerResults,
+            'financial' : financialResults}
+
+
+def runPortfolio(filenames, simulationOptions, numWorkers, baseCurrency, exportOutputDir=None, compress=False):
+    ''' Loads the scenario files as the sites of a portfolio, runs their power and financial simulations on one shared
+    pool of threads (or of processes if the simulation options ask for the processes backend) and returns a tuple of
+    (dictionary of the results of each site by file name, portfolio totals). If exportOutputDir is given the daily 
+    results of each site are exported into it (see Export.py) '''
+    portfolio = SolarCalculator.Portfolio.loadPortfolio(filenames, numWorkers, baseCurrency, **simulationOptions)
+
+    portfolio.runPower()
+    powerResults = portfolio.getPowerResults()
+    portfolio.runFinancial()
+    financialResults = portfolio.getFinancialResults()
+
+    siteResults = {}
+    for filename in filenames:
+        name = os.path.splitext(os.path.basename(filename))[0]
+        power = powerResults['sites'][name]
+        financial = financialResults['sites'][name]
+
+        if exportOutputDir is not None:
+            exportDirectory = getExportDirectory(filename, exportOutputDir)
+            SolarCalculator.Export.exportSimulation(portfolio.getSimulation(name), exportDirectory, compress)
+
+        siteResults[filename] = {'scenario' : os.path.basename(filename),
+                                 'summary' : summariseResults(power, financial),
+                                 'power' : power,
+                                 'financial' : financial}
+
+    total = {'sites' : [os.path.basename(filename) for filename in filenames],
+             'power' : powerResults['total'],
+             'financial' : financialResults['total']}
+
+    return siteResults, total
+
+
+def getResultsFilename(filename, outputDir):
+    ''' Returns the name of the file the results of the given scenario file are written to '''
+    name = os.path.splitext(os.path.basename(filename))[0]
+    return os.path.join(outputDir, name + RESULTS_SUFFIX)
+
+
+def getExportDirectory(filename, outputDir):
+    ''' Returns the name of the folder the daily results of the given scenario file are exported to '''
+    name = os.path.splitext(os.path.basename(filename))[0]
+    return os.path.join(outputDir, name + EXPORT_SUFFIX)
+
+
+def parseArguments(argv):
+    ''' Parses the command line arguments '''
+    parser = argparse.ArgumentParser(description='Runs solar farm simulations from scenario files without the GUI')
+    parser.add_argument('scenarios', nargs='+', help='JSON scenario files to simulate')
+    parser.add_argument('-o', '--output', default='.', help='folder to write the results to (default: current folder)')
+    parser.add_argument('--summary-only', action='store_true', help='only write the headline results, not the daily series')
+    parser.add_argument('--export', action='store_true', help='also export the daily results of each scenario as NumPy columns '
+                        'to a SCENARIO' + EXPORT_SUFFIX + ' folder, which can be memory mapped')
+    parser.add_argument('--compress', action='store_true', help='compress the exported columns in chunks of days')
+    parser.add_argument('--engine', choices=[SolarCalculator.Simulation.ENGINE_VECTORISED, SolarCalculator.Simulation.ENGINE_THREADED],
+                        help='power simulation engine')
+    parser.add_argument('--backend', choices=[SolarCalculator.Simulation.BACKEND_THREADS, SolarCalculator.Simulation.BACKEND_PROCESSES],
+                        help='run the power simulation jobs on threads or processes')
+    parser.add_argument('--processes', type=int, help='number of processes for the processes backend')
+    parser.add_argument('--timestep', type=int, help='simulation timestep in minutes')
+    parser.add_argument('--ephemeris-cache', help='folder to cache the solar ephemeris in between runs')
+    parser.add_argument('--rates', help='JSON file of exchange rates to use rather than downloading the latest rates')
+    parser.add_argument('--result-cache', help='folder to cache the results of scenarios in, so repeated scenarios are not re-run')
+    parser.add_argument('--portfolio', help='run the scenarios as the sites of one portfolio on a shared pool of threads, '
+                        'or of processes with --backend processes, writing the portfolio totals to PORTFOLIO' + RESULTS_SUFFIX)
+    parser.add_argument('--workers', type=int, help='number of threads or processes shared by the sites of a portfolio '
+                        '(default: one per core)')
+    parser.add_argument('--currency', default='USD', help='currency of the portfolio totals (default: USD)')
+    return parser.parse_args(argv)
+
+
+def runPortfolioScenarios(arguments, simulationOptions):
+    ''' Runs the scenarios given on the command line as one portfolio and writes the results of each site and the 
+    portfolio totals, returns the exit code '''
+    startTime = time.time()
+    try:
+        exportOutputDir = arguments.output if arguments.export else None
+        siteResults, total = runPortfolio(arguments.scenarios, simulationOptions, arguments.workers, arguments.currency,
+                                          exportOutputDir, arguments.compress)
+    except Exception:
+        sys.stderr.write("FAILED portfolio %s\n" % arguments.portfolio)
+        traceback.print_exc()
+        return 1
+
+    for filename in arguments.scenarios:
+        results = siteResults[filename]
+        if arguments.summary_only:
+            del results['power']
+            del results['financial']
+
+        with open(getResultsFilename(filename, arguments.output), 'w') as f:
+            json.dump(results, f, cls=ResultsEncoder)
+
+    resultsFilename = getResultsFilename(arguments.portfolio, arguments.output)
+    with open(resultsFilename, 'w') as f:
+        json.dump(total, f, cls=ResultsEncoder)
+
+    print "%d sites -> %s (%.2f s)" % (len(arguments.scenarios), resultsFilename, time.time() - startTime)
+    return 0
+
+
+def main(argv):
+    ''' Runs each of the scenarios given on the command line, returns the exit code '''
+    arguments = parseArguments(argv)
+
+    # Take the exchange rates from the file if one was given, so the rates are never downloaded
+    if arguments.rates is not None:
+        rates = SolarCalculator.Utils.PyExchangeRates.FileRatesProvider(arguments.rates)
+        SolarCalculator.Assets.CURRENCY_EXCHANGE.setProvider(rates)
+
+    # Build the options for the simulations from the arguments that were given
+    simulationOptions = {}
+    if arguments.engine is not None:
+        simulationOptions['engine'] = arguments.engine
+    if arguments.backend is not None:
+        simulationOptions['backend'] = arguments.backend
+    if arguments.processes is not None:
+        simulationOptions['numProcesses'] = arguments.processes
+    if arguments.timestep is not None:
+        simulationOptions['simulationTimestepMins'] = arguments.timestep
+    if arguments.ephemeris_cache is not None:
+        simulationOptions['ephemerisCache'] = SolarCalculator.Simulation.SolarEphemerisCache(arguments.ephemeris_cache)
+    if arguments.result_cache is not None:
+        simulationOptions['resultCache'] = SolarCalculator.Simulation.SimulationResultCache(arguments.result_cache)
+
+    if not os.path.isdir(arguments.output):
+        os.makedirs(arguments.output)
+
+    # Run all the scenarios at once as a portfolio if one was asked for
+    if arguments.portfolio is not None:
+        return runPortfolioScenarios(arguments, simulationOptions)
+
+    # Run the scenarios one at a time, carrying on to the next one if a scenario fails
+    failures = 0
+    for filename in arguments.scenarios:
+        startTime = time.time()
+        try:
+            exportDirectory = getExportDirectory(filename, arguments.output) if arguments.export else None
+            results = runScenario(filename, simulationOptions, exportDirectory, arguments.compress)
+        except Exception:
+            failures += 1
+            sys.stderr.write("FAILED %s\n" % filename)
+            traceback.print_exc()
+            continue
+
+        if arguments.summary_only:
+            del results['power']
+            del results['financial']
+
+        resultsFilename = getResultsFilename(filename, arguments.output)
+        with open(resultsFilename, 'w') as f:
+            json.dump(results, f, cls=ResultsEncoder)
+
+        print "%s -> %s (%.2f s)" % (filename, resultsFilename, time.time() - startTime)
+
+    return 1 if failures else 0
+
+# --------------------------------------------------------------------------------------------------------------------
+# BOOTSTRAP MAIN PROGRAM
+# --------------------------------------------------------------------------------------------------------------------
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv[1:]))
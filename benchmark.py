@@ -0,0 +1,288 @@
+'''@package benchmark.py
+
+Benchmarks the hot paths of the power and financial simulations over a set of standard scenarios, so the speed of
+the simulations can be compared between commits. Each scenario is the same solar farm simulated over a different
+length of time at a different timestep. The currency exchange uses fixed rates held in memory and the site uses
+fixed temperatures, so the benchmarks don't depend on the network, the exchange rates on the day
+or the data files.
+
+Each scenario is run in its own process so the peak memory of one scenario doesn't hide the next. For each scenario
+the wall time and days simulated per second of the power and financial simulations are recorded, along with the peak
+resident memory of the process, how much of it the simulation added on top of what the process had used before it
+started, the peak resident memory of any worker processes, and the size of the daily results the simulation keeps.
+
+Usage:
+    python benchmark.py --output before.json
+    python benchmark.py --output after.json --compare before.json
+'''
+
+# Import system modules
+import os
+import sys
+import json
+import time
+import datetime
+import platform
+import argparse
+import subprocess
+
+# Peak memory is read from the resource module, which is only available on unix
+try:
+    import resource
+except ImportError:
+    resource = None
+
+# Import NumPy
+import numpy
+
+# Load the SolarCalculator modules
+import SolarCalculator.Assets
+import SolarCalculator.Simulation
+import SolarCalculator.Scenario
+import SolarCalculator.Utils.PyExchangeRates
+
+# --------------------------------------------------------------------------------------------------------------------
+# CONSTANTS
+# --------------------------------------------------------------------------------------------------------------------
+
+# Standard scenarios as (name, years simulated, timestep in minutes)
+BENCHMARK_SCENARIOS = [('1year-60min', 1, 60),
+                       ('25years-15min', 25, 15),
+                       ('50years-5min', 50, 5)]
+
+BENCHMARK_START = datetime.date(2014, 1, 1)         # Start date of every scenario
+
+# Average monthly temperatures of the site (degrees C), fixed so the benchmarks don't depend on the data file
+BENCHMARK_TEMPERATURE = [26.4, 26.8, 26.5, 25.6, 24.0, 23.1, 22.3, 22.2, 22.6, 23.5, 24.6, 25.7]
+
+# Exchange rates against USD used instead of the latest rates
+BENCHMARK_RATES = {'USD' : 1.0, 'NZD' : 1.2, 'AUD' : 1.1, 'EUR' : 0.75, 'GBP' : 0.64, 'TOP' : 1.8}
+
+REGRESSION_THRESHOLD = 1.1      # A scenario that takes this many times longer than it did before is a regression
+
+# --------------------------------------------------------------------------------------------------------------------
+# FUNCTIONS
+# --------------------------------------------------------------------------------------------------------------------
+
+def createBenchmarkSimulation(years, timestepMins, **simulationOptions):
+    ''' Creates the simulation of the benchmark solar farm over the given number of years. Any keyword arguments are
+    passed on to the Simulation, overriding the options the GUI uses '''
+    Assets = SolarCalculator.Assets
+    materials = SolarCalculator.Scenario.MATERIALS
+
+    panel = Assets.PVPanel(voltage=30.5, rating=230, degradationRate=0.4, area=1.63, cost=100, currency='NZD', depRate=6)
+    module = Assets.PVModule(panelType=panel, panelNum=30)
+    array = Assets.PVArray(moduleType=module, moduleNum=7, arrayAngle=21)
+    dcCable = Assets.DCCable(diameter=20, material=materials['Copper'], length=100, costPerMeter=100, depRate=6)
+    ac1Cable = Assets.AC1Cable(strandNum=5, diameter=6, material=materials['Copper'], length=100, costPerMeter=100, depRate=6)
+    ac2Cable = Assets.AC2Cable(strandNum=5, diameter=2, material=materials['Copper'], length=500, costPerMeter=100, depRate=6)
+    inverter = Assets.Inverter(powerFactor=1.0, efficiency=95, voltage=400, cost=50000, depRate=6)
+    transformer = Assets.Transformer(voltage=11e3, efficiency=98.9, VARating=1, cost=100000, depRate=6)
+    circuitBreaker = Assets.CircuitBreaker(cost=5000)
+    site = Assets.Site(transformerNum=1, arrayNum=30, latitude=-21.0928, longitude=-175.1050, circuitBreakerNum=10,
+                       inverterNum=2, temperature=BENCHMARK_TEMPERATURE, landPrice=100000, currency='NZD',
+                       landAppRate=1.03)
+    financial = Assets.Financial(maintenance=25000, miscExpenses=100000, interestRate=6, powerPrice=0.25,
+                                 baseCurrency='NZD')
+
+    options = dict(SolarCalculator.Scenario.DEFAULT_SIMULATION_OPTIONS)
+    options.update(simulationOptions)
+    options['simulationTimestepMins'] = timestepMins
+
+    finish = BENCHMARK_START.replace(year=BENCHMARK_START.year + years)
+
+    return SolarCalculator.Simulation.Simulation(start=BENCHMARK_START, finish=finish,
+                    PVPanel=panel, PVModule=module, PVArray=array, DCCable=dcCable, Inverter=inverter,
+                    AC1Cable=ac1Cable, Transformer=transformer, AC2Cable=ac2Cable, CircuitBreaker=circuitBreaker,
+                    Site=site, Financial=financial, **options)
+
+
+def getPeakRSS(children=False):
+    ''' Returns the peak resident memory of this process in MB, or of the largest of its finished child processes if
+    children is True. Returns None if it can't be measured '''
+    if resource is None:
+        return None
+
+    peak = resource.getrusage(resource.RUSAGE_CHILDREN if children else resource.RUSAGE_SELF).ru_maxrss
+
+    # ru_maxrss is in bytes on OSX and in kB on Linux and the other unixes
+    if platform.system() == 'Darwin':
+        return peak / (1024.0 * 1024.0)
+    return peak / 1024.0
+
+
+def getResultsSize(simulation):
+    ''' Returns the size in MB of the arrays of daily power and financial results of a simulation that has been run '''
+    resultSet = simulation.getResultSet()
+    columns = resultSet['power'].values() + resultSet['financial'].values()
+    return sum(numpy.asarray(column).nbytes for column in columns) / (1024.0 * 1024.0)
+
+
+def runBenchmark(name, simulationOptions):
+    ''' Runs one of the benchmark scenarios in this process and returns a dictionary of the measurements '''
+    years, timestepMins = dict((scenario[0], scenario[1:]) for scenario in BENCHMARK_SCENARIOS)[name]
+
+    # Use the fixed rates so the exchange never goes online
+    rates = SolarCalculator.Utils.PyExchangeRates.MemoryRatesProvider(BENCHMARK_RATES)
+    SolarCalculator.Assets.CURRENCY_EXCHANGE.setProvider(rates)
+
+    # Memory the process had used before the simulation, from importing the modules
+    startRSS = getPeakRSS()
+
+    simulation = createBenchmarkSimulation(years, timestepMins, **simulationOptions)
+    numDays = simulation.numDays
+
+    # Power simulation, getPowerResults blocks until it's finished
+    startTime = time.time()
+    simulation.runPower()
+    simulation.getPowerResults()
+    powerTime = time.time() - startTime
+
+    # Financial simulation
+    startTime = time.time()
+    simulation.runFinancial()
+    simulation.getFinancialResults()
+    financialTime = time.time() - startTime
+
+    peakRSS = getPeakRSS()
+    simulationRSS = peakRSS - startRSS if peakRSS is not None else None
+
+    # The pool of the processes backend has been joined by now, so its workers count as finished children
+    peakWorkerRSS = None
+    if simulation.backend == SolarCalculator.Simulation.BACKEND_PROCESSES:
+        peakWorkerRSS = getPeakRSS(children=True)
+
+    return {'years' : years,
+            'timestepMins' : timestepMins,
+            'numDays' : numDays,
+            'engine' : simulation.engine,
+            'backend' : simulation.backend,
+            'financialEngine' : simulation.financialEngine,
+            'powerTime' : powerTime,                            # s
+            'powerDaysPerSecond' : numDays / powerTime,
+            'financialTime' : financialTime,                    # s
+            'financialDaysPerSecond' : numDays / financialTime,
+            'totalTime' : powerTime + financialTime,            # s
+            'peakRSS' : peakRSS,                                # MB
+            'simulationRSS' : simulationRSS,                    # MB
+            'peakWorkerRSS' : peakWorkerRSS,                    # MB
+            'resultsSize' : getResultsSize(simulation)}         # MB
+
+
+def runBenchmarkInProcess(name, argv):
+    ''' Runs one of the benchmark scenarios in a new process with the given command line options and returns its
+    measurements '''
+    command = [sys.executable, os.path.abspath(__file__), '--run-scenario', name] + argv
+    output = subprocess.check_output(command)
+
+    # The measurements are the last line of the output, anything the simulation printed comes before them
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def getCommit():
+    ''' Returns the git commit the benchmarks were run on, or None if it can't be found '''
+    try:
+        with open(os.devnull, 'w') as devnull:
+            return subprocess.check_output(['git', 'rev-parse', 'HEAD'], stderr=devnull,
+                                           cwd=os.path.dirname(os.path.abspath(__file__))).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compareResults(previous, current, threshold):
+    ''' Prints the speed of each scenario relative to a previous run and returns the names of the scenarios that
+    are slower by more than the threshold '''
+    regressions = []
+
+    for name in sorted(current['scenarios'].keys()):
+        if name not in previous['scenarios']:
+            continue
+
+        for field in ['powerTime', 'financialTime']:
+            ratio = current['scenarios'][name][field] / previous['scenarios'][name][field]
+            print "%-16s %-14s %8.3f s -> %8.3f s (x%.2f)" % (name, field, previous['scenarios'][name][field],
+                                                              current['scenarios'][name][field], ratio)
+            if ratio > threshold:
+                regressions.append(name)
+
+    return sorted(set(regressions))
+
+
+def parseArguments(argv):
+    ''' Parses the command line arguments '''
+    names = [scenario[0] for scenario in BENCHMARK_SCENARIOS]
+
+    parser = argparse.ArgumentParser(description='Benchmarks the power and financial simulations')
+    parser.add_argument('--scenarios', nargs='+', choices=names, default=names, help='scenarios to run (default: all)')
+    parser.add_argument('-o', '--output', help='JSON file to write the results to')
+    parser.add_argument('--compare', help='JSON results of a previous run to compare against')
+    parser.add_argument('--threshold', type=float, default=REGRESSION_THRESHOLD,
+                        help='slow down compared to the previous run that counts as a regression (default: %.1f)' % REGRESSION_THRESHOLD)
+    parser.add_argument('--engine', choices=['vectorised', 'threaded'], help='power simulation engine')
+    parser.add_argument('--backend', choices=['threads', 'processes'], help='run the power simulation jobs on threads or processes')
+    parser.add_argument('--financial-engine', choices=['float', 'vectorised', 'money'], help='financial simulation engine')
+    parser.add_argument('--run-scenario', choices=names, help=argparse.SUPPRESS)
+    return parser.parse_args(argv)
+
+
+def getSimulationOptions(arguments):
+    ''' Returns the options for the simulations from the command line arguments, and the arguments to pass them on
+    to the process running each scenario '''
+    simulationOptions = {}
+    argv = []
+
+    for option, argument in [('engine', 'engine'), ('backend', 'backend'), ('financialEngine', 'financial_engine')]:
+        value = getattr(arguments, argument)
+        if value is not None:
+            simulationOptions[option] = value
+            argv += ['--' + argument.replace('_', '-'), value]
+
+    return simulationOptions, argv
+
+
+def main(argv):
+    ''' Runs the benchmarks, returns the exit code '''
+    arguments = parseArguments(argv)
+    simulationOptions, scenarioArgv = getSimulationOptions(arguments)
+
+    # Run a single scenario when started by runBenchmarkInProcess, passing the measurements back on stdout
+    if arguments.run_scenario is not None:
+        print json.dumps(runBenchmark(arguments.run_scenario, simulationOptions))
+        return 0
+
+    results = {'commit' : getCommit(),
+               'date' : datetime.datetime.now().isoformat(),
+               'python' : platform.python_version(),
+               'platform' : platform.platform(),
+               'scenarios' : {}}
+
+    for name in arguments.scenarios:
+        measurements = runBenchmarkInProcess(name, scenarioArgv)
+        results['scenarios'][name] = measurements
+
+        print "%-16s power %8.3f s (%9.1f days/s)  financial %8.3f s (%9.1f days/s)  peak RSS %s MB" % (name,
+              measurements['powerTime'], measurements['powerDaysPerSecond'], measurements['financialTime'],
+              measurements['financialDaysPerSecond'], "%.1f" % measurements['peakRSS'] if measurements['peakRSS'] else '-')
+
+    if arguments.output is not None:
+        with open(arguments.output, 'w') as f:
+            json.dump(results, f, indent=4, sort_keys=True)
+
+    # Check for regressions against the previous run
+    if arguments.compare is not None:
+        with open(arguments.compare, 'r') as f:
+            previous = json.load(f)
+
+        regressions = compareResults(previous, results, arguments.threshold)
+        if regressions:
+            print "Slower than %s: %s" % (arguments.compare, ', '.join(regressions))
+            return 1
+
+    return 0
+
+# --------------------------------------------------------------------------------------------------------------------
+# BOOTSTRAP MAIN PROGRAM
+# --------------------------------------------------------------------------------------------------------------------
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv[1:]))
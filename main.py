@@ -39,10 +39,11 @@ import matplotlib.pyplot as plt
 import SolarCalculator.GUI
 import SolarCalculator.Simulation 
 import SolarCalculator.Assets 
+import SolarCalculator.Scenario
+import SolarCalculator.Analytics
 
 # Load the utility modules
 import SolarCalculator.Utils.ReverseGeocode
-import SolarCalculator.Utils.AverageTemperatureData 
 
 import sys                        # Fixes Unicode encoding error
 reload(sys)                       # ...
@@ -57,6 +58,9 @@ RED = 'red' # (255,0,0, 200)
 BLACK = 'black' # (0,0,0)
 WHITE = 'white' # (255,255,255,255)
 
+# Folder in the users home dir where the results of simulations are cached, so running the same simulation again is instant
+RESULT_CACHE_DIR = os.path.join(os.path.expanduser("~"), '.SolarFarmResults')
+
 
 # ------------------------------------------------------------------------------------------------------
 # SIMULATION RESULTS
@@ -262,6 +266,16 @@ def showResults():
 	resultsText += "Final Loan Value : \n    $ %.2f (%s)\n " % (FINANCIAL_RESULTS['loanValue'][-1], FINANCIAL_RESULTS['baseCurrency'])
 	resultsText += "Total Revenue : \n    $ %.2f (%s)\n " % (FINANCIAL_RESULTS['accumulativeRevenue'][-1], FINANCIAL_RESULTS['baseCurrency'])
 
+	# Investment metrics, discounted at the interest rate of the loan
+	analytics = SolarCalculator.Analytics.summariseFinancialResults(POWER_RESULTS, FINANCIAL_RESULTS)
+	resultsText += "\nINVESTMENT ANALYSIS (discounted at %g%%) ----\n" % analytics['discountRate']
+	resultsText += "Net Present Value : \n    $ %.2f (%s)\n " % (analytics['npv'], FINANCIAL_RESULTS['baseCurrency'])
+	resultsText += "Internal Rate of Return : \n    %.2f%% \n " % analytics['irr']
+	resultsText += "Levelised Cost of Energy : \n    $ %.4f (%s) per kWh\n " % (analytics['lcoe'], FINANCIAL_RESULTS['baseCurrency'])
+	resultsText += "Payback Date : \n    %s\n " % (analytics['paybackDate'] or 'Not paid back')
+	resultsText += "Discounted Payback Date : \n    %s\n " % (analytics['discountedPaybackDate'] or 'Not paid back')
+	resultsText += "Loan Paid Off : \n    %s\n " % (analytics['loanPaidOffDate'] or 'Not paid off')
+
 
 
 	# Show the results box and plots
@@ -272,131 +286,11 @@ def showResults():
 def createSimulation(inputParameters, optionalInputParameters):
 	''' Takes the input parameters from the view controller and instantiates the necessary components to run a simulation.
 
-	Firstly a reverse geocode is run to check the country that the simulation is in is valid. Using the information of the
-	country we can load the historic temperature data for this country. If the length of the transmission line needs to be
-	calculated we do this using the latitude and longitude of the grid connection point. Then all the objects for the 
-	simulation are created and a simulation object is instantiated. This is then returned so it can be run. '''
-	
-	# --------------------------------------------------------------------------------------------
-	# REVERSE GEO CODING 
-	# --------------------------------------------------------------------------------------------
-	
-	# Get the site information from the Reverse Geocode
-	code = SolarCalculator.Utils.ReverseGeocode.get_country_code(inputParameters['siteLatitude'], inputParameters['siteLongitude'])
-
-	# Throw an exception if the GeoCode Fails
-	if code == False:
-		raise SolarCalculator.Utils.ReverseGeocode.CountryNotFound("Country Not Found at Given Lat, Long")
-
-
-
-	# --------------------------------------------------------------------------------------------
-	# LOAD DATA FROM FILES 
-	# --------------------------------------------------------------------------------------------
-	
-	# Load the temperature data
-	temperature = SolarCalculator.Utils.AverageTemperatureData.TEMPERATURE_DATA[code]['PAST']	
-	
-
-
-	# --------------------------------------------------------------------------------------------
-	# CALCULATE OPTIONAL PARAMETERS
-	# --------------------------------------------------------------------------------------------
-
-	# If the user specified for the transmission line length to be calculated, then calculate it
-	if optionalInputParameters['TXCableLength'] == None:
-		TXCableLength = SolarCalculator.Simulation.calcLength(inputParameters['siteLatitude'], inputParameters['siteLongitude'], 
-								   inputParameters['siteGridLatitude'], inputParameters['siteGridLongitude'])
-	else:
-		TXCableLength = optionalInputParameters['TXCableLength']
-
-
-
-	# --------------------------------------------------------------------------------------------
-	# CREATE SIMULATION OBJECTS 
-	# --------------------------------------------------------------------------------------------
-	
-	# Constants
-	MATERIALS = {}
-	MATERIALS['Copper'] = SolarCalculator.Assets.Material(name='Cu', resistivity=1.68e-8, tempCoefficient=3.62e-3)
-	MATERIALS['Aluminium'] = SolarCalculator.Assets.Material(name='Al', resistivity=2.82e-8, tempCoefficient=3.9e-3)
-
-	# Instantiate solar farm objects
-	panel = SolarCalculator.Assets.PVPanel(voltage=inputParameters['panelVoltage'], 
-		 			rating=inputParameters['panelRating'], 
-		 			degradationRate=inputParameters['panelDegradation'], 
-		 			area=inputParameters['panelArea'], 
-		 			cost=inputParameters['panelCost'], 
-		 			currency=inputParameters['panelCurrency'],
-		 			depRate=inputParameters['panelDepreciation'])
-
-	module = SolarCalculator.Assets.PVModule(panelType=panel, 
-		 			  panelNum=inputParameters['siteNumPanels'])
-	
-	array = SolarCalculator.Assets.PVArray(moduleType=module, 
-					moduleNum=inputParameters['siteNumModules'], 
-					arrayAngle=inputParameters['panelAngle'])
-
-	dcCable = SolarCalculator.Assets.DCCable(diameter=inputParameters['DCCableDiameter'], 
-					  material=MATERIALS[inputParameters['DCCableMaterial']], 
-					  length=inputParameters['DCCableLength'], 
-					  costPerMeter=inputParameters['DCCableCost'], 
-					  depRate=inputParameters['DCCableDepreciation'])	
-
-	ac1Cable = SolarCalculator.Assets.AC1Cable(strandNum=inputParameters['ACCableNumStrands'], 
-						diameter=inputParameters['ACCableDiameter'], 
-						material=MATERIALS[inputParameters['ACCableMaterial']], 
-						length=inputParameters['ACCableLength'], 
-						costPerMeter=inputParameters['ACCableCost'], 
-						depRate=inputParameters['ACCableDepreciation'])
-
-	ac2Cable = SolarCalculator.Assets.AC2Cable(strandNum=inputParameters['TXCableNumStrands'], 
-						diameter=inputParameters['TXCableDiameter'], 
-						material=MATERIALS[inputParameters['TXCableMaterial']], 
-						length=TXCableLength, 
-						costPerMeter=inputParameters['TXCableCost'], 
-						depRate=inputParameters['TXCableDepreciation'])
-
-	inverter = SolarCalculator.Assets.Inverter(powerFactor=inputParameters['inverterPowerFactor'], 
-						efficiency=inputParameters['inverterEfficiency'], 
-						voltage=inputParameters['inverterOutputVoltage'], 
-						cost=inputParameters['inverterCost'] , 
-						depRate=inputParameters['inverterDepreciation'])
-	
-	transformer = SolarCalculator.Assets.Transformer(voltage=inputParameters['transformerOutputVoltage'], 
-							  efficiency=inputParameters['transformerEfficiency'] , 
-							  VARating=inputParameters['transformerRating'] , 
-							  cost=inputParameters['transformerCost'] , 
-							  depRate=inputParameters['transformerDepreciation'])
-
-	circuitBreaker = SolarCalculator.Assets.CircuitBreaker(cost=inputParameters['circuitBreakerCost'])
-
-	site = SolarCalculator.Assets.Site(transformerNum=inputParameters['siteNumTransformers'], 
-				arrayNum=inputParameters['siteNumArrays'], 
-				latitude=inputParameters['siteLatitude'], 
-				longitude=inputParameters['siteLongitude'],
-		  		circuitBreakerNum=inputParameters['siteNumCircuitBreakers'], 
-		  		inverterNum=inputParameters['siteNumInverters'], 
-		  		temperature=temperature, 
-		  		landPrice=inputParameters['siteCost'],
-		  		currency=inputParameters['siteCurrency'],
-				landAppRate=inputParameters['siteAppreciation'])
-
-	financial = SolarCalculator.Assets.Financial(maintenance=inputParameters['financialMaintenance'], 
-						  miscExpenses=inputParameters['financialMiscExpenses'], 
-						  interestRate =inputParameters['financialInterestRate'],
-						  powerPrice = inputParameters['financialPowerPrice'], 
-						  baseCurrency=inputParameters['financialBaseCurrency'])
-
-
-	# Create the simulation object
-	simulation = SolarCalculator.Simulation.Simulation(start=inputParameters['startDate'], finish=inputParameters['endDate'], 
-							PVPanel=panel, PVModule=module, PVArray=array, 
-		               		DCCable=dcCable, Inverter=inverter, AC1Cable=ac1Cable, Transformer=transformer, 
-		                   	AC2Cable=ac2Cable, CircuitBreaker=circuitBreaker, Site=site, Financial=financial,
-	                       	numThreads=50, simulationTimestepMins=60)
-
-	return simulation
+	The simulation objects are built by SolarCalculator.Scenario.createSimulation, which is shared with the headless
+	batch runner (batch.py) so both create their simulations in exactly the same way. The results are cached in
+	RESULT_CACHE_DIR so running the same simulation again (such as the demo) shows the results straight away.'''
+	resultCache = SolarCalculator.Simulation.SimulationResultCache(RESULT_CACHE_DIR)
+	return SolarCalculator.Scenario.createSimulation(inputParameters, optionalInputParameters, resultCache=resultCache)
 
 
 